@@ -4,6 +4,7 @@ import importlib.metadata
 import logging
 import platform
 import sys
+from collections.abc import Collection
 from datetime import datetime
 from functools import partial
 from pathlib import Path
@@ -19,9 +20,16 @@ from homeassistant.components.persistent_notification import (
     async_create as async_create_notification,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP
 from homeassistant.const import __version__ as HA_VERSION
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
@@ -32,32 +40,46 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
 
+from .cell_drift import CellDriftTracker
+from .cell_stats import cell_entity_key
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_BATTERY_DATA_ONLY,
+    CONF_CELL_VECTOR_SENSORS,
     CONF_EXPOSE_PER_CELL,
+    CONF_FAST_LANE_INTERVAL,
     CONF_PASSIVE,
     CONF_RETRIES,
     CONF_SCAN_INTERVAL,
     CONF_TIMEOUT_TOLERANCE,
     CONF_WARN_CLOCK_DRIFT,
+    DEFAULT_ADAPTIVE_POLLING,
     DEFAULT_BATTERY_DATA_ONLY,
+    DEFAULT_CELL_VECTOR_SENSORS,
+    DEFAULT_FAST_LANE_INTERVAL,
     DEFAULT_PASSIVE,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_WARN_CLOCK_DRIFT,
     DOMAIN,
     EXPOSE_RECOMMENDED_ENTITY_KEYS,
     PLATFORMS,
+    SERVICE_APPLY_SCHEDULE,
     SERVICE_CALIBRATE_BATTERY_SOC,
     SERVICE_CAPTURE_FRAMES,
     SERVICE_EXPOSE_RECOMMENDED_ENTITIES,
+    SERVICE_GET_CELL_HISTORY,
+    SERVICE_PIN_CELLS,
     SERVICE_REBOOT_INVERTER,
     SERVICE_REDETECT_PLANT,
     SERVICE_SET_SYSTEM_DATETIME,
+    SERVICE_UNPIN_CELLS,
     SYSTEM_TIME_DRIFT_THRESHOLD,
     resolve_experimental_client_kwargs,
+    resolve_experimental_coordinator_kwargs,
     system_time_drift,
 )
 from .coordinator import GivEnergyUpdateCoordinator, missing_devices
+from .domain_scheduler import DomainScheduler
 from .http import (
     CaptureDownloadView,
     CaptureLandingView,
@@ -65,6 +87,8 @@ from .http import (
     capture_dir,
     write_capture,
 )
+from .schedule import FLAG_FIELDS, SLOT_FIELDS, TARGET_FIELDS, plan_schedule
+from .snapshot import SNAPSHOT_SAVE_INTERVAL, PlantSnapshot, decode_snapshot, encode_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,7 +103,7 @@ _STRATEGY_URL = f"/{DOMAIN}/{_STRATEGY_FILENAME}"
 # served from the same package dir so they resolve offline without a CDN.
 _FONTS_DIRNAME = "fonts"
 _FONTS_URL = f"/{DOMAIN}/{_FONTS_DIRNAME}"
-_STRATEGY_VERSION = "11"
+_STRATEGY_VERSION = "12"
 
 # Per-config-entry topology cache. PlantCapabilities is persisted as
 # `to_dict()` directly (no envelope) following HA Core's Store convention —
@@ -122,6 +146,92 @@ async def _save_capabilities(
     await _capabilities_store(hass, entry_id).async_save(capabilities.to_dict())
 
 
+# The poll/detect scheduler shared by all of the domain's config entries. Kept
+# beside (not inside) hass.data[DOMAIN], which is the entry_id → coordinator map
+# the services and unload path iterate.
+_SCHEDULER_DATA_KEY = f"{DOMAIN}_scheduler"
+
+# Per-config-entry warm-start snapshot of the register caches (see snapshot.py).
+# Versioned like the capabilities cache; a payload shape change bumps the version.
+_SNAPSHOT_STORAGE_KEY_PREFIX = f"{DOMAIN}.plant_snapshot"
+_SNAPSHOT_STORAGE_VERSION = 1
+
+
+# Per-config-entry set of pinned per-cell entities (unique_ids), the only
+# individual cell entities created while per-cell exposure is off. A Store
+# rather than an entry option so pinning doesn't trip the options reload.
+_PINNED_CELLS_STORAGE_KEY_PREFIX = f"{DOMAIN}.pinned_cells"
+_PINNED_CELLS_STORAGE_VERSION = 1
+
+
+def _pinned_cells_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(
+        hass,
+        _PINNED_CELLS_STORAGE_VERSION,
+        f"{_PINNED_CELLS_STORAGE_KEY_PREFIX}.{entry_id}",
+    )
+
+
+async def _load_pinned_cells(hass: HomeAssistant, entry_id: str) -> set[str]:
+    payload = await _pinned_cells_store(hass, entry_id).async_load()
+    if not isinstance(payload, list):
+        return set()
+    return {uid for uid in payload if isinstance(uid, str)}
+
+
+# Per-config-entry long-term cell drift statistics (see cell_drift.py), saved
+# alongside the warm-start snapshot.
+_CELL_DRIFT_STORAGE_KEY_PREFIX = f"{DOMAIN}.cell_drift"
+_CELL_DRIFT_STORAGE_VERSION = 1
+
+
+def _cell_drift_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(
+        hass,
+        _CELL_DRIFT_STORAGE_VERSION,
+        f"{_CELL_DRIFT_STORAGE_KEY_PREFIX}.{entry_id}",
+    )
+
+
+async def _load_cell_drift(hass: HomeAssistant, entry_id: str) -> CellDriftTracker:
+    payload = await _cell_drift_store(hass, entry_id).async_load()
+    return CellDriftTracker.from_dict(payload)
+
+
+def _snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(
+        hass,
+        _SNAPSHOT_STORAGE_VERSION,
+        f"{_SNAPSHOT_STORAGE_KEY_PREFIX}.{entry_id}",
+    )
+
+
+async def _load_snapshot(
+    hass: HomeAssistant, entry_id: str, prior: PlantCapabilities
+) -> PlantSnapshot | None:
+    """Load the warm-start snapshot for `entry_id`, or None on miss/stale/mismatch."""
+    payload = await _snapshot_store(hass, entry_id).async_load()
+    if payload is None:
+        return None
+    return decode_snapshot(payload, prior, dt_util.utcnow())
+
+
+async def _save_snapshot(
+    hass: HomeAssistant, entry_id: str, coordinator: GivEnergyUpdateCoordinator
+) -> None:
+    """Persist the coordinator's live data as the next warm-start snapshot.
+
+    Skipped while the data is still the loaded snapshot (nothing new to save)
+    or isn't a real Plant. The cell drift statistics are saved with it.
+    """
+    if coordinator.data is None or coordinator.warm_start_from is not None:
+        return
+    payload = encode_snapshot(coordinator.data, dt_util.utcnow())
+    if payload is not None:
+        await _snapshot_store(hass, entry_id).async_save(payload)
+    await _cell_drift_store(hass, entry_id).async_save(coordinator.cell_drift.as_dict())
+
+
 async def _redetect_plant_entry(hass: HomeAssistant, entry_id: str) -> None:
     """Discard an entry's cached topology and reload it — a cold re-detect.
 
@@ -130,6 +240,7 @@ async def _redetect_plant_entry(hass: HomeAssistant, entry_id: str) -> None:
     "I changed the hardware (added/recovered a battery), please rediscover" path.
     """
     await _capabilities_store(hass, entry_id).async_remove()
+    await _snapshot_store(hass, entry_id).async_remove()
     hass.config_entries.async_schedule_reload(entry_id)
 
 
@@ -154,6 +265,48 @@ SERVICE_DEVICE_OR_SERIAL_SCHEMA = vol.Schema(
 
 SERVICE_DEVICE_SCHEMA = vol.Schema({vol.Required("device_id"): cv.string})
 
+# The whole desired schedule; every field is optional and keyed like the
+# control it stands in for. Omitted fields are left as they are.
+SERVICE_APPLY_SCHEDULE_SCHEMA = vol.Schema(
+    vol.All(
+        {
+            vol.Exclusive("device_id", "target"): cv.string,
+            vol.Exclusive("serial", "target"): cv.string,
+            **{vol.Optional(key): cv.time for key in SLOT_FIELDS},
+            **{
+                vol.Optional(key): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=d.native_min_value, max=d.native_max_value),
+                )
+                for key, d in TARGET_FIELDS.items()
+            },
+            **{vol.Optional(key): cv.boolean for key in FLAG_FIELDS},
+        },
+        _require_one_of_device_or_serial,
+    )
+)
+
+# Cells are addressed by the serial of their pack / module (LV battery, AIO
+# module or HV BMU) and 1-based cell number.
+_CELL_NUMBERS = vol.All(cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1))])
+
+SERVICE_GET_CELL_HISTORY_SCHEMA = vol.Schema(
+    {vol.Required("serial"): cv.string, vol.Optional("cells"): _CELL_NUMBERS}
+)
+
+SERVICE_PIN_CELLS_SCHEMA = vol.Schema(
+    vol.All(
+        {
+            # A module without a decoded serial is keyed "" in the cell stats;
+            # its per-cell entities have no unique_id prefix to pin by.
+            vol.Required("serial"): vol.All(cv.string, vol.Strip, vol.Length(min=1)),
+            vol.Optional("voltages"): _CELL_NUMBERS,
+            vol.Optional("temperatures"): _CELL_NUMBERS,
+        },
+        cv.has_at_least_one_key("voltages", "temperatures"),
+    )
+)
+
 
 SERVICE_CAPTURE_FRAMES_SCHEMA = vol.Schema(
     {
@@ -211,6 +364,34 @@ def _entry_id_for_serial(hass: HomeAssistant, serial: str) -> str | None:
     return None
 
 
+def _entry_id_for_cells(hass: HomeAssistant, serial: str) -> str | None:
+    """The entry whose plant has a pack / module with this serial, or None."""
+    return next(
+        (
+            entry_id
+            for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+            if serial in coordinator.cell_stats or serial in coordinator.cell_history
+        ),
+        None,
+    )
+
+
+def _pinned_cell_ids(coordinator: GivEnergyUpdateCoordinator, call_data: dict) -> set[str]:
+    """The per-cell entity unique_ids a pin_cells / unpin_cells call names."""
+    serial = call_data["serial"]
+    stats = coordinator.cell_stats.get(serial)
+    if stats is None:
+        raise HomeAssistantError(f"No cell data for {serial!r} in the latest poll")
+    unique_ids: set[str] = set()
+    for quantity, field in (("voltage", "voltages"), ("temperature", "temperatures")):
+        for cell in call_data.get(field, []):
+            key = cell_entity_key(stats.kind, quantity, cell)
+            if key is None:
+                raise HomeAssistantError(f"{serial} has no cell {cell} {quantity} entity")
+            unique_ids.add(f"{serial}_{key}")
+    return unique_ids
+
+
 def _resolve_target(hass: HomeAssistant, call_data: dict) -> tuple[str | None, str]:
     """Resolve a device_id-or-serial service call to a config entry_id.
 
@@ -557,22 +738,40 @@ def _reconcile_readability_gated_controls(
 # CONF_EXPOSE_PER_CELL). Roll-ups (`cell_voltage_min`, …) and the `v_cells_sum`
 # aggregate deliberately don't match — only the individual per-cell rows do.
 _PER_CELL_UNIQUE_ID_MARKERS = ("_v_cell_", "_t_cell_", "_t_cells_")
+# The per-module Cells entity that stands in for them (sensor.GivEnergyCellArraySensor),
+# and the optional Cell Vector entity (CONF_CELL_VECTOR_SENSORS).
+_CELL_ARRAY_UNIQUE_ID_SUFFIX = "_cell_array"
+_CELL_VECTOR_UNIQUE_ID_SUFFIX = "_cell_vector"
 
 
-def _reconcile_per_cell_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+def _reconcile_per_cell_entities(
+    hass: HomeAssistant, entry: ConfigEntry, pinned: Collection[str] = ()
+) -> None:
     """Remove per-cell entity rows when per-cell exposure is off (#179).
 
     The sensor platform stops creating the individual per-cell voltage/temperature
     entities when CONF_EXPOSE_PER_CELL is False, but HA keeps the pre-existing rows
     on an entry that previously had them — so turning the option off would leave
     orphaned, unavailable cell entities. Remove exactly those (matched by the
-    per-cell unique_id markers), leaving the roll-ups and every other entity intact.
-    Absent ⇒ legacy ⇒ on, so existing installs keep their cells untouched.
+    per-cell unique_id markers) that aren't ``pinned``, leaving the roll-ups and
+    every other entity intact. Absent ⇒ legacy ⇒ on, so existing installs keep
+    their cells untouched; turning it on removes the per-module Cells entities
+    that stood in for them. The Cell Vector entities likewise go when their
+    option is off.
     """
-    if entry.options.get(CONF_EXPOSE_PER_CELL, True):
-        return
     registry = er.async_get(hass)
+    expose_per_cell = entry.options.get(CONF_EXPOSE_PER_CELL, True)
+    retired_suffixes: tuple[str, ...] = ()
+    if expose_per_cell:
+        retired_suffixes += (_CELL_ARRAY_UNIQUE_ID_SUFFIX,)
+    if not entry.options.get(CONF_CELL_VECTOR_SENSORS, DEFAULT_CELL_VECTOR_SENSORS):
+        retired_suffixes += (_CELL_VECTOR_UNIQUE_ID_SUFFIX,)
     for ent in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if ent.domain == "sensor" and ent.unique_id.endswith(retired_suffixes):
+            registry.async_remove(ent.entity_id)
+            continue
+        if expose_per_cell or ent.unique_id in pinned:
+            continue
         if ent.unique_id and any(m in ent.unique_id for m in _PER_CELL_UNIQUE_ID_MARKERS):
             _LOGGER.info(
                 "Removing per-cell entity %s (per-cell exposure disabled, #179)",
@@ -581,6 +780,27 @@ def _reconcile_per_cell_entities(hass: HomeAssistant, entry: ConfigEntry) -> Non
             registry.async_remove(ent.entity_id)
 
 
+# The Fast power sensors fed by the coordinator's fast lane (CONF_FAST_LANE_INTERVAL).
+_FAST_LANE_UNIQUE_ID_SUFFIX = "_fast"
+
+
+def _reconcile_fast_lane_entities(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: GivEnergyUpdateCoordinator
+) -> None:
+    """Remove the Fast power sensor rows when the fast lane is off.
+
+    Turned off (or the entry switched to passive, where the fast lane never
+    runs), the sensor platform stops creating them, but HA would keep the rows
+    as orphaned, unavailable entities.
+    """
+    if coordinator.fast_lane_interval:
+        return
+    registry = er.async_get(hass)
+    for ent in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if ent.domain == "sensor" and ent.unique_id.endswith(_FAST_LANE_UNIQUE_ID_SUFFIX):
+            registry.async_remove(ent.entity_id)
+
+
 def _reconcile_ac_coupled_dc_limits(
     hass: HomeAssistant, coordinator: GivEnergyUpdateCoordinator
 ) -> None:
@@ -642,6 +862,10 @@ def _check_system_time_drift(
     if entry.options.get(CONF_BATTERY_DATA_ONLY, DEFAULT_BATTERY_DATA_ONLY):
         clear()
         return
+    # A warm-start snapshot's clock is as old as the snapshot: judge (and leave
+    # any standing issue alone) only once live data has landed.
+    if coordinator.warm_start_from is not None:
+        return
 
     system_time = coordinator.data.inverter.system_time
     now = dt_util.now()
@@ -676,6 +900,44 @@ def _check_system_time_drift(
     )
 
 
+async def _persist_seed_capabilities(
+    hass: HomeAssistant,
+    entry_id: str,
+    coordinator: GivEnergyUpdateCoordinator,
+    prior_capabilities: PlantCapabilities | None,
+) -> None:
+    """Persist the topology the first live poll confirmed, where it should be."""
+    # Seed the cache on cold start (no prior loaded), and FRESHEN it on a warm
+    # hit whose live capabilities drifted from the cache: detect() rebuilds the
+    # capabilities from the wire, so derived fields can legitimately change
+    # under us — givenergy-modbus 2.3.0's 0x31 read-alias retirement (#249) is
+    # the motivating case, where a persisted inverter_address=0x31 works only
+    # via the hardware facade and is expected to self-heal by the consumer
+    # re-persisting after detect(). The matching warm hit stays write-free.
+    # Mismatch is already covered by _on_topology_changed having saved exc.actual.
+    #
+    # Only persist a CLEAN poll: if the seed poll was partial (last_partial_failures
+    # non-empty), the integration still loads (coordinator serves the partial), but
+    # we don't commit a possibly-degraded topology to disk — flaky kit could
+    # otherwise vanish permanently on the next warm start. A permanently-partial
+    # plant re-detects fresh each cold start and self-heals to a clean persist once
+    # the read succeeds.
+    live_capabilities = coordinator.data.capabilities
+    if live_capabilities is not None and not coordinator.last_partial_failures:
+        if prior_capabilities is None:
+            await _save_capabilities(hass, entry_id, live_capabilities)
+        elif live_capabilities != prior_capabilities and not missing_devices(
+            prior_capabilities, live_capabilities
+        ):
+            # Never freshen with a loss-reduced topology: after a persistent
+            # loss the served capabilities are deliberately reduced for the
+            # tick while the full prior stays cached for the next re-probe.
+            await _save_capabilities(hass, entry_id, live_capabilities)
+            # Reconnect detect() hints should follow the wire too, not the
+            # stale cache we loaded at startup.
+            coordinator._prior_capabilities = live_capabilities
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Clear any legacy dashboard_outdated issues left by the now-removed
     # generate_dashboard service so the Repairs UI doesn't show a broken Fix button.
@@ -689,10 +951,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # on real topology change it raises PlantTopologyMismatch.
     prior_capabilities = await _load_capabilities(hass, entry.entry_id)
 
+    # Capabilities snapshot the platforms' entity sets currently reflect —
+    # captured after async_forward_entry_setups below and moved along by each
+    # in-place entity sync. None until then: a topology change or heal during
+    # the initial connect (before any entities exist) needs nothing, since the
+    # platforms then enumerate from the topology the connect settled on.
+    setup_capabilities: PlantCapabilities | None = None
+
     async def _on_topology_changed(actual: PlantCapabilities) -> None:
-        # async_schedule_reload is the documented preferred path from inside
-        # integration code: it cancels any pending setup retry before queuing
-        # the reload task, avoiding a race where the retry fires mid-reload.
+        nonlocal setup_capabilities
         await _save_capabilities(hass, entry.entry_id, actual)
         ir.async_create_issue(
             hass,
@@ -703,7 +970,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             severity=ir.IssueSeverity.WARNING,
             translation_key="plant_topology_changed",
         )
-        hass.config_entries.async_schedule_reload(entry.entry_id)
+        if setup_capabilities is None:
+            return
+        if actual.device_type != setup_capabilities.device_type:
+            # A different device type means different inverter descriptions and
+            # control sets, not just more or fewer devices: rebuild from scratch.
+            # async_schedule_reload is the documented preferred path from inside
+            # integration code: it cancels any pending setup retry before queuing
+            # the reload task, avoiding a race where the retry fires mid-reload.
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
+        # Same device type, devices added (or, once accepted, gone): add and
+        # retire just those entities after the next poll reads the new layout.
+        coordinator.async_schedule_entity_sync(retire=True)
+        setup_capabilities = actual
 
     async def _on_devices_missing(prior: PlantCapabilities, actual: PlantCapabilities) -> None:
         # A previously-known device stopped responding and the loss persisted
@@ -724,35 +1004,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             data={"entry_id": entry.entry_id, "devices": devices},
         )
 
-    # Capabilities snapshot the platforms built their entities from — captured
-    # after async_forward_entry_setups below. None until then, so the heal that
-    # fires during the initial connect (before any entities exist) is a no-op.
-    setup_capabilities: PlantCapabilities | None = None
-
     async def _on_topology_healed(confirmed: PlantCapabilities) -> None:
+        nonlocal setup_capabilities
         # Full expected topology confirmed — clear any standing "device missing"
         # repair the moment the device answers again (idempotent: a no-op when
         # no such issue exists).
         ir.async_delete_issue(hass, DOMAIN, f"expected_devices_missing_{entry.entry_id}")
-        # Entity sets are frozen at platform setup: a device that answered late
-        # (slow BMS during a warm-start detect) got no entities, and nothing
-        # creates them when it recovers. missing_devices(confirmed, setup)
-        # lists exactly those — present in the confirmed topology, absent from
-        # the snapshot entities were built from — so reload to pick them up (#148).
+        # Entity sets are enumerated at platform setup: a device that answered
+        # late (slow BMS during a warm-start detect) got no entities.
+        # missing_devices(confirmed, setup) lists exactly those — present in the
+        # confirmed topology, absent from the snapshot entities were built from
+        # — so sync them in once the next poll has read them (#148). A heal
+        # never loses a device, so nothing is retired.
         if setup_capabilities is None:
             return
         appeared = missing_devices(confirmed, setup_capabilities)
         if appeared:
             _LOGGER.info(
                 "Recovered device(s) %s had no entities created at setup; "
-                "reloading the entry to create them",
+                "adding them after the next poll",
                 ", ".join(appeared),
             )
-            hass.config_entries.async_schedule_reload(entry.entry_id)
+            coordinator.async_schedule_entity_sync(retire=False)
+            setup_capabilities = confirmed
 
     # Resolve opt-in experimental client flags from options into Client(...) kwargs.
     # Empty for the default-off case, so the construction is unchanged.
     experimental_client_kwargs = resolve_experimental_client_kwargs(entry.options)
+    # Integration-side experimental features (e.g. pipelined refresh) become
+    # coordinator kwargs instead; likewise empty when all are off.
+    experimental_coordinator_kwargs = resolve_experimental_coordinator_kwargs(entry.options)
+
+    # Every entry's coordinator shares one scheduler, so a multi-inverter site
+    # staggers its polls and runs one detect sweep at a time.
+    scheduler: DomainScheduler = hass.data.setdefault(_SCHEDULER_DATA_KEY, DomainScheduler())
+    entry.async_on_unload(scheduler.register(entry.entry_id))
 
     coordinator = GivEnergyUpdateCoordinator(
         hass=hass,
@@ -761,45 +1047,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         scan_interval=entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
         passive=entry.data.get(CONF_PASSIVE, DEFAULT_PASSIVE),
         experimental_client_kwargs=experimental_client_kwargs,
+        adaptive_polling=entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+        fast_lane_interval=entry.options.get(CONF_FAST_LANE_INTERVAL, DEFAULT_FAST_LANE_INTERVAL),
+        scheduler=scheduler,
         prior_capabilities=prior_capabilities,
         on_topology_changed=_on_topology_changed,
         on_devices_missing=_on_devices_missing,
         on_topology_healed=_on_topology_healed,
+        **experimental_coordinator_kwargs,
     )
-
-    await coordinator.async_config_entry_first_refresh()
-
-    # Seed the cache on cold start (no prior loaded), and FRESHEN it on a warm
-    # hit whose live capabilities drifted from the cache: detect() rebuilds the
-    # capabilities from the wire, so derived fields can legitimately change
-    # under us — givenergy-modbus 2.3.0's 0x31 read-alias retirement (#249) is
-    # the motivating case, where a persisted inverter_address=0x31 works only
-    # via the hardware facade and is expected to self-heal by the consumer
-    # re-persisting after detect(). The matching warm hit stays write-free.
-    # Mismatch is already covered by _on_topology_changed having saved exc.actual.
-    #
-    # Only persist a CLEAN poll: if the seed poll was partial (last_partial_failures
-    # non-empty), the integration still loads (coordinator serves the partial), but
-    # we don't commit a possibly-degraded topology to disk — flaky kit could
-    # otherwise vanish permanently on the next warm start. A permanently-partial
-    # plant re-detects fresh each cold start and self-heals to a clean persist once
-    # the read succeeds.
-    live_capabilities = coordinator.data.capabilities
-    if live_capabilities is not None and not coordinator.last_partial_failures:
-        if prior_capabilities is None:
-            await _save_capabilities(hass, entry.entry_id, live_capabilities)
-        elif live_capabilities != prior_capabilities and not missing_devices(
-            prior_capabilities, live_capabilities
-        ):
-            # Never freshen with a loss-reduced topology: after a persistent
-            # loss the served capabilities are deliberately reduced for the
-            # tick while the full prior stays cached for the next re-probe.
-            await _save_capabilities(hass, entry.entry_id, live_capabilities)
-            # Reconnect detect() hints should follow the wire too, not the
-            # stale cache we loaded at startup.
-            coordinator._prior_capabilities = live_capabilities
+    # Loaded before the first refresh, which already folds into it.
+    coordinator.cell_drift = await _load_cell_drift(hass, entry.entry_id)
+
+    # Warm start: with a persisted topology and a recent snapshot of the register
+    # caches, seed the coordinator from the snapshot so the platforms can build
+    # their entities now; the live connect/detect/first poll runs in the
+    # background once they exist (below). Otherwise (cold start, no usable
+    # snapshot) block on the first refresh as before — which is also the only
+    # path that raises ConfigEntryNotReady for an unreachable inverter; a warm
+    # start instead loads and lets the entities go unavailable.
+    snapshot = (
+        await _load_snapshot(hass, entry.entry_id, prior_capabilities)
+        if prior_capabilities is not None
+        else None
+    )
+    if snapshot is not None:
+        _LOGGER.debug("Warm start from the plant snapshot saved at %s", snapshot.saved_at)
+        coordinator.seed_from_snapshot(snapshot.plant, snapshot.saved_at)
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        await _persist_seed_capabilities(hass, entry.entry_id, coordinator, prior_capabilities)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    coordinator.pinned_cells = await _load_pinned_cells(hass, entry.entry_id)
 
     # Reload the entry when its options change (e.g. the battery-data-only toggle,
     # #95), so the platforms re-enumerate with the new filter. No listener exists
@@ -814,6 +1094,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry.async_on_unload(coordinator.async_add_listener(_system_time_drift_listener))
     _system_time_drift_listener()  # evaluate immediately rather than after one poll
 
+    # Keep the warm-start snapshot current: at most every SNAPSHOT_SAVE_INTERVAL
+    # while polling, and once more on Home Assistant stop (entries aren't
+    # unloaded at shutdown). async_unload_entry saves it too, for reloads.
+    next_snapshot_at = 0.0
+
+    @callback
+    def _snapshot_listener() -> None:
+        nonlocal next_snapshot_at
+        if not coordinator.last_update_success or coordinator.warm_start_from is not None:
+            return
+        now = hass.loop.time()
+        if now < next_snapshot_at:
+            return
+        next_snapshot_at = now + SNAPSHOT_SAVE_INTERVAL
+        entry.async_create_background_task(
+            hass,
+            _save_snapshot(hass, entry.entry_id, coordinator),
+            name=f"{DOMAIN} plant snapshot {entry.entry_id}",
+        )
+
+    async def _save_snapshot_on_stop(_event: Event) -> None:
+        await _save_snapshot(hass, entry.entry_id, coordinator)
+
+    entry.async_on_unload(coordinator.async_add_listener(_snapshot_listener))
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _save_snapshot_on_stop)
+    )
+
     # Re-point any entities under renamed unique_ids before the platforms create
     # them, so the existing entity (and its history) is reused rather than orphaned.
     _migrate_unique_ids(hass, entry)
@@ -835,15 +1143,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # When per-cell exposure is off, remove any individual per-cell rows a prior
     # version (or a prior opt-in) created, so the toggle cleans up rather than
-    # leaving orphaned/unavailable cell entities (#179).
-    _reconcile_per_cell_entities(hass, entry)
+    # leaving orphaned/unavailable cell entities (#179) — pinned cells excepted.
+    _reconcile_per_cell_entities(hass, entry, coordinator.pinned_cells)
+
+    # Likewise the Fast power sensors once the fast lane is turned off.
+    _reconcile_fast_lane_entities(hass, entry, coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # The platforms have now enumerated their entities from coordinator.data —
-    # snapshot the topology that enumeration saw for the heal-path diff (#148).
+    # snapshot the topology that enumeration saw for the heal/change diffs (#148).
     setup_capabilities = coordinator.data.capabilities
 
+    if snapshot is not None:
+        # Warm start: the live first poll runs now that the entities exist. Its
+        # detect() fires _on_topology_healed against setup_capabilities as usual.
+        async def _warm_start_refresh() -> None:
+            await coordinator.async_refresh()
+            if coordinator.warm_start_from is None:
+                await _persist_seed_capabilities(
+                    hass, entry.entry_id, coordinator, prior_capabilities
+                )
+
+        entry.async_create_background_task(
+            hass, _warm_start_refresh(), name=f"{DOMAIN} warm start {entry.entry_id}"
+        )
+
     # EMS entity-id realignment prompt. An EMS controller's entities are now named
     # `givenergy_ems_…` (sensor._device_kind); existing installs still carry the old
     # `givenergy_inverter_…` ids until the user runs HA's "Recreate entity IDs" on the
@@ -900,6 +1225,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Sync the inverter's clock to Home Assistant's current local time.
             await c._client.one_shot_command(commands.set_system_date_time(dt_util.now()))
 
+        async def handle_apply_schedule(call: ServiceCall) -> ServiceResponse:
+            entry_id, err = _resolve_target(hass, call.data)
+            if err:
+                raise HomeAssistantError(err)
+            c = hass.data.get(DOMAIN, {}).get(entry_id)
+            if c is None or c._client is None or not c._client.connected:
+                raise HomeAssistantError("GivEnergy inverter is not currently connected")
+            if c.data is None or c.data.capabilities is None or c.data.ems is not None:
+                # The EMS plant schedule lives in different registers, with its
+                # own controls; this service covers the inverter's.
+                raise HomeAssistantError("apply_schedule supports inverter schedules only")
+            plan = plan_schedule(
+                c.data,
+                call.data,
+                c.writes.overlay.pending(),
+                clean=not c.last_partial_failures,
+            )
+            bus_time = await c.writes.submit(plan.requests) if plan.requests else 0.0
+            _LOGGER.debug(
+                "apply_schedule wrote %d register(s), %d already set, in %.3fs",
+                len(plan.changes),
+                plan.unchanged,
+                bus_time,
+            )
+            return plan.as_response(bus_time)
+
+        async def handle_get_cell_history(call: ServiceCall) -> ServiceResponse:
+            serial = call.data["serial"]
+            entry_id = _entry_id_for_cells(hass, serial)
+            if entry_id is None:
+                raise HomeAssistantError(f"No GivEnergy battery pack or module {serial!r}")
+            cells = call.data.get("cells")
+            history = hass.data[DOMAIN][entry_id].cell_history.query(
+                serial, set(cells) if cells else None
+            )
+            if history is None:
+                raise HomeAssistantError(f"No cell history recorded for {serial!r} yet")
+            return history
+
+        async def _set_cell_pins(call: ServiceCall, pin: bool) -> None:
+            serial = call.data["serial"]
+            entry_id = _entry_id_for_cells(hass, serial)
+            if entry_id is None:
+                raise HomeAssistantError(f"No GivEnergy battery pack or module {serial!r}")
+            c = hass.data[DOMAIN][entry_id]
+            unique_ids = _pinned_cell_ids(c, call.data)
+            pinned = c.pinned_cells | unique_ids if pin else c.pinned_cells - unique_ids
+            if pinned == c.pinned_cells:
+                return
+            c.pinned_cells = pinned
+            await _pinned_cells_store(hass, entry_id).async_save(sorted(pinned))
+            if pin:
+                # The entity sync adds the newly pinned cells' entities on the
+                # next clean poll — requested now. It doesn't retire: that would
+                # also take the entities of a device that is merely missing.
+                c.async_schedule_entity_sync(retire=False)
+                await c.async_request_refresh()
+            else:
+                c.async_retire_entities(unique_ids)
+
+        async def handle_pin_cells(call: ServiceCall) -> None:
+            await _set_cell_pins(call, pin=True)
+
+        async def handle_unpin_cells(call: ServiceCall) -> None:
+            await _set_cell_pins(call, pin=False)
+
         async def handle_capture_frames(call: ServiceCall) -> None:
             device_id = call.data.get("device_id")
             duration = call.data["duration"]
@@ -987,6 +1378,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             handle_set_system_datetime,
             SERVICE_DEVICE_OR_SERIAL_SCHEMA,
         )
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_APPLY_SCHEDULE,
+            handle_apply_schedule,
+            SERVICE_APPLY_SCHEDULE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_CELL_HISTORY,
+            handle_get_cell_history,
+            SERVICE_GET_CELL_HISTORY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+        hass.services.async_register(
+            DOMAIN, SERVICE_PIN_CELLS, handle_pin_cells, SERVICE_PIN_CELLS_SCHEMA
+        )
+        hass.services.async_register(
+            DOMAIN, SERVICE_UNPIN_CELLS, handle_unpin_cells, SERVICE_PIN_CELLS_SCHEMA
+        )
 
         async def handle_redetect_plant(call: ServiceCall) -> None:
             # Clear the cached topology for this device's entry and trigger a
@@ -1083,6 +1494,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         coordinator: GivEnergyUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # A reload (options change, topology change) warm-starts from this.
+        await _save_snapshot(hass, entry.entry_id, coordinator)
         # Shut down before discarding the client: no new scheduled refresh can
         # race the teardown. HA auto-registers async_shutdown via
         # config_entry.async_on_unload, but those callbacks fire only after this
@@ -1096,6 +1509,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(DOMAIN, SERVICE_REBOOT_INVERTER)
         hass.services.async_remove(DOMAIN, SERVICE_CALIBRATE_BATTERY_SOC)
         hass.services.async_remove(DOMAIN, SERVICE_SET_SYSTEM_DATETIME)
+        hass.services.async_remove(DOMAIN, SERVICE_APPLY_SCHEDULE)
+        hass.services.async_remove(DOMAIN, SERVICE_GET_CELL_HISTORY)
+        hass.services.async_remove(DOMAIN, SERVICE_PIN_CELLS)
+        hass.services.async_remove(DOMAIN, SERVICE_UNPIN_CELLS)
         hass.services.async_remove(DOMAIN, SERVICE_CAPTURE_FRAMES)
         hass.services.async_remove(DOMAIN, SERVICE_REDETECT_PLANT)
         hass.services.async_remove(DOMAIN, SERVICE_EXPOSE_RECOMMENDED_ENTITIES)
@@ -1104,12 +1521,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Discard the entry's cached plant-capabilities store when it is deleted.
+    """Discard the entry's stores (capabilities, snapshot, cells) when it is deleted.
 
     HA does not auto-remove an integration's `Store` data on config-entry
     deletion, so without this a delete-then-re-add (or a leftover after an
-    uninstall) would orphan the `.storage` capabilities file. The cache is keyed
+    uninstall) would orphan the `.storage` files. The cache is keyed
     by entry_id, so a re-added entry gets a fresh id and a cold detect() either
     way — this is housekeeping, not a behaviour change.
     """
     await _capabilities_store(hass, entry.entry_id).async_remove()
+    await _snapshot_store(hass, entry.entry_id).async_remove()
+    await _pinned_cells_store(hass, entry.entry_id).async_remove()
+    await _cell_drift_store(hass, entry.entry_id).async_remove()
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 
 from homeassistant.components.binary_sensor import (
@@ -17,8 +17,10 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .cell_stats import KIND_AIO_MODULE, KIND_HV_MODULE, KIND_LV_BATTERY, CellStats
 from .const import DOMAIN
 from .coordinator import GivEnergyUpdateCoordinator
+from .entity_sync import EntitySync
 from .sensor import _device_kind
 
 # LFP soft operating band. A cell that has genuinely drifted outside this for a
@@ -45,9 +47,32 @@ DEBOUNCE_SECONDS = 300
 DEBOUNCE_MIN_POLLS = 3
 
 
+@dataclass(frozen=True, slots=True)
+class CellBands:
+    """In-spec envelope for one cell chemistry."""
+
+    cell_min_v: float
+    cell_max_v: float
+    temp_min_c: float
+    temp_max_c: float
+
+
+# Alert bands per chemistry, and the chemistry of each device kind. Every pack
+# GivEnergy ships today (LV, AIO and HV alike) is LFP; a new chemistry is one
+# entry in each table.
+CHEMISTRY_BANDS: dict[str, CellBands] = {
+    "lfp": CellBands(CELL_MIN_V, CELL_MAX_V, TEMP_MIN_C, TEMP_MAX_C),
+}
+KIND_CHEMISTRY: dict[str, str] = {
+    KIND_LV_BATTERY: "lfp",
+    KIND_AIO_MODULE: "lfp",
+    KIND_HV_MODULE: "lfp",
+}
+
+
 @dataclass
 class _Offender:
-    """Tracks one metric that is currently out of spec across consecutive polls."""
+    """One metric that is currently out of spec across consecutive polls."""
 
     battery: str
     metric: str
@@ -56,12 +81,84 @@ class _Offender:
     poll_count: int = 1
 
 
-@dataclass
-class _Reading:
-    battery: str
-    metric: str
-    value: float
-    detail: dict[str, object] = field(default_factory=dict)
+class _PackTracker:
+    """Per-slot debounce state for one pack / module.
+
+    Slots are the pack's cell voltages followed by its temperature readings, in
+    the layout of its CellStats arrays. Each slot holds the consecutive polls it
+    has been out of spec (0 = in spec), when that run started and the latest
+    offending value; a tick only writes into these preallocated lists.
+    """
+
+    __slots__ = ("bands", "cells", "first_seen", "group_width", "kind", "polls", "values")
+
+    def __init__(self, stats: CellStats, bands: CellBands) -> None:
+        self.bands = bands
+        self.kind = stats.kind
+        self.cells = len(stats.voltages)
+        self.group_width = stats.cells_per_temperature
+        slots = self.cells + len(stats.temperatures)
+        self.polls = [0] * slots
+        self.first_seen: list[datetime | None] = [None] * slots
+        self.values = [0.0] * slots
+
+    def fits(self, stats: CellStats) -> bool:
+        """Whether ``stats`` has the slot layout this tracker was built for."""
+        return (
+            stats.kind == self.kind
+            and len(stats.voltages) == self.cells
+            and len(stats.temperatures) == len(self.polls) - self.cells
+        )
+
+    def update(self, stats: CellStats, refresh: datetime) -> None:
+        """Advance every slot's counter off this poll's readings."""
+        bands, polls = self.bands, self.polls
+        slot = 0
+        for value in stats.voltages:
+            # None / below the floor: unpopulated slot or dropped read.
+            if (
+                value is not None
+                and value >= CELL_PRESENT_FLOOR_V
+                and not bands.cell_min_v <= value <= bands.cell_max_v
+            ):
+                self._hit(slot, value, refresh)
+            else:
+                polls[slot] = 0
+            slot += 1
+        for value in stats.temperatures:
+            if value is not None and not bands.temp_min_c <= value <= bands.temp_max_c:
+                self._hit(slot, value, refresh)
+            else:
+                polls[slot] = 0
+            slot += 1
+
+    def _hit(self, slot: int, value: float, refresh: datetime) -> None:
+        if not self.polls[slot]:
+            self.first_seen[slot] = refresh
+        self.polls[slot] += 1
+        self.values[slot] = value
+
+    def tripped(self, refresh: datetime) -> bool:
+        for slot, polls in enumerate(self.polls):
+            if polls >= DEBOUNCE_MIN_POLLS:
+                first_seen = self.first_seen[slot]
+                if (
+                    first_seen is not None
+                    and (refresh - first_seen).total_seconds() >= DEBOUNCE_SECONDS
+                ):
+                    return True
+        return False
+
+    def metric(self, slot: int) -> str:
+        """The offender metric name for ``slot`` (``cell_03_voltage``, …)."""
+        if slot < self.cells:
+            return f"cell_{slot + 1:02d}_voltage"
+        group = slot - self.cells
+        width = self.group_width
+        if width == 1:
+            return f"cell_{group + 1:02d}_temperature"
+        lo = group * width + 1
+        return f"cells_{lo:02d}_{lo + width - 1:02d}_temperature"
 
 
 async def async_setup_entry(
@@ -70,37 +167,16 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: GivEnergyUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    # Pointless on a battery-less (PV-only) install.
-    if not coordinator.data.batteries:
-        return
-    async_add_entities([GivEnergyBatteryOutOfSpecBinarySensor(coordinator)])
-
-
-def _iter_readings(batteries: list) -> Iterator[_Reading]:
-    """Yield every in-spec-checkable cell-voltage and group-temperature reading."""
-    for index, battery in enumerate(batteries):
-        serial = battery.serial_number or f"battery_{index}"
-        for cell in range(1, 17):
-            value = getattr(battery, f"v_cell_{cell:02d}", None)
-            if value is None or value < CELL_PRESENT_FLOOR_V:
-                continue  # unpopulated slot or dropped read
-            yield _Reading(serial, f"cell_{cell:02d}_voltage", float(value), {"cell": cell})
-        for lo, hi in ((1, 4), (5, 8), (9, 12), (13, 16)):
-            value = getattr(battery, f"t_cells_{lo:02d}_{hi:02d}", None)
-            if value is None:
-                continue
-            yield _Reading(
-                serial,
-                f"cells_{lo:02d}_{hi:02d}_temperature",
-                float(value),
-                {"cell_group": f"{lo}-{hi}"},
-            )
-
-
-def _out_of_spec(reading: _Reading) -> bool:
-    if reading.metric.endswith("_voltage"):
-        return not (CELL_MIN_V <= reading.value <= CELL_MAX_V)
-    return not (TEMP_MIN_C <= reading.value <= TEMP_MAX_C)
+
+    def entities() -> list[BinarySensorEntity]:
+        # Pointless on a battery-less (PV-only) install; created by the entity
+        # sync if a battery is detected later.
+        data = coordinator.data
+        if not (data.batteries or data.aio_battery_modules or data.hv_stacks):
+            return []
+        return [GivEnergyBatteryOutOfSpecBinarySensor(coordinator)]
+
+    entry.async_on_unload(EntitySync(hass, coordinator, async_add_entities, entities).async_setup())
 
 
 class GivEnergyBatteryOutOfSpecBinarySensor(
@@ -114,7 +190,11 @@ class GivEnergyBatteryOutOfSpecBinarySensor(
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator: GivEnergyUpdateCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: GivEnergyUpdateCoordinator,
+        bands: Mapping[str, CellBands] = CHEMISTRY_BANDS,
+    ) -> None:
         super().__init__(coordinator)
         serial = coordinator.data.inverter_serial_number
         self._attr_unique_id = f"{serial}_battery_out_of_spec"
@@ -128,7 +208,8 @@ class GivEnergyBatteryOutOfSpecBinarySensor(
             identifiers={(DOMAIN, serial)},
             name=f"GivEnergy {_device_kind(model)} {serial}",
         )
-        self._offenders: dict[str, _Offender] = {}
+        self._bands = bands
+        self._trackers: dict[str, _PackTracker] = {}
         self._last_processed_refresh: datetime | None = None
         self._evaluate()
 
@@ -147,39 +228,43 @@ class GivEnergyBatteryOutOfSpecBinarySensor(
             return
         self._last_processed_refresh = refresh
 
-        current: dict[str, _Reading] = {
-            f"{r.battery}:{r.metric}": r
-            for r in _iter_readings(self.coordinator.data.batteries)
-            if _out_of_spec(r)
-        }
-        # Drop anything that has returned to spec.
-        for key in list(self._offenders):
-            if key not in current:
-                del self._offenders[key]
-        # Record/advance current offenders.
-        for key, reading in current.items():
-            existing = self._offenders.get(key)
-            if existing is None:
-                self._offenders[key] = _Offender(
-                    battery=reading.battery,
-                    metric=reading.metric,
-                    value=reading.value,
-                    first_seen=refresh,
+        stats = self.coordinator.cell_stats
+        # Forget packs that have left the plant.
+        if self._trackers.keys() != stats.keys():
+            for serial in self._trackers.keys() - stats.keys():
+                del self._trackers[serial]
+        for serial, pack in stats.items():
+            tracker = self._trackers.get(serial)
+            if tracker is None or not tracker.fits(pack):
+                bands = self._bands[KIND_CHEMISTRY[pack.kind]]
+                tracker = self._trackers[serial] = _PackTracker(pack, bands)
+            tracker.update(pack, refresh)
+
+    @property
+    def _offenders(self) -> dict[str, _Offender]:
+        """Every slot currently out of spec, keyed ``<battery>:<metric>``."""
+        offenders: dict[str, _Offender] = {}
+        for serial, tracker in self._trackers.items():
+            for slot, polls in enumerate(tracker.polls):
+                first_seen = tracker.first_seen[slot]
+                if not polls or first_seen is None:
+                    continue
+                metric = tracker.metric(slot)
+                offenders[f"{serial}:{metric}"] = _Offender(
+                    battery=serial,
+                    metric=metric,
+                    value=tracker.values[slot],
+                    first_seen=first_seen,
+                    poll_count=polls,
                 )
-            else:
-                existing.value = reading.value
-                existing.poll_count += 1
+        return offenders
 
     @property
     def is_on(self) -> bool:
         refresh = self.coordinator.last_successful_refresh
         if refresh is None:
             return False
-        return any(
-            offender.poll_count >= DEBOUNCE_MIN_POLLS
-            and (refresh - offender.first_seen).total_seconds() >= DEBOUNCE_SECONDS
-            for offender in self._offenders.values()
-        )
+        return any(tracker.tripped(refresh) for tracker in self._trackers.values())
 
     @property
     def extra_state_attributes(self) -> dict[str, object]:
@@ -0,0 +1,204 @@
+"""Long-term per-cell drift statistics, persisted per entry.
+
+Spotting a cell that is slowly drifting away from its pack otherwise means
+charting hundreds of per-cell series over weeks. CellDriftTracker keeps what
+such a chart would show, per pack / module and cell, on top of the per-tick
+cell statistics snapshot (cell_stats.compute_cell_stats):
+
+- an exponentially weighted moving average of the cell's deviation from its
+  pack mean (mV), time-weighted so the poll interval doesn't change its span;
+- the day's minimum and maximum deviation;
+- the average as it stood at the close of each of the last DRIFT_DAYS days,
+  from which a least-squares drift slope (mV/day) is fitted.
+
+That is a few numbers per cell, so the whole tracker round-trips through a
+compact Store payload (``as_dict`` / ``from_dict``) and the ranking survives
+restarts without recording a single cell.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from .cell_stats import CellStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time constant of the deviation average: a step change is ~63% absorbed after
+# this long, so a one-off excursion barely moves it but a trend shows within a day.
+DRIFT_TIME_CONSTANT = timedelta(hours=6)
+# Daily closes kept for the slope fit, and the fewest it is fitted from.
+DRIFT_DAYS = 30
+DRIFT_MIN_DAYS_FOR_SLOPE = 3
+# Cells listed by the Worst Cell Drift sensor.
+WORST_CELLS = 5
+
+
+@dataclass(frozen=True)
+class CellDrift:
+    """One cell's drift statistics, in mV (slope in mV/day)."""
+
+    cell: int
+    deviation: float
+    day_min: float | None
+    day_max: float | None
+    slope: float | None
+
+
+@dataclass
+class _PackDrift:
+    day: date
+    last: datetime
+    ewma: list[float | None]
+    day_min: list[float | None]
+    day_max: list[float | None]
+    # (day ordinal, per-cell average at that day's close), oldest first.
+    daily: deque[tuple[int, list[float | None]]] = field(
+        default_factory=lambda: deque(maxlen=DRIFT_DAYS)
+    )
+
+
+def _slope(points: Sequence[tuple[int, float]]) -> float | None:
+    """Least-squares slope of ``points`` (x in days), or None if too few."""
+    if len(points) < DRIFT_MIN_DAYS_FOR_SLOPE:
+        return None
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var_x:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def _rounded(values: Sequence[float | None]) -> list[float | None]:
+    return [round(v, 2) if v is not None else None for v in values]
+
+
+class CellDriftTracker:
+    """Per-cell deviation statistics for every pack / module, keyed like cell_stats."""
+
+    def __init__(self) -> None:
+        self._packs: dict[str, _PackDrift] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._packs
+
+    def record(self, at: datetime, stats: Mapping[str, CellStats]) -> None:
+        """Fold one refresh's cell statistics in; ``at`` is local time (days roll at midnight).
+
+        A refresh at or before a pack's last recorded one (a tick serving
+        last-known data) is ignored.
+        """
+        for key, pack in stats.items():
+            if pack.v_mean is None:
+                continue
+            # An unpopulated slot reads 0 V; like cell_stats, it isn't a cell.
+            deviations = [(v - pack.v_mean) * 1000 if v else None for v in pack.voltages]
+            drift = self._packs.get(key)
+            if drift is None or len(drift.ewma) != len(deviations):
+                self._packs[key] = _PackDrift(
+                    day=at.date(),
+                    last=at,
+                    ewma=list(deviations),
+                    day_min=list(deviations),
+                    day_max=list(deviations),
+                )
+                continue
+            if at <= drift.last:
+                continue
+            if at.date() != drift.day:
+                drift.daily.append((drift.day.toordinal(), list(drift.ewma)))
+                drift.day = at.date()
+                drift.day_min = [None] * len(deviations)
+                drift.day_max = [None] * len(deviations)
+            weight = -math.expm1(-(at - drift.last) / DRIFT_TIME_CONSTANT)
+            drift.last = at
+            for i, d in enumerate(deviations):
+                if d is None:
+                    if pack.voltages[i] is not None:
+                        # An empty slot: drop anything stored for it before.
+                        drift.ewma[i] = drift.day_min[i] = drift.day_max[i] = None
+                    continue
+                average = drift.ewma[i]
+                drift.ewma[i] = d if average is None else average + weight * (d - average)
+                low, high = drift.day_min[i], drift.day_max[i]
+                drift.day_min[i] = d if low is None else min(low, d)
+                drift.day_max[i] = d if high is None else max(high, d)
+
+    def cells(self, key: str) -> list[CellDrift]:
+        """Every tracked cell of ``key``'s pack / module, worst (largest |average|) first."""
+        drift = self._packs.get(key)
+        if drift is None:
+            return []
+        today = drift.day.toordinal()
+        out: list[CellDrift] = []
+        for i, average in enumerate(drift.ewma):
+            if average is None:
+                continue
+            points = [(day, v) for day, values in drift.daily if (v := values[i]) is not None]
+            points.append((today, average))
+            out.append(
+                CellDrift(
+                    cell=i + 1,
+                    deviation=average,
+                    day_min=drift.day_min[i],
+                    day_max=drift.day_max[i],
+                    slope=_slope(points),
+                )
+            )
+        out.sort(key=lambda c: (-abs(c.deviation), c.cell))
+        return out
+
+    def days_tracked(self, key: str) -> int:
+        drift = self._packs.get(key)
+        return len(drift.daily) + 1 if drift is not None else 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """The compact Store payload: a handful of rounded numbers per cell."""
+        return {
+            key: {
+                "day": drift.day.isoformat(),
+                "last": drift.last.isoformat(),
+                "ewma": _rounded(drift.ewma),
+                "min": _rounded(drift.day_min),
+                "max": _rounded(drift.day_max),
+                "daily": [[day, _rounded(values)] for day, values in drift.daily],
+            }
+            for key, drift in self._packs.items()
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Any) -> CellDriftTracker:
+        """Rebuild a tracker from ``as_dict`` output; unreadable packs are dropped."""
+        tracker = cls()
+        if not isinstance(payload, dict):
+            return tracker
+        for key, raw in payload.items():
+            try:
+                ewma = [None if v is None else float(v) for v in raw["ewma"]]
+                drift = _PackDrift(
+                    day=date.fromisoformat(raw["day"]),
+                    last=datetime.fromisoformat(raw["last"]),
+                    ewma=ewma,
+                    day_min=[None if v is None else float(v) for v in raw["min"]],
+                    day_max=[None if v is None else float(v) for v in raw["max"]],
+                )
+                for day, values in raw["daily"]:
+                    if len(values) != len(ewma):
+                        raise ValueError("daily row length mismatch")
+                    drift.daily.append(
+                        (int(day), [None if v is None else float(v) for v in values])
+                    )
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug("Dropping unreadable cell drift state for %s: %s", key, err)
+                continue
+            if len(drift.day_min) == len(drift.day_max) == len(ewma):
+                tracker._packs[key] = drift
+        return tracker
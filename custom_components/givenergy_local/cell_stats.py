@@ -0,0 +1,267 @@
+"""Per-tick cell statistics snapshot, shared by every cell consumer.
+
+The cell roll-up sensors (min / max / delta), the battery out-of-spec alert and
+the cell-balance heatmap each used to walk every cell attribute of every pack on
+their own each tick — on a multi-stack HV plant that is hundreds of ``getattr``
+calls several times over. The coordinator instead builds one
+:func:`compute_cell_stats` snapshot per successful refresh, and the consumers
+read its arrays and precomputed aggregates. The same snapshots feed a short
+in-memory :class:`CellHistory`, so per-cell history can be fetched on demand
+without an entity (and a recorder row) per cell.
+
+Presence follows the roll-up convention: an unused cell slot reads exactly 0
+(voltages and temperatures alike — see sensor._present_cells), so 0 and None
+are "not populated". The raw per-slot arrays are kept alongside so a consumer
+with a stricter rule (the out-of-spec alert's voltage floor) can apply it.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from givenergy_modbus.model.plant import Plant
+
+# Cell layout per device kind, matching the per-cell and roll-up sensors: LV
+# packs report 16 cell voltages and one thermistor per 4-cell group; an AIO
+# module reports 24 voltages and populates only its first 12 cell temperatures;
+# an HV module (BMU) reports 24 of each.
+LV_CELL_COUNT = 16
+LV_TEMPERATURE_GROUPS: tuple[tuple[int, int], ...] = ((1, 4), (5, 8), (9, 12), (13, 16))
+AIO_CELL_COUNT = 24
+AIO_TEMPERATURE_COUNT = 12
+HV_CELL_COUNT = 24
+HV_TEMPERATURE_COUNT = 24
+
+# A present cell further than this from its pack's mean voltage is an outlier.
+# Matches the heatmap's default colour span (±15 mV), so an outlier is a cell
+# the heatmap paints fully saturated.
+CELL_OUTLIER_DEVIATION_V = 0.015
+
+KIND_LV_BATTERY = "lv_battery"
+KIND_AIO_MODULE = "aio_module"
+KIND_HV_MODULE = "hv_module"
+
+
+@dataclass(frozen=True, slots=True)
+class CellStats:
+    """Cell readings and aggregates for one pack / module, as of one refresh."""
+
+    kind: str
+    serial: str
+    # Raw readings per slot (1-based cell n at index n-1); None when not decoded.
+    voltages: tuple[float | None, ...]
+    temperatures: tuple[float | None, ...]
+    # Cells sharing each temperature reading: 4 on an LV pack, else 1.
+    cells_per_temperature: int
+    v_min: float | None
+    v_max: float | None
+    v_mean: float | None
+    v_spread: float | None
+    t_min: float | None
+    t_max: float | None
+    # 1-based numbers of present cells deviating from v_mean past the threshold.
+    outliers: tuple[int, ...]
+
+    def rollup(self, prefix: str, stat: str) -> float | None:
+        """The ``stat`` ("min" / "max" / "spread") of the ``prefix`` cells."""
+        if prefix == "v_cell":
+            return {"min": self.v_min, "max": self.v_max, "spread": self.v_spread}[stat]
+        if stat == "spread":
+            return (
+                self.t_max - self.t_min
+                if self.t_max is not None and self.t_min is not None
+                else None
+            )
+        return {"min": self.t_min, "max": self.t_max}[stat]
+
+
+def _read(obj: Any, names: Iterable[str]) -> tuple[float | None, ...]:
+    """Numeric readings for ``names`` off ``obj`` (anything else reads as None)."""
+    out: list[float | None] = []
+    for name in names:
+        value = getattr(obj, name, None)
+        out.append(value if isinstance(value, (int, float)) else None)
+    return tuple(out)
+
+
+def cell_names(prefix: str, count: int) -> tuple[str, ...]:
+    """The attribute names `prefix_01`..`prefix_{count}`."""
+    return tuple(f"{prefix}_{i:02d}" for i in range(1, count + 1))
+
+
+_LV_VOLTAGE_NAMES = cell_names("v_cell", LV_CELL_COUNT)
+_LV_TEMPERATURE_NAMES = tuple(f"t_cells_{lo:02d}_{hi:02d}" for lo, hi in LV_TEMPERATURE_GROUPS)
+_AIO_VOLTAGE_NAMES = cell_names("v_cell", AIO_CELL_COUNT)
+_AIO_TEMPERATURE_NAMES = cell_names("t_cell", AIO_TEMPERATURE_COUNT)
+_HV_VOLTAGE_NAMES = cell_names("v_cell", HV_CELL_COUNT)
+_HV_TEMPERATURE_NAMES = cell_names("t_cell", HV_TEMPERATURE_COUNT)
+
+
+def _stats(
+    kind: str,
+    serial: str,
+    voltages: tuple[float | None, ...],
+    temperatures: tuple[float | None, ...],
+    cells_per_temperature: int,
+) -> CellStats:
+    present_v = [v for v in voltages if v]
+    present_t = [t for t in temperatures if t]
+    v_min = min(present_v) if present_v else None
+    v_max = max(present_v) if present_v else None
+    v_mean = sum(present_v) / len(present_v) if present_v else None
+    outliers: tuple[int, ...] = ()
+    if v_mean is not None:
+        outliers = tuple(
+            n
+            for n, v in enumerate(voltages, start=1)
+            if v and abs(v - v_mean) > CELL_OUTLIER_DEVIATION_V
+        )
+    return CellStats(
+        kind=kind,
+        serial=serial,
+        voltages=voltages,
+        temperatures=temperatures,
+        cells_per_temperature=cells_per_temperature,
+        v_min=v_min,
+        v_max=v_max,
+        v_mean=v_mean,
+        v_spread=v_max - v_min if v_max is not None and v_min is not None else None,
+        t_min=min(present_t) if present_t else None,
+        t_max=max(present_t) if present_t else None,
+        outliers=outliers,
+    )
+
+
+def compute_cell_stats(plant: Plant) -> dict[str, CellStats]:
+    """One pass over every pack / module's cells, keyed by serial.
+
+    LV packs without a decoded serial are keyed ``battery_<index>`` (the label
+    the out-of-spec alert has always used for them). AIO modules and HV BMUs
+    that didn't decode (``is_valid()`` false) are skipped — they get no
+    entities either.
+    """
+    stats: dict[str, CellStats] = {}
+    for index, battery in enumerate(plant.batteries):
+        serial = battery.serial_number or f"battery_{index}"
+        stats[serial] = _stats(
+            KIND_LV_BATTERY,
+            serial,
+            _read(battery, _LV_VOLTAGE_NAMES),
+            _read(battery, _LV_TEMPERATURE_NAMES),
+            4,
+        )
+    for module in plant.aio_battery_modules:
+        if not module.is_valid():
+            continue
+        stats[module.serial_number] = _stats(
+            KIND_AIO_MODULE,
+            module.serial_number,
+            _read(module, _AIO_VOLTAGE_NAMES),
+            _read(module, _AIO_TEMPERATURE_NAMES),
+            1,
+        )
+    for stack in plant.hv_stacks:
+        for bmu in stack.bmus:
+            if not bmu.is_valid():
+                continue
+            stats[bmu.serial_number] = _stats(
+                KIND_HV_MODULE,
+                bmu.serial_number,
+                _read(bmu, _HV_VOLTAGE_NAMES),
+                _read(bmu, _HV_TEMPERATURE_NAMES),
+                1,
+            )
+    return stats
+
+
+# Snapshots kept per pack / module by CellHistory: an hour at the default 30 s
+# scan interval. The readings are the CellStats tuples themselves, shared rather
+# than copied, so a sample costs a few references.
+CELL_HISTORY_SAMPLES = 120
+
+
+def cell_entity_key(kind: str, quantity: str, cell: int) -> str | None:
+    """The per-cell entity key for ``cell``'s voltage or temperature, None if none.
+
+    Matches the per-cell sensor descriptions: an LV pack's temperatures are per
+    4-cell group, so any cell in the group names the group's entity; an AIO
+    module exposes only its populated first 12 cell temperatures.
+    """
+    if quantity == "voltage":
+        count = {KIND_LV_BATTERY: LV_CELL_COUNT, KIND_AIO_MODULE: AIO_CELL_COUNT}.get(
+            kind, HV_CELL_COUNT
+        )
+        return f"v_cell_{cell:02d}" if 1 <= cell <= count else None
+    if kind == KIND_LV_BATTERY:
+        for lo, hi in LV_TEMPERATURE_GROUPS:
+            if lo <= cell <= hi:
+                return f"t_cells_{lo:02d}_{hi:02d}"
+        return None
+    count = AIO_TEMPERATURE_COUNT if kind == KIND_AIO_MODULE else HV_TEMPERATURE_COUNT
+    return f"t_cell_{cell:02d}" if 1 <= cell <= count else None
+
+
+def temperature_label(stats: CellStats, index: int) -> str:
+    """The cells the ``index``-th (0-based) temperature reading covers: "5" or "5-8"."""
+    lo = index * stats.cells_per_temperature + 1
+    hi = lo + stats.cells_per_temperature - 1
+    return str(lo) if lo == hi else f"{lo}-{hi}"
+
+
+class CellHistory:
+    """The last CELL_HISTORY_SAMPLES cell snapshots per pack / module, by serial."""
+
+    def __init__(self, maxlen: int = CELL_HISTORY_SAMPLES) -> None:
+        self._maxlen = maxlen
+        self._samples: dict[str, deque[tuple[datetime, CellStats]]] = {}
+        self._last_at: datetime | None = None
+
+    def record(self, at: datetime, stats: Mapping[str, CellStats]) -> None:
+        """Append one refresh's snapshots; a refresh already recorded is ignored."""
+        if self._last_at is not None and at <= self._last_at:
+            return
+        self._last_at = at
+        for serial, cell_stats in stats.items():
+            samples = self._samples.get(serial)
+            if samples is None:
+                samples = self._samples[serial] = deque(maxlen=self._maxlen)
+            samples.append((at, cell_stats))
+
+    def query(self, serial: str, cells: Collection[int] | None = None) -> dict[str, Any] | None:
+        """``serial``'s recorded readings, one series per cell, None if never seen.
+
+        ``cells`` (1-based) narrows the result to those cells' voltages and the
+        temperature readings covering them; all cells when omitted.
+        """
+        samples = self._samples.get(serial)
+        if not samples:
+            return None
+        latest = samples[-1][1]
+        voltages = {
+            str(n): [s.voltages[n - 1] if n <= len(s.voltages) else None for _, s in samples]
+            for n in range(1, len(latest.voltages) + 1)
+            if cells is None or n in cells
+        }
+        temperatures: dict[str, list[float | None]] = {}
+        for index in range(len(latest.temperatures)):
+            lo = index * latest.cells_per_temperature + 1
+            covered = range(lo, lo + latest.cells_per_temperature)
+            if cells is not None and not any(n in cells for n in covered):
+                continue
+            temperatures[temperature_label(latest, index)] = [
+                s.temperatures[index] if index < len(s.temperatures) else None for _, s in samples
+            ]
+        return {
+            "serial": serial,
+            "kind": latest.kind,
+            "times": [at.isoformat() for at, _ in samples],
+            "voltages": voltages,
+            "temperatures": temperatures,
+        }
+
+    def __contains__(self, serial: object) -> bool:
+        return serial in self._samples
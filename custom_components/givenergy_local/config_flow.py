@@ -17,19 +17,32 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import SectionConfig, section
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_BATTERY_DATA_ONLY,
+    CONF_CELL_VECTOR_SENSORS,
     CONF_EXPERIMENTAL,
     CONF_EXPOSE_PER_CELL,
+    CONF_FAST_LANE_INTERVAL,
     CONF_PASSIVE,
     CONF_SCAN_INTERVAL,
+    CONF_THROTTLE_DEADBAND,
+    CONF_THROTTLE_MAX_INTERVAL,
+    CONF_THROTTLE_POWER_SENSORS,
     CONF_WARN_CLOCK_DRIFT,
+    DEFAULT_ADAPTIVE_POLLING,
     DEFAULT_BATTERY_DATA_ONLY,
+    DEFAULT_CELL_VECTOR_SENSORS,
+    DEFAULT_FAST_LANE_INTERVAL,
     DEFAULT_PASSIVE,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THROTTLE_DEADBAND,
+    DEFAULT_THROTTLE_MAX_INTERVAL,
+    DEFAULT_THROTTLE_POWER_SENSORS,
     DEFAULT_WARN_CLOCK_DRIFT,
     DOMAIN,
     EXPERIMENTAL_FEATURES,
+    FAST_LANE_INTERVALS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -183,6 +196,18 @@ class GivEnergyLocalOptionsFlow(OptionsFlow):
             # saving preserves its per-cell entities; new entries carry an explicit
             # False from config-flow creation, surfaced via add_suggested_values.
             vol.Required(CONF_EXPOSE_PER_CELL, default=True): bool,
+            vol.Required(CONF_CELL_VECTOR_SENSORS, default=DEFAULT_CELL_VECTOR_SENSORS): bool,
+            vol.Required(CONF_THROTTLE_POWER_SENSORS, default=DEFAULT_THROTTLE_POWER_SENSORS): bool,
+            vol.Required(CONF_THROTTLE_DEADBAND, default=DEFAULT_THROTTLE_DEADBAND): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=1000)
+            ),
+            vol.Required(
+                CONF_THROTTLE_MAX_INTERVAL, default=DEFAULT_THROTTLE_MAX_INTERVAL
+            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+            vol.Required(CONF_ADAPTIVE_POLLING, default=DEFAULT_ADAPTIVE_POLLING): bool,
+            vol.Required(CONF_FAST_LANE_INTERVAL, default=DEFAULT_FAST_LANE_INTERVAL): vol.In(
+                FAST_LANE_INTERVALS
+            ),
         }
         # Surface the collapsed "Experimental features" group only once at least one
         # flag exists, so the header never appears empty (the registry ships empty).
@@ -33,6 +33,37 @@ SYSTEM_TIME_DRIFT_THRESHOLD = timedelta(minutes=10)
 # no option key, so reads fall back to True (preserve their per-cell entities),
 # while new entries get False written explicitly at config-flow creation.
 CONF_EXPOSE_PER_CELL = "expose_per_cell"
+# One recorder-friendly Cell Vector sensor per pack / module: the cell spread as
+# state, every cell voltage and temperature packed into its (recorded)
+# attributes, and no state_class so it stays out of long-term statistics. A
+# single row per tick per pack instead of one per cell. Off by default.
+CONF_CELL_VECTOR_SENSORS = "cell_vector_sensors"
+DEFAULT_CELL_VECTOR_SENSORS = False
+# Apply the per-description publish policies (deadband, minimum interval,
+# heartbeat) of the high-frequency power sensors, so a watt of jitter isn't a
+# recorder row and a websocket message every tick. Off by default: every change
+# publishes. See sensor.PublishPolicy.
+CONF_THROTTLE_POWER_SENSORS = "throttle_power_sensors"
+DEFAULT_THROTTLE_POWER_SENSORS = False
+# Its tuning: the smallest change (W) that publishes straight away, and the
+# heartbeat (s) that publishes the current value whatever it is.
+CONF_THROTTLE_DEADBAND = "throttle_deadband"
+DEFAULT_THROTTLE_DEADBAND = 20
+CONF_THROTTLE_MAX_INTERVAL = "throttle_max_interval"
+DEFAULT_THROTTLE_MAX_INTERVAL = 300
+# Per-bank adaptive IR polling (active mode): inverter power-flow banks stay at
+# every tick while battery-side banks back off while their content is unchanged.
+# Off by default — the historic every-bank refresh() is the proven path. See
+# scheduler.BankScheduler.
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+# Fast lane (active mode): re-read only the inverter's power-flow registers every
+# this many seconds between full ticks, feeding a separate set of Fast power
+# sensors for automations that need 2-5 s updates without polling every bank
+# that often. 0 = off (the default). See GivEnergyUpdateCoordinator.async_fast_poll.
+CONF_FAST_LANE_INTERVAL = "fast_lane_interval"
+DEFAULT_FAST_LANE_INTERVAL = 0
+FAST_LANE_INTERVALS: dict[int, str] = {0: "Off", 2: "2 s", 3: "3 s", 5: "5 s"}
 # Retained only for migrating older config entries — see async_migrate_entry.
 # The current defaults live as constructor defaults on GivEnergyUpdateCoordinator.
 CONF_TIMEOUT_TOLERANCE = "timeout_tolerance"
@@ -48,6 +79,10 @@ SERVICE_CAPTURE_FRAMES = "capture_frames"
 SERVICE_REDETECT_PLANT = "redetect_plant"
 SERVICE_EXPOSE_RECOMMENDED_ENTITIES = "expose_recommended_entities"
 SERVICE_SET_SYSTEM_DATETIME = "set_system_datetime"
+SERVICE_APPLY_SCHEDULE = "apply_schedule"
+SERVICE_GET_CELL_HISTORY = "get_cell_history"
+SERVICE_PIN_CELLS = "pin_cells"
+SERVICE_UNPIN_CELLS = "unpin_cells"
 
 # Curated headline entities for the expose_recommended_entities service.
 # Each value is an entity-description `key` (the suffix portion of unique_id).
@@ -84,7 +119,9 @@ EXPOSE_RECOMMENDED_ENTITY_KEYS = (
 
 # --- Experimental features (opt-in givenergy-modbus client flags) -------------
 # A grouped, collapsed "Experimental features" section in the options flow. Each
-# entry forwards one optional kwarg into Client(...) when its toggle is on.
+# entry forwards one optional kwarg into Client(...) when its toggle is on — or,
+# for an integration-side feature, into GivEnergyUpdateCoordinator(...) instead
+# (set coordinator_kwarg and leave client_kwarg None; no pin bump needed).
 #
 # Adding a feature = ONE entry below + a label in strings.json /
 # translations/en.json under options.step.init.sections.experimental.data, and
@@ -107,14 +144,16 @@ CONF_EXPERIMENTAL = "experimental"
 
 @dataclass(frozen=True)
 class ExperimentalFeature:
-    """One opt-in client flag. The UI toggle is boolean; `client_value` is what
-    gets passed to Client(...) when the toggle is on (True for a bool flag, or a
-    concrete value like a float for a tunable)."""
+    """One opt-in client (or coordinator) flag. The UI toggle is boolean;
+    `client_value` is what gets passed to Client(...) — or the coordinator — when
+    the toggle is on (True for a bool flag, or a concrete value like a float for a
+    tunable)."""
 
     conf_key: str
-    client_kwarg: str
+    client_kwarg: str | None = None
     client_value: Any = True
     default: bool = False  # MUST stay False — enforced by test.
+    coordinator_kwarg: str | None = None
 
 
 EXPERIMENTAL_FEATURES: tuple[ExperimentalFeature, ...] = (
@@ -123,6 +162,10 @@ EXPERIMENTAL_FEATURES: tuple[ExperimentalFeature, ...] = (
         client_kwarg="splice_reject_heal_seconds",
         client_value=300,
     ),
+    ExperimentalFeature(
+        conf_key="pipelined_refresh",
+        coordinator_kwarg="pipelined_refresh",
+    ),
 )
 
 
@@ -141,7 +184,25 @@ def resolve_experimental_client_kwargs(
     return {
         feature.client_kwarg: feature.client_value
         for feature in features
-        if section.get(feature.conf_key, feature.default)
+        if feature.client_kwarg is not None and section.get(feature.conf_key, feature.default)
+    }
+
+
+def resolve_experimental_coordinator_kwargs(
+    options: Mapping[str, Any],
+    features: tuple[ExperimentalFeature, ...] = EXPERIMENTAL_FEATURES,
+) -> dict[str, Any]:
+    """Map enabled integration-side experimental toggles to coordinator kwargs.
+
+    The counterpart of resolve_experimental_client_kwargs for features that
+    change how the coordinator polls rather than how the client behaves; {}
+    when none is enabled.
+    """
+    section = options.get(CONF_EXPERIMENTAL, {}) or {}
+    return {
+        feature.coordinator_kwarg: feature.client_value
+        for feature in features
+        if feature.coordinator_kwarg is not None and section.get(feature.conf_key, feature.default)
     }
 
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable, Iterable
+import time
+from collections.abc import Awaitable, Callable, Collection, Iterable, Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -16,18 +17,36 @@ from givenergy_modbus.exceptions import (
 from givenergy_modbus.model.inverter import SinglePhaseInverter
 from givenergy_modbus.model.inverter_threephase import ThreePhaseInverter
 from givenergy_modbus.model.plant import Plant, PlantCapabilities
-from homeassistant.core import HomeAssistant
+from givenergy_modbus.pdu import (
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
+    TransparentRequest,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .cell_drift import CellDriftTracker
+from .cell_stats import CellHistory, CellStats, compute_cell_stats
 from .const import DOMAIN
+from .domain_scheduler import DomainScheduler
+from .pipeline import PipelinedReader, execute_reads, merge_outcomes
+from .scheduler import BankKey, BankScheduler, bank_requests, refresh_requests
+from .timing import PollTimings
+from .writes import READBACK_MAX_COUNT, WriteQueue, block_ranges
 
 InverterModel = SinglePhaseInverter | ThreePhaseInverter
 
+# One stamped register window on a device: (register type, base, count), as in
+# the keys of Plant.register_block_updated_at minus the device address.
+BlockKey = tuple[str, int, int]
+
 # Invoked after detect() raises PlantTopologyMismatch and the new topology
 # has been accepted on the live client. Receives the freshly-detected
-# capabilities so the caller can persist them and trigger an entry reload —
-# the coordinator itself stays free of HA UI / config-entry concerns.
+# capabilities so the caller can persist them and bring the entities in line
+# (an entity sync, or a reload when the device type changed) — the coordinator
+# itself stays free of HA UI / config-entry concerns.
 TopologyChangedCallback = Callable[[PlantCapabilities], Awaitable[None]]
 
 # Invoked when detect() reports that a previously-known device did NOT respond
@@ -41,7 +60,7 @@ DevicesMissingCallback = Callable[[PlantCapabilities, PlantCapabilities], Awaita
 # capabilities. Lets the caller clear a stale "device missing" repair the
 # moment the device answers again, and reconcile entities against what is now
 # confirmed — a device that answered late never got entities at platform
-# setup, so the caller reloads the entry when the heal reveals one (#148).
+# setup, so the caller schedules an entity sync when the heal reveals one (#148).
 TopologyHealedCallback = Callable[[PlantCapabilities], Awaitable[None]]
 
 _LOGGER = logging.getLogger(__name__)
@@ -57,6 +76,11 @@ _FULL_REFRESH_INTERVAL = 300  # seconds (~5 minutes)
 # flood the log. The cumulative partial_failures counter/sensor is unaffected.
 _PARTIAL_LOG_EVERY = 20
 
+# The inverter fields the fast lane re-reads between full ticks: the power-flow
+# block behind the PV, battery, grid and load power readings. Resolved to input
+# registers per concrete model (single/three-phase) at poll time.
+FAST_LANE_FIELDS = ("p_pv1", "p_pv2", "p_battery", "p_grid_out", "p_load_demand")
+
 
 def _summarize_failures(failures: Iterable[ReadFailure]) -> str:
     """Render dropped reads as e.g. ``IR(60) on device 0x03, HR(2040) on device 0x11``.
@@ -72,6 +96,18 @@ def _summarize_failures(failures: Iterable[ReadFailure]) -> str:
     )
 
 
+def _stamped_blocks(plant: Plant, address: int, reg_type: str) -> list[tuple[int, int]]:
+    """The (base, count) windows of ``address``'s ``reg_type`` registers ``plant`` has read."""
+    stamps = getattr(plant, "register_block_updated_at", None)
+    if not isinstance(stamps, dict):
+        return []
+    return [
+        (base, count)
+        for (block_address, block_type, base, count) in stamps
+        if block_address == address and block_type == reg_type
+    ]
+
+
 # Per-slot probe budget for detect()'s peripheral sweep (batteries, meters).
 # More generous than the library defaults (0.5s / 1 retry) to resist a
 # transiently-quiet BMS being skipped on a noisy bus. NB the library sweep
@@ -99,7 +135,7 @@ def missing_devices(prior: PlantCapabilities | None, actual: PlantCapabilities)
     """Describe devices present in ``prior`` but absent from ``actual``.
 
     An empty list means this is *not* a device loss — a pure add or a
-    ``device_type`` change returns ``[]`` so the routine accept-persist-reload
+    ``device_type`` change returns ``[]`` so the routine accept-persist-sync
     path handles it. A non-empty list means a previously-known device is gone
     (the descriptors double as the repair message), which the caller should
     retry and, if persistent, surface loudly rather than silently bake in.
@@ -138,11 +174,12 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
     Concurrency invariant: detect() must not run while any other request can be
     in flight against the same client. Today this holds naturally — detect only
     runs inside _connect(), which itself runs under HA's coordinator lock and
-    before any entity write path is available. Entity write calls via
-    client.one_shot_command() *can* interleave with regular refresh ticks (HA's
-    lock doesn't cover them), but that's safe: reads and writes have orthogonal
-    shape hashes, the tx_queue serialises bytes onto the wire, and the consumer
-    demuxes responses by shape hash. Moving detect onto a hot path would break
+    before any entity write path is available. Entity writes (batched through
+    the WriteQueue into client.one_shot_command(), plus their read-backs) *can*
+    interleave with regular refresh ticks (HA's lock doesn't cover them), but
+    that's safe: reads and writes have orthogonal shape hashes, the tx_queue
+    serialises bytes onto the wire, and the consumer demuxes responses by shape
+    hash. Moving detect onto a hot path would break
     the invariant and need a per-client lock around detect and capability
     mutation.
     """
@@ -157,6 +194,10 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         experimental_client_kwargs: dict[str, Any] | None = None,
         timeout_tolerance: int = 3,
         retries: int = 1,
+        adaptive_polling: bool = False,
+        pipelined_refresh: bool = False,
+        fast_lane_interval: float = 0,
+        scheduler: DomainScheduler | None = None,
         prior_capabilities: PlantCapabilities | None = None,
         on_topology_changed: TopologyChangedCallback | None = None,
         on_devices_missing: DevicesMissingCallback | None = None,
@@ -184,6 +225,10 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         self._on_topology_changed = on_topology_changed
         self._on_devices_missing = on_devices_missing
         self._on_topology_healed = on_topology_healed
+        # Shared across the domain's config entries (poll stagger, detect
+        # budget, one poll per endpoint); a standalone coordinator gets its own,
+        # which never waits.
+        self.scheduler = scheduler if scheduler is not None else DomainScheduler()
         self._client: Client | None = None
         self._schedule_reconnect: bool = False
         self._loss_redetect_after: float = 0.0
@@ -229,12 +274,101 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         self._unchanged_ticks: int = 0
         self._active_tick: int = 0
         self._full_refresh_every: int = max(1, round(_FULL_REFRESH_INTERVAL / scan_interval))
+        # Opt-in per-bank IR scheduling (active mode only — a passive coordinator
+        # never solicits reads). None keeps the historic every-bank refresh().
+        self.bank_scheduler: BankScheduler | None = (
+            BankScheduler(scan_interval) if adaptive_polling and not passive else None
+        )
+        # Opt-in (experimental) pipelined reads, active mode only: a full tick's
+        # HR batch and IR banks go out together, the IR banks through a bounded
+        # window of in-flight requests with per-device latency histograms.
+        self.pipeline: PipelinedReader | None = (
+            PipelinedReader() if pipelined_refresh and not passive else None
+        )
+        # Change-driven entity writes: a per-device snapshot of the register
+        # caches as of the previous listener fan-out, and the set of device
+        # addresses whose registers differ from it this tick (None = unknown,
+        # treat every device as changed). Plant-data entities consult it to skip
+        # an async_write_ha_state whose state could not have moved.
+        self._register_snapshot: dict[int, dict[Any, Any]] = {}
+        self._snapshot_capabilities: PlantCapabilities | None = None
+        self.changed_devices: frozenset[int] | None = None
+        # State writes skipped because nothing an entity exposes had changed:
+        # cumulative (monotonic, like total_failures) and for the last fan-out.
+        self.suppressed_writes: int = 0
+        self.last_tick_suppressed_writes: int = 0
+        self._tick_suppressed_writes: int = 0
+        # Of those, the writes a sensor's publish policy held back (a change
+        # inside its deadband), cumulative.
+        self.throttled_writes: int = 0
+        # Bumped on every listener fan-out; per-tick caches on the entity side
+        # (the sensor value vector) key off it to know when to re-evaluate.
+        self.update_generation: int = 0
+        # Cell readings and aggregates per pack / module (keyed by serial), built
+        # once per successful refresh for the roll-up sensors, the out-of-spec
+        # alert and the heatmap. Left as-is by a failed tick (last-known data).
+        self.cell_stats: dict[str, CellStats] = {}
+        # The recent snapshots behind the get_cell_history service, and the
+        # unique_ids of the individual per-cell entities the user pinned (the
+        # only ones created while per-cell exposure is off; loaded by setup).
+        self.cell_history = CellHistory()
+        self.pinned_cells: set[str] = set()
+        # Long-term per-cell drift statistics behind the Worst Cells sensors;
+        # replaced by the persisted tracker at setup, saved with the snapshot.
+        self.cell_drift = CellDriftTracker()
+        # Seconds since each stamped register window was committed, per device
+        # ({address: {block: age}}), as of the last fan-out. None until the data
+        # is a real Plant. block_layout_version moves only when the set of
+        # stamped windows does, so entities can cache which blocks back them.
+        self.block_ages: dict[int, dict[BlockKey, float]] | None = None
+        self.block_layout_version: int = 0
+        self._block_layout: frozenset[tuple[int, str, int, int]] = frozenset()
+        # Rolling per-phase (connect, detect, load_config, refresh, fan_out,
+        # tick) and per-device poll timings, for the p50/p95/p99 diagnostic
+        # sensors and the diagnostics download. _tick_started is the wall time
+        # the current tick began, against which each device's bank commits are
+        # measured.
+        self.timings = PollTimings()
+        self._tick_started: datetime | None = None
+        # When self.data is a warm-start snapshot rather than a live poll: the
+        # time the snapshot was saved. Cleared by the first live success.
+        self.warm_start_from: datetime | None = None
+        # Entity writes, batched within a short window and confirmed by a
+        # read-back of just the written registers (see writes.py).
+        self.writes = WriteQueue(self)
+        # The platforms' entity-set syncs (see entity_sync.py), and the sync
+        # waiting for the next clean live fan-out: None when none is pending,
+        # else whether it may retire entities (an accepted topology change).
+        self._entity_syncs: list[Callable[[bool], None]] = []
+        self._entity_retires: list[Callable[[Collection[str]], None]] = []
+        self._pending_entity_sync: bool | None = None
+        # Opt-in fast lane (active mode only): between full ticks, re-read just
+        # the power-flow registers (FAST_LANE_FIELDS) every fast_lane_interval
+        # seconds and notify only the fast-lane listeners. 0 = off. The timer
+        # runs while at least one listener is subscribed.
+        self.fast_lane_interval: float = fast_lane_interval if not passive else 0
+        self._fast_lane_listeners: list[CALLBACK_TYPE] = []
+        self._fast_lane_unsub: CALLBACK_TYPE | None = None
+        self._fast_lane_busy: bool = False
+        self.fast_lane_polls: int = 0
+        self.fast_lane_failures: int = 0
+        self.last_fast_lane_poll: datetime | None = None
 
     # ------------------------------------------------------------------
     # DataUpdateCoordinator entry point
     # ------------------------------------------------------------------
 
     async def _async_update_data(self) -> Plant:
+        if self.passive and self._client is not None and self._client.connected:
+            # A passive tick only reads the cache a peer keeps fresh: no bus
+            # traffic of ours to stagger.
+            return await self._poll()
+        async with self.scheduler.poll_slot(self.host, self.port):
+            return await self._poll()
+
+    async def _poll(self) -> Plant:
+        self._tick_started = dt_util.utcnow()
+        tick_started = time.monotonic()
         try:
             loop = asyncio.get_running_loop()
             if self._schedule_reconnect and loop.time() >= self._loss_redetect_after:
@@ -268,7 +402,9 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
             return plant
         except RefreshPartiallySucceeded as exc:
             if reconnecting:
-                if self.data is None and exc.plant.inverter_serial_number:
+                if (
+                    self.data is None or self.warm_start_from is not None
+                ) and exc.plant.inverter_serial_number:
                     # Cold start with an identified inverter: serve the partial so
                     # the integration *loads* (the failed reads' entities go
                     # unavailable — a structurally-absent block like AC-config on a
@@ -277,7 +413,8 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
                     # later poll reads them. _record_partial sets
                     # last_partial_failures, which also blocks the cold-start
                     # capabilities persist in __init__ — never commit a degraded
-                    # topology to disk.
+                    # topology to disk. A warm start (serving a snapshot) counts
+                    # as cold here: live partial data beats the snapshot.
                     self._record_partial(exc)
                     self._mark_success(exc.plant)
                     return exc.plant
@@ -324,6 +461,346 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
             raise UpdateFailed(
                 f"Error communicating with inverter: {str(err) or type(err).__name__}"
             ) from err
+        finally:
+            self.timings.phases.record("tick", time.monotonic() - tick_started)
+
+    @callback
+    def seed_from_snapshot(self, plant: Plant, saved_at: datetime) -> None:
+        """Serve a persisted snapshot as this coordinator's data until a live poll lands.
+
+        Lets setup enumerate entities without waiting on connect/detect. The
+        snapshot's block stamps are its real ages, so the stale-IR gate applies
+        to it as to any other last-known data. last_successful_refresh is left
+        untouched: nothing has been read from the inverter yet.
+        """
+        self.warm_start_from = saved_at
+        self.async_set_updated_data(plant)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Settle optimistic writes, diff the register caches, then fan out to the entities.
+
+        The diff (and the cell statistics snapshot) run once per fan-out so each
+        entity reads shared results rather than re-walking the Plant itself.
+        """
+        self.update_generation += 1
+        # A write settles only against a read this tick issued after it landed.
+        settled = self.writes.overlay.reconcile(self.data, self._tick_started)
+        self.changed_devices = self._diff_register_caches()
+        if settled is not None and self.changed_devices is not None:
+            # Dropping a write's layer changes what its controls show even when
+            # the registers underneath didn't move.
+            self.changed_devices |= {settled}
+        self.block_ages = self._block_age_table()
+        if self.last_update_success and self.data is not None:
+            self.cell_stats = compute_cell_stats(self.data)
+            if self.last_successful_refresh is not None:
+                self.cell_history.record(self.last_successful_refresh, self.cell_stats)
+                self.cell_drift.record(
+                    dt_util.as_local(self.last_successful_refresh), self.cell_stats
+                )
+        self._tick_suppressed_writes = 0
+        with self.timings.phases.measure("fan_out"):
+            super().async_update_listeners()
+        self.last_tick_suppressed_writes = self._tick_suppressed_writes
+        self._run_pending_entity_sync()
+
+    @callback
+    def async_add_entity_sync(
+        self,
+        sync: Callable[[bool], None],
+        retire: Callable[[Collection[str]], None] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Register a platform's entity-set sync; returns the unsubscribe callback.
+
+        ``retire``, if given, is the platform's targeted retire (see
+        async_retire_entities).
+        """
+        self._entity_syncs.append(sync)
+        if retire is not None:
+            self._entity_retires.append(retire)
+
+        @callback
+        def remove() -> None:
+            self._entity_syncs.remove(sync)
+            if retire is not None:
+                self._entity_retires.remove(retire)
+
+        return remove
+
+    @callback
+    def async_retire_entities(self, unique_ids: Collection[str]) -> None:
+        """Retire just these entities, where the platforms no longer enumerate them.
+
+        For an option-driven removal (an unpinned cell) rather than a topology
+        change: the devices are all still there, so nothing else is retired —
+        unlike a retiring sync, which would also take a device that is merely
+        missing from the latest poll.
+        """
+        for retire in list(self._entity_retires):
+            retire(unique_ids)
+
+    @callback
+    def async_schedule_entity_sync(self, *, retire: bool) -> None:
+        """Re-enumerate the platforms' entities after the next clean live poll.
+
+        The topology is known as soon as detect() returns, but a new device's
+        serial and telemetry — which its entities are built from — only after a
+        poll has read it, so the sync waits for a fan-out of live data from a
+        poll with no failed reads. A pending retiring sync stays retiring.
+        """
+        self._pending_entity_sync = retire or bool(self._pending_entity_sync)
+
+    @callback
+    def _run_pending_entity_sync(self) -> None:
+        retire = self._pending_entity_sync
+        if (
+            retire is None
+            or not self.last_update_success
+            or self.warm_start_from is not None
+            or self.consecutive_failures
+            or self._consecutive_partials
+        ):
+            return
+        self._pending_entity_sync = None
+        for sync in list(self._entity_syncs):
+            sync(retire)
+
+    @callback
+    def async_add_fast_lane_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Subscribe to fast-lane polls; the first subscriber starts the timer.
+
+        Returns the unsubscribe callback; the last one to leave stops it.
+        """
+        self._fast_lane_listeners.append(update_callback)
+        if self._fast_lane_unsub is None and self.fast_lane_interval:
+            self._fast_lane_unsub = async_track_time_interval(
+                self.hass,
+                self._async_fast_lane_tick,
+                timedelta(seconds=self.fast_lane_interval),
+                name=f"{DOMAIN} fast lane {self.host}",
+                cancel_on_shutdown=True,
+            )
+
+        @callback
+        def remove() -> None:
+            self._fast_lane_listeners.remove(update_callback)
+            if not self._fast_lane_listeners and self._fast_lane_unsub is not None:
+                self._fast_lane_unsub()
+                self._fast_lane_unsub = None
+
+        return remove
+
+    @callback
+    def _async_fast_lane_tick(self, _now: datetime) -> None:
+        if self._fast_lane_busy:
+            # The previous fast poll is still waiting on the bus: don't queue
+            # another behind it.
+            return
+        self.hass.async_create_background_task(
+            self.async_fast_poll(), name=f"{DOMAIN} fast lane poll {self.host}"
+        )
+
+    def fast_lane_ranges(self, plant: Plant) -> list[tuple[int, int]]:
+        """The (base, count) input-register runs backing FAST_LANE_FIELDS on ``plant``'s inverter.
+
+        Resolved through the concrete model's registers_of(), so a three-phase
+        inverter reads its own layout; fields it computes rather than reads
+        contribute nothing. Unlike a read-back, any gap inside one block is read
+        through: the whole power-flow block is a single round trip. Runs inside
+        a bank the full tick already reads widen to that bank (see block_ranges).
+        """
+        getter = getattr(type(plant.inverter), "REGISTER_GETTER", None)
+        if getter is None:
+            return []
+        capabilities = getattr(plant, "capabilities", None)
+        address = capabilities.inverter_address if capabilities is not None else 0x11
+        return block_ranges(
+            (
+                register.index
+                for field in FAST_LANE_FIELDS
+                for register in getter.registers_of(field)
+                if register.reg_type == "IR"
+            ),
+            _stamped_blocks(plant, address, "IR"),
+            max_gap=READBACK_MAX_COUNT,
+        )
+
+    async def async_fast_poll(self) -> bool:
+        """Re-read the power-flow registers and notify the fast-lane listeners.
+
+        A handful of input registers in one or two round trips, independent of
+        the full tick: like a read-back, the responses land in the register
+        cache behind ``self.data``, but only the fast-lane entities are told —
+        no register diff, cell statistics or full fan-out. Interleaving with a
+        full tick is safe for the same reasons as a read-back (see the class
+        docstring). Returns False, leaving the entities on their last values,
+        when there's no live Plant to patch or the read failed.
+        """
+        client = self._client
+        if client is None or not client.connected or self.data is not client.plant:
+            return False
+        capabilities = client.plant.capabilities
+        address = capabilities.inverter_address if capabilities is not None else 0x11
+        requests = [
+            ReadInputRegistersRequest(
+                base_register=base, register_count=count, device_address=address
+            )
+            for base, count in self.fast_lane_ranges(client.plant)
+        ]
+        if not requests:
+            return False
+        self._fast_lane_busy = True
+        try:
+            await self._timed("fast_lane", self._execute_reads(requests))
+        except (RefreshPartiallySucceeded, RefreshFailed) as exc:
+            self.fast_lane_failures += 1
+            _LOGGER.debug("Fast-lane read of %d register run(s) failed: %s", len(requests), exc)
+            return False
+        finally:
+            self._fast_lane_busy = False
+        self.fast_lane_polls += 1
+        self.last_fast_lane_poll = dt_util.utcnow()
+        for update_callback in list(self._fast_lane_listeners):
+            update_callback()
+        return True
+
+    async def async_read_back(self, registers: Iterable[int]) -> bool:
+        """Re-read the inverter's holding ``registers`` and notify the entities they back.
+
+        The control-write counterpart of a refresh: only the blocks holding the
+        given registers are read (see block_ranges), so confirming a write costs
+        one round trip instead of a full tick over every device. The responses land in the
+        register cache behind ``self.data``, then fan out through
+        _async_update_listeners_for. Returns False, leaving the caller to fall
+        back on a refresh, when there's no live Plant to patch or a read failed.
+        """
+        client = self._client
+        if client is None or not client.connected or self.data is not client.plant:
+            # Nothing polled yet, or self.data is still a warm-start snapshot:
+            # reads would land in a Plant the entities aren't looking at.
+            return False
+        capabilities = client.plant.capabilities
+        address = capabilities.inverter_address if capabilities is not None else 0x11
+        requests = [
+            ReadHoldingRegistersRequest(
+                base_register=base, register_count=count, device_address=address
+            )
+            for base, count in block_ranges(registers, _stamped_blocks(client.plant, address, "HR"))
+        ]
+        if not requests:
+            return True
+        issued_at = dt_util.utcnow()
+        try:
+            await self._timed("read_back", self._execute_reads(requests))
+        except (RefreshPartiallySucceeded, RefreshFailed) as exc:
+            _LOGGER.debug("Read-back of %d register run(s) failed: %s", len(requests), exc)
+            return False
+        self._async_update_listeners_for(address, issued_at)
+        return True
+
+    @property
+    def displayed_inverter(self) -> SinglePhaseInverter | ThreePhaseInverter:
+        """The inverter model the controls show: the polled registers with any
+        written-but-unconfirmed values laid on top (see OptimisticOverlay)."""
+        return self.writes.overlay.inverter(self.data)
+
+    @callback
+    def _async_update_listeners_for(self, address: int, issued_at: datetime | None = None) -> None:
+        """Fan out a read-back, or an optimistic write, of ``address``'s holding registers.
+
+        Like async_update_listeners, but scoped to ``address``: only its register
+        snapshot is re-taken and only it is reported changed, so every
+        change-gated entity of another device skips its write. A tick in flight
+        may already have patched other devices' caches; their snapshots are left
+        alone, and the tick's own fan-out still sees those changes. The cell
+        statistics are not rebuilt, and the pass is not sampled as a poll fan-out.
+        ``issued_at`` is when the read-back behind it was sent; None for an
+        optimistic write, which read nothing and so settles nothing.
+        """
+        self.update_generation += 1
+        self.writes.overlay.reconcile(self.data, issued_at)
+        self.changed_devices = self._diff_device(address)
+        self.block_ages = self._block_age_table()
+        super().async_update_listeners()
+
+    def _diff_device(self, address: int) -> frozenset[int] | None:
+        """Re-snapshot ``address``'s register cache alone and report it changed.
+
+        None, as for a full fan-out, when the data isn't a Plant with real
+        register caches or the capabilities were replaced since the last one —
+        that fan-out then owns re-taking the whole snapshot.
+        """
+        caches = getattr(self.data, "register_caches", None)
+        if (
+            not isinstance(caches, dict)
+            or self.data.capabilities is not self._snapshot_capabilities
+        ):
+            return None
+        cache = caches.get(address)
+        if cache is None:
+            return frozenset()
+        self._register_snapshot[address] = dict(cache)
+        return frozenset({address})
+
+    def _diff_register_caches(self) -> frozenset[int] | None:
+        """Return the addresses whose register values changed since the last fan-out.
+
+        A device that appeared or vanished counts as changed. None when the data
+        isn't a Plant with real register caches (no data yet, or a test double)
+        or the capabilities were replaced since the last fan-out.
+        """
+        caches = getattr(self.data, "register_caches", None)
+        if not isinstance(caches, dict):
+            self._register_snapshot = {}
+            self._snapshot_capabilities = None
+            return None
+        snapshot = {addr: dict(cache) for addr, cache in caches.items()}
+        previous = self._register_snapshot
+        self._register_snapshot = snapshot
+        capabilities = self.data.capabilities
+        if capabilities is not self._snapshot_capabilities:
+            # A re-detected topology can re-map an entity's index to another
+            # address, so nothing is known to be unchanged on this tick.
+            self._snapshot_capabilities = capabilities
+            return None
+        return frozenset(
+            addr
+            for addr in snapshot.keys() | previous.keys()
+            if snapshot.get(addr) != previous.get(addr)
+        )
+
+    def _block_age_table(self) -> dict[int, dict[BlockKey, float]] | None:
+        """Age every stamped register window once, grouped by device address.
+
+        The stale-IR gate of every plant-data sensor reads its banks' ages off
+        this table instead of scanning Plant.register_age() per register per
+        ``available`` read. None when the data isn't a Plant (no data yet, or a
+        test double).
+        """
+        stamps = getattr(self.data, "register_block_updated_at", None)
+        if not isinstance(stamps, dict):
+            return None
+        if stamps.keys() != self._block_layout:
+            self._block_layout = frozenset(stamps)
+            self.block_layout_version += 1
+        now = dt_util.utcnow()
+        table: dict[int, dict[BlockKey, float]] = {}
+        for (address, reg_type, base, count), stamped in stamps.items():
+            table.setdefault(address, {})[(reg_type, base, count)] = (now - stamped).total_seconds()
+        return table
+
+    def device_unchanged(self, device_address: int | None) -> bool:
+        """True if ``device_address``'s registers are known not to have moved this tick."""
+        changed = self.changed_devices
+        return changed is not None and device_address is not None and device_address not in changed
+
+    def record_suppressed_write(self, *, throttled: bool = False) -> None:
+        """Count one entity state write skipped as a no-op (or held back by a publish policy)."""
+        self.suppressed_writes += 1
+        self._tick_suppressed_writes += 1
+        if throttled:
+            self.throttled_writes += 1
 
     # ------------------------------------------------------------------
     # Failure / success bookkeeping
@@ -334,7 +811,11 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         self._last_inverter_time = plant.inverter.system_time
         self.last_successful_refresh = dt_util.utcnow()
         self.consecutive_failures = 0
+        self.warm_start_from = None
         self._accumulate_comms_counters(plant)
+        stamps = getattr(plant, "register_block_updated_at", None)
+        if isinstance(stamps, dict) and self._tick_started is not None:
+            self.timings.record_device_commits(stamps, self._tick_started)
 
     # (library Plant attr, our per-device cumulative dict attr)
     _COMMS_COUNTER_SOURCES = (
@@ -452,29 +933,104 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
 
         Holding registers (config, charge slots, …) are re-read only every
         _full_refresh_every ticks; input registers (real-time data) are read
-        every tick.
+        every tick — or, with adaptive polling on, per bank as the scheduler
+        decides (see _scheduled_refresh).
 
         Raises RefreshPartiallySucceeded / RefreshFailed straight up to
-        _async_update_data, which owns the seed-vs-steady-state policy (it's the
+        _poll, which owns the seed-vs-steady-state policy (it's the
         only caller that knows whether this tick is a reconnect seed).
         """
-        assert self._client is not None  # _async_update_data ensures this
+        assert self._client is not None  # _poll ensures this
         full_refresh = self._active_tick % self._full_refresh_every == 0
         self._active_tick += 1
+        if full_refresh and self.pipeline is not None:
+            # Don't wait for the HR batch to drain before queueing the IR banks;
+            # the failures of both are pooled into one poll outcome.
+            outcomes = await asyncio.gather(
+                self._timed("load_config", self._client.load_config(retries=self.retries)),
+                self._timed("refresh", self._read_measurements()),
+                return_exceptions=True,
+            )
+            return merge_outcomes(self._client.plant, outcomes)
         if full_refresh:
-            await self._client.load_config(retries=self.retries)
+            await self._timed("load_config", self._client.load_config(retries=self.retries))
+        return await self._timed("refresh", self._read_measurements())
+
+    async def _timed[T](self, phase: str, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable``, recording its wall time (failed or not) under ``phase``."""
+        with self.timings.phases.measure(phase):
+            return await awaitable
+
+    async def _read_measurements(self) -> Plant:
+        """Read this tick's IR banks: scheduled, pipelined, or the client's refresh()."""
+        assert self._client is not None  # _active_update ensures this
+        if self.bank_scheduler is not None:
+            return await self._scheduled_refresh(self.bank_scheduler)
+        plant = self._client.plant
+        if self.pipeline is not None and plant.capabilities is not None:
+            # The same request list refresh() builds (absent banks skipped).
+            return await self._execute_reads(refresh_requests(plant))
         return await self._client.refresh(retries=self.retries)
 
+    async def _execute_reads(self, requests: Sequence[TransparentRequest]) -> Plant:
+        """Run a batch of register reads through the pipeline if enabled, else the client.
+
+        The timeout/retry_delay mirror refresh()'s defaults (tuned for a
+        contended bus, #132).
+        """
+        assert self._client is not None  # callers ensure this
+        client = self._client
+        if self.pipeline is not None:
+            return await self.pipeline.execute(
+                client, list(requests), timeout=2.0, retries=self.retries, retry_delay=0.5
+            )
+        return await execute_reads(
+            client, list(requests), timeout=2.0, retries=self.retries, retry_delay=0.5
+        )
+
+    async def _scheduled_refresh(self, scheduler: BankScheduler) -> Plant:
+        """Read only the IR banks the scheduler says are due this tick.
+
+        The adaptive-polling counterpart of ``Client.refresh()``: same banks, same
+        read budget and the same partial/total failure signalling (via
+        execute_reads), but a bank whose content has been holding steady is
+        deferred for a few ticks — its last-known values ride along in the
+        cache meanwhile. The outcome (including which banks failed) is fed back so
+        the scheduler can adapt each bank's cadence.
+        """
+        assert self._client is not None  # _active_update ensures this
+        client = self._client
+        plant = client.plant
+        if plant.capabilities is None:
+            # Let the library raise its own PlantNotDetected, as refresh() would.
+            return await client.refresh(retries=self.retries)
+        due = scheduler.due(plant)
+        requests = bank_requests(due)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        failed: set[BankKey] = set()
+        try:
+            await self._execute_reads(requests)
+        except (RefreshPartiallySucceeded, RefreshFailed) as exc:
+            failed = {(f.device_address, f.base_register, f.register_count) for f in exc.failures}
+            raise
+        finally:
+            now = loop.time()
+            scheduler.record(
+                plant, due, failed, elapsed=now - started, now=now, now_wall=dt_util.utcnow()
+            )
+        return plant
+
     async def _passive_update(self, reconnecting: bool) -> Plant:
         """Seed the cache on (re)connect; on subsequent ticks read the cached plant.
 
         The library's register cache is kept fresh by a peer client on the
         shared Modbus bus.  Raises UpdateFailed if the cache appears frozen.
         """
-        assert self._client is not None  # _async_update_data ensures this
+        assert self._client is not None  # _poll ensures this
         if reconnecting:
-            await self._client.load_config(retries=self.retries)
-            return await self._client.refresh(retries=self.retries)
+            await self._timed("load_config", self._client.load_config(retries=self.retries))
+            return await self._timed("refresh", self._client.refresh(retries=self.retries))
 
         plant = self._client.plant
         self._check_cache_freshness(plant)
@@ -512,9 +1068,9 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         full peripheral-probe sweep when the topology hasn't changed since the
         last process startup. On `PlantTopologyMismatch` the new topology is
         accepted on the live client and the caller-provided callback is
-        invoked to persist it and schedule a reload — the reload is needed
-        because entity counts (notably batteries) are frozen at platform
-        setup time.
+        invoked to persist it and bring the entity set in line with it —
+        entities are enumerated per device at platform setup, so new devices
+        need a sync (or, for a device-type change, a reload) to appear.
 
         detect() populates plant.capabilities, which makes subsequent
         refresh_plant() calls dispatch via model-aware load_config()/refresh()
@@ -528,7 +1084,7 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         # would be mistaken for monotonic growth and undercounted.
         self._comms_last_seen.clear()
         try:
-            await self._client.connect()
+            await self._timed("connect", self._client.connect())
             topology_confirmed = True
             try:
                 # The library's battery sweep probes each pack slot (0x33-0x37)
@@ -539,11 +1095,15 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
                 # silently vanished after a reconnect this way) — so we pass a more
                 # generous per-slot budget (see PROBE_* above) as insurance against
                 # dropping a real pack on a noisy bus.
-                await self._client.detect(
-                    prior=self._prior_capabilities,
-                    probe_timeout=PROBE_TIMEOUT_SECONDS,
-                    probe_retries=PROBE_RETRIES,
-                )
+                async with self.scheduler.detect_slot():
+                    await self._timed(
+                        "detect",
+                        self._client.detect(
+                            prior=self._prior_capabilities,
+                            probe_timeout=PROBE_TIMEOUT_SECONDS,
+                            probe_retries=PROBE_RETRIES,
+                        ),
+                    )
             except PlantTopologyMismatch as exc:
                 topology_confirmed = await self._handle_topology_mismatch(exc)
             if self._client is None:
@@ -575,6 +1135,9 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
             self._last_inverter_time = None
             self._unchanged_ticks = 0
             self._active_tick = 0
+            if self.bank_scheduler is not None:
+                # Fresh Client, fresh Plant: nothing is cached, so every bank is due.
+                self.bank_scheduler.reset()
             _LOGGER.info("Connected to inverter at %s:%s", self.host, self.port)
         except BaseException:
             # connect()/detect() failed before capabilities were established (a
@@ -594,7 +1157,7 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
         Returns True only when the full expected topology is confirmed (a loss
         that healed on retry) so the caller can clear a stale repair. Returns
         False for a persistent loss (surfaced via on_devices_missing, prior kept)
-        and for a routine add / device_type change (accepted, persisted, reloaded
+        and for a routine add / device_type change (accepted, persisted, synced
         via on_topology_changed).
         """
         assert self._client is not None  # _connect set it before calling
@@ -623,11 +1186,12 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
                     )
                     return False
                 try:
-                    await self._client.detect(
-                        prior=self._prior_capabilities,
-                        probe_timeout=PROBE_TIMEOUT_SECONDS,
-                        probe_retries=PROBE_RETRIES,
-                    )
+                    async with self.scheduler.detect_slot():
+                        await self._client.detect(
+                            prior=self._prior_capabilities,
+                            probe_timeout=PROBE_TIMEOUT_SECONDS,
+                            probe_retries=PROBE_RETRIES,
+                        )
                 except PlantTopologyMismatch as retry_exc:
                     # A retry can surface a *different* mismatch (e.g. an add now);
                     # re-classify against this retry's prior/actual.
@@ -668,17 +1232,17 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
                 await self._on_devices_missing(exc.prior, exc.actual)
             return False
 
-        # Not (or no longer) a loss: routine add / device_type change. Preserve
-        # the existing behaviour — accept, persist, and reload via the callback.
+        # Not (or no longer) a loss: routine add / device_type change. Accept
+        # it, and let the callback persist it and sync (or reload) the entities.
         _LOGGER.warning(
             "Plant topology has changed since last seen — accepting new layout "
-            "(prior=%r, actual=%r); a reload will refresh entity counts",
+            "(prior=%r, actual=%r); entities will follow after the next poll",
             exc.prior,
             exc.actual,
         )
         # Library leaves plant.capabilities=None on mismatch; assign so this
         # tick's refresh_plant() still dispatches correctly using the new
-        # topology before the reload tears things down.
+        # topology (whose poll the entity sync then enumerates from).
         self._client.plant.capabilities = exc.actual
         self._prior_capabilities = exc.actual
         if self._on_topology_changed is not None:
@@ -701,4 +1265,5 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
                 self._client = None
 
     async def async_close(self) -> None:
+        await self.writes.async_close()
         await self._reset_client()
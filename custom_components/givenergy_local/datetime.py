@@ -91,5 +91,4 @@ class GivEnergyDateTimeEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Dat
             return
         # HA passes a timezone-aware datetime; the inverter clock is local wall-clock,
         # matching what the set_system_datetime service writes (it passes dt_util.now()).
-        await client.one_shot_command(commands.set_system_date_time(dt_util.as_local(value)))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(commands.set_system_date_time(dt_util.as_local(value)))
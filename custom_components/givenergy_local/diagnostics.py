@@ -0,0 +1,91 @@
+"""Config entry diagnostics download: poll timing and comms health.
+
+Carries the coordinator's rolling per-phase / per-device poll timings (the
+same p50/p95/p99 the Poll Duration sensors show, plus the latest sample and
+sample count), the failure and comms-quality counters, the entity write
+queue's batching counters, and — when those experimental options are on — the
+pipelined reader's latency histograms and the adaptive bank schedule. The host
+is redacted; no register data is included (a wire capture is the tool for
+that — see http.py).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import GivEnergyUpdateCoordinator
+
+TO_REDACT = {CONF_HOST}
+
+
+def _by_device(counts: dict[int, int]) -> dict[str, int]:
+    return {f"0x{address:02x}": count for address, count in sorted(counts.items())}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GivEnergyUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+    }
+    if coordinator is None:
+        return diagnostics
+
+    last_refresh = coordinator.last_successful_refresh
+    diagnostics["poll"] = {
+        "passive": coordinator.passive,
+        "scan_interval_seconds": coordinator.update_interval.total_seconds()
+        if coordinator.update_interval is not None
+        else None,
+        "last_successful_refresh": last_refresh.isoformat() if last_refresh else None,
+        "warm_start_from": coordinator.warm_start_from.isoformat()
+        if coordinator.warm_start_from
+        else None,
+        "timings": coordinator.timings.as_dict(),
+        "scheduler": coordinator.scheduler.as_dict(),
+    }
+    diagnostics["failures"] = {
+        "consecutive": coordinator.consecutive_failures,
+        "total": coordinator.total_failures,
+        "partial": coordinator.partial_failures,
+        "last_partial_devices": sorted(
+            {f"0x{f.device_address:02x}" for f in coordinator.last_partial_failures}
+        ),
+    }
+    diagnostics["comms"] = {
+        "crc_failures": _by_device(coordinator.crc_failures_by_device),
+        "splice_rejections": _by_device(coordinator.splice_rejections_by_device),
+        "splice_holds": _by_device(coordinator.splice_holds_by_device),
+        "read_retries": _by_device(coordinator.read_retries_by_device),
+        "cold_start_holds": _by_device(coordinator.cold_start_held_by_device),
+    }
+    diagnostics["writes"] = coordinator.writes.as_dict()
+    if coordinator.pipeline is not None:
+        diagnostics["pipeline"] = {
+            "latency": {
+                f"0x{address:02x}": histogram.as_dict()
+                for address, histogram in sorted(coordinator.pipeline.latency.items())
+            },
+        }
+    if coordinator.bank_scheduler is not None:
+        scheduler = coordinator.bank_scheduler
+        diagnostics["bank_schedule"] = {
+            bank.label(): {
+                "interval_ticks": bank.interval_ticks,
+                "polls": bank.polls,
+                "skipped": bank.skipped,
+            }
+            for bank in scheduler.banks
+        }
+    return diagnostics
@@ -0,0 +1,96 @@
+"""Domain-wide poll scheduling shared by every config entry's coordinator.
+
+Each entry runs its own coordinator and Client, and HA schedules every
+coordinator's refresh on the same whole-second grid — so on a multi-inverter
+(or inverter + EMS / gateway) site every dongle is hit in the same second each
+scan interval, and a restart runs every entry's cold detect() sweep at once.
+The scheduler is shared through ``hass.data`` and gives the coordinators three
+things:
+
+* **Staggered polls.** Poll starts are spaced at least ``POLL_STAGGER_SECONDS``
+  apart across entries. HA re-arms each coordinator's timer from the end of its
+  previous refresh, so once spread the phases stay spread.
+* **A detect budget.** At most ``MAX_CONCURRENT_DETECTS`` topology sweeps run at
+  once. A sweep is the slowest, most bus-heavy thing the integration does.
+* **One poll per endpoint.** Entries that reach the same ``host:port`` never
+  have two polls in flight on it at once. The config flow keys entries by
+  inverter serial, so this is the reload / re-IP overlap case rather than
+  two plants on one socket.
+
+With a single registered entry none of this waits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+# Minimum gap between two entries' poll starts (seconds).
+POLL_STAGGER_SECONDS = 2.0
+
+# Topology sweeps allowed to run at once across the whole domain.
+MAX_CONCURRENT_DETECTS = 1
+
+
+class DomainScheduler:
+    """Staggers polls and budgets detect sweeps across config entries."""
+
+    def __init__(
+        self,
+        stagger: float = POLL_STAGGER_SECONDS,
+        max_concurrent_detects: int = MAX_CONCURRENT_DETECTS,
+    ) -> None:
+        self.stagger = stagger
+        self._entries: set[str] = set()
+        self._next_poll_at = 0.0
+        self._endpoint_locks: dict[tuple[str, int], asyncio.Lock] = {}
+        self._detect_slots = asyncio.Semaphore(max(1, max_concurrent_detects))
+        self.staggered_polls = 0
+        self.stagger_seconds = 0.0
+        self.detect_waits = 0
+
+    def register(self, entry_id: str) -> Callable[[], None]:
+        """Count ``entry_id`` towards the stagger; returns the matching unregister."""
+        self._entries.add(entry_id)
+        return lambda: self._entries.discard(entry_id)
+
+    @property
+    def entries(self) -> int:
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def poll_slot(self, host: str, port: int) -> AsyncIterator[None]:
+        """Hold a poll of ``host:port``: after its stagger slot, alone on that endpoint."""
+        lock = self._endpoint_locks.setdefault((host, port), asyncio.Lock())
+        async with lock:
+            if len(self._entries) > 1:
+                loop = asyncio.get_running_loop()
+                now = loop.time()
+                # Reserve the slot before sleeping so concurrent callers queue
+                # behind it rather than all computing the same start.
+                start = max(now, self._next_poll_at)
+                self._next_poll_at = start + self.stagger
+                if start > now:
+                    self.staggered_polls += 1
+                    self.stagger_seconds += start - now
+                    await asyncio.sleep(start - now)
+            yield
+
+    @asynccontextmanager
+    async def detect_slot(self) -> AsyncIterator[None]:
+        """Hold one of the domain's concurrent detect() sweeps."""
+        if self._detect_slots.locked():
+            self.detect_waits += 1
+        async with self._detect_slots:
+            yield
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "stagger_seconds": self.stagger,
+            "staggered_polls": self.staggered_polls,
+            "total_stagger_wait_seconds": round(self.stagger_seconds, 1),
+            "detect_waits": self.detect_waits,
+        }
@@ -0,0 +1,97 @@
+"""Keep a platform's entities in step with the plant topology without a reload.
+
+Platforms that create entities per device (battery packs, AIO modules, HV
+stacks and their modules) enumerate them from coordinator.data at setup. When a
+device answers late (a slow BMS during a warm-start detect) or a routine add is
+accepted, reloading the whole entry to pick it up tears down every entity,
+reconnects and re-runs detect — on a large plant, the most expensive thing the
+integration does. Instead, the platform hands its enumeration to an EntitySync:
+when the coordinator runs a sync (see
+GivEnergyUpdateCoordinator.async_schedule_entity_sync) the platform is
+re-enumerated against the new topology, entities whose unique_id is new are
+added in place and, for an accepted topology change, those no longer enumerated
+are retired (removed from the entity registry, which removes the live entity).
+An option-driven removal (an unpinned cell) retires just the named entities
+(see GivEnergyUpdateCoordinator.async_retire_entities).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Collection, Sequence
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import GivEnergyUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EntitySync:
+    """One platform's live entities, keyed by unique_id, re-enumerated on a topology sync."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: GivEnergyUpdateCoordinator,
+        async_add_entities: AddEntitiesCallback,
+        enumerate_entities: Callable[[], Sequence[Entity]],
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._enumerate = enumerate_entities
+        self.entities: dict[str, Entity] = {}
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Add the platform's initial entities and subscribe to topology syncs."""
+        self._add(self._enumerate())
+        return self._coordinator.async_add_entity_sync(self.async_sync, self.async_retire)
+
+    @callback
+    def async_sync(self, retire: bool) -> None:
+        """Add entities the current topology enumerates that don't exist yet.
+
+        With ``retire``, also remove those it no longer enumerates. Only an
+        accepted topology change retires: a heal never loses a device, and a
+        device that merely stopped answering keeps its (unavailable) entities.
+        """
+        current = {entity.unique_id: entity for entity in self._enumerate()}
+        added = [entity for unique_id, entity in current.items() if unique_id not in self.entities]
+        retired = [uid for uid in self.entities if uid not in current] if retire else []
+        if added:
+            _LOGGER.info("Adding %d entities for newly detected devices", len(added))
+            self._add(added)
+        if retired:
+            _LOGGER.info("Retiring %d entities of devices no longer detected", len(retired))
+            self._retire(retired)
+
+    @callback
+    def async_retire(self, unique_ids: Collection[str]) -> None:
+        """Retire those of ``unique_ids`` the platform no longer enumerates.
+
+        Nothing else is retired, and nothing is added.
+        """
+        current = {entity.unique_id for entity in self._enumerate()}
+        retired = [uid for uid in unique_ids if uid in self.entities and uid not in current]
+        if retired:
+            self._retire(retired)
+
+    @callback
+    def _retire(self, unique_ids: Sequence[str]) -> None:
+        registry = er.async_get(self._hass)
+        for unique_id in unique_ids:
+            entity = self.entities.pop(unique_id)
+            if entity.registry_entry is not None:
+                registry.async_remove(entity.entity_id)
+            else:
+                self._hass.async_create_task(entity.async_remove(force_remove=True))
+
+    @callback
+    def _add(self, entities: Sequence[Entity]) -> None:
+        self.entities.update((entity.unique_id, entity) for entity in entities)
+        self._async_add_entities(list(entities))
@@ -311,14 +311,13 @@ class GivEnergyNumberEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Numbe
 
     @property
     def native_value(self) -> float | None:
-        return self.entity_description.value_fn(self.coordinator.data.inverter)
+        return self.entity_description.value_fn(self.coordinator.displayed_inverter)
 
     async def async_set_native_value(self, value: float) -> None:
         client = self.coordinator._client
         if client is None or not client.connected:
             return
-        await client.one_shot_command(self.entity_description.set_value_cmd(value))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(self.entity_description.set_value_cmd(value))
 
 
 class GivEnergyEmsNumberEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], NumberEntity):
@@ -353,5 +352,4 @@ class GivEnergyEmsNumberEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Nu
         client = self.coordinator._client
         if client is None or not client.connected:
             return
-        await client.one_shot_command(self.entity_description.set_value_cmd(value))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(self.entity_description.set_value_cmd(value))
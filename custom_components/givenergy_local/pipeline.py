@@ -0,0 +1,208 @@
+"""Pipelined active-mode reads: config and measurement banks issued together.
+
+The coordinator's default tick awaits ``Client.load_config()`` and then
+``Client.refresh()`` back to back, so the holding-register batch has to drain
+completely before the first input-register bank is even queued — on a 5-pack or
+multi-stack HV plant that is two full round-trip trains per full tick, with the
+coordinator lock held throughout. In pipelined mode (an experimental option)
+the holding-register batch and the input-register banks are issued together over
+the same client connection, the IR banks through :class:`PipelinedReader`. It
+adds no concurrency limit of its own: every bank goes through the client's public
+``execute()`` at once, exactly as ``refresh()`` would queue them, so the client's
+tx queue remains the only pacing. Each request is timed, giving a per-device
+latency histogram as a diagnostic.
+
+Failure signalling mirrors the library's batch executor exactly: no failures
+returns, some raises ``RefreshPartiallySucceeded`` with the plant, all raises
+``RefreshFailed`` — so the coordinator's seed-vs-steady-state policy is unchanged.
+:func:`execute_reads` is the same, unpipelined: one ``execute()`` batch, no
+timing, for the coordinator's own reads (scheduled banks, read-backs, the fast
+lane) when the pipeline is off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from givenergy_modbus.client.client import Client
+from givenergy_modbus.exceptions import ReadFailure, RefreshFailed, RefreshPartiallySucceeded
+from givenergy_modbus.model.plant import Plant
+from givenergy_modbus.pdu import TransparentRequest
+
+# Upper bounds (ms) of the latency histogram buckets; one overflow bucket follows.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (100, 250, 500, 1000, 2000, 5000)
+
+
+@dataclass
+class LatencyHistogram:
+    """Request round-trip times for one device, bucketed (retries included)."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    requests: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        self.requests += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict[str, int | float | None]:
+        """Bucket counts keyed ``le_<ms>`` / ``gt_<ms>``, plus mean and max (ms)."""
+        buckets: dict[str, int | float | None] = {
+            f"le_{bound}ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.counts, strict=False)
+        }
+        buckets[f"gt_{LATENCY_BUCKETS_MS[-1]}ms"] = self.counts[-1]
+        buckets["failures"] = self.failures
+        buckets["mean_ms"] = (
+            round(self.total_seconds / self.requests * 1000) if self.requests else None
+        )
+        buckets["max_ms"] = round(self.max_seconds * 1000) if self.requests else None
+        return buckets
+
+
+class PipelinedReader:
+    """Runs a batch of register reads concurrently, timing each one per device.
+
+    Latency histograms are cumulative for the reader's lifetime (one
+    coordinator), across reconnects.
+    """
+
+    def __init__(self) -> None:
+        self.latency: dict[int, LatencyHistogram] = {}
+
+    async def execute(
+        self,
+        client: Client,
+        requests: list[TransparentRequest],
+        *,
+        timeout: float,
+        retries: int,
+        retry_delay: float,
+    ) -> Plant:
+        """Read ``requests``; raise as the library's batch refresh would on failures."""
+        plant = client.plant
+        if not requests:
+            return plant
+        loop = asyncio.get_running_loop()
+
+        async def _one(request: TransparentRequest) -> Exception | None:
+            histogram = self.latency.setdefault(request.device_address, LatencyHistogram())
+            started = loop.time()
+            (outcome,) = await client.execute(
+                [request],
+                timeout=timeout,
+                retries=retries,
+                retry_delay=retry_delay,
+                return_exceptions=True,
+            )
+            if isinstance(outcome, Exception):
+                histogram.failures += 1
+                return outcome
+            if isinstance(outcome, BaseException):
+                raise outcome
+            histogram.record(loop.time() - started)
+            return None
+
+        # CancelledError (a BaseException) is re-raised above rather than returned,
+        # so a cancelled tick propagates instead of being reported as read failures.
+        results = await asyncio.gather(*(_one(request) for request in requests))
+        return check_read_outcomes(plant, requests, results)
+
+
+async def execute_reads(
+    client: Client,
+    requests: list[TransparentRequest],
+    *,
+    timeout: float,
+    retries: int,
+    retry_delay: float,
+) -> Plant:
+    """Read ``requests`` in one ``execute()`` batch; raise as refresh() would on failures."""
+    if not requests:
+        return client.plant
+    outcomes = await client.execute(
+        requests,
+        timeout=timeout,
+        retries=retries,
+        retry_delay=retry_delay,
+        return_exceptions=True,
+    )
+    return check_read_outcomes(client.plant, requests, outcomes)
+
+
+def check_read_outcomes(
+    plant: Plant, requests: Sequence[TransparentRequest], outcomes: Sequence[object]
+) -> Plant:
+    """Return ``plant`` if every read succeeded, else raise the library's failure.
+
+    An ``Exception`` outcome is a failed read; any other ``BaseException``
+    (cancellation) is re-raised as-is rather than reported as one.
+    """
+    failures: list[ReadFailure] = []
+    causes: list[Exception] = []
+    for request, outcome in zip(requests, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            failures.append(
+                ReadFailure(
+                    request.device_address,
+                    type(request).__name__,
+                    getattr(request, "base_register", 0),
+                    getattr(request, "register_count", 0),
+                )
+            )
+            causes.append(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+    if not failures:
+        return plant
+    group = ExceptionGroup(f"{len(failures)}/{len(requests)} register reads failed", causes)
+    if len(failures) == len(requests):
+        raise RefreshFailed(
+            f"all {len(requests)} register reads failed", failures=failures, cause=group
+        )
+    raise RefreshPartiallySucceeded(
+        f"{len(failures)} of {len(requests)} register reads failed",
+        plant=plant,
+        failures=failures,
+        cause=group,
+    )
+
+
+def merge_outcomes(plant: Plant, outcomes: Sequence[Plant | BaseException]) -> Plant:
+    """Fold the results of concurrently-run read batches into one poll outcome.
+
+    Any non-read exception (a dead producer, PlantNotDetected, cancellation) is
+    re-raised as-is. Read failures are pooled: every batch failing outright is
+    ``RefreshFailed``, anything less is ``RefreshPartiallySucceeded``.
+    """
+    failures: list[ReadFailure] = []
+    causes: list[Exception] = []
+    all_failed = True
+    for outcome in outcomes:
+        if isinstance(outcome, (RefreshFailed, RefreshPartiallySucceeded)):
+            failures.extend(outcome.failures)
+            # Pool the leaf causes (not the wrapping errors) so the coordinator's
+            # timeout-only check still sees through to them.
+            causes.extend(outcome.cause.exceptions)
+            all_failed = all_failed and isinstance(outcome, RefreshFailed)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            all_failed = False
+    if not failures:
+        return plant
+    group = ExceptionGroup(f"{len(failures)} register reads failed", causes)
+    if all_failed:
+        raise RefreshFailed(
+            f"all register reads failed ({len(failures)})", failures=failures, cause=group
+        )
+    raise RefreshPartiallySucceeded(
+        f"{len(failures)} register reads failed", plant=plant, failures=failures, cause=group
+    )
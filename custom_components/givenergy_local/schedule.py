@@ -0,0 +1,141 @@
+"""Bulk schedule writes for the apply_schedule service.
+
+Setting a day's schedule through the controls is one write, one read-back and
+one state change per slot endpoint, SoC target and enable flag. The service
+takes the whole desired schedule instead, builds the same commands those
+controls send (the descriptions in time.py, number.py and switch.py), and diffs
+each register write against the inverter's cached holding registers. Only the
+registers whose value would change are submitted, as one batch through the
+coordinator's write queue, so an unchanged schedule costs no bus time at all.
+A field is checked the way its control is: one the time platform wouldn't
+offer, or would ignore a write to, is rejected rather than written.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from givenergy_modbus.model.plant import Plant
+from givenergy_modbus.model.register import HR
+from givenergy_modbus.pdu import TransparentRequest, WriteHoldingRegisterRequest
+from homeassistant.exceptions import ServiceValidationError
+
+from .number import NUMBER_DESCRIPTIONS, GivEnergyNumberEntityDescription
+from .switch import SWITCH_DESCRIPTIONS, GivEnergySwitchEntityDescription
+from .time import TIME_DESCRIPTIONS, GivEnergyTimeEntityDescription, _include_time
+from .writes import coalesce
+
+# Schedule fields, keyed like the controls they stand in for. Applied in this
+# order (slots, then targets, then flags), so an explicit enable flag wins over
+# the enable a charge target implies.
+SLOT_FIELDS: dict[str, GivEnergyTimeEntityDescription] = {d.key: d for d in TIME_DESCRIPTIONS}
+TARGET_FIELDS: dict[str, GivEnergyNumberEntityDescription] = {
+    d.key: d for d in NUMBER_DESCRIPTIONS if d.key in ("charge_target_soc", "battery_soc_reserve")
+}
+FLAG_FIELDS: dict[str, GivEnergySwitchEntityDescription] = {
+    d.key: d for d in SWITCH_DESCRIPTIONS if d.key in ("enable_charge", "enable_discharge")
+}
+
+
+@dataclass(frozen=True)
+class RegisterChange:
+    register: int
+    previous: int | None
+    value: int
+
+
+@dataclass(frozen=True)
+class SchedulePlan:
+    """The writes a schedule needs, after dropping those the inverter already holds."""
+
+    requests: list[TransparentRequest]
+    changes: list[RegisterChange]
+    unchanged: int
+
+    def as_response(self, bus_time: float) -> dict[str, Any]:
+        return {
+            "written": [
+                {"register": c.register, "previous": c.previous, "value": c.value}
+                for c in self.changes
+            ],
+            "unchanged": self.unchanged,
+            "bus_time": round(bus_time, 3),
+        }
+
+
+def unsupported_fields(
+    plant: Plant, schedule: Mapping[str, Any], *, clean: bool = True
+) -> list[str]:
+    """The slot fields of ``schedule`` whose time control would refuse the write.
+
+    The time platform's own checks: a slot whose control isn't created at setup
+    (_include_time — e.g. the firmware-gated battery pause slot; ``clean`` as
+    there), or whose slot reads None, which the control's set_value ignores.
+    Targets and flags have no such gate: their controls exist on every
+    inverter plant.
+    """
+    inverter = plant.inverter
+    return [
+        key
+        for key, slot in SLOT_FIELDS.items()
+        if key in schedule
+        and (not _include_time(slot, inverter, clean) or slot.slot_fn(inverter) is None)
+    ]
+
+
+def schedule_requests(
+    plant: Plant, schedule: Mapping[str, Any], *, clean: bool = True
+) -> list[TransparentRequest]:
+    """The control commands for every field of ``schedule``, in field order.
+
+    Raises ServiceValidationError, before building any command, if a field
+    isn't supported on this inverter (see unsupported_fields).
+    """
+    if unsupported := unsupported_fields(plant, schedule, clean=clean):
+        raise ServiceValidationError(f"Not supported by this inverter: {', '.join(unsupported)}")
+    inverter = plant.inverter
+    requests: list[TransparentRequest] = []
+    for key, slot in SLOT_FIELDS.items():
+        if key in schedule:
+            requests += slot.setter_fn(schedule[key], inverter)
+    for key, target in TARGET_FIELDS.items():
+        if key in schedule:
+            requests += target.set_value_cmd(schedule[key])
+    for key, flag in FLAG_FIELDS.items():
+        if key in schedule:
+            requests += flag.turn_on_cmd() if schedule[key] else flag.turn_off_cmd()
+    return requests
+
+
+def plan_schedule(
+    plant: Plant,
+    schedule: Mapping[str, Any],
+    pending: Mapping[int, int] | None = None,
+    *,
+    clean: bool = True,
+) -> SchedulePlan:
+    """Diff ``schedule``'s writes against ``plant``'s cached inverter holding registers.
+
+    ``pending`` holds the optimistic values still awaiting confirmation, by
+    register; they count as already written, so a schedule re-applied straight
+    after a control write doesn't send it twice. Unsupported fields raise as
+    in schedule_requests.
+    """
+    cache = {
+        **plant.register_caches.get(plant.capabilities.inverter_address, {}),
+        **{HR(register): value for register, value in (pending or {}).items()},
+    }
+    requests: list[TransparentRequest] = []
+    changes: list[RegisterChange] = []
+    unchanged = 0
+    for request in coalesce(schedule_requests(plant, schedule, clean=clean)):
+        if isinstance(request, WriteHoldingRegisterRequest):
+            previous = cache.get(HR(request.register))
+            if previous == request.value:
+                unchanged += 1
+                continue
+            changes.append(RegisterChange(request.register, previous, request.value))
+        requests.append(request)
+    return SchedulePlan(requests=requests, changes=changes, unchanged=unchanged)
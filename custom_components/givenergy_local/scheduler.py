@@ -0,0 +1,248 @@
+"""Per-bank adaptive scheduling of active-mode input-register polls.
+
+The library's ``Client.refresh()`` solicits every IR bank of every device on every
+call. On a multi-battery plant most of those round-trips re-read battery banks whose
+content hasn't moved since the last tick (cell voltages and BMS identity change on
+the order of minutes, not seconds), while the inverter's power-flow banks genuinely
+change every poll. ``BankScheduler`` gives each (device, base, count) bank its own
+cadence instead: inverter/meter banks stay at one tick, battery-side banks back off
+exponentially while their content is byte-identical and tighten again as soon as it
+moves. The coordinator asks it which banks are due each tick and reports back what
+was read; the schedule and the bus time it saved are surfaced as diagnostics.
+
+Holding registers are not scheduled here — they stay on the coordinator's
+``_full_refresh_every`` cycle via ``Client.load_config()``.
+
+The bank list itself (:func:`refresh_banks`) is kept here rather than taken from
+the library's private helpers, mirroring what ``refresh()`` solicits in the
+pinned givenergy-modbus release.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from givenergy_modbus.model.plant import Plant, PlantCapabilities
+from givenergy_modbus.pdu import ReadInputRegistersRequest
+
+# (device_address, base_register, register_count) — the library's IR bank identity,
+# matching the (addr, "IR", base, count) keys of Plant.register_block_updated_at.
+BankKey = tuple[int, int, int]
+
+# Ceiling for a slow (battery-side) bank's poll interval. Kept well inside the
+# sensor stale-IR gate (max(300 s, 10 ticks), see sensor._StaleIRGate) and the
+# library's 300 s splice-guard stale-baseline bypass, so a backed-off bank never
+# reads as stale or trips a cold-start re-baseline just because we polled it less.
+SLOW_BANK_MAX_SECONDS = 120
+
+# Smoothing for the achieved-cadence and per-read cost estimates.
+_EWMA_ALPHA = 0.3
+
+
+def refresh_banks(caps: PlantCapabilities) -> list[BankKey]:
+    """Every IR bank ``Client.refresh()`` polls for this topology, in its order."""
+    inverter = caps.inverter_address
+    banks: list[BankKey] = []
+    if not caps.is_ems:
+        banks += [(inverter, 0, 60), (inverter, 180, 60)]
+    if caps.is_three_phase:
+        banks += [(inverter, base, min(60, 1414 - base)) for base in range(1000, 1414, 60)]
+    if caps.is_ems:
+        banks.append((inverter, 2040, 55))
+    if caps.is_gateway:
+        banks += [(inverter, base, min(60, 1860 - base)) for base in range(1600, 1860, 60)]
+    banks += [(addr, 60, 60) for addr in caps.lv_battery_addresses]
+    if caps.lv_bcu_address is not None:
+        banks.append((caps.lv_bcu_address, 60, 60))
+    banks += [(addr, 60, 30) for addr in caps.meter_addresses]
+    banks += [(0x70 + offset, 60, 60) for offset, _ in caps.bcu_stacks]
+    banks += [(addr, 60, 60) for addr in caps.aio_battery_module_addresses]
+    banks += [(addr, 60, 60) for addr in caps.hv_bmu_addresses]
+    return banks
+
+
+def bank_requests(banks: list[BankKey]) -> list[ReadInputRegistersRequest]:
+    """One input-register read per bank."""
+    return [
+        ReadInputRegistersRequest(base_register=base, register_count=count, device_address=addr)
+        for addr, base, count in banks
+    ]
+
+
+def refresh_requests(plant: Plant) -> list[ReadInputRegistersRequest]:
+    """The reads one ``refresh()`` makes: every bank that detect() didn't mark absent."""
+    if plant.capabilities is None:
+        return []
+    return bank_requests(
+        [
+            (addr, base, count)
+            for addr, base, count in refresh_banks(plant.capabilities)
+            if plant.block_present(addr, "IR", base, count) is not False
+        ]
+    )
+
+
+@dataclass
+class BankSchedule:
+    """Scheduling state and counters for one IR bank."""
+
+    key: BankKey
+    # Upper bound on interval_ticks: 1 for fast (power-flow) banks.
+    max_interval_ticks: int
+    interval_ticks: int = 1
+    next_due_tick: int = 0
+    polls: int = 0
+    skipped: int = 0
+    # Monotonic time of the last successful poll, and the datetime of the same
+    # poll for comparing against Plant.content_unchanged_seconds().
+    last_polled_at: float | None = None
+    last_polled_wall: datetime | None = None
+    # EWMA of the seconds actually elapsed between successful polls.
+    cadence_seconds: float | None = None
+
+    def label(self) -> str:
+        addr, base, count = self.key
+        return f"0x{addr:02x} IR({base},{count})"
+
+
+class BankScheduler:
+    """Decides which IR banks are due each active tick and adapts their cadence.
+
+    Fast banks (the inverter's own banks and meters) are read every tick. Slow
+    banks (LV batteries, LV BCU, HV BCUs/BMUs, AIO modules) start at one tick and
+    double their interval each time a poll finds their content unchanged, up to
+    ``SLOW_BANK_MAX_SECONDS``; a poll that sees new content halves it again. A
+    bank whose read failed is retried on the next tick. A reconnect (fresh Plant,
+    no cached blocks) must call :meth:`reset` so every bank is solicited again.
+    """
+
+    def __init__(self, scan_interval: int) -> None:
+        self.scan_interval = scan_interval
+        self._slow_max_ticks = max(1, SLOW_BANK_MAX_SECONDS // max(1, scan_interval))
+        self._banks: dict[BankKey, BankSchedule] = {}
+        self._capabilities: PlantCapabilities | None = None
+        self._tick = 0
+        # Cumulative, monotonic across reconnects (like the coordinator's failure
+        # counters): bank reads skipped, and the estimated bus time that saved.
+        self.reads_skipped: int = 0
+        self.bus_seconds_saved: float = 0.0
+        # EWMA of the wall time one bank read costs, measured per tick.
+        self.read_seconds: float | None = None
+
+    @property
+    def banks(self) -> list[BankSchedule]:
+        return list(self._banks.values())
+
+    def reset(self) -> None:
+        """Make every bank due on the next tick (a new connection has an empty cache)."""
+        self._tick = 0
+        for bank in self._banks.values():
+            bank.interval_ticks = 1
+            bank.next_due_tick = 0
+            bank.last_polled_at = None
+            bank.last_polled_wall = None
+
+    def _sync(self, caps: PlantCapabilities) -> None:
+        """Rebuild the bank table when the topology changes, keeping known banks' state."""
+        if caps is self._capabilities:
+            return
+        self._capabilities = caps
+        fast = {caps.inverter_address, *caps.meter_addresses}
+        banks: dict[BankKey, BankSchedule] = {}
+        for key in refresh_banks(caps):
+            existing = self._banks.get(key)
+            if existing is not None:
+                banks[key] = existing
+                continue
+            banks[key] = BankSchedule(
+                key=key,
+                max_interval_ticks=1 if key[0] in fast else self._slow_max_ticks,
+                next_due_tick=self._tick,
+            )
+        self._banks = banks
+
+    def due(self, plant: Plant) -> list[BankKey]:
+        """Return the banks to read this tick, counting the ones deferred.
+
+        Banks detect() marked absent are never due — matching the library's own
+        refresh(), which never re-solicits a known-absent device.
+        """
+        caps = plant.capabilities
+        if caps is None:
+            return []
+        self._sync(caps)
+        due: list[BankKey] = []
+        deferred = 0
+        for key, bank in self._banks.items():
+            addr, base, count = key
+            if plant.block_present(addr, "IR", base, count) is False:
+                continue
+            if bank.next_due_tick <= self._tick:
+                due.append(key)
+            else:
+                bank.skipped += 1
+                deferred += 1
+        self.reads_skipped += deferred
+        if deferred and self.read_seconds is not None:
+            self.bus_seconds_saved += deferred * self.read_seconds
+        return due
+
+    def record(
+        self,
+        plant: Plant,
+        polled: list[BankKey],
+        failed: set[BankKey],
+        *,
+        elapsed: float,
+        now: float,
+        now_wall: datetime,
+    ) -> None:
+        """Fold one tick's outcome into the schedule and advance the tick counter.
+
+        ``elapsed`` is the wall time the tick's reads took (``now`` on the same
+        monotonic clock); ``now_wall`` is compared against the plant's content
+        tracker to decide whether each polled bank changed since its last poll.
+        """
+        if polled:
+            per_read = elapsed / len(polled)
+            self.read_seconds = (
+                per_read
+                if self.read_seconds is None
+                else self.read_seconds + _EWMA_ALPHA * (per_read - self.read_seconds)
+            )
+        for key in polled:
+            bank = self._banks.get(key)
+            if bank is None:
+                continue
+            if key in failed:
+                # Keep the interval but retry straight away — a failed read left
+                # the cache serving last-known values for this bank.
+                bank.next_due_tick = self._tick + 1
+                continue
+            addr, base, count = key
+            unchanged = plant.content_unchanged_seconds(addr, "IR", base, count, now=now_wall)
+            if bank.last_polled_at is not None:
+                gap = now - bank.last_polled_at
+                bank.cadence_seconds = (
+                    gap
+                    if bank.cadence_seconds is None
+                    else bank.cadence_seconds + _EWMA_ALPHA * (gap - bank.cadence_seconds)
+                )
+            since_last = (
+                (now_wall - bank.last_polled_wall).total_seconds()
+                if bank.last_polled_wall is not None
+                else None
+            )
+            # The content is the same as at our previous poll iff its current run
+            # began before that poll. With no previous poll there's nothing to
+            # compare against, so treat it as changed (stay at the fast end).
+            if unchanged is not None and since_last is not None and unchanged >= since_last:
+                bank.interval_ticks = min(bank.interval_ticks * 2, bank.max_interval_ticks)
+            else:
+                bank.interval_ticks = max(1, bank.interval_ticks // 2)
+            bank.next_due_tick = self._tick + bank.interval_ticks
+            bank.polls += 1
+            bank.last_polled_at = now
+            bank.last_polled_wall = now_wall
+        self._tick += 1
@@ -205,11 +205,10 @@ class GivEnergySelectEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Selec
 
     @property
     def current_option(self) -> str | None:
-        return self.entity_description.current_option_fn(self.coordinator.data.inverter)
+        return self.entity_description.current_option_fn(self.coordinator.displayed_inverter)
 
     async def async_select_option(self, option: str) -> None:
         client = self.coordinator._client
         if client is None or not client.connected:
             return
-        await client.one_shot_command(self.entity_description.select_option_cmd(option))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(self.entity_description.select_option_cmd(option))
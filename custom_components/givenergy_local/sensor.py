@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass, field
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime
+from functools import partial
+from operator import attrgetter
 from typing import Any
 
 from givenergy_modbus.model.aio_battery import AioBatteryModule
@@ -20,6 +24,7 @@ from givenergy_modbus.model.inverter import (
     Status,
     UsbDevice,
 )
+from givenergy_modbus.model.plant import Plant
 from givenergy_modbus.model.register import Register
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -39,24 +44,63 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
+from .cell_drift import WORST_CELLS
+from .cell_stats import (
+    AIO_TEMPERATURE_COUNT,
+    CellStats,
+    cell_names,
+    temperature_label,
+)
 from .const import (
     CONF_BATTERY_DATA_ONLY,
+    CONF_CELL_VECTOR_SENSORS,
     CONF_EXPOSE_PER_CELL,
+    CONF_THROTTLE_DEADBAND,
+    CONF_THROTTLE_MAX_INTERVAL,
+    CONF_THROTTLE_POWER_SENSORS,
     DEFAULT_BATTERY_DATA_ONLY,
+    DEFAULT_CELL_VECTOR_SENSORS,
+    DEFAULT_THROTTLE_DEADBAND,
+    DEFAULT_THROTTLE_MAX_INTERVAL,
+    DEFAULT_THROTTLE_POWER_SENSORS,
     DOMAIN,
 )
-from .coordinator import GivEnergyUpdateCoordinator, InverterModel
+from .coordinator import BlockKey, GivEnergyUpdateCoordinator, InverterModel
+from .entity_sync import EntitySync
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PublishPolicy:
+    """When a sensor's new value is worth a state write (CONF_THROTTLE_POWER_SENSORS).
+
+    A change of at least ``deadband`` (native units) — or to or from zero —
+    publishes as soon as ``min_interval`` seconds have passed since the last
+    write; smaller changes wait for the ``max_interval`` heartbeat, which
+    publishes the current value whatever it is. The entry's options set the
+    deadband and heartbeat (CONF_THROTTLE_DEADBAND, CONF_THROTTLE_MAX_INTERVAL).
+    """
+
+    deadband: float
+    min_interval: float = 0.0
+    max_interval: float = 300.0
+
+
+# The high-frequency power-flow sensors: a watt of jitter every tick is neither
+# worth a recorder row nor a websocket message.
+_POWER_PUBLISH_POLICY = PublishPolicy(
+    deadband=DEFAULT_THROTTLE_DEADBAND, max_interval=DEFAULT_THROTTLE_MAX_INTERVAL
+)
+
+
 @dataclass(frozen=True, kw_only=True)
 class GivEnergyInverterSensorDescription(SensorEntityDescription):
     value_fn: Callable[[InverterModel], Any] = field(default=lambda _: None)
@@ -93,6 +137,11 @@ class GivEnergyInverterSensorDescription(SensorEntityDescription):
     # check (#152, flagged on the #158 review). Leave None for true computed /
     # derived fields, which are deliberately untracked.
     source_field: str | None = None
+    # Applied only with the throttling option on; None publishes every change.
+    publish_policy: PublishPolicy | None = None
+    # If True, a "(Fast)" twin is created with the fast lane on, refreshed from
+    # the power-flow registers it re-reads (coordinator.FAST_LANE_FIELDS).
+    fast_lane: bool = False
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -103,11 +152,13 @@ class GivEnergyBatterySensorDescription(SensorEntityDescription):
 def _battery_attr(name: str) -> Callable[[Battery], Any]:
     """Return a value_fn that reads `name` off the battery.
 
-    Used by the bulk-defined per-cell entities so each closure captures
-    its own attribute name explicitly (and so mypy can infer the type
-    of the resulting Callable).
+    Used by the bulk-defined per-cell entities so each accessor carries its own
+    attribute name explicitly (and so mypy can infer the type of the resulting
+    Callable). An attrgetter rather than a getattr-by-string closure: the name
+    is bound once here instead of being looked up through a Python frame on
+    every read.
     """
-    return lambda bat: getattr(bat, name)
+    return attrgetter(name)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -118,10 +169,10 @@ class GivEnergyAioModuleSensorDescription(SensorEntityDescription):
 def _module_attr(name: str) -> Callable[[AioBatteryModule], Any]:
     """Return a value_fn that reads `name` off an AIO battery module.
 
-    Per-module counterpart of `_battery_attr`; each closure captures its own
+    Per-module counterpart of `_battery_attr`; each accessor carries its own
     attribute name so the bulk-defined per-cell entities don't share one.
     """
-    return lambda module: getattr(module, name)
+    return attrgetter(name)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -137,7 +188,7 @@ def _bcu_attr(name: str) -> Callable[[Bcu], Any]:
     tests rather than silently surfacing as `unknown`. The BCU fields are
     guaranteed present by the pinned givenergy-modbus model.
     """
-    return lambda bcu: getattr(bcu, name)
+    return attrgetter(name)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -149,13 +200,13 @@ def _hv_module_attr(name: str) -> Callable[[Bmu], Any]:
     """Return a value_fn that reads `name` off an HV battery module (BMU).
 
     Per-module counterpart of `_module_attr` for the bulk-defined per-cell
-    entities so each closure captures its own attribute name.
+    entities so each accessor carries its own attribute name.
     """
-    return lambda bmu: getattr(bmu, name)
+    return attrgetter(name)
 
 
-def _present_cells(obj: Any, prefix: str, count: int) -> list[Any]:
-    """Non-zero, non-None cell readings `prefix_01`..`prefix_{count}` off `obj`.
+def _present_cells(obj: Any, names: tuple[str, ...]) -> list[Any]:
+    """Non-zero, non-None cell readings for the attribute `names` off `obj`.
 
     Unused/unscanned cell slots read exactly 0 — for both voltages (~3.3 V when
     real) and temperatures. An exact-0 temperature is not a plausible real-world
@@ -165,25 +216,42 @@ def _present_cells(obj: Any, prefix: str, count: int) -> list[Any]:
     legitimate cold reading, making it safe to exclude for both types.
     Values come off the model via getattr, typed Any like other value_fns.
     """
-    return [
-        v
-        for i in range(1, count + 1)
-        if (v := getattr(obj, f"{prefix}_{i:02d}", None)) not in (None, 0)
-    ]
+    return [v for name in names if (v := getattr(obj, name, None)) not in (None, 0)]
 
 
-def _cell_rollup(prefix: str, count: int, fn: Callable[[list[Any]], Any]) -> Callable[[Any], Any]:
-    """A value_fn reducing the present `prefix` cells via `fn` (min/max/spread).
+_ROLLUP_FNS: dict[str, Callable[[list[Any]], Any]] = {
+    "min": min,
+    "max": max,
+    "spread": lambda cells: max(cells) - min(cells),
+}
+
+
+@dataclass(frozen=True)
+class _CellRollup:
+    """A value_fn reducing the present `prefix` cells to their `stat` (min/max/spread).
 
     Returns None when no cell has a usable reading, so the entity reports
-    `unknown` rather than a misleading 0.
+    `unknown` rather than a misleading 0. A class rather than a closure so the
+    sensor value vector can recognise it and serve it from the coordinator's
+    per-tick cell statistics snapshot (see cell_stats) instead of re-walking
+    the cells; called directly it reads them itself.
     """
 
-    def value(obj: Any) -> float | None:
-        cells = _present_cells(obj, prefix, count)
-        return fn(cells) if cells else None
+    prefix: str
+    count: int
+    stat: str
+    names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "names", cell_names(self.prefix, self.count))
+
+    def __call__(self, obj: Any) -> float | None:
+        cells = _present_cells(obj, self.names)
+        return _ROLLUP_FNS[self.stat](cells) if cells else None
 
-    return value
+
+def _cell_rollup(prefix: str, count: int, stat: str) -> Callable[[Any], Any]:
+    return _CellRollup(prefix, count, stat)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -202,7 +270,7 @@ def _summary_attr(name: str) -> Callable[[InverterSummary], Any]:
     Counterpart of `_module_attr`/`_bcu_attr` for the blinded `InverterSummary`
     rollup an EMS controller exposes per managed inverter.
     """
-    return lambda summary: getattr(summary, name)
+    return attrgetter(name)
 
 
 def _managed_status(value: Any) -> str | None:
@@ -430,6 +498,8 @@ INVERTER_SENSORS: tuple[GivEnergyInverterSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         # Computed (p_pv1 + p_pv2) so not register-backed; watts -> 0 decimals.
         suggested_display_precision=0,
+        publish_policy=_POWER_PUBLISH_POLICY,
+        fast_lane=True,
         value_fn=lambda inv: inv.p_pv(),
         single_phase_only=True,
     ),
@@ -535,6 +605,8 @@ INVERTER_SENSORS: tuple[GivEnergyInverterSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        publish_policy=_POWER_PUBLISH_POLICY,
+        fast_lane=True,
         value_fn=lambda inv: inv.p_battery,
     ),
     GivEnergyInverterSensorDescription(
@@ -610,6 +682,8 @@ INVERTER_SENSORS: tuple[GivEnergyInverterSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        publish_policy=_POWER_PUBLISH_POLICY,
+        fast_lane=True,
         value_fn=lambda inv: inv.p_grid_out,
         # Signed, positive = export — the right shape for the bundled flow card
         # (which keys off it), but the opposite of HA's Energy-Dashboard sign and
@@ -763,6 +837,8 @@ INVERTER_SENSORS: tuple[GivEnergyInverterSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        publish_policy=_POWER_PUBLISH_POLICY,
+        fast_lane=True,
         value_fn=lambda inv: inv.p_load_demand,
         # Controller-local on an EMS (IR42 inverter busbar load): on the capture it
         # reads 48 W vs the EMS calc_load_power 489 W, so it misrepresents the plant
@@ -1366,7 +1442,7 @@ AIO_MODULE_SENSORS: tuple[GivEnergyAioModuleSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("v_cell", 24, min),
+        value_fn=_cell_rollup("v_cell", 24, "min"),
     ),
     GivEnergyAioModuleSensorDescription(
         key="cell_voltage_max",
@@ -1376,7 +1452,7 @@ AIO_MODULE_SENSORS: tuple[GivEnergyAioModuleSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("v_cell", 24, max),
+        value_fn=_cell_rollup("v_cell", 24, "max"),
     ),
     GivEnergyAioModuleSensorDescription(
         key="cell_voltage_delta",
@@ -1385,7 +1461,7 @@ AIO_MODULE_SENSORS: tuple[GivEnergyAioModuleSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("v_cell", 24, lambda c: max(c) - min(c)),
+        value_fn=_cell_rollup("v_cell", 24, "spread"),
     ),
     GivEnergyAioModuleSensorDescription(
         key="cell_temperature_min",
@@ -1394,7 +1470,7 @@ AIO_MODULE_SENSORS: tuple[GivEnergyAioModuleSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("t_cell", 12, min),
+        value_fn=_cell_rollup("t_cell", AIO_TEMPERATURE_COUNT, "min"),
     ),
     GivEnergyAioModuleSensorDescription(
         key="cell_temperature_max",
@@ -1403,7 +1479,7 @@ AIO_MODULE_SENSORS: tuple[GivEnergyAioModuleSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("t_cell", 12, max),
+        value_fn=_cell_rollup("t_cell", AIO_TEMPERATURE_COUNT, "max"),
     ),
 )
 
@@ -1570,7 +1646,7 @@ HV_MODULE_SENSORS: tuple[GivEnergyHvModuleSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("v_cell", 24, min),
+        value_fn=_cell_rollup("v_cell", 24, "min"),
     ),
     GivEnergyHvModuleSensorDescription(
         key="cell_voltage_max",
@@ -1580,7 +1656,7 @@ HV_MODULE_SENSORS: tuple[GivEnergyHvModuleSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("v_cell", 24, max),
+        value_fn=_cell_rollup("v_cell", 24, "max"),
     ),
     GivEnergyHvModuleSensorDescription(
         key="cell_voltage_delta",
@@ -1589,7 +1665,7 @@ HV_MODULE_SENSORS: tuple[GivEnergyHvModuleSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("v_cell", 24, lambda c: max(c) - min(c)),
+        value_fn=_cell_rollup("v_cell", 24, "spread"),
     ),
     GivEnergyHvModuleSensorDescription(
         key="cell_temperature_min",
@@ -1598,7 +1674,7 @@ HV_MODULE_SENSORS: tuple[GivEnergyHvModuleSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("t_cell", 24, min),
+        value_fn=_cell_rollup("t_cell", 24, "min"),
     ),
     GivEnergyHvModuleSensorDescription(
         key="cell_temperature_max",
@@ -1607,7 +1683,7 @@ HV_MODULE_SENSORS: tuple[GivEnergyHvModuleSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_cell_rollup("t_cell", 24, max),
+        value_fn=_cell_rollup("t_cell", 24, "max"),
     ),
 )
 
@@ -1793,6 +1869,56 @@ def _comms_counter_attributes(
     return _attrs
 
 
+def _poll_duration(pct: int) -> Callable[[GivEnergyUpdateCoordinator], float | None]:
+    """Build a value_fn reading the ``pct`` percentile of the whole-tick duration."""
+
+    def _value(coordinator: GivEnergyUpdateCoordinator) -> float | None:
+        seconds = coordinator.timings.phases.percentile("tick", pct)
+        return round(seconds, 3) if seconds is not None else None
+
+    return _value
+
+
+def _poll_timing_attributes(
+    pct: int,
+) -> Callable[[GivEnergyUpdateCoordinator], dict[str, Any] | None]:
+    """Build an attributes_fn breaking the ``pct`` percentile down by phase and device.
+
+    Phases are the tick's parts (connect/detect only on reconnect ticks,
+    load_config only on full ticks); per device it is how far into the tick
+    that device's last register bank committed — the device the tick waits on.
+    """
+
+    def _attrs(coordinator: GivEnergyUpdateCoordinator) -> dict[str, Any] | None:
+        summary = coordinator.timings.as_dict()
+        if not summary["phases"]:
+            return None
+        return {
+            "phases": {phase: stats[f"p{pct}"] for phase, stats in summary["phases"].items()},
+            "devices": {
+                device: stats[f"p{pct}"] for device, stats in sorted(summary["devices"].items())
+            },
+            "samples": summary["phases"].get("tick", {}).get("samples", 0),
+        }
+
+    return _attrs
+
+
+def _write_confirm_latency(coordinator: GivEnergyUpdateCoordinator) -> float | None:
+    seconds = coordinator.writes.overlay.latency.percentile("confirm", 50)
+    return round(seconds, 3) if seconds is not None else None
+
+
+def _write_confirm_attributes(coordinator: GivEnergyUpdateCoordinator) -> dict[str, Any]:
+    overlay = coordinator.writes.overlay
+    confirm = overlay.latency.summary().get("confirm", {})
+    return {
+        "p95": confirm.get("p95"),
+        "samples": confirm.get("samples", 0),
+        "pending_registers": sorted(overlay.writes),
+    }
+
+
 COORDINATOR_SENSORS: tuple[GivEnergyCoordinatorSensorDescription, ...] = (
     GivEnergyCoordinatorSensorDescription(
         key="last_successful_refresh",
@@ -1884,6 +2010,188 @@ COORDINATOR_SENSORS: tuple[GivEnergyCoordinatorSensorDescription, ...] = (
         attributes_fn=_comms_counter_attributes("cold_start_held_by_device"),
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    GivEnergyCoordinatorSensorDescription(
+        key="suppressed_state_writes",
+        name="Suppressed State Writes",
+        # Entity state writes skipped because nothing the entity exposes had
+        # changed since its last write, or because a publish policy held back a
+        # change inside its deadband. The attributes carry the count from the
+        # most recent completed fan-out and the cumulative throttled share.
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coord: coord.suppressed_writes,
+        attributes_fn=lambda coord: {
+            "last_tick": coord.last_tick_suppressed_writes,
+            "throttled": coord.throttled_writes,
+        },
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    GivEnergyCoordinatorSensorDescription(
+        key="poll_duration_p50",
+        name="Poll Duration p50",
+        # Rolling percentile of the whole poll tick's duration over the last
+        # TIMING_WINDOW ticks; the attributes break it down per phase and device.
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=_poll_duration(50),
+        attributes_fn=_poll_timing_attributes(50),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    GivEnergyCoordinatorSensorDescription(
+        key="poll_duration_p95",
+        name="Poll Duration p95",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=_poll_duration(95),
+        attributes_fn=_poll_timing_attributes(95),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    GivEnergyCoordinatorSensorDescription(
+        key="poll_duration_p99",
+        name="Poll Duration p99",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=_poll_duration(99),
+        attributes_fn=_poll_timing_attributes(99),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    GivEnergyCoordinatorSensorDescription(
+        key="write_confirm_latency",
+        name="Write Confirm Latency",
+        # Rolling median from a control write's submission (when the control
+        # shows the new value optimistically) to the first read confirming it.
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=_write_confirm_latency,
+        attributes_fn=_write_confirm_attributes,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    GivEnergyCoordinatorSensorDescription(
+        key="write_mismatches",
+        name="Write Mismatches",
+        # Control writes the inverter acknowledged but then read back holding a
+        # different value (clamped, or overridden by the inverter itself).
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coord: coord.writes.overlay.mismatches,
+        attributes_fn=lambda coord: {
+            "confirmed": coord.writes.overlay.confirmed,
+            "last_mismatch": coord.writes.overlay.last_mismatch,
+        },
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+
+def _bank_schedule_attributes(
+    coordinator: GivEnergyUpdateCoordinator,
+) -> dict[str, Any] | None:
+    """Per-bank view of the adaptive poll schedule for the UI.
+
+    For each IR bank: its current target interval, the cadence actually
+    achieved (smoothed seconds between successful reads), and how many reads
+    it has made and skipped — so the bus time saved can be traced to the
+    banks that earned it.
+    """
+    scheduler = coordinator.bank_scheduler
+    if scheduler is None or not scheduler.banks:
+        return None
+    return {
+        "read_seconds": round(scheduler.read_seconds, 3)
+        if scheduler.read_seconds is not None
+        else None,
+        "banks": {
+            bank.label(): {
+                "interval_seconds": bank.interval_ticks * scheduler.scan_interval,
+                "achieved_cadence_seconds": round(bank.cadence_seconds, 1)
+                if bank.cadence_seconds is not None
+                else None,
+                "polls": bank.polls,
+                "skipped": bank.skipped,
+            }
+            for bank in scheduler.banks
+        },
+    }
+
+
+# Only created when adaptive polling is enabled (coordinator.bank_scheduler set).
+BANK_SCHEDULER_SENSORS: tuple[GivEnergyCoordinatorSensorDescription, ...] = (
+    GivEnergyCoordinatorSensorDescription(
+        key="poll_reads_skipped",
+        name="Poll Bank Reads Skipped",
+        # Bank reads the adaptive scheduler deferred because the bank's content
+        # was holding steady. The attributes carry the per-bank schedule.
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coord: (
+            coord.bank_scheduler.reads_skipped if coord.bank_scheduler is not None else None
+        ),
+        attributes_fn=_bank_schedule_attributes,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    GivEnergyCoordinatorSensorDescription(
+        key="poll_bus_time_saved",
+        name="Poll Bus Time Saved",
+        # Skipped reads priced at the measured per-read cost — an estimate of
+        # the RS485/dongle time the schedule has given back.
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=0,
+        value_fn=lambda coord: (
+            round(coord.bank_scheduler.bus_seconds_saved, 1)
+            if coord.bank_scheduler is not None
+            else None
+        ),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+
+def _read_latency_attributes(
+    coordinator: GivEnergyUpdateCoordinator,
+) -> dict[str, Any] | None:
+    """Per-device request latency histograms from the pipelined reader."""
+    pipeline = coordinator.pipeline
+    if pipeline is None or not pipeline.latency:
+        return None
+    return {
+        "devices": {
+            f"0x{address:02x}": histogram.as_dict()
+            for address, histogram in sorted(pipeline.latency.items())
+        },
+    }
+
+
+def _mean_read_latency_ms(coordinator: GivEnergyUpdateCoordinator) -> int | None:
+    pipeline = coordinator.pipeline
+    if pipeline is None:
+        return None
+    requests = sum(h.requests for h in pipeline.latency.values())
+    if not requests:
+        return None
+    return round(sum(h.total_seconds for h in pipeline.latency.values()) / requests * 1000)
+
+
+PIPELINE_SENSORS: tuple[GivEnergyCoordinatorSensorDescription, ...] = (
+    GivEnergyCoordinatorSensorDescription(
+        key="read_latency",
+        name="Read Latency",
+        # Mean round-trip of a pipelined register read (retries included), over
+        # every device; the attributes carry each device's latency histogram.
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=_mean_read_latency_ms,
+        attributes_fn=_read_latency_attributes,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
 )
 
 
@@ -1932,6 +2240,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: GivEnergyUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # Re-enumerated in place when the plant topology grows (or an accepted
+    # change drops a device), so a late-answering pack needs no reload (#148).
+    values = _ValueVector(coordinator)
+    sync = EntitySync(
+        hass, coordinator, async_add_entities, partial(_sensor_entities, coordinator, entry, values)
+    )
+    entry.async_on_unload(sync.async_setup())
+
+
+def _sensor_entities(
+    coordinator: GivEnergyUpdateCoordinator, entry: ConfigEntry, values: _ValueVector
+) -> list[SensorEntity]:
+    """Every sensor the current plant data and entry options call for."""
     inverter = coordinator.data.inverter
     capabilities = coordinator.data.capabilities
     is_three_phase = bool(capabilities and capabilities.is_three_phase)
@@ -1945,8 +2266,43 @@ async def async_setup_entry(
     # Whether to create the individual per-cell entities (LV pack / AIO module / HV
     # BMU). Absent ⇒ legacy install ⇒ True (keep existing per-cell entities); new
     # entries carry an explicit False from config-flow creation. See
-    # CONF_EXPOSE_PER_CELL and _reconcile_per_cell_entities (__init__).
+    # CONF_EXPOSE_PER_CELL and _reconcile_per_cell_entities (__init__). When off,
+    # each pack / module gets one Cells entity instead, plus an entity for each
+    # cell the user pinned (the pin_cells service).
     expose_per_cell = entry.options.get(CONF_EXPOSE_PER_CELL, True)
+    pinned = coordinator.pinned_cells
+    cell_vectors = entry.options.get(CONF_CELL_VECTOR_SENSORS, DEFAULT_CELL_VECTOR_SENSORS)
+    throttle = (
+        PublishPolicy(
+            deadband=entry.options.get(CONF_THROTTLE_DEADBAND, DEFAULT_THROTTLE_DEADBAND),
+            max_interval=entry.options.get(
+                CONF_THROTTLE_MAX_INTERVAL, DEFAULT_THROTTLE_MAX_INTERVAL
+            ),
+        )
+        if entry.options.get(CONF_THROTTLE_POWER_SENSORS, DEFAULT_THROTTLE_POWER_SENSORS)
+        else None
+    )
+
+    def cells(serial: str, descriptions: Iterable[Any]) -> list[Any]:
+        """The per-cell descriptions to create for ``serial``'s pack / module."""
+        if expose_per_cell:
+            return list(descriptions)
+        return [d for d in descriptions if f"{serial}_{d.key}" in pinned]
+
+    def cell_summaries(serial: str, stats_key: str, sibling: SensorEntity) -> None:
+        """The whole-pack cell entities for ``serial``'s pack / module."""
+        entities.append(
+            GivEnergyCellDriftSensor(coordinator, serial, stats_key, sibling.device_info)
+        )
+        if not expose_per_cell:
+            entities.append(
+                GivEnergyCellArraySensor(coordinator, serial, stats_key, sibling.device_info)
+            )
+        if cell_vectors:
+            entities.append(
+                GivEnergyCellVectorSensor(coordinator, serial, stats_key, sibling.device_info)
+            )
+
     ems = coordinator.data.ems
 
     entities: list[SensorEntity] = []
@@ -1961,13 +2317,22 @@ async def async_setup_entry(
     # misleading. Drop them; keep the battery pack / HV stack / module / coordinator
     # data below. Control platforms suppress themselves the same way.
     if not battery_data_only:
-        entities.extend(
-            GivEnergyInverterSensor(coordinator, description)
+        inverter_sensors = [
+            GivEnergyInverterSensor(coordinator, description, throttle=throttle)
             for description in INVERTER_SENSORS
             if _include_inverter_sensor(
                 description, inverter, is_three_phase, is_aio, ems is not None
             )
-        )
+        ]
+        entities.extend(inverter_sensors)
+        # The fast lane's power-flow twins (CONF_FAST_LANE_INTERVAL; never in
+        # passive mode, where the coordinator leaves the interval at 0).
+        if coordinator.fast_lane_interval:
+            entities.extend(
+                GivEnergyFastPowerSensor(coordinator, sensor.entity_description, sensor.device_info)
+                for sensor in inverter_sensors
+                if sensor.entity_description.fast_lane
+            )
 
     if ems is not None:
         # EMS controller plant-level aggregates the inverter registers don't carry
@@ -1980,18 +2345,18 @@ async def async_setup_entry(
             GivEnergyBatterySensor(coordinator, description, battery_index)
             for description in BATTERY_SENSORS
         )
-        if expose_per_cell:
-            entities.extend(
-                GivEnergyBatterySensor(coordinator, description, battery_index)
-                for description in BATTERY_CELL_SENSORS
-            )
+        serial = battery.serial_number
+        cell_summaries(serial, serial or f"battery_{battery_index}", entities[-1])
+        entities.extend(
+            GivEnergyBatterySensor(coordinator, description, battery_index)
+            for description in cells(serial, BATTERY_CELL_SENSORS)
+        )
 
     # AIO per-module battery devices (#192) — empty on non-AIO plants. A module
     # with a blank/invalid serial can't anchor a device, so skip it; the index
     # still aligns with `aio_battery_modules` for the entities we do create.
-    # Like the battery entities, this set is fixed at setup: a module absent
-    # during the initial probe gets no entities until a reload (tracked in #148,
-    # to be fixed uniformly for all device types).
+    # A module absent during the initial probe gets its entities from the
+    # entity sync once the topology heals (#148), as for every device type.
     seen_module_serials: set[str] = set()
     for module_index, module in enumerate(coordinator.data.aio_battery_modules):
         if not module.is_valid():
@@ -2014,11 +2379,11 @@ async def async_setup_entry(
             GivEnergyAioModuleSensor(coordinator, description, module_index)
             for description in AIO_MODULE_SENSORS
         )
-        if expose_per_cell:
-            entities.extend(
-                GivEnergyAioModuleSensor(coordinator, description, module_index)
-                for description in AIO_MODULE_CELL_SENSORS
-            )
+        cell_summaries(module.serial_number, module.serial_number, entities[-1])
+        entities.extend(
+            GivEnergyAioModuleSensor(coordinator, description, module_index)
+            for description in cells(module.serial_number, AIO_MODULE_CELL_SENSORS)
+        )
 
     # HV battery stack (BCU) devices (#95) — empty on non-HV plants. Each stack
     # is its own device, parented to the inverter, identified by the inverter
@@ -2038,7 +2403,7 @@ async def async_setup_entry(
         )
         # HV per-module (BMU) devices (#179), nested under the stack. Roll-ups are
         # always created; the 24+24 per-cell entities are gated behind
-        # expose_per_cell. Dedup by serial (cross-stack — see seen_bmu_serials above).
+        # expose_per_cell (or a pin). Dedup by serial (cross-stack — see seen_bmu_serials above).
         for bmu_index, bmu in enumerate(stack.bmus):
             if not bmu.is_valid():
                 continue
@@ -2057,11 +2422,11 @@ async def async_setup_entry(
                 GivEnergyHvModuleSensor(coordinator, description, stack_index, bmu_index)
                 for description in HV_MODULE_SENSORS
             )
-            if expose_per_cell:
-                entities.extend(
-                    GivEnergyHvModuleSensor(coordinator, description, stack_index, bmu_index)
-                    for description in HV_MODULE_CELL_SENSORS
-                )
+            cell_summaries(bmu.serial_number, bmu.serial_number, entities[-1])
+            entities.extend(
+                GivEnergyHvModuleSensor(coordinator, description, stack_index, bmu_index)
+                for description in cells(bmu.serial_number, HV_MODULE_CELL_SENSORS)
+            )
 
     # EMS-managed inverters — empty unless this is an EMS plant. The 0x11 device
     # is the EMS controller; each inverter it manages is a blinded rollup summary
@@ -2086,8 +2451,20 @@ async def async_setup_entry(
     entities.extend(
         GivEnergyCoordinatorSensor(coordinator, description) for description in COORDINATOR_SENSORS
     )
+    if coordinator.bank_scheduler is not None:
+        entities.extend(
+            GivEnergyCoordinatorSensor(coordinator, description)
+            for description in BANK_SCHEDULER_SENSORS
+        )
+    if coordinator.pipeline is not None:
+        entities.extend(
+            GivEnergyCoordinatorSensor(coordinator, description) for description in PIPELINE_SENSORS
+        )
 
-    async_add_entities(entities)
+    for entity in entities:
+        if isinstance(entity, _VectorValue):
+            entity.bind_value_vector(values)
+    return entities
 
 
 _MODEL_NAMES: dict[Model, str] = {
@@ -2190,6 +2567,268 @@ def _source_ir_registers(model_cls: type, key: str) -> tuple[Register, ...]:
     return tuple(r for r in getter.registers_of(key) if r.reg_type == "IR")
 
 
+def _covering_blocks(
+    blocks: Iterable[BlockKey], registers: tuple[Register, ...]
+) -> tuple[tuple[BlockKey, ...], ...]:
+    """For each register, the stamped windows whose span covers it (uncovered ones
+    are dropped: never committed is not a staleness signal). Duplicates collapse,
+    so registers sharing a bank are checked once."""
+    blocks = tuple(blocks)
+    groups: dict[tuple[BlockKey, ...], None] = {}
+    for register in registers:
+        group = tuple(
+            block
+            for block in blocks
+            if block[0] == register.reg_type and block[1] <= register.index < block[1] + block[2]
+        )
+        if group:
+            groups[group] = None
+    return tuple(groups)
+
+
+# Identifies the model object a sensor reads its value off: ("inverter",),
+# ("battery", serial), ("aio_module", serial), … Sensors naming the same source
+# share one resolution of it per tick.
+_SourceKey = tuple[Any, ...]
+_Resolver = Callable[[Plant], Any]
+
+# Marks a value-vector slot not yet evaluated this tick (None is a real value).
+_UNSET: Any = object()
+
+
+class _ValueVector:
+    """Per-tick vector of every plant-data sensor's raw value, shared by the platform.
+
+    Platform setup compiles each sensor into a slot: the source it reads (the
+    inverter, one pack, one module, …) paired with its description's value_fn,
+    deduplicated by (source, key). After each coordinator fan-out a slot is
+    evaluated on its first read and then served from the vector, so HA's repeated
+    ``native_value`` reads during one state write (and the change gate's
+    comparison read) are an index lookup, and each source is resolved at most
+    once. Cell roll-ups are read off the coordinator's cell statistics snapshot
+    rather than the model. Per-tick cost follows the distinct fields read, not
+    entity count times property reads.
+    """
+
+    def __init__(self, coordinator: GivEnergyUpdateCoordinator) -> None:
+        self._coordinator = coordinator
+        self._resolvers: list[_Resolver] = []
+        self._source_slots: dict[_SourceKey, int] = {}
+        self._fields: list[tuple[int, Callable[[Any], Any]]] = []
+        self._field_slots: dict[tuple[_SourceKey, str], int] = {}
+        self._generation: int | None = None
+        self._objects: list[Any] = []
+        self._values: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def bind(
+        self, source: _SourceKey, resolve: _Resolver, key: str, value_fn: Callable[[Any], Any]
+    ) -> int:
+        """Return the slot for ``key`` on ``source``, compiling it on first sight."""
+        slot = self._field_slots.get((source, key))
+        if slot is not None:
+            return slot
+        source_slot = self._source_slot(source, resolve)
+        slot = self._field_slots[(source, key)] = len(self._fields)
+        self._fields.append((source_slot, value_fn))
+        self._values.append(_UNSET)
+        return slot
+
+    def _sync_generation(self) -> None:
+        generation = self._coordinator.update_generation
+        if generation != self._generation:
+            self._generation = generation
+            self._objects = [_UNSET] * len(self._resolvers)
+            self._values = [_UNSET] * len(self._fields)
+
+    def _object(self, source_slot: int) -> Any:
+        obj = self._objects[source_slot]
+        if obj is _UNSET:
+            data = self._coordinator.data
+            obj = self._resolvers[source_slot](data) if data is not None else None
+            self._objects[source_slot] = obj
+        return obj
+
+    def _source_slot(self, source: _SourceKey, resolve: _Resolver) -> int:
+        source_slot = self._source_slots.get(source)
+        if source_slot is None:
+            source_slot = self._source_slots[source] = len(self._resolvers)
+            self._resolvers.append(resolve)
+            self._objects.append(_UNSET)
+        return source_slot
+
+    def source(self, source: _SourceKey, resolve: _Resolver) -> Any:
+        """``source`` resolved against this tick's data, at most once per tick."""
+        self._sync_generation()
+        return self._object(self._source_slot(source, resolve))
+
+    def value(self, slot: int) -> Any:
+        self._sync_generation()
+        value = self._values[slot]
+        if value is not _UNSET:
+            return value
+        source_slot, value_fn = self._fields[slot]
+        obj = self._object(source_slot)
+        if obj is None:
+            value = None
+        elif isinstance(value_fn, _CellRollup) and (
+            stats := self._coordinator.cell_stats.get(obj.serial_number)
+        ):
+            value = stats.rollup(value_fn.prefix, value_fn.stat)
+        else:
+            value = value_fn(obj)
+        self._values[slot] = value
+        return value
+
+
+class _VectorValue(ABC):
+    """Reads the entity's raw value through the platform's shared _ValueVector.
+
+    Entities constructed outside platform setup (no vector bound) evaluate their
+    value_fn directly, exactly as the vector would. Entity's metaclass already
+    derives from ABCMeta, so this mixes into entity classes cleanly.
+    """
+
+    coordinator: GivEnergyUpdateCoordinator
+    entity_description: Any
+    _value_vector: _ValueVector | None = None
+    _value_slot: int = 0
+
+    @abstractmethod
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        """The (source key, resolver) of the model object this entity reads."""
+
+    def bind_value_vector(self, vector: _ValueVector) -> None:
+        source, resolve = self._value_source()
+        self._value_vector = vector
+        self._value_slot = vector.bind(
+            source, resolve, self.entity_description.key, self.entity_description.value_fn
+        )
+
+    def _raw_value(self) -> Any:
+        if self._value_vector is not None:
+            return self._value_vector.value(self._value_slot)
+        data = self.coordinator.data
+        obj = self._value_source()[1](data) if data is not None else None
+        return None if obj is None else self.entity_description.value_fn(obj)
+
+
+def _lv_batteries(plant: Plant) -> dict[str, tuple[int, Battery]]:
+    """Each LV pack's (device address, model), keyed by serial.
+
+    Plant.batteries only decodes the addresses that have a register cache, so a
+    pack that answered late, or was added or removed, shifts every later pack's
+    list position; pairing the list back up with its addresses the same way
+    lets entities follow their own pack by serial. A pack without a decoded
+    serial is keyed ``battery_<index>``, as in the cell statistics.
+    """
+    batteries = plant.batteries
+    capabilities = plant.capabilities
+    if capabilities is None:
+        addresses: list[int] = [0x32 + index for index in range(len(batteries))]
+    else:
+        addresses = capabilities.lv_battery_addresses
+        caches = plant.register_caches
+        if isinstance(caches, dict):  # not a test double
+            addresses = [address for address in addresses if address in caches]
+    packs: dict[str, tuple[int, Battery]] = {}
+    for index, (address, battery) in enumerate(zip(addresses, batteries, strict=False)):
+        packs.setdefault(battery.serial_number or f"battery_{index}", (address, battery))
+    return packs
+
+
+def _battery_by_serial(plant: Plant, serial: str) -> Battery | None:
+    pack = _lv_batteries(plant).get(serial)
+    return pack[1] if pack is not None else None
+
+
+def _aio_module_by_serial(plant: Plant, serial: str) -> AioBatteryModule | None:
+    return next((m for m in plant.aio_battery_modules if m.serial_number == serial), None)
+
+
+def _hv_stack_by_address(plant: Plant, address: int) -> HvStack | None:
+    return next((s for s in plant.hv_stacks if s.device_address == address), None)
+
+
+def _hv_stack_bcu(plant: Plant, address: int) -> Bcu | None:
+    stack = _hv_stack_by_address(plant, address)
+    return stack.bcu if stack is not None else None
+
+
+def _bmu_by_serial(plant: Plant, serial: str) -> Bmu | None:
+    for stack in plant.hv_stacks:
+        for bmu in stack.bmus:
+            if bmu.serial_number == serial:
+                return bmu
+    return None
+
+
+def _managed_summary_by_serial(plant: Plant, serial: str) -> InverterSummary | None:
+    if plant.ems is None:
+        return None
+    return next((s for s in plant.ems.managed_inverters if s.serial_number == serial), None)
+
+
+class _ChangeGatedWrite:
+    """Skips the per-tick state write when nothing the entity exposes has changed.
+
+    A CoordinatorEntity writes its state on every refresh by default, which on a
+    large plant means hundreds of identical writes per tick through the event bus
+    and recorder. This gate sits in front of that write. When the backing
+    device's register cache is unchanged since the last fan-out (see
+    GivEnergyUpdateCoordinator.changed_devices) and availability hasn't flipped,
+    the value can't have moved and the write is skipped outright. Otherwise the
+    (available, value, attributes) signature is compared against the last one
+    written. Each skipped write is counted on the coordinator.
+
+    Entities whose ``native_value`` has side effects (the monotonic clamp) set
+    ``_gate_on_value = False``: evaluating the value twice per tick would advance
+    the clamp's clock, so they only use the register-level check.
+    """
+
+    coordinator: GivEnergyUpdateCoordinator
+    _gate_on_value: bool = True
+    _written_available: bool | None = None
+    _written_signature: tuple[Any, ...] | None = None
+
+    def _backing_device_address(self) -> int | None:
+        """The device whose registers back this entity, or None if not resolvable."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        available = self.available  # type: ignore[attr-defined]
+        if (
+            available == self._written_available
+            and self.coordinator.changed_devices is not None
+            and self.coordinator.device_unchanged(self._backing_device_address())
+        ):
+            self.coordinator.record_suppressed_write()
+            return
+        signature: tuple[Any, ...] | None = None
+        if self._gate_on_value:
+            signature = (
+                (available, self.native_value, self.extra_state_attributes)  # type: ignore[attr-defined]
+                if available
+                else (available,)
+            )
+            if signature == self._written_signature:
+                self.coordinator.record_suppressed_write()
+                return
+        if available and self._written_available and not self._publish_due():
+            self.coordinator.record_suppressed_write(throttled=True)
+            return
+        self._written_available = available
+        self._written_signature = signature
+        super()._handle_coordinator_update()  # type: ignore[misc]
+
+    def _publish_due(self) -> bool:
+        """Whether a changed value is worth writing now; see PublishPolicy."""
+        return True
+
+
 class _StaleIRGate:
     """Marks a sensor unavailable when a backing input-register bank has stopped
     committing past a ceiling (#152).
@@ -2197,21 +2836,30 @@ class _StaleIRGate:
     Shared by the inverter, battery and AIO-module sensors — each resolves its own
     device address (the inverter's is fixed, the per-pack/per-module ones come from
     capabilities or the module itself), while this mixin owns the register
-    resolution, the staleness ceiling, and the per-bank age check. Freshness comes
-    from the library's Plant.register_age() (2.3.0, #248), which scans the stamped
-    block windows generically. A held/rejected bank stops being re-stamped, so its
-    age grows past the ceiling and the device's sensors go unavailable instead of
-    showing a confidently-wrong frozen value (#176).
+    resolution, the staleness ceiling, and the per-bank age check. A held/rejected
+    bank stops being re-stamped, so its age grows past the ceiling and the
+    device's sensors go unavailable instead of showing a confidently-wrong frozen
+    value (#176).
+
+    Ages come from the coordinator's per-fan-out block age table: each sensor's
+    registers are resolved to the stamped windows covering them once per device
+    (again only if the set of windows changes), so ``available`` is a few dict
+    lookups. Without a table (an entity built around a bare coordinator double)
+    it falls back to the library's Plant.register_age() (2.3.0, #248).
     """
 
     coordinator: GivEnergyUpdateCoordinator
     _source_ir_registers: tuple[Register, ...]
     _stale_ir_ceiling: float
+    _stale_ir_blocks: dict[int, tuple[tuple[BlockKey, ...], ...]]
+    _stale_ir_layout: int | None
 
     def _init_stale_gate(
         self, coordinator: GivEnergyUpdateCoordinator, model_cls: type, key: str
     ) -> None:
         self._source_ir_registers = _source_ir_registers(model_cls, key)
+        self._stale_ir_blocks = {}
+        self._stale_ir_layout = None
         interval = coordinator.update_interval
         self._stale_ir_ceiling = max(
             _STALE_IR_CEILING_FLOOR,
@@ -2224,16 +2872,37 @@ class _StaleIRGate:
         False when there is no resolvable IR source (computed / HR-backed fields) or
         a bank was never committed — neither is a staleness signal.
         """
-        plant = self.coordinator.data
-        for register in self._source_ir_registers:
-            age = plant.register_age(device_address, register)
-            if age is not None and age > self._stale_ir_ceiling:
-                return True
-        return False
+        coordinator = self.coordinator
+        table = coordinator.block_ages
+        if not isinstance(table, dict):
+            plant = coordinator.data
+            for register in self._source_ir_registers:
+                age = plant.register_age(device_address, register)
+                if age is not None and age > self._stale_ir_ceiling:
+                    return True
+            return False
+        ages = table.get(device_address)
+        if not ages:
+            return False
+        if self._stale_ir_layout != coordinator.block_layout_version:
+            self._stale_ir_layout = coordinator.block_layout_version
+            self._stale_ir_blocks = {}
+        groups = self._stale_ir_blocks.get(device_address)
+        if groups is None:
+            groups = self._stale_ir_blocks[device_address] = _covering_blocks(
+                ages, self._source_ir_registers
+            )
+        # A register is as fresh as the freshest window covering it.
+        return any(min(ages[block] for block in group) > self._stale_ir_ceiling for group in groups)
 
 
 class GivEnergyInverterSensor(
-    _StaleIRGate, CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity, RestoreEntity
+    _ChangeGatedWrite,
+    _VectorValue,
+    _StaleIRGate,
+    CoordinatorEntity[GivEnergyUpdateCoordinator],
+    SensorEntity,
+    RestoreEntity,
 ):
     _attr_has_entity_name = True
     entity_description: GivEnergyInverterSensorDescription
@@ -2242,14 +2911,29 @@ class GivEnergyInverterSensor(
         self,
         coordinator: GivEnergyUpdateCoordinator,
         description: GivEnergyInverterSensorDescription,
+        *,
+        throttle: PublishPolicy | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        # ``throttle`` carries the entry's deadband and heartbeat (None when
+        # throttling is off); the description opts in and sets min_interval.
+        policy = description.publish_policy
+        self._publish_policy = (
+            replace(throttle, min_interval=policy.min_interval)
+            if policy is not None and throttle is not None
+            else None
+        )
+        self._published_value: Any = None
+        self._published_at = 0.0
         self._monotonic_max: float | None = None
         self._monotonic_date: date | None = None
         self._monotonic_last_read: datetime | None = None
         self._monotonic_reset_pending: bool | None = False
         self._monotonic_prior_day_value: float | None = None
+        # The clamp's native_value advances its own clock, so it can't be
+        # evaluated an extra time just to compare (see _ChangeGatedWrite).
+        self._gate_on_value = not description.monotonic
         self._init_stale_gate(
             coordinator,
             type(coordinator.data.inverter),
@@ -2302,6 +2986,33 @@ class GivEnergyInverterSensor(
             # spanning midnight, so the late reset must still be admitted.
             self._monotonic_prior_day_value = max(restored, 0.0)
 
+    def _backing_device_address(self) -> int | None:
+        capabilities = self.coordinator.data.capabilities
+        return capabilities.inverter_address if capabilities is not None else None
+
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        return ("inverter",), attrgetter("inverter")
+
+    def _publish_due(self) -> bool:
+        policy = self._publish_policy
+        if policy is None:
+            return True
+        value, last = self.native_value, self._published_value
+        if not isinstance(value, (int, float)) or not isinstance(last, (int, float)):
+            return True
+        elapsed = time.monotonic() - self._published_at
+        if elapsed >= policy.max_interval:
+            return True
+        significant = abs(value - last) >= policy.deadband or (value == 0) != (last == 0)
+        return significant and elapsed >= policy.min_interval
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        if self._publish_policy is not None:
+            self._published_value = self.native_value
+            self._published_at = time.monotonic()
+        super().async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Drop to unavailable when a backing IR bank has stopped committing (#152)."""
@@ -2316,7 +3027,7 @@ class GivEnergyInverterSensor(
 
     @property
     def native_value(self) -> Any:
-        value = self.entity_description.value_fn(self.coordinator.data.inverter)
+        value = self._raw_value()
         if self.entity_description.monotonic and isinstance(value, (int, float)):
             if not self.entity_description.monotonic_resets_daily:
                 # Lifetime counter: pure high-water clamp. Hold the maximum and
@@ -2417,10 +3128,54 @@ class GivEnergyInverterSensor(
         return value
 
 
+class GivEnergyFastPowerSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity):
+    """A power-flow reading refreshed by the coordinator's fast lane between full ticks.
+
+    The twin of a regular inverter power sensor for automations that need 2-5 s
+    updates, kept deliberately plain: its value is read straight off the inverter
+    model on every fast-lane poll and full tick, with no value vector, change
+    gate, stale-bank check or publish policy. No state_class, so the extra rows
+    stay out of long-term statistics; the regular sensor carries those.
+    """
+
+    _attr_has_entity_name = True
+    _attr_state_class = None
+    entity_description: GivEnergyInverterSensorDescription
+
+    def __init__(
+        self,
+        coordinator: GivEnergyUpdateCoordinator,
+        description: GivEnergyInverterSensorDescription,
+        device_info: DeviceInfo | None,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_name = f"{description.name} (Fast)"
+        serial = coordinator.data.inverter_serial_number
+        self._attr_unique_id = f"{serial}_{description.key}_fast"
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_fast_lane_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> Any:
+        return self.entity_description.value_fn(self.coordinator.data.inverter)
+
+
 class GivEnergyBatterySensor(
-    _StaleIRGate, CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity
+    _ChangeGatedWrite,
+    _VectorValue,
+    _StaleIRGate,
+    CoordinatorEntity[GivEnergyUpdateCoordinator],
+    SensorEntity,
 ):
     _attr_has_entity_name = True
+    # The heatmap payload changes every tick; keep it out of the recorder.
+    _unrecorded_attributes = frozenset({"cell_voltages", "cell_voltage_mean", "outlier_cells"})
     entity_description: GivEnergyBatterySensorDescription
 
     def __init__(
@@ -2431,8 +3186,12 @@ class GivEnergyBatterySensor(
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        self._battery_index = battery_index
         battery = coordinator.data.batteries[battery_index]
+        # Bind to the pack's serial, not its list position: Plant.batteries skips
+        # packs without a register cache, so positions shift when a pack answers
+        # late or the topology changes, and the in-place entity sync keeps the
+        # surviving entities. Resolving by serial keeps each entity on its pack.
+        self._battery_serial = battery.serial_number or f"battery_{battery_index}"
         self._init_stale_gate(coordinator, type(battery), description.key)
         precision = _derive_display_precision(description, battery)
         if precision is not None:
@@ -2448,6 +3207,26 @@ class GivEnergyBatterySensor(
             via_device=(DOMAIN, coordinator.data.inverter_serial_number),
         )
 
+    def _pack(self) -> tuple[int, Battery] | None:
+        """This entity's pack (device address, model) in the latest coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        if self._value_vector is not None:
+            packs = self._value_vector.source(("lv_batteries",), _lv_batteries)
+        else:
+            packs = _lv_batteries(data)
+        return packs.get(self._battery_serial)
+
+    def _backing_device_address(self) -> int | None:
+        pack = self._pack()
+        return pack[0] if pack is not None else None
+
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        return ("battery", self._battery_serial), partial(
+            _battery_by_serial, serial=self._battery_serial
+        )
+
     @property
     def available(self) -> bool:
         """Drop to unavailable when this pack's IR bank has stopped committing (#152).
@@ -2456,25 +3235,25 @@ class GivEnergyBatterySensor(
         stops being re-stamped and ages past the ceiling, so the pack's sensors go
         unavailable rather than showing a frozen value (the #176 case).
         """
-        if not super().available:
+        # Unavailable (not cross-wired) when this pack is absent from the poll.
+        pack = self._pack()
+        if not super().available or pack is None:
             return False
         if not self._source_ir_registers:
             return True
-        capabilities = self.coordinator.data.capabilities
-        if capabilities is None or self._battery_index >= len(capabilities.lv_battery_addresses):
-            return True
-        return not self._ir_bank_stale(capabilities.lv_battery_addresses[self._battery_index])
+        return not self._ir_bank_stale(pack[0])
 
     @property
     def native_value(self) -> Any:
-        batteries = self.coordinator.data.batteries
-        if self._battery_index >= len(batteries):
-            return None
-        return self.entity_description.value_fn(batteries[self._battery_index])
+        return self._raw_value()
 
 
 class GivEnergyAioModuleSensor(
-    _StaleIRGate, CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity
+    _ChangeGatedWrite,
+    _VectorValue,
+    _StaleIRGate,
+    CoordinatorEntity[GivEnergyUpdateCoordinator],
+    SensorEntity,
 ):
     """Per-cell sensor for one All-in-One removable battery module (#192).
 
@@ -2516,9 +3295,15 @@ class GivEnergyAioModuleSensor(
         data = self.coordinator.data
         if data is None:
             return None
-        return next(
-            (m for m in data.aio_battery_modules if m.serial_number == self._module_serial),
-            None,
+        return _aio_module_by_serial(data, self._module_serial)
+
+    def _backing_device_address(self) -> int | None:
+        module = self._module()
+        return module.module_address if module is not None else None
+
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        return ("aio_module", self._module_serial), partial(
+            _aio_module_by_serial, serial=self._module_serial
         )
 
     @property
@@ -2535,14 +3320,15 @@ class GivEnergyAioModuleSensor(
 
     @property
     def native_value(self) -> Any:
-        module = self._module()
-        if module is None:
-            return None
-        return self.entity_description.value_fn(module)
+        return self._raw_value()
 
 
 class GivEnergyHvStackSensor(
-    _StaleIRGate, CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity
+    _ChangeGatedWrite,
+    _VectorValue,
+    _StaleIRGate,
+    CoordinatorEntity[GivEnergyUpdateCoordinator],
+    SensorEntity,
 ):
     """Pack-level sensor for one HV battery stack's BCU (#95).
 
@@ -2590,9 +3376,14 @@ class GivEnergyHvStackSensor(
         data = self.coordinator.data
         if data is None:
             return None
-        return next(
-            (s for s in data.hv_stacks if s.device_address == self._stack_address),
-            None,
+        return _hv_stack_by_address(data, self._stack_address)
+
+    def _backing_device_address(self) -> int | None:
+        return self._stack_address
+
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        return ("hv_stack", self._stack_address), partial(
+            _hv_stack_bcu, address=self._stack_address
         )
 
     @property
@@ -2609,13 +3400,12 @@ class GivEnergyHvStackSensor(
 
     @property
     def native_value(self) -> Any:
-        stack = self._stack()
-        if stack is None:
-            return None
-        return self.entity_description.value_fn(stack.bcu)
+        return self._raw_value()
 
 
-class GivEnergyHvModuleSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity):
+class GivEnergyHvModuleSensor(
+    _ChangeGatedWrite, _VectorValue, CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity
+):
     """Per-module sensor for one BMU in an HV battery stack (#179).
 
     Each module is its own HA device, nested under its HV-stack device (which is
@@ -2660,11 +3450,10 @@ class GivEnergyHvModuleSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], Sen
         data = self.coordinator.data
         if data is None:
             return None
-        for stack in data.hv_stacks:
-            for bmu in stack.bmus:
-                if bmu.serial_number == self._bmu_serial:
-                    return bmu
-        return None
+        return _bmu_by_serial(data, self._bmu_serial)
+
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        return ("hv_module", self._bmu_serial), partial(_bmu_by_serial, serial=self._bmu_serial)
 
     @property
     def available(self) -> bool:
@@ -2672,13 +3461,174 @@ class GivEnergyHvModuleSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], Sen
 
     @property
     def native_value(self) -> Any:
-        bmu = self._bmu()
-        if bmu is None:
+        return self._raw_value()
+
+
+class _CellStatsSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity):
+    """A whole-pack / module view over the coordinator's cell statistics snapshot."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unique_id_suffix: str
+
+    def __init__(
+        self,
+        coordinator: GivEnergyUpdateCoordinator,
+        serial: str,
+        stats_key: str,
+        device_info: DeviceInfo | None,
+    ) -> None:
+        super().__init__(coordinator)
+        self._serial = serial
+        self._stats_key = stats_key
+        self._attr_unique_id = f"{serial}_{self._unique_id_suffix}"
+        # The sibling roll-up's device, so this entity lands on the same one.
+        self._attr_device_info = device_info
+
+    def _stats(self) -> CellStats | None:
+        return self.coordinator.cell_stats.get(self._stats_key)
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._stats() is not None
+
+
+class GivEnergyCellArraySensor(_ChangeGatedWrite, _CellStatsSensor):
+    """Every cell of one pack / module in a single entity, for the lean per-cell mode.
+
+    With per-cell exposure off, this stands in for the pack / module's 20-48
+    individual cell entities: its state is the mean cell voltage, and the cell
+    voltages and temperatures ride along as attributes read off the
+    coordinator's cell statistics snapshot. The arrays are kept out of the
+    recorder — per-cell history is fetched on demand (get_cell_history), and
+    the cells a user pins get their own entities. No state_class, so no
+    long-term statistics either; the min/max/delta roll-ups carry those.
+    """
+
+    _attr_name = "Cells"
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+    _attr_device_class = SensorDeviceClass.VOLTAGE
+    _attr_suggested_display_precision = 3
+    _unrecorded_attributes = frozenset(
+        {"cell_voltages", "cell_temperatures", "outlier_cells", "pinned_cells"}
+    )
+    _unique_id_suffix = "cell_array"
+
+    @property
+    def native_value(self) -> float | None:
+        stats = self._stats()
+        if stats is None or stats.v_mean is None:
+            return None
+        return round(stats.v_mean, 4)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        stats = self._stats()
+        if stats is None:
+            return None
+        prefix = f"{self._serial}_"
+        return {
+            "cell_voltages": list(stats.voltages),
+            "cell_temperatures": {
+                temperature_label(stats, index): t for index, t in enumerate(stats.temperatures)
+            },
+            "outlier_cells": list(stats.outliers),
+            "pinned_cells": sorted(
+                uid.removeprefix(prefix)
+                for uid in self.coordinator.pinned_cells
+                if uid.startswith(prefix)
+            ),
+        }
+
+
+def _millivolts(volts: float | None) -> int | None:
+    return round(volts * 1000) if volts is not None else None
+
+
+class GivEnergyCellVectorSensor(_ChangeGatedWrite, _CellStatsSensor):
+    """One pack / module's cells packed into a single recorded state (CONF_CELL_VECTOR_SENSORS).
+
+    The state is the cell voltage spread in mV; the attributes carry every cell
+    voltage as integer mV and every temperature reading to 0.1 °C — the most
+    compact form that still round-trips the BMS's resolution — so the recorder
+    writes one small row per pack per change instead of one row per cell. No
+    state_class, so nothing here reaches long-term statistics. The heatmap card
+    reads ``cell_mv`` in place of the per-cell entities.
+    """
+
+    _attr_name = "Cell Vector"
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.MILLIVOLT
+    _attr_device_class = SensorDeviceClass.VOLTAGE
+    _attr_suggested_display_precision = 0
+    _unique_id_suffix = "cell_vector"
+
+    @property
+    def native_value(self) -> int | None:
+        stats = self._stats()
+        return _millivolts(stats.v_spread) if stats is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        stats = self._stats()
+        if stats is None:
             return None
-        return self.entity_description.value_fn(bmu)
+        return {
+            "cell_mv": [_millivolts(v) for v in stats.voltages],
+            "cell_temps": [round(t, 1) if t is not None else None for t in stats.temperatures],
+            "cells_per_temp": stats.cells_per_temperature,
+        }
+
+
+class GivEnergyCellDriftSensor(_ChangeGatedWrite, _CellStatsSensor):
+    """The pack / module's cells ranked by long-term drift from the pack mean.
+
+    Backed by the coordinator's persisted CellDriftTracker: the state is the
+    worst cell's averaged deviation from the pack mean (mV, so long-term
+    statistics chart the pack's balance trend with one series), and the
+    attributes list the worst cells with their deviation, today's range and
+    fitted drift slope — an early warning without recording any cell.
+    """
+
+    _attr_name = "Worst Cell Drift"
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.MILLIVOLT
+    _attr_device_class = SensorDeviceClass.VOLTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _unique_id_suffix = "cell_drift"
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._stats_key in self.coordinator.cell_drift
 
+    @property
+    def native_value(self) -> float | None:
+        ranked = self.coordinator.cell_drift.cells(self._stats_key)
+        return round(abs(ranked[0].deviation), 1) if ranked else None
 
-class GivEnergyManagedInverterSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity):
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        drift = self.coordinator.cell_drift
+        ranked = drift.cells(self._stats_key)
+        if not ranked:
+            return None
+        return {
+            "worst_cells": [
+                {
+                    "cell": c.cell,
+                    "deviation_mv": round(c.deviation, 1),
+                    "today_min_mv": round(c.day_min, 1) if c.day_min is not None else None,
+                    "today_max_mv": round(c.day_max, 1) if c.day_max is not None else None,
+                    "slope_mv_per_day": round(c.slope, 2) if c.slope is not None else None,
+                }
+                for c in ranked[:WORST_CELLS]
+            ],
+            "days_tracked": drift.days_tracked(self._stats_key),
+        }
+
+
+class GivEnergyManagedInverterSensor(
+    _ChangeGatedWrite, _VectorValue, CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity
+):
     """Summary sensor for one EMS-managed inverter.
 
     On an EMS plant the 0x11 device is the EMS *controller*; the inverters it
@@ -2726,11 +3676,18 @@ class GivEnergyManagedInverterSensor(CoordinatorEntity[GivEnergyUpdateCoordinato
     def _summary(self) -> InverterSummary | None:
         """Resolve this entity's managed inverter by serial in the latest data."""
         data = self.coordinator.data
-        if data is None or data.ems is None:
+        if data is None:
             return None
-        return next(
-            (s for s in data.ems.managed_inverters if s.serial_number == self._serial),
-            None,
+        return _managed_summary_by_serial(data, self._serial)
+
+    def _backing_device_address(self) -> int | None:
+        # The rollup lives in the controller's EMS block.
+        capabilities = self.coordinator.data.capabilities
+        return capabilities.inverter_address if capabilities is not None else None
+
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        return ("managed_inverter", self._serial), partial(
+            _managed_summary_by_serial, serial=self._serial
         )
 
     @property
@@ -2741,13 +3698,12 @@ class GivEnergyManagedInverterSensor(CoordinatorEntity[GivEnergyUpdateCoordinato
 
     @property
     def native_value(self) -> Any:
-        summary = self._summary()
-        if summary is None:
-            return None
-        return self.entity_description.value_fn(summary)
+        return self._raw_value()
 
 
-class GivEnergyEmsSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity):
+class GivEnergyEmsSensor(
+    _ChangeGatedWrite, _VectorValue, CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity
+):
     """Plant-level telemetry sensor for an EMS controller (device 0x11).
 
     On an EMS plant the 0x11 device is the controller, not an inverter, so its
@@ -2780,16 +3736,20 @@ class GivEnergyEmsSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEn
             serial_number=serial,
         )
 
+    def _backing_device_address(self) -> int | None:
+        capabilities = self.coordinator.data.capabilities
+        return capabilities.inverter_address if capabilities is not None else None
+
+    def _value_source(self) -> tuple[_SourceKey, _Resolver]:
+        return ("ems",), attrgetter("ems")
+
     @property
     def available(self) -> bool:
         return super().available and self.coordinator.data.ems is not None
 
     @property
     def native_value(self) -> Any:
-        ems = self.coordinator.data.ems
-        if ems is None:
-            return None
-        return self.entity_description.value_fn(ems)
+        return self._raw_value()
 
 
 class GivEnergyCoordinatorSensor(CoordinatorEntity[GivEnergyUpdateCoordinator], SensorEntity):
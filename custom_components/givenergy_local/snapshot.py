@@ -0,0 +1,100 @@
+"""Warm-start Plant snapshot: the last good register cache, persisted per entry.
+
+Setup otherwise blocks on a full connect → detect → load_config before a single
+entity exists. With a snapshot on disk (and a matching persisted topology), the
+coordinator is seeded from it, the platforms enumerate their entities straight
+away, and the live connect runs in the background.
+
+The payload is compact: the register caches in the library's hex probe-dump
+format (``to_compact``, one row per 60-register block) plus each committed
+block's age at save time. The block ages are restored as commit stamps, so the
+stale-IR gate reads a snapshot's values as exactly as old as they are — within
+the ceiling they display, past it the IR-backed sensors go unavailable until
+the first live poll lands (stale-until-fresh).
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from givenergy_modbus.model.plant import Plant, PlantCapabilities
+from givenergy_modbus.model.register_cache import parse_compact, to_compact
+
+_LOGGER = logging.getLogger(__name__)
+
+# Snapshots older than this are ignored: a warm start should show what the
+# plant looked like moments before the restart, not a long-gone state.
+SNAPSHOT_MAX_AGE = timedelta(hours=1)
+
+# Minimum spacing of the periodic snapshot saves while polling (seconds). The
+# snapshot is also written on Home Assistant stop and on entry unload.
+SNAPSHOT_SAVE_INTERVAL = 600
+
+
+@dataclass(frozen=True)
+class PlantSnapshot:
+    plant: Plant
+    saved_at: datetime
+
+
+def encode_snapshot(plant: Plant, now: datetime) -> dict[str, Any] | None:
+    """Serialise ``plant``'s register caches and block ages, or None if not a real Plant."""
+    caches = getattr(plant, "register_caches", None)
+    stamps = getattr(plant, "register_block_updated_at", None)
+    capabilities = getattr(plant, "capabilities", None)
+    if (
+        not isinstance(caches, dict)
+        or not isinstance(stamps, dict)
+        or not isinstance(capabilities, PlantCapabilities)
+    ):
+        return None
+    return {
+        "saved_at": now.isoformat(),
+        "capabilities": capabilities.to_dict(),
+        "inverter_serial_number": plant.inverter_serial_number,
+        "data_adapter_serial_number": plant.data_adapter_serial_number,
+        "registers": to_compact(caches),
+        "blocks": [
+            [address, reg_type, base, count, round((now - stamped).total_seconds(), 1)]
+            for (address, reg_type, base, count), stamped in sorted(stamps.items())
+        ],
+    }
+
+
+def decode_snapshot(
+    payload: dict[str, Any], prior: PlantCapabilities, now: datetime
+) -> PlantSnapshot | None:
+    """Rebuild a Plant from ``payload``, or None if it is stale, foreign or corrupt.
+
+    The snapshot is only trusted against the persisted topology it was taken
+    with: entities are enumerated from its capabilities, and the live detect()
+    confirms them against the same prior.
+    """
+    try:
+        saved_at = datetime.fromisoformat(payload["saved_at"])
+        if now - saved_at > SNAPSHOT_MAX_AGE:
+            _LOGGER.debug("Plant snapshot from %s is too old for a warm start", saved_at)
+            return None
+        if PlantCapabilities.from_dict(payload["capabilities"]) != prior:
+            _LOGGER.debug("Plant snapshot was taken with a different topology; ignoring it")
+            return None
+        caches = parse_compact(payload["registers"])
+        if not caches:
+            return None
+        plant = Plant(
+            register_caches=caches,
+            inverter_serial_number=payload["inverter_serial_number"],
+            data_adapter_serial_number=payload["data_adapter_serial_number"],
+        )
+        plant.capabilities = prior
+        for address, reg_type, base, count, age in payload["blocks"]:
+            plant.register_block_updated_at[(address, reg_type, base, count)] = (
+                saved_at - timedelta(seconds=age)
+            )
+    except (KeyError, ValueError, TypeError) as exc:
+        _LOGGER.debug("Plant snapshot rejected: %s", exc)
+        return None
+    return PlantSnapshot(plant=plant, saved_at=saved_at)
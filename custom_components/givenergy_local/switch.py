@@ -145,7 +145,7 @@ class GivEnergySwitchEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Switc
 
     @property
     def is_on(self) -> bool:
-        return self.entity_description.is_on_fn(self.coordinator.data.inverter)
+        return self.entity_description.is_on_fn(self.coordinator.displayed_inverter)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         await self._send_command(self.entity_description.turn_on_cmd())
@@ -157,8 +157,7 @@ class GivEnergySwitchEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Switc
         client = self.coordinator._client
         if client is None or not client.connected:
             return
-        await client.one_shot_command(cmd)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(cmd)
 
 
 class GivEnergyEmsSwitchEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], SwitchEntity):
@@ -199,5 +198,4 @@ class GivEnergyEmsSwitchEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Sw
         client = self.coordinator._client
         if client is None or not client.connected:
             return
-        await client.one_shot_command(cmd)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(cmd)
@@ -309,7 +309,7 @@ class GivEnergyTimeEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], TimeEnt
 
     @property
     def native_value(self) -> dt_time | None:
-        slot = self.entity_description.slot_fn(self.coordinator.data.inverter)
+        slot = self.entity_description.slot_fn(self.coordinator.displayed_inverter)
         if slot is None:
             return None
         return slot.start if self.entity_description.is_start else slot.end
@@ -318,11 +318,11 @@ class GivEnergyTimeEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], TimeEnt
         client = self.coordinator._client
         if client is None or not client.connected:
             return
-        inverter = self.coordinator.data.inverter
+        # A pending write to the slot's other end must survive this one.
+        inverter = self.coordinator.displayed_inverter
         if self.entity_description.slot_fn(inverter) is None:
             return
-        await client.one_shot_command(self.entity_description.setter_fn(value, inverter))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(self.entity_description.setter_fn(value, inverter))
 
 
 class GivEnergyEmsTimeEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], TimeEntity):
@@ -360,5 +360,4 @@ class GivEnergyEmsTimeEntity(CoordinatorEntity[GivEnergyUpdateCoordinator], Time
         client = self.coordinator._client
         if client is None or not client.connected:
             return
-        await client.one_shot_command(self.entity_description.setter_fn(value))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writes.submit(self.entity_description.setter_fn(value))
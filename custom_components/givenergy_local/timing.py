@@ -0,0 +1,118 @@
+"""Rolling poll-timing instrumentation for the coordinator.
+
+Each tick is broken into phases — ``connect`` / ``detect`` (reconnect ticks
+only), ``load_config`` (full ticks only), ``refresh`` (the IR reads), ``fan_out``
+(the entity listener pass) and ``tick`` (the whole update), plus ``read_back``
+(a control write's targeted re-read) and ``fast_lane`` (a fast-lane power-flow
+read), both outside any tick — and each phase's
+duration is kept in a fixed-size rolling window so its p50/p95/p99 can be read
+off at any time. Per device, the window holds how far into the tick that
+device's last register bank committed (from the Plant's block stamps), which
+shows which device the tick is waiting on. Surfaced as diagnostic sensors and
+in the config entry's diagnostics download, to size scan intervals on busy
+dongles.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+
+# Samples kept per series: at the default 30 s scan interval, ~50 minutes.
+TIMING_WINDOW = 100
+
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+PHASES: tuple[str, ...] = (
+    "connect",
+    "detect",
+    "load_config",
+    "refresh",
+    "fan_out",
+    "tick",
+    "read_back",
+    "fast_lane",
+)
+
+
+def percentile(ordered: list[float], pct: int) -> float:
+    """Nearest-rank ``pct`` percentile of the non-empty sorted ``ordered``."""
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RollingTimings:
+    """Named series of durations (seconds), each capped at ``window`` samples."""
+
+    def __init__(self, window: int = TIMING_WINDOW) -> None:
+        self.window = window
+        self._series: dict[str, deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = deque(maxlen=self.window)
+        series.append(seconds)
+
+    @contextmanager
+    def measure(self, key: str) -> Iterator[None]:
+        """Record the wall time of the ``with`` body under ``key``, even if it raises."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(key, time.monotonic() - started)
+
+    def percentile(self, key: str, pct: int) -> float | None:
+        series = self._series.get(key)
+        if not series:
+            return None
+        return percentile(sorted(series), pct)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Per series: p50/p95/p99, the latest sample and the sample count."""
+        out: dict[str, dict[str, Any]] = {}
+        for key, series in self._series.items():
+            if not series:
+                continue
+            ordered = sorted(series)
+            out[key] = {
+                **{f"p{pct}": round(percentile(ordered, pct), 3) for pct in PERCENTILES},
+                "last": round(series[-1], 3),
+                "samples": len(series),
+            }
+        return out
+
+
+class PollTimings:
+    """Per-phase and per-device rolling timings for one coordinator."""
+
+    def __init__(self, window: int = TIMING_WINDOW) -> None:
+        self.phases = RollingTimings(window)
+        self.devices = RollingTimings(window)
+
+    def record_device_commits(
+        self, stamps: dict[tuple[int, str, int, int], datetime], tick_started: datetime
+    ) -> None:
+        """Record, per device, how long into the tick its last bank committed.
+
+        Only banks stamped during this tick count, so a device whose reads were
+        skipped (adaptive polling, absent banks) records nothing for it.
+        """
+        latest: dict[int, float] = {}
+        for (address, _reg_type, _base, _count), stamped in stamps.items():
+            if stamped < tick_started:
+                continue
+            offset = (stamped - tick_started).total_seconds()
+            if offset > latest.get(address, -1.0):
+                latest[address] = offset
+        for address, offset in latest.items():
+            self.devices.record(f"0x{address:02x}", offset)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"phases": self.phases.summary(), "devices": self.devices.summary()}
@@ -0,0 +1,478 @@
+"""Coalesced control writes: one batched command and a targeted read-back.
+
+Each control entity used to send its own ``one_shot_command()`` and then ask
+the coordinator for a full refresh. An automation that sets a charge slot's
+start, end and target together cost three command round trips and three
+complete refresh cycles (every HR and IR bank) for a handful of registers.
+Entity writes now go through the coordinator's :class:`WriteQueue` instead:
+
+* Requests arriving within ``WRITE_COALESCE_WINDOW`` of the first are flushed
+  as one ``one_shot_command()`` batch. The protocol has no multi-register write
+  (each register is its own function-6 frame), so the gain is one validation
+  pass and one train of frames on the wire rather than fewer frames. A
+  register written twice in a window is sent once, with the last value: two
+  in-flight writes to one register share a response shape, and the client
+  would cancel the first.
+* The batch is confirmed by reading back only the written holding registers
+  (``GivEnergyUpdateCoordinator.async_read_back``) instead of a full refresh.
+  The write echo has already patched the cache; the read-back catches a value
+  the inverter clamped or ignored. If the read-back fails, a normal refresh is
+  requested.
+* A submitted value is shown straight away. :class:`OptimisticOverlay` holds
+  it, keyed by register, as a layer the controls read on top of the register
+  cache; the cache itself only ever holds what the inverter returned. The
+  first read issued after the write's acknowledgement confirms it (recording
+  the write-to-confirm latency) or, if the inverter holds something else,
+  drops it and counts a mismatch. A read already in flight when the write
+  landed settles nothing. A failed write drops the layer, showing the polled
+  value again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from givenergy_modbus.exceptions import InvalidPduState
+from givenergy_modbus.model.inverter import SinglePhaseInverter
+from givenergy_modbus.model.inverter_threephase import ThreePhaseInverter, select_inverter
+from givenergy_modbus.model.plant import Plant, PlantCapabilities
+from givenergy_modbus.model.register import HR
+from givenergy_modbus.model.register_cache import RegisterCache
+from givenergy_modbus.pdu import TransparentRequest, WriteHoldingRegisterRequest
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .timing import RollingTimings
+
+if TYPE_CHECKING:
+    from .coordinator import GivEnergyUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long the first write of a batch waits for others to join it (seconds).
+# Long enough to catch the writes of one automation step or script, short
+# enough not to be noticed on a single UI change.
+WRITE_COALESCE_WINDOW = 0.25
+
+# Unwritten registers tolerated inside one read-back run: reading a few extra
+# registers is cheaper than another round trip.
+READBACK_MAX_GAP = 4
+
+# Registers per read-back request — the library's block size.
+READBACK_MAX_COUNT = 60
+
+
+def coalesce(requests: Iterable[TransparentRequest]) -> list[TransparentRequest]:
+    """Drop all but the last write to each register, keeping the survivors' order."""
+    requests = list(requests)
+    last: dict[tuple[int, int], int] = {}
+    for index, request in enumerate(requests):
+        if isinstance(request, WriteHoldingRegisterRequest):
+            last[(request.device_address, request.register)] = index
+    return [
+        request
+        for index, request in enumerate(requests)
+        if not isinstance(request, WriteHoldingRegisterRequest)
+        or last[(request.device_address, request.register)] == index
+    ]
+
+
+def readback_ranges(
+    registers: Iterable[int], max_gap: int = READBACK_MAX_GAP
+) -> list[tuple[int, int]]:
+    """Merge ``registers`` into ``(base, count)`` runs for register reads.
+
+    Neighbouring registers share a run while the gap between them is at most
+    ``max_gap`` and the run stays within ``READBACK_MAX_COUNT``.
+    """
+    runs: list[tuple[int, int]] = []
+    for register in sorted(set(registers)):
+        if runs:
+            base, count = runs[-1]
+            if register - (base + count) <= max_gap and register - base < READBACK_MAX_COUNT:
+                runs[-1] = (base, register - base + 1)
+                continue
+        runs.append((register, 1))
+    return runs
+
+
+def block_ranges(
+    registers: Iterable[int],
+    blocks: Iterable[tuple[int, int]],
+    max_gap: int = READBACK_MAX_GAP,
+) -> list[tuple[int, int]]:
+    """Like readback_ranges, but reading through the known ``blocks`` that cover ``registers``.
+
+    A register inside one of ``blocks`` (the ``(base, count)`` windows the
+    regular polls already read) is read with the widest such block, so its
+    response re-stamps a window the Plant already tracks instead of adding an
+    ad-hoc one to register_block_updated_at. Only registers no block covers
+    fall back to merged runs.
+    """
+    blocks = list(blocks)
+    chosen: set[tuple[int, int]] = set()
+    loose: list[int] = []
+    for register in set(registers):
+        covering = [block for block in blocks if block[0] <= register < block[0] + block[1]]
+        if covering:
+            chosen.add(max(covering, key=lambda block: block[1]))
+        else:
+            loose.append(register)
+    return sorted(chosen.union(readback_ranges(loose, max_gap)))
+
+
+def _register_writes(requests: Iterable[TransparentRequest]) -> list[WriteHoldingRegisterRequest]:
+    return [request for request in requests if isinstance(request, WriteHoldingRegisterRequest)]
+
+
+@dataclass
+class OptimisticWrite:
+    value: int
+    # Monotonic time of the submission, for the write-to-confirm latency.
+    submitted: float
+    # When the inverter acknowledged the write; reads issued after it confirm.
+    acked_at: datetime | None = None
+
+
+class OptimisticOverlay:
+    """Written-but-unconfirmed holding-register values, keyed by register.
+
+    A layer over the inverter cache of the Plant the entities display (the
+    coordinator's data), never written into it: warm-start snapshots and
+    content hashes only ever see what the inverter returned. :meth:`inverter`
+    lays the pending values over the cache, so every control reading a written
+    register shows the new value without knowing which registers back it.
+    """
+
+    def __init__(self) -> None:
+        self.writes: dict[int, OptimisticWrite] = {}
+        self.latency = RollingTimings()
+        self.confirmed = 0
+        self.mismatches = 0
+        self.last_mismatch: dict[str, Any] | None = None
+        # The layered model last built, and the cache it was built over.
+        self._view: tuple[RegisterCache, SinglePhaseInverter | ThreePhaseInverter] | None = None
+
+    def apply(self, plant: Plant | None, requests: Iterable[TransparentRequest]) -> int | None:
+        """Show ``requests``' values over ``plant``; returns the device address shown on."""
+        target = _inverter_cache(plant)
+        if target is None:
+            return None
+        now = time.monotonic()
+        for request in _register_writes(requests):
+            self.writes[request.register] = OptimisticWrite(request.value, now)
+        self._view = None
+        return target[0]
+
+    def acknowledge(self, requests: Iterable[TransparentRequest]) -> None:
+        """Mark ``requests`` as accepted by the inverter."""
+        now = dt_util.utcnow()
+        for request in _register_writes(requests):
+            entry = self.writes.get(request.register)
+            if entry is not None and entry.value == request.value and entry.acked_at is None:
+                entry.acked_at = now
+
+    def revert(self, plant: Plant | None, requests: Iterable[TransparentRequest]) -> int | None:
+        """Take ``requests``' values back off the display; returns the device address."""
+        reverted = False
+        for request in _register_writes(requests):
+            entry = self.writes.get(request.register)
+            if entry is None or entry.value != request.value or entry.acked_at is not None:
+                continue
+            del self.writes[request.register]
+            reverted = True
+        if not reverted:
+            return None
+        self._view = None
+        target = _inverter_cache(plant)
+        return target[0] if target is not None else None
+
+    def reconcile(self, plant: Plant | None, issued_at: datetime | None) -> int | None:
+        """Confirm or drop each write a read issued at ``issued_at`` settles.
+
+        A write is settled by a holding-register read covering it that was
+        issued after its acknowledgement: confirmed if the inverter holds the
+        written value, a mismatch otherwise (the read's value then shows). A
+        read issued earlier may have sampled the register before the write
+        landed, however late it commits, so it settles nothing; ``issued_at``
+        None (a fan-out with no read behind it) likewise. Returns the device
+        address when a write was settled, as its displayed value may change.
+        """
+        self._view = None
+        if not self.writes or issued_at is None:
+            return None
+        target = _inverter_cache(plant)
+        if target is None:
+            return None
+        address, cache = target
+        stamps = getattr(plant, "register_block_updated_at", None)
+        if not isinstance(stamps, dict):
+            stamps = {}
+        now = time.monotonic()
+        settled = False
+        for register, entry in list(self.writes.items()):
+            if entry.acked_at is None or issued_at < entry.acked_at:
+                continue
+            read_at = _last_read(stamps, address, register)
+            if read_at is None or read_at < issued_at:
+                # Not covered by this read.
+                continue
+            del self.writes[register]
+            settled = True
+            actual = cache.get(HR(register))
+            if actual == entry.value:
+                self.confirmed += 1
+                self.latency.record("confirm", now - entry.submitted)
+            else:
+                self.mismatches += 1
+                self.last_mismatch = {"register": register, "written": entry.value, "read": actual}
+        return address if settled else None
+
+    def pending(self) -> dict[int, int]:
+        """The value each register with an unconfirmed write is shown at."""
+        return {register: entry.value for register, entry in self.writes.items()}
+
+    def inverter(self, plant: Plant) -> SinglePhaseInverter | ThreePhaseInverter:
+        """``plant``'s inverter model with the unconfirmed writes laid over its registers."""
+        target = _inverter_cache(plant) if self.writes else None
+        if target is None or plant.capabilities is None:
+            return plant.inverter
+        cache = target[1]
+        if self._view is None or self._view[0] is not cache:
+            layered = RegisterCache(cache)
+            for register, entry in self.writes.items():
+                layered[HR(register)] = entry.value
+            self._view = (cache, select_inverter(plant.capabilities.device_type, layered))
+        return self._view[1]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "pending": sorted(self.writes),
+            "confirmed": self.confirmed,
+            "mismatches": self.mismatches,
+            "last_mismatch": self.last_mismatch,
+            "confirm_latency": self.latency.summary().get("confirm"),
+        }
+
+
+def _inverter_cache(plant: Plant | None) -> tuple[int, RegisterCache] | None:
+    """The inverter address and register cache of ``plant``, or None for a test double."""
+    caches = getattr(plant, "register_caches", None)
+    capabilities = getattr(plant, "capabilities", None)
+    if not isinstance(caches, dict) or not isinstance(capabilities, PlantCapabilities):
+        return None
+    cache = caches.get(capabilities.inverter_address)
+    return (capabilities.inverter_address, cache) if cache is not None else None
+
+
+def _last_read(
+    stamps: dict[tuple[int, str, int, int], datetime], address: int, register: int
+) -> datetime | None:
+    """When a holding-register read covering ``register`` on ``address`` last committed."""
+    latest: datetime | None = None
+    for (stamped_address, reg_type, base, count), stamped in stamps.items():
+        if (
+            stamped_address == address
+            and reg_type == "HR"
+            and base <= register < base + count
+            and (latest is None or stamped > latest)
+        ):
+            latest = stamped
+    return latest
+
+
+_CANCELLED = "Write cancelled; the inverter may not have applied it"
+
+
+@dataclass
+class _Submission:
+    requests: list[TransparentRequest]
+    # Resolves to the batch's bus time (seconds).
+    future: asyncio.Future[float]
+
+
+class WriteQueue:
+    """Per-coordinator queue batching entity writes and reading them back."""
+
+    def __init__(
+        self, coordinator: GivEnergyUpdateCoordinator, window: float = WRITE_COALESCE_WINDOW
+    ) -> None:
+        self._coordinator = coordinator
+        self.window = window
+        self._pending: list[_Submission] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # Every flush still running, held until it completes: a window's task
+        # stops being _flush_task once its batch is taken, not when it finishes.
+        self._flushes: set[asyncio.Task[None]] = set()
+        # One batch on the wire at a time, so a batch never races the next one
+        # for the same register.
+        self._lock = asyncio.Lock()
+        self.batches = 0
+        self.submitted = 0
+        self.sent = 0
+        self.readbacks = 0
+        self.readback_failures = 0
+        self.overlay = OptimisticOverlay()
+
+    async def submit(self, requests: Sequence[TransparentRequest]) -> float:
+        """Queue ``requests`` and wait until their batch is written and read back.
+
+        Returns the batch's bus time: seconds from sending the writes to the
+        end of their read-back, excluding the coalescing wait. Raises whatever
+        the write raised; a batch that fails validation is retried per
+        submission, so only the offending caller sees the error.
+        """
+        future: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        self._pending.append(_Submission(list(requests), future))
+        self.submitted += len(requests)
+        self._notify(self.overlay.apply(self._coordinator.data, requests))
+        if self._flush_task is None:
+            coordinator = self._coordinator
+            task = coordinator.hass.async_create_background_task(
+                self._flush_after_window(), name=f"{DOMAIN} write flush {coordinator.host}"
+            )
+            self._flush_task = task
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        return await future
+
+    async def async_close(self) -> None:
+        """Cancel every flush still running, failing the writes it hadn't confirmed."""
+        flushes = list(self._flushes)
+        for task in flushes:
+            task.cancel()
+        await asyncio.gather(*flushes, return_exceptions=True)
+        # A flush cancelled before it first ran never reaches its own handler.
+        self._fail_pending()
+
+    async def _flush_after_window(self) -> None:
+        batch: list[_Submission] = []
+        try:
+            await asyncio.sleep(self.window)
+            batch, self._pending = self._pending, []
+            self._flush_task = None
+            async with self._lock:
+                started = time.monotonic()
+                try:
+                    sent = await self._send(batch)
+                except Exception as exc:  # noqa: BLE001 — handed to the waiting callers
+                    self._fail(batch, exc)
+                    return
+                if sent is not None:
+                    await self._confirm(*sent, started=started)
+        except asyncio.CancelledError:
+            if self._flush_task is asyncio.current_task():
+                # Cancelled inside the window: the batch is still pending.
+                self._fail_pending()
+            # _confirm has settled whatever it wrote; fail only the callers
+            # still waiting, rather than leaving them (and their optimistic
+            # values) hanging on a flush that will never finish.
+            self._fail(
+                [submission for submission in batch if not submission.future.done()],
+                HomeAssistantError(_CANCELLED),
+            )
+            raise
+
+    def _fail_pending(self) -> None:
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        self._fail(batch, HomeAssistantError(_CANCELLED))
+
+    async def _send(
+        self, batch: list[_Submission]
+    ) -> tuple[list[_Submission], list[TransparentRequest]] | None:
+        """Write ``batch``; return the submissions that reached the inverter and
+        what was sent for them, or None once the whole batch has been failed."""
+        client = self._coordinator._client
+        if client is None or not client.connected:
+            self._fail(batch, HomeAssistantError("Not connected to the inverter; write not sent"))
+            return None
+        requests = coalesce(request for submission in batch for request in submission.requests)
+        try:
+            await client.one_shot_command(requests)
+            written = batch
+        except InvalidPduState:
+            if len(batch) == 1:
+                raise
+            # Validation runs before anything is sent, so nothing of the batch
+            # reached the inverter: send each submission on its own instead.
+            written = []
+            for submission in batch:
+                try:
+                    await client.one_shot_command(submission.requests)
+                except Exception as exc:  # noqa: BLE001 — handed to this caller only
+                    self._fail([submission], exc)
+                else:
+                    written.append(submission)
+            requests = coalesce(
+                request for submission in written for request in submission.requests
+            )
+        return written, requests
+
+    async def _confirm(
+        self,
+        written: list[_Submission],
+        requests: list[TransparentRequest],
+        *,
+        started: float,
+    ) -> None:
+        """Settle a sent batch. The writes reached the inverter, so nothing here
+        reverts them: a read-back that goes wrong falls back to a refresh."""
+        self.batches += 1
+        self.sent += len(requests)
+        try:
+            self.overlay.acknowledge(requests)
+            registers = [request.register for request in _register_writes(requests)]
+            if registers:
+                await self._read_back(registers)
+        except Exception:  # noqa: BLE001 — the write itself succeeded
+            _LOGGER.exception("Confirming %d written register(s) failed", len(requests))
+            self.readback_failures += 1
+            await self._coordinator.async_request_refresh()
+        finally:
+            bus_time = time.monotonic() - started
+            for submission in written:
+                if not submission.future.done():
+                    submission.future.set_result(bus_time)
+
+    async def _read_back(self, registers: Iterable[int]) -> None:
+        coordinator = self._coordinator
+        self.readbacks += 1
+        if not await coordinator.async_read_back(registers):
+            self.readback_failures += 1
+            await coordinator.async_request_refresh()
+
+    def _fail(self, batch: Iterable[_Submission], exc: BaseException) -> None:
+        """Fail ``batch``'s callers, taking their values back off the display."""
+        batch = list(batch)
+        self._notify(
+            self.overlay.revert(
+                self._coordinator.data,
+                (request for submission in batch for request in submission.requests),
+            )
+        )
+        for submission in batch:
+            if not submission.future.done():
+                submission.future.set_exception(exc)
+
+    def _notify(self, address: int | None) -> None:
+        if address is not None:
+            self._coordinator._async_update_listeners_for(address)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "window_seconds": self.window,
+            "batches": self.batches,
+            "requests_submitted": self.submitted,
+            "requests_sent": self.sent,
+            "readbacks": self.readbacks,
+            "readback_failures": self.readback_failures,
+            "optimistic": self.overlay.as_dict(),
+        }
@@ -491,12 +491,17 @@
       cards.push(placeholder("apexcharts-card"));
     }
 
-    // Card 3+: ge-cell-heatmap per battery pack.
+    // Card 3+: ge-cell-heatmap per battery pack. `stats` points the card at the
+    // pack's Cell Vector sensor when the option created it, else its Cells
+    // entity in lean per-cell mode; either one's attributes carry every cell
+    // voltage in one state (no per-cell entity lookups). With neither, the card
+    // reads the per-cell entities.
     plant.batteries.forEach(function (b) {
       cards.push({
         type: "custom:ge-cell-heatmap",
         title: "Cell balance - " + String(b.serial).toUpperCase(),
         batteries: [b.serial],
+        stats: [a.bat(b, "cell_vector") || a.bat(b, "cell_array")],
       });
     });
 
@@ -813,6 +818,9 @@
       batteries: plant.batteries.map(function (rec) {
         return rec.serial;
       }),
+      stats: plant.batteries.map(function (rec) {
+        return a.bat(rec, "cell_vector") || a.bat(rec, "cell_array");
+      }),
     };
     var cards = [note, heatmap];
 
@@ -1231,7 +1239,11 @@
     // Renders one row per battery pack: each of the 16 cell voltages coloured
     // by its mV deviation from that pack's own mean (imbalance visible at any
     // charge level), plus the pack mean (V) and spread (max-min, mV).
-    // Config: type / batteries (required) / cells / span_mv / title
+    // Config: type / batteries (required) / stats / cells / span_mv / title
+    // `stats` (optional, aligned with `batteries`) names each pack's Cells or
+    // Cell Vector sensor; when its `cell_voltages` (V) or `cell_mv` (mV)
+    // attribute is present the row is drawn from that one state, else from the
+    // per-cell voltage entities.
     if (!customElements.get("ge-cell-heatmap")) {
       customElements.define("ge-cell-heatmap", class extends HTMLElement {
         setConfig(cfg) {
@@ -1271,31 +1283,41 @@
             }
             return null;
           };
+          const num = (x) => {
+            const v = x != null ? Number(x) : NaN;
+            return Number.isFinite(v) && v !== 0 ? v : null;
+          };
+          // One row's cell voltages: the pack's stats snapshot when available,
+          // else one per-cell entity read per cell.
+          const packVals = (s, bi) => {
+            const stats = cfg.stats && cfg.stats[bi] && hass.states[cfg.stats[bi]];
+            const attrs = (stats && stats.attributes) || {};
+            const arr = attrs.cell_voltages;
+            if (Array.isArray(arr)) return Array.from({length: nCells}, (_, i) => num(arr[i]));
+            const mv = attrs.cell_mv;
+            if (Array.isArray(mv)) {
+              return Array.from({length: nCells}, (_, i) => {
+                const v = num(mv[i]);
+                return v != null ? v / 1000 : null;
+              });
+            }
+            const lo = s.toLowerCase();
+            return Array.from({length: nCells}, (_, i) => {
+              const st = cellState(lo, i + 1);
+              return st ? num(st.state) : null;
+            });
+          };
+          const packs = cfg.batteries.map(packVals);
           // `set hass` fires on every HA state change; skip the DOM rebuild
           // unless one of our cells (or the config) actually changed.
           const sig =
-            (cfg.batteries || [])
-              .map((s) => {
-                const lo = s.toLowerCase();
-                let cells = "";
-                for (let n = 1; n <= nCells; n++) {
-                  const st = cellState(lo, n);
-                  cells += (st ? st.state : "?") + ",";
-                }
-                return lo + ":" + cells;
-              })
-              .join("|") +
+            packs.map((vals, bi) => cfg.batteries[bi].toLowerCase() + ":" + vals.join(",")).join("|") +
             "#" + (cfg.title || "") + "/" + (cfg.span_mv != null ? cfg.span_mv : 15);
           if (sig === this._sig) return;
           this._sig = sig;
           const esc = (s) => String(s).replace(/[&<>"']/g, (c) =>
             ({ "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c]));
           const span = (cfg.span_mv != null ? cfg.span_mv : 15) / 1000;
-          const valOf = (s, n) => {
-            const st = cellState(s, n);
-            const v = st ? Number(st.state) : NaN;
-            return Number.isFinite(v) ? v : null;
-          };
           const colour = (d) => {
             if (d == null) return "var(--disabled-color, #9e9e9e)";
             const t = Math.max(-1, Math.min(1, d / span));
@@ -1304,7 +1326,7 @@
           };
           const head = `<tr><th class="row">#</th>${Array.from({length: nCells}, (_, i) => `<th>${i + 1}</th>`).join("")}<th>m</th><th>&Delta;</th></tr>`;
           const rows = cfg.batteries.map((s, bi) => {
-            const vals = Array.from({length: nCells}, (_, i) => valOf(s, i + 1));
+            const vals = packs[bi];
             const present = vals.filter((v) => v != null);
             const mean = present.length ? present.reduce((a, b) => a + b, 0) / present.length : null;
             const dmv = present.length ? Math.round((Math.max(...present) - Math.min(...present)) * 1000) : null;
@@ -8,6 +8,7 @@ Uses the Home Assistant WebSocket API. Requires:
       HA → Profile → Security → Long-Lived Access Tokens → Create token
   - Python 3.11+ with the `websockets` package:
       pip install "websockets>=12.0"
+  - Optionally `numpy`, which speeds up the analysis of long histories
 
 Dry-run is the default. Pass --apply to write changes.
 
@@ -136,20 +137,29 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import bisect
 import json
 import math
 import re
 import sys
 from collections import Counter
-from collections.abc import Callable, Sequence
-from datetime import UTC, date, datetime, timedelta
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import UTC, date, datetime, time, timedelta
 from enum import Enum
-from typing import Any
+from functools import cached_property, lru_cache
+from typing import Any, NamedTuple
 from zoneinfo import ZoneInfo
 
 # `websockets` is imported lazily in HAWebSocket.connect() so this module stays
 # importable (for unit-testing the pure helpers below) without the dependency.
 
+# `numpy` is optional: with it, long series are analysed as arrays (see
+# _Columns); without it, the plain-Python reference implementations run.
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 
 # ---------------------------------------------------------------------------
 # Entity mapping
@@ -304,6 +314,19 @@ _RETRY_ATTEMPTS = 5
 _RETRY_BASE_DELAY = 2.0  # seconds; linear backoff: delay * attempt
 _ENTITY_PAUSE_SECONDS = 0.5
 
+# Reads page through an entity's history one window per
+# recorder/statistics_during_period call (~2,200 hourly rows), so neither side
+# builds a multi-year payload in memory.
+_FETCH_WINDOW = timedelta(days=90)
+
+# Entities fetched and rebuilt at once in Phase A (--concurrency). Reads only:
+# the writes of Phase B stay one entity at a time, paced as above.
+_DEFAULT_CONCURRENCY = 4
+
+# Phase A reads several series per statistics_during_period call: as many as
+# keep one window's estimated hourly rows under this many.
+_FETCH_BATCH_ROWS = 20_000
+
 
 # ---------------------------------------------------------------------------
 # Entity reset-class classification
@@ -350,16 +373,16 @@ _MOVEMENT_TOLERANCE_PCT = 5.0  # source-vs-rebuilt movement divergence tolerance
 # LIFETIME totals.
 
 
-def _percentile(sorted_vals: list[float], p: float) -> float:
+def _percentile(sorted_vals: Sequence[float] | np.ndarray, p: float) -> float:
     """Nearest-rank (floor-index) percentile of an ascending-sorted, non-empty
-    list. Uses the floor index rather than linear interpolation so a single
+    list (or array). Uses the floor index rather than linear interpolation so a single
     order-of-magnitude outlier near the top cannot drag the percentile up toward
     itself on small samples (which would let the spike bless itself through the
     ceiling)."""
     return sorted_vals[int((len(sorted_vals) - 1) * p / 100.0)]
 
 
-def adaptive_ceiling(deltas: Sequence[float | None]) -> float | None:
+def adaptive_ceiling(deltas: Sequence[float | None] | np.ndarray) -> float | None:
     """Per-hour plausibility ceiling from an entity's positive state-deltas.
 
     Genuine hourly deltas are bounded by the hardware (inverter clip, battery
@@ -370,6 +393,11 @@ def adaptive_ceiling(deltas: Sequence[float | None]) -> float | None:
     _CEILING_MIN_SAMPLES (and on empty) so the caller fails closed rather than
     guessing a bound from too little data.
     """
+    if np is not None and isinstance(deltas, np.ndarray):
+        positive = np.sort(deltas[deltas > 0])
+        if len(positive) < _CEILING_MIN_SAMPLES:
+            return None
+        return float(_percentile(positive, _CEILING_PERCENTILE)) * _CEILING_FACTOR
     pos = sorted(d for d in deltas if d is not None and d > 0)
     if len(pos) < _CEILING_MIN_SAMPLES:
         return None
@@ -415,16 +443,140 @@ def _is_reset_boundary(
     """
     if reset_class is ResetClass.LIFETIME:
         return False
-    local = datetime.fromisoformat(start_iso).astimezone(tz)
-    tol_minutes = tol_hours * 60
-    minutes_into_day = local.hour * 60 + local.minute
-    dist_to_midnight = min(minutes_into_day, 24 * 60 - minutes_into_day)
+    stamp = _stamp(start_iso, tz)
+    near_midnight = stamp.midnight_minutes <= tol_hours * 60
     if reset_class is ResetClass.DAILY:
-        return dist_to_midnight <= tol_minutes
+        return near_midnight
     # ANNUAL: near midnight AND on Dec 31 / Jan 1.
-    near_midnight = dist_to_midnight <= tol_minutes
-    on_year_edge = (local.month, local.day) in {(1, 1), (12, 31)}
-    return near_midnight and on_year_edge
+    return near_midnight and stamp.year_edge
+
+
+# ---------------------------------------------------------------------------
+# Columnar series (optional NumPy fast paths)
+# ---------------------------------------------------------------------------
+
+# Below this many rows the array set-up costs more than it saves.
+_COLUMNAR_MIN_ROWS = 256
+
+
+def _float_column(rows: list[dict[str, Any]], key: str) -> np.ndarray:
+    return np.array([np.nan if (v := r.get(key)) is None else v for r in rows], dtype=float)
+
+
+class _Columns:
+    """A series of rows as arrays: epoch seconds, and ``sum`` / ``state`` with
+    NaN for None. Each column is built on first use.
+
+    Every fast path built on these returns exactly what its plain-Python
+    reference does — row for row, bit for bit — so which one runs is invisible
+    to callers. Reported changes are still computed from the rows' own values,
+    span hours from the (whole-second) epochs, and running totals use a
+    sequential cumulative sum, not a pairwise one.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+
+    @cached_property
+    def epoch(self) -> np.ndarray:
+        return np.array([_utc_us(r["start"]) for r in self.rows]) / 10**6
+
+    @cached_property
+    def sum(self) -> np.ndarray:
+        return _float_column(self.rows, "sum")
+
+    @cached_property
+    def state(self) -> np.ndarray:
+        return _float_column(self.rows, "state")
+
+    def state_deltas(self) -> np.ndarray:
+        """Consecutive state deltas where both rows carry a state (see _state_deltas)."""
+        deltas = np.diff(self.state)
+        return deltas[~np.isnan(deltas)]
+
+    def implausible_hours(self, ceiling: float) -> list[dict[str, Any]]:
+        rows = self.rows
+        # A None sum makes its NaN change compare False, so the pair is skipped.
+        return [
+            {"start": rows[i]["start"], "change": round(rows[i]["sum"] - rows[i - 1]["sum"], 3)}
+            for i in (np.flatnonzero(np.diff(self.sum) > ceiling) + 1).tolist()
+        ]
+
+    def flat_line_spans(self, min_hours: int) -> list[dict[str, Any]]:
+        rows = self.rows
+        changed = np.abs(np.diff(np.nan_to_num(self.sum, nan=0.0))) > _FLAT_EPSILON
+        bounds = np.flatnonzero(changed) + 1
+        firsts = np.concatenate(([0], bounds))
+        lasts = np.concatenate((bounds - 1, [len(rows) - 1]))
+        hours = (self.epoch[lasts] - self.epoch[firsts]) / 3600.0
+        long = (lasts > firsts) & (hours >= min_hours)
+        return [
+            {"start": rows[first]["start"], "end": rows[last]["start"], "hours": round(h, 6)}
+            for first, last, h in zip(
+                firsts[long].tolist(), lasts[long].tolist(), hours[long].tolist()
+            )
+        ]
+
+    def reset_aware_movement(self, reset_class: ResetClass, tz: ZoneInfo) -> float:
+        present = np.flatnonzero(~np.isnan(self.state))
+        if len(present) < 2:
+            return 0.0
+        states = self.state[present]
+        deltas = np.diff(states)
+        moved = np.where(deltas >= 0, deltas, 0.0)
+        for i in np.flatnonzero(deltas < 0).tolist():
+            if _is_reset_boundary(self.rows[present[i + 1]]["start"], reset_class, tz, 2.0):
+                moved[i] = states[i + 1]
+        return float(np.cumsum(moved)[-1])
+
+    def clean_steps(
+        self, reset_class: ResetClass, ceiling: float, tz: ZoneInfo, midnight_tol_hours: float
+    ) -> _CleanSteps:
+        """Which rows the rebuild walk would accept as they stand (see _CleanSteps)."""
+        deltas = np.diff(self.state)
+        adjacent = np.diff(self.epoch) <= 3600
+        clean = adjacent & (deltas >= 0) & (deltas <= ceiling)
+        added = np.where(clean, deltas, 0.0)
+        for i in np.flatnonzero(adjacent & (deltas < 0)).tolist():
+            if _is_reset_boundary(self.rows[i + 1]["start"], reset_class, tz, midnight_tol_hours):
+                clean[i] = True
+                added[i] = self.state[i + 1]
+        return _CleanSteps(added, np.flatnonzero(~clean).tolist(), len(self.rows))
+
+
+class _CleanSteps:
+    """The steps between consecutive rows that the rebuild walk takes as they stand.
+
+    Step ``k`` leads from row ``k`` to row ``k + 1``. It is clean when the later
+    row is at most an hour on and its state rose by no more than the ceiling,
+    or fell at a reset boundary. From a row whose predecessor is the walk's
+    last-good reading, with nothing held, every row up to the next unclean step
+    is accepted, adding its rise (or post-reset state) to the running sum.
+    """
+
+    def __init__(self, added: np.ndarray, unclean: list[int], rows: int) -> None:
+        self._added = added
+        self._unclean = unclean
+        self._rows = rows
+
+    def run_end(self, i: int) -> int:
+        """One past the last row of the clean run starting at row ``i``."""
+        k = bisect.bisect_left(self._unclean, i - 1)
+        return self._unclean[k] + 1 if k < len(self._unclean) else self._rows
+
+    def running(self, running: float, i: int, end: int) -> list[float]:
+        """The running sum after each of rows ``i``..``end - 1``, from ``running``.
+
+        A sequential cumulative sum, so it is bit-for-bit the walk's own.
+        """
+        return np.cumsum(np.concatenate(([running], self._added[i - 1 : end - 1])))[1:].tolist()
+
+
+def _columns(rows: list[dict[str, Any]]) -> _Columns | None:
+    """The columnar view of ``rows``, or None to use the reference path."""
+    if np is None or len(rows) < _COLUMNAR_MIN_ROWS:
+        return None
+    return _Columns(rows)
 
 
 # ---------------------------------------------------------------------------
@@ -435,7 +587,7 @@ def _is_reset_boundary(
 def _elapsed_hours(prev_start: str, start: str) -> float:
     """Whole-ish hours between two ISO timestamps, floored at 1 (so the per-hour
     bound applies to adjacent readings and scales up across a gap)."""
-    delta = (_to_utc(start) - _to_utc(prev_start)).total_seconds() / 3600.0
+    delta = (_utc_us(start) - _utc_us(prev_start)) / 10**6 / 3600.0
     return max(1.0, delta)
 
 
@@ -445,18 +597,15 @@ def _gap_crosses_reset(prev_start: str, start: str, reset_class: ResetClass, tz:
     normal reset row, not a crossed gap. LIFETIME never resets."""
     if reset_class is ResetClass.LIFETIME:
         return False
-    a = _to_utc(prev_start).astimezone(tz)
-    b = _to_utc(start).astimezone(tz)
-    if b <= a:
+    # Compared on the local wall clock, as two datetimes in the same zone are.
+    a = _stamp(prev_start, tz)
+    b = _stamp(start, tz)
+    if b.local_us <= a.local_us:
         return False
     if reset_class is ResetClass.DAILY:
-        first_midnight = (a + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        return first_midnight < b  # strictly before b
+        return a.next_midnight_us < b.local_us  # strictly before b
     # ANNUAL: first Jan-1 boundary after a, strictly before b
-    first_jan1 = a.replace(
-        year=a.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0
-    )
-    return first_jan1 < b
+    return a.next_new_year_us < b.local_us
 
 
 def _segment_coherent(held: list[tuple[str, float]], ceiling: float, tz: ZoneInfo) -> bool:
@@ -508,20 +657,67 @@ def rebuild_sum_walk(
 
     ``events`` (if given) accumulates lists under keys: ``rebaseline``, ``smear``,
     ``gap_undercount``, ``unresolved`` — surfaced by validation.
+
+    With NumPy, runs of rows accepted as they stand are summed as arrays; the
+    reference walk (_SumWalk) steps through each row that needs a decision — a
+    gap, a None, an implausible or off-boundary change — and whatever it holds.
     """
+    walk = _SumWalk(reset_class, ceiling, tz, midnight_tol_hours, events)
+    cols = _columns(rows)
+    if cols is None:
+        for row in rows:
+            walk.step(row)
+        return walk.finish()
+    steps = cols.clean_steps(reset_class, ceiling, tz, midnight_tol_hours)
+    i = 0
+    while i < len(rows):
+        # A run can start once the walk has nothing held and its last-good
+        # reading is the previous row.
+        if (
+            i
+            and not walk.held
+            and walk.prev_start == rows[i - 1]["start"]
+            and walk.prev_state == cols.state[i - 1]
+        ):
+            end = steps.run_end(i)
+            if end > i:
+                walk.take(rows[i:end], steps.running(walk.running, i, end))
+                walk.prev_state = float(cols.state[end - 1])
+                i = end
+                continue
+        walk.step(rows[i])
+        i += 1
+    return walk.finish()
 
-    def _ev(key: str, payload: dict) -> None:
-        if events is not None:
-            events.setdefault(key, []).append(payload)
 
-    out: list[dict[str, Any]] = []
-    running = 0.0
-    prev_state: float | None = None
-    prev_start: str | None = None
-    held: list[tuple[str, float]] = []  # (start, state) buffered, not yet emitted
+class _SumWalk:
+    """The reference rebuild walk: a state machine fed one row at a time."""
 
-    def _emit(start: str, sum_val: float, state_val: float | None) -> None:
-        out.append(
+    def __init__(
+        self,
+        reset_class: ResetClass,
+        ceiling: float,
+        tz: ZoneInfo,
+        midnight_tol_hours: float,
+        events: dict[str, list] | None,
+    ) -> None:
+        self.reset_class = reset_class
+        self.ceiling = ceiling
+        self.tz = tz
+        self.midnight_tol_hours = midnight_tol_hours
+        self.events = events
+        self.out: list[dict[str, Any]] = []
+        self.running = 0.0
+        self.prev_state: float | None = None
+        self.prev_start: str | None = None
+        self.held: list[tuple[str, float]] = []  # (start, state) buffered, not yet emitted
+
+    def _ev(self, key: str, payload: dict) -> None:
+        if self.events is not None:
+            self.events.setdefault(key, []).append(payload)
+
+    def _emit(self, start: str, sum_val: float, state_val: float | None) -> None:
+        self.out.append(
             {
                 "start": start,
                 "sum": round(sum_val, 6),
@@ -529,31 +725,44 @@ def rebuild_sum_walk(
             }
         )
 
-    def _flush_transient() -> None:
+    def _flush_transient(self) -> None:
         # The held run was a transient spike: emit each as last-good (flat).
-        for s, _st in held:
-            _emit(s, running, prev_state)
-        held.clear()
+        for s, _st in self.held:
+            self._emit(s, self.running, self.prev_state)
+        self.held.clear()
 
-    def _flush_segment() -> None:
-        nonlocal running, prev_state, prev_start
+    def _flush_segment(self) -> None:
+        held = self.held
         # Only reached after data has been accepted (held is non-empty), so the
         # last-good level is established.
-        assert prev_state is not None
+        assert self.prev_state is not None
         base = held[0][1]
         # offset (held[0] - prev_state) is suppressed; internal deltas are booked.
         for s, st in held:
-            _emit(s, running + (st - base), running + (st - base))
-        _ev(
+            self._emit(s, self.running + (st - base), self.running + (st - base))
+        self._ev(
             "rebaseline",
-            {"start": held[0][0], "offset": round(base - prev_state, 3), "held": len(held)},
+            {"start": held[0][0], "offset": round(base - self.prev_state, 3), "held": len(held)},
         )
-        running += held[-1][1] - base
-        prev_state = held[-1][1]
-        prev_start = held[-1][0]
+        self.running += held[-1][1] - base
+        self.prev_state = held[-1][1]
+        self.prev_start = held[-1][0]
         held.clear()
 
-    for row in rows:
+    def take(self, rows: list[dict[str, Any]], running: list[float]) -> None:
+        """Accept ``rows`` as they stand, ``running`` being the sum after each.
+
+        The caller vouches for them: each follows the last-good reading by an
+        hour or less, with nothing held, and either rose within the ceiling or
+        fell at a reset boundary. The caller also sets ``prev_state``.
+        """
+        for row, value in zip(rows, running):
+            value = round(value, 6)
+            self.out.append({"start": row["start"], "sum": value, "state": value})
+        self.running = running[-1]
+        self.prev_start = rows[-1]["start"]
+
+    def step(self, row: dict[str, Any]) -> None:
         state = row.get("state")
         start = row["start"]
         if state is None:
@@ -562,71 +771,77 @@ def rebuild_sum_walk(
             # last-good reading to carry, so emit a genuine None rather than
             # fabricating a 0.0 state that downstream reset/delta logic would
             # treat as real.
-            _emit(start, running, prev_state)
-            continue
-        if prev_state is None:
-            running = float(state)
-            prev_state = float(state)
-            prev_start = start
-            _emit(start, running, running)
-            continue
+            self._emit(start, self.running, self.prev_state)
+            return
+        if self.prev_state is None:
+            self.running = float(state)
+            self.prev_state = float(state)
+            self.prev_start = start
+            self._emit(start, self.running, self.running)
+            return
 
         # prev_start is assigned in lockstep with prev_state, so passing the
         # prev_state-is-None guard above guarantees prev_start is set too.
-        assert prev_start is not None
+        assert self.prev_start is not None
+        prev_start = self.prev_start
         elapsed = _elapsed_hours(prev_start, start)
-        bound = ceiling * elapsed
+        bound = self.ceiling * elapsed
         # (1) Reset-crossing gap FIRST, before any delta-sign branch.
-        if elapsed > 1 and _gap_crosses_reset(prev_start, start, reset_class, tz):
-            _flush_transient()
-            _emit(start, running, running)  # carry flat across the gap
-            _ev("gap_undercount", {"start": start, "from": prev_start})
-            prev_state = float(state)
-            prev_start = start
-            continue
+        if elapsed > 1 and _gap_crosses_reset(prev_start, start, self.reset_class, self.tz):
+            self._flush_transient()
+            self._emit(start, self.running, self.running)  # carry flat across the gap
+            self._ev("gap_undercount", {"start": start, "from": prev_start})
+            self.prev_state = float(state)
+            self.prev_start = start
+            return
 
-        delta = state - prev_state
+        delta = state - self.prev_state
         # (2) Accept genuine (possibly multi-hour) accumulation.
         if 0 <= delta <= bound:
-            _flush_transient()
+            self._flush_transient()
             if elapsed > 1:
-                smeared = _smear_gap(running, delta, prev_start, start, tz)
+                smeared = _smear_gap(self.running, delta, prev_start, start, self.tz)
                 if smeared:
-                    out.extend(smeared)
-                    _ev(
+                    self.out.extend(smeared)
+                    self._ev(
                         "smear",
                         {"start": start, "energy": round(delta, 3), "hours": round(elapsed, 1)},
                     )
-            running += delta
-            prev_state = float(state)
-            prev_start = start
-            _emit(start, running, running)
-            continue
+            self.running += delta
+            self.prev_state = float(state)
+            self.prev_start = start
+            self._emit(start, self.running, self.running)
+            return
         # (3) Boundary reset (intra-reading, no gap).
-        if delta < 0 and _is_reset_boundary(start, reset_class, tz, midnight_tol_hours):
-            _flush_transient()
-            running += state
-            prev_state = float(state)
-            prev_start = start
-            _emit(start, running, running)
-            continue
+        if delta < 0 and _is_reset_boundary(
+            start, self.reset_class, self.tz, self.midnight_tol_hours
+        ):
+            self._flush_transient()
+            self.running += state
+            self.prev_state = float(state)
+            self.prev_start = start
+            self._emit(start, self.running, self.running)
+            return
         # (4) Otherwise: buffer as held; try to confirm a coherent segment.
         #     Coherence bounds each held pair by its OWN elapsed time (passes the
         #     (start, state) tuples + ceiling), not the single cumulative `bound`.
-        held.append((start, float(state)))
-        if len(held) >= _REBASELINE_HOLDS and _segment_coherent(held, ceiling, tz):
-            _flush_segment()
-
-    if held:
-        _ev("unresolved", {"start": held[0][0], "count": len(held)})
-        _flush_transient()  # emit last-good; the recorded event makes the gate refuse
-    # Held/smeared rows can be appended after a later-timestamped gap row, so the
-    # raw append order is not guaranteed sorted. Restore the ascending-by-start
-    # contract that import + Phase-C verify_written rely on. Every emitted row
-    # (real, held, smeared) carries a normalised UTC ISO start, so lexical sort
-    # order is chronological.
-    out.sort(key=lambda r: r["start"])
-    return out
+        self.held.append((start, float(state)))
+        if len(self.held) >= _REBASELINE_HOLDS and _segment_coherent(
+            self.held, self.ceiling, self.tz
+        ):
+            self._flush_segment()
+
+    def finish(self) -> list[dict[str, Any]]:
+        if self.held:
+            self._ev("unresolved", {"start": self.held[0][0], "count": len(self.held)})
+            self._flush_transient()  # emit last-good; the recorded event makes the gate refuse
+        # Held/smeared rows can be appended after a later-timestamped gap row, so the
+        # raw append order is not guaranteed sorted. Restore the ascending-by-start
+        # contract that import + Phase-C verify_written rely on. Every emitted row
+        # (real, held, smeared) carries a normalised UTC ISO start, so lexical sort
+        # order is chronological.
+        self.out.sort(key=lambda r: r["start"])
+        return self.out
 
 
 # ---------------------------------------------------------------------------
@@ -635,7 +850,11 @@ def rebuild_sum_walk(
 
 
 class HAWebSocket:
-    """Minimal async HA WebSocket client covering only what the migration needs."""
+    """Minimal async HA WebSocket client covering only what the migration needs.
+
+    Several requests may be in flight at once: a single reader task hands each
+    response to the call waiting on its message id.
+    """
 
     def __init__(self, base_url: str, token: str) -> None:
         ws_base = base_url.rstrip("/").replace("https://", "wss://").replace("http://", "ws://")
@@ -643,6 +862,8 @@ class HAWebSocket:
         self._token = token
         self._ws: Any = None
         self._msg_id = 0
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._reader: asyncio.Task[None] | None = None
 
     async def connect(self) -> None:
         try:
@@ -650,8 +871,8 @@ class HAWebSocket:
         except ImportError:
             sys.exit("Missing dependency: pip install 'websockets>=12.0'")
         # max_size=None lifts the default 1 MiB frame cap: the entity/device
-        # registry listings (and large recorder responses) routinely exceed it
-        # on a populated HA instance. This is a trusted, admin-token local tool.
+        # registry listings routinely exceed it on a populated HA instance.
+        # This is a trusted, admin-token local tool.
         self._ws = await websockets.asyncio.client.connect(self._url, max_size=None)
         hello = await self._recv()
         if hello.get("type") != "auth_required":
@@ -665,22 +886,50 @@ class HAWebSocket:
             )
 
     async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
         if self._ws:
             await self._ws.close()
 
     async def _recv(self) -> dict[str, Any]:
         return json.loads(await self._ws.recv())
 
+    async def _read_responses(self) -> None:
+        """Route each incoming message to the call awaiting its id; others are skipped."""
+        try:
+            while True:
+                msg = await self._recv()
+                msg_id = msg.get("id")
+                if not isinstance(msg_id, int):
+                    continue
+                future = self._pending.pop(msg_id, None)
+                if future is not None and not future.done():
+                    future.set_result(msg)
+        except Exception as exc:
+            # The connection is gone: fail every call still waiting on it.
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"WebSocket closed: {exc!r}"))
+            self._pending.clear()
+        finally:
+            self._reader = None
+
     async def _call(self, msg_type: str, **kwargs: Any) -> Any:
         self._msg_id += 1
         msg_id = self._msg_id
-        await self._ws.send(json.dumps({"type": msg_type, "id": msg_id, **kwargs}))
-        while True:
-            msg = await self._recv()
-            if msg.get("id") == msg_id:
-                if not msg.get("success", True):
-                    raise RuntimeError(f"HA returned an error for '{msg_type}': {msg.get('error')}")
-                return msg.get("result")
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = future
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read_responses())
+        try:
+            await self._ws.send(json.dumps({"type": msg_type, "id": msg_id, **kwargs}))
+            msg = await future
+        finally:
+            self._pending.pop(msg_id, None)
+        if not msg.get("success", True):
+            raise RuntimeError(f"HA returned an error for '{msg_type}': {msg.get('error')}")
+        return msg.get("result")
 
     async def _call_with_retry(self, msg_type: str, **kwargs: Any) -> Any:
         """Call a recorder mutation, retrying on HA's 'timeout' error.
@@ -729,11 +978,12 @@ class HAWebSocket:
         start: datetime,
         end: datetime | None = None,
         types: list[str] | None = None,
+        period: str = "hour",
     ) -> dict[str, list[dict[str, Any]]]:
         kwargs: dict[str, Any] = {
             "statistic_ids": statistic_ids,
             "start_time": start.isoformat(),
-            "period": "hour",
+            "period": period,
             "types": types or ["sum", "state"],
         }
         if end is not None:
@@ -741,6 +991,38 @@ class HAWebSocket:
         result = await self._call("recorder/statistics_during_period", **kwargs)
         return result or {}
 
+    async def iter_statistics(
+        self,
+        statistic_ids: list[str],
+        start: datetime,
+        end: datetime | None = None,
+        types: list[str] | None = None,
+        window: timedelta = _FETCH_WINDOW,
+        since: datetime | None = None,
+    ) -> AsyncIterator[dict[str, list[dict[str, Any]]]]:
+        """Page hourly statistics over [start, end) one window per call, oldest first.
+
+        Each window's result is yielded as it arrives, so a caller holds at most
+        one window of raw rows and can start on them before the rest is fetched.
+        A monthly-period probe first finds where the history begins, so the
+        empty years before it cost one round trip rather than one per window;
+        a caller that already knows (``since``) skips the probe.
+        """
+        stop = end or datetime.now(tz=UTC)
+        if since is None:
+            probe = await self.get_statistics(
+                statistic_ids, start, end=stop, types=types, period="month"
+            )
+            firsts = [_to_utc(rows[0]["start"]) for rows in probe.values() if rows]
+            if not firsts:
+                return
+            since = min(firsts)
+        cursor = max(start, since)
+        while cursor < stop:
+            window_end = min(cursor + window, stop)
+            yield await self.get_statistics(statistic_ids, cursor, end=window_end, types=types)
+            cursor = window_end
+
     async def clear_statistics(self, statistic_ids: list[str]) -> None:
         await self._call_with_retry("recorder/clear_statistics", statistic_ids=statistic_ids)
 
@@ -774,13 +1056,83 @@ def _to_utc(ts: int | float | str) -> datetime:
         if ts > 1e11:
             ts = ts / 1000
         return datetime.fromtimestamp(ts, tz=UTC)
-    return datetime.fromisoformat(str(ts)).astimezone(UTC)
+    return _parse_iso(str(ts))
+
+
+# A row's start is an ISO string, and every hour of an entity's history recurs
+# across the GivTCP, GE, merged and rebuilt series and each pass over them. So
+# each distinct start is parsed once, into integers, and every later use is a
+# cache hit. The caches hold a few years of hourly starts.
+_STAMP_CACHE_SIZE = 1 << 17
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=_STAMP_CACHE_SIZE)
+def _parse_iso(start: str) -> datetime:
+    return datetime.fromisoformat(start).astimezone(UTC)
+
+
+@lru_cache(maxsize=_STAMP_CACHE_SIZE)
+def _utc_us(start: str) -> int:
+    """A row start as UTC microseconds since 1970."""
+    return (_parse_iso(start) - _UNIX_EPOCH) // _MICROSECOND
+
+
+def _as_us(dt: datetime) -> int:
+    """An aware datetime as UTC microseconds since 1970."""
+    return (dt - _UNIX_EPOCH) // _MICROSECOND
+
+
+def _wall_us(wall: datetime) -> int:
+    """A naive local wall-clock time as microseconds since 1970-01-01 00:00."""
+    return (wall - _UNIX_EPOCH.replace(tzinfo=None)) // _MICROSECOND
+
+
+class _Stamp(NamedTuple):
+    """A row start in one timezone, in integers: what reset detection needs.
+
+    Local times are wall-clock microseconds (``_wall_us``), so comparing them
+    matches comparing the local datetimes, including across a DST change.
+    """
+
+    local_us: int
+    next_midnight_us: int  # the local midnight that starts the next day
+    next_new_year_us: int  # the local midnight that starts the next year
+    midnight_minutes: int  # minutes to the nearest local midnight
+    year_edge: bool  # on local Dec 31 or Jan 1
+
+
+@lru_cache(maxsize=_STAMP_CACHE_SIZE)
+def _stamp(start: str, tz: ZoneInfo) -> _Stamp:
+    local = _parse_iso(start).astimezone(tz)
+    wall = local.replace(tzinfo=None)
+    minutes_into_day = local.hour * 60 + local.minute
+    return _Stamp(
+        local_us=_wall_us(wall),
+        next_midnight_us=_wall_us(datetime.combine(wall.date() + timedelta(days=1), time())),
+        next_new_year_us=_wall_us(datetime(wall.year + 1, 1, 1)),
+        midnight_minutes=min(minutes_into_day, 24 * 60 - minutes_into_day),
+        year_edge=(local.month, local.day) in {(1, 1), (12, 31)},
+    )
 
 
 def _as_iso(dt: datetime) -> str:
     return dt.astimezone(UTC).isoformat()
 
 
+async def fetch_rows(
+    ws: HAWebSocket | StatisticsBatcher,
+    statistic_id: str,
+    start: datetime,
+    end: datetime | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield one statistic's rows over [start, end), normalised, as each window arrives."""
+    async for chunk in ws.iter_statistics([statistic_id], start, end=end):
+        for row in chunk.get(statistic_id, []):
+            yield _normalise(row)
+
+
 def _normalise(row: dict[str, Any]) -> dict[str, Any]:
     """Return a copy of a statistics row with `start` as ISO UTC string and no `end`."""
     r = {k: v for k, v in row.items() if k != "end"}
@@ -788,6 +1140,198 @@ def _normalise(row: dict[str, Any]) -> dict[str, Any]:
     return r
 
 
+# ---------------------------------------------------------------------------
+# Batched plan reads
+# ---------------------------------------------------------------------------
+
+
+def batch_by_rows(estimates: dict[str, int], budget: int) -> list[list[str]]:
+    """Pack ids, in order, into batches whose estimated rows stay within `budget`.
+
+    An id that alone exceeds the budget gets a batch of its own.
+    """
+    batches: list[list[str]] = []
+    rows = 0
+    for statistic_id, estimate in estimates.items():
+        if not batches or rows + estimate > budget:
+            batches.append([])
+            rows = 0
+        batches[-1].append(statistic_id)
+        rows += estimate
+    return batches
+
+
+# One window of an id's rows from its batch's fetch; the fetch's error; or None
+# once every window has been handed over.
+_Window = list[dict[str, Any]] | Exception | None
+
+
+class _Feed:
+    """One batched read's windows, handed over one at a time.
+
+    The fetch waits for the read to take a window before handing it the next,
+    so a read never has more than one window waiting for it. A read that stops
+    early closes its feed, and the fetch skips it from then on.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[_Window] = asyncio.Queue(maxsize=1)
+        self.closed = False
+
+    @classmethod
+    def ended(cls) -> _Feed:
+        feed = cls()
+        feed._queue.put_nowait(None)
+        return feed
+
+    async def put(self, window: _Window) -> None:
+        if not self.closed:
+            await self._queue.put(window)
+
+    async def get(self) -> _Window:
+        return await self._queue.get()
+
+    def close(self) -> None:
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+
+class _BatchPlan:
+    """One read group's sizes, where each id's history begins, and its reads so far."""
+
+    def __init__(self, estimates: dict[str, int], firsts: dict[str, datetime]) -> None:
+        self.estimates = estimates
+        self.firsts = firsts
+        self.served: set[str] = set()
+        # Reads waiting for the next launch to batch them into a fetch.
+        self.waiting: dict[str, _Feed] = {}
+        self.launching = False
+
+
+class StatisticsBatcher:
+    """Serve the plan's per-entity reads from batched statistics requests.
+
+    recorder/statistics_during_period takes a list of ids, so rather than a
+    round trip per series (and per window), the reads the plan will make are
+    registered up front, grouped by their [start, end) range. The first read
+    from a group probes all of its ids in one monthly call, which sizes each:
+    the hourly rows one window of it would return. Reads that have started
+    together are then packed into batches of up to _FETCH_BATCH_ROWS estimated
+    rows per window, each fetched once — every window carrying all of the
+    batch's ids — and handed their own rows window by window. Only started
+    reads are batched, and the fetch waits for each to take a window before
+    fetching the next, so no read's history is buffered ahead of it. Ids with
+    no history cost nothing further; reads that weren't registered go straight
+    to the connection.
+    """
+
+    def __init__(
+        self, ws: HAWebSocket, reads: Sequence[tuple[str, datetime, datetime | None]]
+    ) -> None:
+        self._ws = ws
+        self._groups: dict[tuple[datetime, datetime | None], list[str]] = {}
+        for statistic_id, start, end in reads:
+            ids = self._groups.setdefault((start, end), [])
+            if statistic_id not in ids:
+                ids.append(statistic_id)
+        self._plans: dict[tuple[datetime, datetime | None], asyncio.Task[_BatchPlan]] = {}
+        self._fetches: set[asyncio.Task[None]] = set()
+
+    async def iter_statistics(
+        self,
+        statistic_ids: list[str],
+        start: datetime,
+        end: datetime | None = None,
+        types: list[str] | None = None,
+    ) -> AsyncIterator[dict[str, list[dict[str, Any]]]]:
+        key = (start, end)
+        if (
+            len(statistic_ids) == 1
+            and types is None
+            and statistic_ids[0] in self._groups.get(key, ())
+        ):
+            feed = await self._feed_of(statistic_ids[0], key)
+            if feed is not None:
+                try:
+                    while (rows := await feed.get()) is not None:
+                        if isinstance(rows, Exception):
+                            raise rows
+                        yield {statistic_ids[0]: rows}
+                finally:
+                    feed.close()
+                return
+        async for chunk in self._ws.iter_statistics(statistic_ids, start, end=end, types=types):
+            yield chunk
+
+    async def _feed_of(
+        self, statistic_id: str, key: tuple[datetime, datetime | None]
+    ) -> _Feed | None:
+        """`statistic_id`'s feed from its group's next batch; None once it's been served."""
+        if key not in self._plans:
+            self._plans[key] = asyncio.create_task(self._plan(key))
+        plan = await self._plans[key]
+        if statistic_id in plan.served:
+            return None
+        plan.served.add(statistic_id)
+        if statistic_id not in plan.firsts:
+            return _Feed.ended()
+        feed = plan.waiting[statistic_id] = _Feed()
+        if not plan.launching:
+            # Launched on the next loop pass, so reads started alongside this
+            # one (woken by the same probe or the same finished fetch) join it.
+            plan.launching = True
+            asyncio.get_running_loop().call_soon(self._launch, key, plan)
+        return feed
+
+    def _launch(self, key: tuple[datetime, datetime | None], plan: _BatchPlan) -> None:
+        waiting, plan.waiting, plan.launching = plan.waiting, {}, False
+        estimates = {i: plan.estimates[i] for i in waiting}
+        for batch in batch_by_rows(estimates, _FETCH_BATCH_ROWS):
+            since = min(plan.firsts[i] for i in batch)
+            task = asyncio.create_task(self._fetch(batch, since, key, waiting))
+            self._fetches.add(task)
+            task.add_done_callback(self._fetches.discard)
+
+    async def _plan(self, key: tuple[datetime, datetime | None]) -> _BatchPlan:
+        start, end = key
+        ids = self._groups[key]
+        stop = end or datetime.now(tz=UTC)
+        probe = await self._ws.get_statistics(ids, start, end=stop, period="month")
+        window_rows = _FETCH_WINDOW // timedelta(hours=1)
+        firsts: dict[str, datetime] = {}
+        estimates: dict[str, int] = {}
+        for statistic_id in ids:
+            rows = probe.get(statistic_id) or []
+            if not rows:
+                continue
+            firsts[statistic_id] = max(start, _to_utc(rows[0]["start"]))
+            hours = (stop - firsts[statistic_id]) // timedelta(hours=1) + 1
+            estimates[statistic_id] = min(hours, window_rows)
+        return _BatchPlan(estimates, firsts)
+
+    async def _fetch(
+        self,
+        ids: list[str],
+        since: datetime,
+        key: tuple[datetime, datetime | None],
+        feeds: dict[str, _Feed],
+    ) -> None:
+        """Page the batch, handing each id its rows of every window as it arrives."""
+        start, end = key
+        last: _Window = None
+        try:
+            async for chunk in self._ws.iter_statistics(ids, start, end=end, since=since):
+                for statistic_id in ids:
+                    await feeds[statistic_id].put(chunk.get(statistic_id, []))
+                if all(feeds[i].closed for i in ids):
+                    return
+        except Exception as exc:
+            last = exc
+        for statistic_id in ids:
+            await feeds[statistic_id].put(last)
+
+
 # ---------------------------------------------------------------------------
 # Validation checks (pure)
 # ---------------------------------------------------------------------------
@@ -795,6 +1339,8 @@ def _normalise(row: dict[str, Any]) -> dict[str, Any]:
 
 def find_implausible_hours(rows: list[dict[str, Any]], ceiling: float) -> list[dict[str, Any]]:
     """Rows whose sum-change from the previous row exceeds the ceiling."""
+    if (cols := _columns(rows)) is not None:
+        return cols.implausible_hours(ceiling)
     flagged = []
     for prev, cur in zip(rows, rows[1:]):
         ps, cs = prev.get("sum"), cur.get("sum")
@@ -815,6 +1361,8 @@ def find_flat_line_spans(
     not row count) is >= min_hours. Epsilon comparison handles float/synthetic
     sums. Returns {start, end, hours}; the caller exempts spans that overlap a
     recorded gap_undercount interval."""
+    if (cols := _columns(rows)) is not None:
+        return cols.flat_line_spans(min_hours)
     spans: list[dict[str, Any]] = []
     run_start = 0
     for i in range(1, len(rows) + 1):
@@ -827,8 +1375,8 @@ def find_flat_line_spans(
         last = i - 1
         if last > run_start:  # at least two rows in the run
             duration = (
-                _to_utc(rows[last]["start"]) - _to_utc(rows[run_start]["start"])
-            ).total_seconds() / 3600.0
+                (_utc_us(rows[last]["start"]) - _utc_us(rows[run_start]["start"])) / 10**6 / 3600.0
+            )
             if duration >= min_hours:
                 spans.append(
                     {
@@ -924,6 +1472,8 @@ def _reset_aware_movement(
     """Genuine accumulation across *rows*: positive consecutive deltas, plus the
     post-reset state at a legitimate reset boundary (a reset drops the raw value,
     so max(0, Δ) would lose that day's pre-reset accumulation otherwise)."""
+    if (cols := _columns(rows)) is not None:
+        return cols.reset_aware_movement(reset_class, tz)
     total = 0.0
     prev = None
     for r in rows:
@@ -999,9 +1549,9 @@ def classify_gaps(
 ) -> list[dict[str, Any]]:
     """Contiguous missing spans (more than one expected step between rows)."""
     gaps = []
-    step = timedelta(minutes=expected_step_minutes)
+    step = timedelta(minutes=expected_step_minutes) // _MICROSECOND
     for prev, cur in zip(rows, rows[1:]):
-        delta = _to_utc(cur["start"]) - _to_utc(prev["start"])
+        delta = _utc_us(cur["start"]) - _utc_us(prev["start"])
         missing = round(delta / step) - 1
         if missing >= 1:
             gaps.append({"after": prev["start"], "before": cur["start"], "hours": missing})
@@ -1209,20 +1759,15 @@ async def detect_cutover(
     givtcp_id = f"sensor.givtcp_{inv_sn}_{_CUTOVER_DETECT_GIVTCP}"
     ge_id = resolve(f"sensor.givenergy_inverter_{inv_sn}_{_CUTOVER_DETECT_GE}")
 
-    now = datetime.now(tz=UTC)
-    epoch = datetime(2000, 1, 1, tzinfo=UTC)
-    # Scan the past 5 years for the last GivTCP data point; go back further if
-    # the recorder has a longer history.
-    lookback_start = now - timedelta(days=5 * 365)
-
-    raw_givtcp = await ws.get_statistics([givtcp_id], lookback_start, end=now)
-    raw_ge = await ws.get_statistics([ge_id], epoch, end=now)
-
-    givtcp_rows = raw_givtcp.get(givtcp_id, [])
-    ge_rows = raw_ge.get(ge_id, [])
-
-    last_givtcp = _to_utc(givtcp_rows[-1]["start"]).date() if givtcp_rows else None
-    first_ge = _to_utc(ge_rows[0]["start"]).date() if ge_rows else None
+    # Both series ride the same requests; only the last GivTCP row and the first
+    # GE row matter, so neither is kept whole.
+    last_givtcp: date | None = None
+    first_ge: date | None = None
+    async for chunk in ws.iter_statistics([givtcp_id, ge_id], _EPOCH, end=datetime.now(tz=UTC)):
+        if rows := chunk.get(givtcp_id):
+            last_givtcp = _to_utc(rows[-1]["start"]).date()
+        if first_ge is None and (rows := chunk.get(ge_id)):
+            first_ge = _to_utc(rows[0]["start"]).date()
 
     return last_givtcp, first_ge
 
@@ -1266,10 +1811,11 @@ def build_merged_states(
     is the input to ``rebuild_sum_walk`` — walking it produces one continuous
     sum, so the join seam never exists.
     """
-    pre = [r for r in givtcp_rows if _to_utc(r["start"]) < cutover]
-    post = [r for r in ge_rows if _to_utc(r["start"]) >= cutover]
+    boundary = _as_us(cutover)
+    pre = [r for r in givtcp_rows if _utc_us(r["start"]) < boundary]
+    post = [r for r in ge_rows if _utc_us(r["start"]) >= boundary]
     merged = pre + post
-    merged.sort(key=lambda r: _to_utc(r["start"]))
+    merged.sort(key=lambda r: _utc_us(r["start"]))
     return merged
 
 
@@ -1331,7 +1877,7 @@ _EPOCH = datetime(2000, 1, 1, tzinfo=UTC)
 
 
 async def migrate_entity(
-    ws: HAWebSocket,
+    ws: HAWebSocket | StatisticsBatcher,
     givtcp_id: str,
     ge_id: str,
     description: str,
@@ -1346,19 +1892,19 @@ async def migrate_entity(
 ) -> MigrationResult:
     r = MigrationResult(description, ge_id, warn_diverged)
 
+    # Rows are normalised window by window as they arrive: the raw payload of a
+    # multi-year history is never held whole.
     try:
-        raw_givtcp = await ws.get_statistics([givtcp_id], _EPOCH, end=cutover)
-        raw_ge = await ws.get_statistics([ge_id], _EPOCH)
+        givtcp_stats = [s async for s in fetch_rows(ws, givtcp_id, _EPOCH, end=cutover)]
+        ge_all = [s async for s in fetch_rows(ws, ge_id, _EPOCH)]
     except Exception as exc:
         r.status = "error"
         r.error = str(exc)
         return r
 
-    givtcp_stats = [_normalise(s) for s in raw_givtcp.get(givtcp_id, [])]
-    ge_all = [_normalise(s) for s in raw_ge.get(ge_id, [])]
-
-    ge_pre = [s for s in ge_all if _to_utc(s["start"]) < cutover]
-    ge_post = [s for s in ge_all if _to_utc(s["start"]) >= cutover]
+    boundary = _as_us(cutover)
+    ge_pre = [s for s in ge_all if _utc_us(s["start"]) < boundary]
+    ge_post = [s for s in ge_all if _utc_us(s["start"]) >= boundary]
 
     r.givtcp_rows = len(givtcp_stats)
     r.ge_pre_rows = len(ge_pre)
@@ -1421,12 +1967,7 @@ async def migrate_entity(
         # Rebuild path (default): one continuous sum from the concatenated state
         # timeline, plausibility- and reset-guarded.
         merged_states = build_merged_states(givtcp_stats, ge_all, cutover)
-        deltas = [
-            (merged_states[i]["state"] - merged_states[i - 1]["state"])
-            for i in range(1, len(merged_states))
-            if merged_states[i].get("state") is not None
-            and merged_states[i - 1].get("state") is not None
-        ]
+        deltas = _state_deltas(merged_states)
         # Negative deltas (resets, spikes) are silently excluded inside
         # adaptive_ceiling (it filters to `d > 0`), so passing the full list here
         # is intentional — no pre-filtering needed.
@@ -1482,8 +2023,13 @@ def _repair_reset_class(
     return (reset_classes or {}).get(ge_id) or classify_entity(ge_id)
 
 
-def _state_deltas(rows: list[dict[str, Any]]) -> list[float]:
-    """Positive-or-any consecutive state deltas, mirroring migrate_entity's pattern."""
+def _state_deltas(rows: list[dict[str, Any]]) -> Sequence[float] | np.ndarray:
+    """Consecutive state deltas (any sign) between rows that both carry a state.
+
+    An array when the rows are analysed with numpy, which adaptive_ceiling takes as is.
+    """
+    if (cols := _columns(rows)) is not None:
+        return cols.state_deltas()
     return [
         rows[i]["state"] - rows[i - 1]["state"]
         for i in range(1, len(rows))
@@ -1631,17 +2177,20 @@ async def write_candidate(ws: HAWebSocket, r: MigrationResult) -> None:
 async def verify_written(ws: HAWebSocket, r: MigrationResult) -> bool:
     """Phase C: re-read the stored series and confirm it matches the approved
     candidate — row count, per-row normalized `start` timestamp, AND per-row sum
-    within epsilon (equal sums with shifted/reordered timestamps must NOT pass)."""
-    raw = await ws.get_statistics([r.ge_id], _EPOCH)
-    stored = [_normalise(s) for s in raw.get(r.ge_id, [])]
+    within epsilon (equal sums with shifted/reordered timestamps must NOT pass).
+    Compared window by window, stopping at the first mismatch."""
     rebuilt = r.rebuilt_rows or []
-    if len(stored) != len(rebuilt):
-        return False
-    return all(
-        a["start"] == b["start"]
-        and abs((a.get("sum") or 0.0) - (b.get("sum") or 0.0)) <= _FLAT_EPSILON
-        for a, b in zip(stored, rebuilt)
-    )
+    count = 0
+    async for a in fetch_rows(ws, r.ge_id, _EPOCH):
+        if count >= len(rebuilt):
+            return False
+        b = rebuilt[count]
+        if a["start"] != b["start"]:
+            return False
+        if abs((a.get("sum") or 0.0) - (b.get("sum") or 0.0)) > _FLAT_EPSILON:
+            return False
+        count += 1
+    return count == len(rebuilt)
 
 
 # ---------------------------------------------------------------------------
@@ -1924,32 +2473,51 @@ async def run(args: argparse.Namespace) -> int:
     print()
 
     # ── Phase A: build every candidate (no writes yet) ──────────────────────
-    results: list[MigrationResult] = []
-    units_by_id: dict[str, str | None] = {}
+    # Up to --concurrency entities are fetched and rebuilt at once; their reads
+    # share the one connection, batched several series per request. Results
+    # keep the plan's order.
+    units_by_id: dict[str, str | None] = {ge_id: unit for (_, ge_id, _, unit, _, _, _) in plan}
     # Authoritative reset cadence per target, straight from the plan — used by
     # validation instead of re-deriving from the (renameable) ge_id.
     reset_classes = {ge_id: reset_class for (_, ge_id, _, _, _, reset_class, _) in plan}
-    for givtcp_id, ge_id, desc, unit, warn, reset_class, resolved in plan:
-        units_by_id[ge_id] = unit
-        print(f"  Building: {desc} …", end=" ", flush=True)
-        # `resolved` (registry recognition), not recorder presence, is what makes
-        # a target real — so an orphan from a prior broken run is never written.
-        r = await migrate_entity(
-            ws,
-            givtcp_id,
-            ge_id,
-            desc,
-            cutover,
-            unit,
-            resolved,
-            reset_class,
-            tz,
-            args.trust_source_sums,
-            warn,
-            max_kwh=args.max_kw,
-        )
-        results.append(r)
-        print(r.status)
+    building = asyncio.Semaphore(args.concurrency)
+    source = StatisticsBatcher(
+        ws,
+        [(givtcp_id, _EPOCH, cutover) for (givtcp_id, *_) in plan]
+        + [(ge_id, _EPOCH, None) for (_, ge_id, *_) in plan],
+    )
+
+    async def build(
+        givtcp_id: str,
+        ge_id: str,
+        desc: str,
+        unit: str,
+        warn: bool,
+        reset_class: ResetClass,
+        resolved: bool,
+    ) -> MigrationResult:
+        async with building:
+            # `resolved` (registry recognition), not recorder presence, is what
+            # makes a target real — so an orphan from a prior broken run is never
+            # written.
+            r = await migrate_entity(
+                source,
+                givtcp_id,
+                ge_id,
+                desc,
+                cutover,
+                unit,
+                resolved,
+                reset_class,
+                tz,
+                args.trust_source_sums,
+                warn,
+                max_kwh=args.max_kw,
+            )
+        print(f"  Built: {desc} … {r.status}", flush=True)
+        return r
+
+    results = list(await asyncio.gather(*(build(*entry) for entry in plan)))
 
     # Validate the in-memory candidates and print the findings report. This drives
     # both the dry-run preview and the Phase-A apply gate from the SAME findings.
@@ -2066,6 +2634,14 @@ def _positive_float(value: str) -> float:
     return f
 
 
+def _positive_int(value: str) -> int:
+    """argparse type: a positive integer (for --concurrency)."""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return n
+
+
 def main() -> None:
     p = argparse.ArgumentParser(
         description="Migrate GivTCP long-term energy statistics to givenergy_local.",
@@ -2137,6 +2713,17 @@ def main() -> None:
             "with --apply."
         ),
     )
+    p.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=_DEFAULT_CONCURRENCY,
+        metavar="N",
+        help=(
+            "Entities fetched and rebuilt at once while building the candidates "
+            f"(default {_DEFAULT_CONCURRENCY}). Only reads overlap: writes under "
+            "--apply still go one entity at a time."
+        ),
+    )
     args = p.parse_args()
     sys.exit(asyncio.run(run(args)))
 
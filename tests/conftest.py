@@ -229,6 +229,9 @@ def mock_client(mock_plant) -> AsyncMock:
             "close",
             "one_shot_command",
             "capture_frames",
+            # The public batch-read primitive, driven directly by the adaptive
+            # per-bank scheduler, read-backs and the fast lane.
+            "execute",
         ]
     )
     client.connected = True
@@ -239,6 +242,7 @@ def mock_client(mock_plant) -> AsyncMock:
     client.detect = AsyncMock()
     client.close = AsyncMock()
     client.one_shot_command = AsyncMock()
+    client.execute = AsyncMock(side_effect=lambda requests, **kwargs: [None] * len(requests))
     with (
         patch("custom_components.givenergy_local.coordinator.Client", return_value=client),
         patch("custom_components.givenergy_local.config_flow.Client", return_value=client),
@@ -520,6 +520,35 @@ describe("analyst mode", () => {
     expect(av.cards[3].type).toBe("custom:ge-cell-heatmap");
   });
 
+  it("points each heatmap at its pack's Cells entity in lean per-cell mode", async () => {
+    const hass = makeHass({ batterySerials: ["BAT1", "BAT2"], cellArray: true });
+    const dash = await GE.generateDashboard({ mode: "analyst" }, hass);
+    const av = view(dash, "Analyst");
+    expect(av.cards[2].stats).toEqual(["sensor.ge_bat1_cell_array"]);
+    expect(av.cards[3].stats).toEqual(["sensor.ge_bat2_cell_array"]);
+    const health = view(dash, "Battery Health").sections[0].cards.find(
+      (c) => c.type === "custom:ge-cell-heatmap"
+    );
+    expect(health.batteries).toEqual(["BAT1", "BAT2"]);
+    expect(health.stats).toEqual(["sensor.ge_bat1_cell_array", "sensor.ge_bat2_cell_array"]);
+  });
+
+  it("leaves the heatmap on the per-cell entities when no pack entity carries the cells", async () => {
+    const hass = makeHass({ batterySerials: ["BAT1"] });
+    const dash = await GE.generateDashboard({ mode: "analyst" }, hass);
+    expect(view(dash, "Analyst").cards[2].stats).toEqual([null]);
+  });
+
+  it("prefers the pack's Cell Vector sensor for the heatmap when it exists", async () => {
+    const hass = makeHass({ batterySerials: ["BAT1"], cellVector: true });
+    const dash = await GE.generateDashboard({ mode: "analyst" }, hass);
+    expect(view(dash, "Analyst").cards[2].stats).toEqual(["sensor.ge_bat1_cell_vector"]);
+    const health = view(dash, "Battery Health").sections[0].cards.find(
+      (c) => c.type === "custom:ge-cell-heatmap"
+    );
+    expect(health.stats).toEqual(["sensor.ge_bat1_cell_vector"]);
+  });
+
   it("resolves all analyst entity slots from the registry and survives the loft_ prefix", async () => {
     const hass = makeHass({ batterySerials: ["BAT1"], areaPrefix: "loft_" });
     const dash = await GE.generateDashboard({ mode: "analyst" }, hass);
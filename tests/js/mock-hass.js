@@ -128,7 +128,7 @@ function entitiesFor(deviceId, serial, keys, prefix, omit, disabled) {
 }
 
 // opts: { inverterSerial, batterySerials[], ems, acCoupled, smartLoad, areaPrefix,
-//         extraInverterSerial }
+//         extraInverterSerial, cellVector }
 function makeHass(opts) {
   opts = opts || {};
   const prefix = opts.areaPrefix || "";
@@ -165,6 +165,10 @@ function makeHass(opts) {
       entitiesFor("dev_inv", invSerial, invKeys, prefix, opts.omitKeys, opts.disabledKeys)
     );
 
+    // the optional per-pack Cell Vector sensor (cell_vector_sensors option) and
+    // the Cells entity of lean per-cell mode
+    let batKeys = opts.cellVector ? BATTERY_KEYS.concat(["cell_vector"]) : BATTERY_KEYS;
+    if (opts.cellArray) batKeys = batKeys.concat(["cell_array"]);
     bats.forEach(function (serial, i) {
       const id = "dev_bat" + (i + 1);
       devices.push({
@@ -175,7 +179,7 @@ function makeHass(opts) {
       });
       entities.push.apply(
         entities,
-        entitiesFor(id, serial, BATTERY_KEYS, prefix, opts.omitKeys, opts.disabledKeys)
+        entitiesFor(id, serial, batKeys, prefix, opts.omitKeys, opts.disabledKeys)
       );
     });
   }
@@ -9,8 +9,10 @@ from homeassistant.helpers import entity_registry as er
 from custom_components.givenergy_local.binary_sensor import (
     DEBOUNCE_MIN_POLLS,
     DEBOUNCE_SECONDS,
+    CellBands,
     GivEnergyBatteryOutOfSpecBinarySensor,
 )
+from custom_components.givenergy_local.cell_stats import compute_cell_stats
 from custom_components.givenergy_local.const import DOMAIN
 
 BASE = datetime(2026, 1, 1, tzinfo=UTC)
@@ -27,17 +29,36 @@ def _battery(serial="BT1", cells=None, temps=None):
     return bat
 
 
-def _entity(batteries):
+def _snapshot(coordinator) -> None:
+    """Rebuild the coordinator's cell statistics, as its fan-out does each refresh."""
+    coordinator.cell_stats = compute_cell_stats(coordinator.data)
+
+
+def _module(serial, cells, temps=()):
+    """An AIO module / HV BMU: per-cell voltages and per-cell temperatures."""
+    module = SimpleNamespace(serial_number=serial, is_valid=lambda: True)
+    for i, volt in enumerate(cells, start=1):
+        setattr(module, f"v_cell_{i:02d}", volt)
+    for i, temp in enumerate(temps, start=1):
+        setattr(module, f"t_cell_{i:02d}", temp)
+    return module
+
+
+def _entity(batteries, aio_modules=(), bmus=(), **kwargs):
     coordinator = MagicMock()
     coordinator.data.batteries = batteries
+    coordinator.data.aio_battery_modules = list(aio_modules)
+    coordinator.data.hv_stacks = [SimpleNamespace(bmus=list(bmus))] if bmus else []
     coordinator.data.inverter_serial_number = "SA1234G123"
     coordinator.last_successful_refresh = None
-    return GivEnergyBatteryOutOfSpecBinarySensor(coordinator), coordinator
+    _snapshot(coordinator)
+    return GivEnergyBatteryOutOfSpecBinarySensor(coordinator, **kwargs), coordinator
 
 
 def _poll(entity, coordinator, at: datetime, batteries=None) -> None:
     if batteries is not None:
         coordinator.data.batteries = batteries
+    _snapshot(coordinator)
     coordinator.last_successful_refresh = at
     entity._evaluate()
 
@@ -137,6 +158,35 @@ def test_attributes_enumerate_current_offenders():
     assert offender["seconds_out_of_spec"] == 120
 
 
+def test_aio_module_and_hv_bmu_cells_are_checked():
+    aio = _module("AIO1", [3.30] * 23 + [3.70], temps=[22.0] * 12)
+    bmu = _module("BMU1", [3.30] * 24, temps=[22.0] * 23 + [55.0])
+    entity, coordinator = _entity([], aio_modules=[aio], bmus=[bmu])
+    for n in range(DEBOUNCE_MIN_POLLS):
+        _poll(entity, coordinator, BASE + timedelta(seconds=n * 150))
+    assert entity.is_on is True
+    assert set(entity._offenders) == {"AIO1:cell_24_voltage", "BMU1:cell_24_temperature"}
+
+
+def test_bands_are_per_chemistry():
+    wide = {"lfp": CellBands(cell_min_v=2.0, cell_max_v=3.65, temp_min_c=-10.0, temp_max_c=60.0)}
+    bad = [_battery(cells=[2.5] + [3.30] * 15, temps=[55.0, 22.0, 22.0, 22.0])]
+    entity, coordinator = _entity(bad, bands=wide)
+    for n in range(DEBOUNCE_MIN_POLLS):
+        _poll(entity, coordinator, BASE + timedelta(seconds=n * DEBOUNCE_SECONDS))
+    assert entity.is_on is False
+    assert entity._offenders == {}
+
+
+def test_departed_pack_is_forgotten():
+    bad = _battery(serial="BT2", cells=[2.5] + [3.30] * 15)
+    entity, coordinator = _entity([_battery(), bad])
+    _poll(entity, coordinator, BASE)
+    assert "BT2:cell_01_voltage" in entity._offenders
+    _poll(entity, coordinator, BASE + timedelta(seconds=150), batteries=[_battery()])
+    assert entity._offenders == {}
+
+
 # ---------------------------------------------------------------------------
 # Creation gating (integration-level)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,121 @@
+"""Tests for the persisted long-term cell drift statistics."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.givenergy_local.cell_drift import CellDriftTracker
+from custom_components.givenergy_local.cell_stats import CellStats
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _stats(*voltages: float | None) -> dict[str, CellStats]:
+    present = [v for v in voltages if v]
+    mean = sum(present) / len(present)
+    return {
+        "BT1": CellStats(
+            kind="lv_battery",
+            serial="BT1",
+            voltages=voltages,
+            temperatures=(),
+            cells_per_temperature=4,
+            v_min=min(present),
+            v_max=max(present),
+            v_mean=mean,
+            v_spread=max(present) - min(present),
+            t_min=None,
+            t_max=None,
+            outliers=(),
+        )
+    }
+
+
+def test_average_ranks_the_persistently_deviating_cell_first():
+    tracker = CellDriftTracker()
+    tracker.record(START, _stats(3.300, 3.300, 3.300))
+    # Cell 3 sits 6 mV high for a day; cell 1 has one brief 9 mV excursion.
+    for n in range(1, 48):
+        at = START + timedelta(minutes=30 * n)
+        tracker.record(at, _stats(3.309 if n == 5 else 3.300, 3.300, 3.306))
+
+    ranked = tracker.cells("BT1")
+    assert ranked[0].cell == 3
+    assert ranked[0].deviation == pytest.approx(4.0, abs=0.1)
+    cells = {c.cell: c for c in ranked}
+    # The excursion shows in the day's range but barely moves the average.
+    assert cells[1].day_max == pytest.approx(4.0)
+    assert cells[1].deviation == pytest.approx(cells[2].deviation, abs=0.5)
+
+
+def test_stale_tick_is_ignored():
+    tracker = CellDriftTracker()
+    tracker.record(START, _stats(3.300, 3.310))
+    tracker.record(START, _stats(3.300, 3.400))
+    assert tracker.cells("BT1")[0].deviation == pytest.approx(5.0)
+
+
+def test_daily_closes_give_a_drift_slope():
+    tracker = CellDriftTracker()
+    for day in range(5):
+        # Cell 2 climbs 2 mV/day above the pack mean (the mean moves by half that).
+        offset = 0.002 * day
+        at = START + timedelta(days=day)
+        for hour in range(0, 24, 2):
+            tracker.record(at + timedelta(hours=hour), _stats(3.300, 3.300 + offset))
+
+    (worst, other) = tracker.cells("BT1")
+    assert worst.cell in (1, 2)
+    assert tracker.days_tracked("BT1") == 5
+    slopes = {c.cell: c.slope for c in (worst, other)}
+    assert slopes[2] == pytest.approx(1.0, rel=0.2)
+    assert slopes[1] == pytest.approx(-1.0, rel=0.2)
+
+
+def test_slope_needs_a_few_days():
+    tracker = CellDriftTracker()
+    tracker.record(START, _stats(3.300, 3.310))
+    tracker.record(START + timedelta(days=1), _stats(3.300, 3.310))
+    assert all(c.slope is None for c in tracker.cells("BT1"))
+
+
+def test_round_trips_through_the_store_payload():
+    tracker = CellDriftTracker()
+    for day in range(3):
+        tracker.record(START + timedelta(days=day), _stats(3.300, None, 3.310))
+
+    restored = CellDriftTracker.from_dict(tracker.as_dict())
+
+    assert "BT1" in restored
+    assert restored.days_tracked("BT1") == 3
+    assert sorted((c.cell, round(c.deviation, 2)) for c in restored.cells("BT1")) == [
+        (1, -5.0),
+        (3, 5.0),
+    ]
+    # Recording carries on from the restored state.
+    restored.record(START + timedelta(days=3), _stats(3.300, None, 3.310))
+    assert restored.days_tracked("BT1") == 4
+
+
+def test_unreadable_payload_is_dropped():
+    assert "BT1" not in CellDriftTracker.from_dict(None)
+    assert "BT1" not in CellDriftTracker.from_dict({"BT1": {"ewma": "garbage"}})
+    assert "BT1" not in CellDriftTracker.from_dict({"BT1": "garbage"})
+
+
+def test_an_unpopulated_slot_is_not_tracked():
+    """A slot reading 0 V has no deviation, so it never outranks the real cells."""
+    tracker = CellDriftTracker()
+    voltages = (*([3.300] * 14), 3.304, 0.0)
+    tracker.record(START, _stats(*voltages))
+    tracker.record(START + timedelta(minutes=30), _stats(*voltages))
+    cells = tracker.cells("BT1")
+    assert [c.cell for c in cells][0] == 15
+    assert 16 not in {c.cell for c in cells}
+
+    # An average an older version persisted for the slot is dropped on the next tick.
+    payload = tracker.as_dict()
+    payload["BT1"]["ewma"][15] = -3300.0
+    restored = CellDriftTracker.from_dict(payload)
+    restored.record(START + timedelta(hours=1), _stats(*voltages))
+    assert 16 not in {c.cell for c in restored.cells("BT1")}
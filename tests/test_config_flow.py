@@ -2,16 +2,22 @@
 
 from unittest.mock import patch
 
+import pytest
+import voluptuous as vol
 from givenergy_modbus.exceptions import RefreshFailed, RefreshPartiallySucceeded
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
 
 from custom_components.givenergy_local.const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_BATTERY_DATA_ONLY,
     CONF_EXPERIMENTAL,
     CONF_EXPOSE_PER_CELL,
+    CONF_FAST_LANE_INTERVAL,
     CONF_PASSIVE,
     CONF_SCAN_INTERVAL,
+    CONF_THROTTLE_DEADBAND,
+    CONF_THROTTLE_MAX_INTERVAL,
     CONF_WARN_CLOCK_DRIFT,
     DOMAIN,
     ExperimentalFeature,
@@ -294,6 +300,68 @@ async def test_options_flow_warn_clock_drift_renders_and_persists(
     assert setup_integration.options[CONF_WARN_CLOCK_DRIFT] is False
 
 
+async def test_options_flow_throttle_tuning_persists_and_is_bounded(
+    hass, mock_client, setup_integration
+):
+    """The power-sensor deadband and heartbeat render with their defaults, persist,
+    and refuse values outside their ranges."""
+    result = await hass.config_entries.options.async_init(setup_integration.entry_id)
+    defaults = {marker.schema: marker.default() for marker in result["data_schema"].schema}
+    assert defaults[CONF_THROTTLE_DEADBAND] == 20
+    assert defaults[CONF_THROTTLE_MAX_INTERVAL] == 300
+
+    with pytest.raises(vol.Invalid):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_BATTERY_DATA_ONLY: False, CONF_THROTTLE_DEADBAND: 0}
+        )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_BATTERY_DATA_ONLY: False, CONF_THROTTLE_DEADBAND: 50, CONF_THROTTLE_MAX_INTERVAL: 60},
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == "create_entry"
+    assert setup_integration.options[CONF_THROTTLE_DEADBAND] == 50
+    assert setup_integration.options[CONF_THROTTLE_MAX_INTERVAL] == 60
+
+
+async def test_options_flow_adaptive_polling_defaults_off_and_persists(
+    hass, mock_client, setup_integration
+):
+    """Adaptive per-bank polling renders defaulted off and persists when enabled; the
+    reload then builds the coordinator with a bank scheduler."""
+    result = await hass.config_entries.options.async_init(setup_integration.entry_id)
+    assert CONF_ADAPTIVE_POLLING in {marker.schema for marker in result["data_schema"].schema}
+    assert hass.data[DOMAIN][setup_integration.entry_id].bank_scheduler is None
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_BATTERY_DATA_ONLY: False, CONF_ADAPTIVE_POLLING: True}
+    )
+    await hass.async_block_till_done()
+
+    assert setup_integration.options[CONF_ADAPTIVE_POLLING] is True
+    assert hass.data[DOMAIN][setup_integration.entry_id].bank_scheduler is not None
+
+
+async def test_options_flow_fast_lane_defaults_off_and_persists(
+    hass, mock_client, setup_integration
+):
+    """The fast lane renders defaulted off and persists a chosen interval; the reload
+    then builds the coordinator with it."""
+    result = await hass.config_entries.options.async_init(setup_integration.entry_id)
+    assert CONF_FAST_LANE_INTERVAL in {marker.schema for marker in result["data_schema"].schema}
+    assert hass.data[DOMAIN][setup_integration.entry_id].fast_lane_interval == 0
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_BATTERY_DATA_ONLY: False, CONF_FAST_LANE_INTERVAL: 3}
+    )
+    await hass.async_block_till_done()
+
+    assert setup_integration.options[CONF_FAST_LANE_INTERVAL] == 3
+    assert hass.data[DOMAIN][setup_integration.entry_id].fast_lane_interval == 3
+    assert await hass.config_entries.async_unload(setup_integration.entry_id)
+
+
 async def test_options_flow_prefills_existing_value(hass, mock_client, setup_integration):
     """Re-opening the options form when the value is already True must pre-fill True,
     proving add_suggested_values_to_schema round-trips the saved option."""
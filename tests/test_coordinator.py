@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -61,6 +63,15 @@ def _partial(plant, failures=None) -> RefreshPartiallySucceeded:
     )
 
 
+def _reads(fail: Callable[[Any], bool] = lambda request: False) -> AsyncMock:
+    """A client.execute double: each read times out if ``fail(request)``, else succeeds."""
+
+    async def execute(requests, **kwargs):
+        return [TimeoutError() if fail(request) else None for request in requests]
+
+    return AsyncMock(side_effect=execute)
+
+
 def _refresh_failed(*causes: BaseException) -> RefreshFailed:
     """A total-poll failure whose ExceptionGroup carries the given causes."""
     return RefreshFailed(
@@ -1527,3 +1538,582 @@ async def test_experimental_kwargs_forwarded_to_client(hass):
         "port": 8899,
         "demo_kwarg": 5.0,
     }
+
+
+# ----------------------------------------------------------------------
+# Adaptive per-bank polling
+# ----------------------------------------------------------------------
+
+
+def _scheduled_client(mock_plant):
+    """A connected client whose batch executor records the requested IR banks."""
+    mock_plant.capabilities = _caps(lv_battery_addresses=[0x33])
+    mock_plant.block_present.return_value = True
+    mock_plant.content_unchanged_seconds.return_value = 10_000.0  # content holding steady
+    client = AsyncMock()
+    client.connected = True
+    client.plant = mock_plant
+    client.load_config = AsyncMock(return_value=mock_plant)
+    client.execute = _reads()
+    return client
+
+
+def _requested_banks(client, call_index):
+    requests = client.execute.call_args_list[call_index].args[0]
+    return {(r.device_address, r.base_register, r.register_count) for r in requests}
+
+
+async def test_adaptive_polling_off_by_default(hass):
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    assert coordinator.bank_scheduler is None
+
+
+async def test_adaptive_polling_not_used_in_passive_mode(hass):
+    coordinator = GivEnergyUpdateCoordinator(
+        hass, "192.168.1.1", 8899, 30, passive=True, adaptive_polling=True
+    )
+    assert coordinator.bank_scheduler is None
+
+
+async def test_adaptive_polling_defers_steady_battery_bank(hass, mock_plant):
+    """With adaptive polling on, refresh() is bypassed for a per-bank read set: the
+    inverter banks are read every tick while a steady battery bank backs off."""
+    coordinator = GivEnergyUpdateCoordinator(
+        hass, "192.168.1.1", 8899, 30, passive=False, adaptive_polling=True
+    )
+    client = _scheduled_client(mock_plant)
+    coordinator._client = client
+
+    for _ in range(3):
+        assert await coordinator._async_update_data() is mock_plant
+
+    client.refresh.assert_not_called()
+    inverter_banks = {(0x32, 0, 60), (0x32, 180, 60)}
+    assert _requested_banks(client, 0) == inverter_banks | {(0x33, 60, 60)}
+    assert _requested_banks(client, 1) == inverter_banks | {(0x33, 60, 60)}
+    # Steady on tick 1 → interval doubles, so tick 2 skips the battery.
+    assert _requested_banks(client, 2) == inverter_banks
+    assert coordinator.bank_scheduler.reads_skipped == 1
+    # Holding registers keep their own full-refresh cycle.
+    client.load_config.assert_called_once_with(retries=1)
+
+
+async def test_adaptive_polling_failed_bank_retried_and_partial_raised(hass, mock_plant):
+    """A bank whose read failed is re-read next tick; the partial still reaches the
+    coordinator's seed/steady-state policy unchanged."""
+    coordinator = GivEnergyUpdateCoordinator(
+        hass, "192.168.1.1", 8899, 30, passive=False, adaptive_polling=True
+    )
+    client = _scheduled_client(mock_plant)
+    failing: set[int] = set()
+    client.execute = _reads(lambda request: request.device_address in failing)
+    coordinator._client = client
+    coordinator.data = mock_plant
+
+    await coordinator._async_update_data()
+    failing.add(0x33)
+    assert await coordinator._async_update_data() is mock_plant
+    assert coordinator.partial_failures == 1
+
+    failing.clear()
+    await coordinator._async_update_data()
+    assert (0x33, 60, 60) in _requested_banks(client, 2)
+
+
+async def test_adaptive_polling_reset_on_reconnect(hass, mock_plant):
+    """A reconnect builds a fresh Plant with an empty cache, so every bank is due."""
+    coordinator = GivEnergyUpdateCoordinator(
+        hass, "192.168.1.1", 8899, 30, passive=False, adaptive_polling=True
+    )
+    client = _scheduled_client(mock_plant)
+    with patch("custom_components.givenergy_local.coordinator.Client", return_value=client):
+        coordinator._client = client
+        for _ in range(2):
+            await coordinator._async_update_data()
+
+        coordinator._client = None
+        await coordinator._async_update_data()
+
+    assert (0x33, 60, 60) in _requested_banks(client, 2)
+
+
+async def test_pipelined_refresh_off_by_default_and_in_passive_mode(hass):
+    assert GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30).pipeline is None
+    coordinator = GivEnergyUpdateCoordinator(
+        hass, "192.168.1.1", 8899, 30, passive=True, pipelined_refresh=True
+    )
+    assert coordinator.pipeline is None
+
+
+async def test_pipelined_full_tick_overlaps_config_and_measurement_reads(hass, mock_plant):
+    """With pipelined refresh on, a full tick queues the IR banks while the HR batch
+    is still in flight, reads them concurrently, and pools their failures."""
+    coordinator = GivEnergyUpdateCoordinator(
+        hass, "192.168.1.1", 8899, 30, passive=False, pipelined_refresh=True
+    )
+    mock_plant.capabilities = _caps(lv_battery_addresses=[0x33])
+    mock_plant.block_present.return_value = True
+    coordinator.data = mock_plant
+
+    config_started = asyncio.Event()
+    ir_sent: list[int] = []
+
+    async def _load_config(retries):
+        config_started.set()
+        # Still "in flight" until the IR banks have been queued.
+        while not ir_sent:
+            await asyncio.sleep(0)
+        raise _partial(mock_plant, [_read_failure(0x32)])
+
+    async def _execute(requests, timeout, retries, retry_delay, return_exceptions):
+        await config_started.wait()
+        ir_sent.extend(request.device_address for request in requests)
+        return [MagicMock() for _ in requests]
+
+    client = AsyncMock()
+    client.connected = True
+    client.plant = mock_plant
+    client.load_config = _load_config
+    client.execute = _execute
+    coordinator._client = client
+
+    assert await coordinator._async_update_data() is mock_plant
+    client.refresh.assert_not_called()
+    assert sorted(ir_sent) == [0x32, 0x32, 0x33]
+    # The HR batch's failure still lands as a partial poll.
+    assert coordinator.partial_failures == 1
+    assert coordinator.pipeline.latency[0x33].requests == 1
+
+
+# ---------------------------------------------------------------------------
+# Change-driven entity writes
+# ---------------------------------------------------------------------------
+
+
+async def test_changed_devices_diffs_register_caches(hass):
+    """Each fan-out diffs the register caches against the previous one, per device."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    caps = _caps(lv_battery_addresses=[0x33])
+    caches = {0x32: {"IR(0)": 1}, 0x33: {"IR(60)": 2}}
+    coordinator.data = SimpleNamespace(
+        register_caches=caches,
+        capabilities=caps,
+        batteries=[],
+        aio_battery_modules=[],
+        hv_stacks=[],
+    )
+
+    # First sight of these capabilities: nothing is known to be unchanged.
+    coordinator.async_update_listeners()
+    assert coordinator.changed_devices is None
+
+    coordinator.async_update_listeners()
+    assert coordinator.changed_devices == frozenset()
+    assert coordinator.device_unchanged(0x33)
+
+    caches[0x33]["IR(60)"] = 3
+    coordinator.async_update_listeners()
+    assert coordinator.changed_devices == {0x33}
+    assert not coordinator.device_unchanged(0x33)
+    assert coordinator.device_unchanged(0x32)
+
+    del caches[0x32]
+    coordinator.async_update_listeners()
+    assert coordinator.changed_devices == {0x32}
+
+    coordinator.data.capabilities = _caps(lv_battery_addresses=[0x33, 0x34])
+    coordinator.async_update_listeners()
+    assert coordinator.changed_devices is None
+
+
+async def test_block_age_table_built_once_per_fan_out(hass):
+    """Every stamped window is aged once per fan-out, grouped by device address;
+    the layout version only moves when the set of windows does."""
+    from datetime import UTC, datetime, timedelta
+
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    now = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+    stamps = {
+        (0x32, "IR", 0, 60): now - timedelta(seconds=5),
+        (0x32, "IR", 180, 60): now - timedelta(seconds=400),
+        (0x33, "IR", 60, 60): now - timedelta(seconds=20),
+    }
+    coordinator.data = SimpleNamespace(
+        register_block_updated_at=stamps, batteries=[], aio_battery_modules=[], hv_stacks=[]
+    )
+
+    with patch("custom_components.givenergy_local.coordinator.dt_util.utcnow", return_value=now):
+        coordinator.async_update_listeners()
+        assert coordinator.block_ages == {
+            0x32: {("IR", 0, 60): 5.0, ("IR", 180, 60): 400.0},
+            0x33: {("IR", 60, 60): 20.0},
+        }
+        version = coordinator.block_layout_version
+        coordinator.async_update_listeners()
+        assert coordinator.block_layout_version == version
+
+        stamps[(0x34, "IR", 60, 60)] = now
+        coordinator.async_update_listeners()
+    assert coordinator.block_layout_version == version + 1
+    assert coordinator.block_ages[0x34] == {("IR", 60, 60): 0.0}
+
+
+async def test_changed_devices_unknown_without_register_caches(hass, mock_plant):
+    """A plant without real register caches leaves every device treated as changed."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    coordinator.data = mock_plant
+    coordinator.async_update_listeners()
+    coordinator.async_update_listeners()
+    assert coordinator.changed_devices is None
+    assert not coordinator.device_unchanged(0x32)
+
+
+async def test_suppressed_writes_counted_per_fan_out(hass):
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    unsubs = [coordinator.async_add_listener(coordinator.record_suppressed_write) for _ in range(2)]
+
+    coordinator.async_update_listeners()
+    coordinator.async_update_listeners()
+    for unsub in unsubs:
+        unsub()
+    assert coordinator.last_tick_suppressed_writes == 2
+    assert coordinator.suppressed_writes == 4
+
+
+async def test_poll_timings_recorded_per_phase(hass, mock_plant):
+    """A full tick records load_config, refresh and the whole tick; a partial
+    tick skips load_config; fan-out is timed around the listener pass."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+
+    with patch("custom_components.givenergy_local.coordinator.Client") as mock_cls:
+        client = AsyncMock()
+        client.connected = True
+        client.plant = mock_plant
+        client.refresh = AsyncMock(return_value=mock_plant)
+        client.load_config = AsyncMock(return_value=mock_plant)
+        mock_cls.return_value = client
+        coordinator._client = client
+
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+
+    phases = coordinator.timings.as_dict()["phases"]
+    assert phases["tick"]["samples"] == 2
+    assert phases["refresh"]["samples"] == 2
+    assert phases["load_config"]["samples"] == 1
+    assert "connect" not in phases
+
+    coordinator.data = mock_plant
+    coordinator.async_update_listeners()
+    assert coordinator.timings.as_dict()["phases"]["fan_out"]["samples"] == 1
+
+
+async def test_poll_timings_record_failed_ticks_and_device_commits(hass, mock_plant):
+    """A failing tick is still timed; a successful one records how far into the
+    tick each device's banks committed."""
+    from datetime import UTC, timedelta
+
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    started = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+    mock_plant.register_block_updated_at = {
+        (0x32, "IR", 0, 60): started + timedelta(seconds=1),
+        (0x33, "IR", 60, 60): started - timedelta(seconds=60),
+    }
+
+    with (
+        patch("custom_components.givenergy_local.coordinator.Client") as mock_cls,
+        patch("custom_components.givenergy_local.coordinator.dt_util.utcnow", return_value=started),
+    ):
+        client = AsyncMock()
+        client.connected = True
+        client.plant = mock_plant
+        client.refresh = AsyncMock(side_effect=TimeoutError)
+        client.load_config = AsyncMock(return_value=mock_plant)
+        mock_cls.return_value = client
+        coordinator._client = client
+        coordinator.data = mock_plant  # within tolerance: serves last-known data
+        await coordinator._async_update_data()
+        assert coordinator.consecutive_failures == 1
+
+        client.refresh = AsyncMock(return_value=mock_plant)
+        await coordinator._async_update_data()
+
+    timings = coordinator.timings.as_dict()
+    assert timings["phases"]["tick"]["samples"] == 2
+    assert timings["phases"]["refresh"]["samples"] == 2
+    assert timings["devices"] == {
+        "0x32": {"p50": 1.0, "p95": 1.0, "p99": 1.0, "last": 1.0, "samples": 1}
+    }
+
+
+async def test_coordinators_share_the_domain_detect_budget(hass):
+    """Two entries' reconnects never run their detect() sweeps concurrently."""
+    from custom_components.givenergy_local.domain_scheduler import DomainScheduler
+
+    scheduler = DomainScheduler(stagger=0.0)
+    in_flight = 0
+    peak = 0
+
+    async def _detect(**_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    coordinators = []
+    for host in ("192.168.1.1", "192.168.1.2"):
+        scheduler.register(host)
+        coordinators.append(GivEnergyUpdateCoordinator(hass, host, 8899, 30, scheduler=scheduler))
+
+    with patch("custom_components.givenergy_local.coordinator.Client") as mock_cls:
+        client = AsyncMock()
+        client.detect = AsyncMock(side_effect=_detect)
+        mock_cls.return_value = client
+        await asyncio.gather(*(coordinator._connect() for coordinator in coordinators))
+
+    assert client.detect.await_count == 2
+    assert peak == 1
+
+
+async def test_read_back_rereads_only_the_written_registers(hass):
+    """A control write's read-back reads the written holding registers in merged
+    runs at the inverter address, and fans out with only the inverter changed."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    caches = {0x11: {"HR(94)": 1}, 0x32: {"IR(60)": 2}}
+    plant = SimpleNamespace(
+        register_caches=caches,
+        capabilities=_caps(inverter_address=0x11),
+        batteries=[],
+        aio_battery_modules=[],
+        hv_stacks=[],
+    )
+
+    async def read(requests, **kwargs):
+        caches[0x11]["HR(94)"] = 2
+        return [None] * len(requests)
+
+    client = AsyncMock()
+    client.connected = True
+    client.plant = plant
+    client.execute = AsyncMock(side_effect=read)
+    coordinator._client = client
+    coordinator.data = plant
+    coordinator.async_update_listeners()
+    notified = []
+    unsub = coordinator.async_add_listener(lambda: notified.append(coordinator.changed_devices))
+
+    assert await coordinator.async_read_back([95, 94, 116])
+    unsub()
+
+    (requests,) = client.execute.call_args[0]
+    assert [(r.device_address, r.base_register, r.register_count) for r in requests] == [
+        (0x11, 94, 2),
+        (0x11, 116, 1),
+    ]
+    assert notified == [frozenset({0x11})]
+    assert coordinator.timings.phases.percentile("read_back", 50) is not None
+
+
+async def test_read_back_and_fast_poll_reread_whole_polled_blocks(hass):
+    """Once the full tick has stamped its blocks, a read-back or fast-lane poll
+    reads those blocks whole, so no ad-hoc window joins the block stamps."""
+    from datetime import UTC
+
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30, fast_lane_interval=2)
+    plant = _fast_lane_plant({0x11: {}})
+    now = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+    plant.register_block_updated_at = {
+        (0x11, "HR", 0, 60): now,
+        (0x11, "HR", 60, 60): now,
+        (0x11, "HR", 120, 60): now,
+        (0x11, "IR", 0, 60): now,
+        (0x32, "HR", 60, 60): now,
+    }
+    plant.batteries, plant.aio_battery_modules, plant.hv_stacks = [], [], []
+    client = AsyncMock()
+    client.connected = True
+    client.plant = plant
+    coordinator._client = client
+    coordinator.data = plant
+
+    assert await coordinator.async_read_back([95, 94, 116])
+    (requests,) = client.execute.call_args[0]
+    assert [(r.device_address, r.base_register, r.register_count) for r in requests] == [
+        (0x11, 60, 60)
+    ]
+
+    assert await coordinator.async_fast_poll()
+    (requests,) = client.execute.call_args[0]
+    assert [(r.device_address, r.base_register, r.register_count) for r in requests] == [
+        (0x11, 0, 60)
+    ]
+
+
+async def test_read_back_leaves_an_in_flight_ticks_changes_to_the_tick(hass):
+    """A tick that has already patched another device's cache mid-read-back isn't
+    reported by the read-back's fan-out, and isn't lost from the tick's own."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    caches = {0x11: {"HR(94)": 1}, 0x32: {"IR(60)": 2}}
+    plant = SimpleNamespace(
+        register_caches=caches,
+        capabilities=_caps(inverter_address=0x11),
+        batteries=[],
+        aio_battery_modules=[],
+        hv_stacks=[],
+    )
+
+    async def read(requests, **kwargs):
+        caches[0x11]["HR(94)"] = 2
+        return [None] * len(requests)
+        caches[0x32]["IR(60)"] = 3  # the in-flight tick's battery read lands
+
+    client = AsyncMock()
+    client.connected = True
+    client.plant = plant
+    client.execute = AsyncMock(side_effect=read)
+    coordinator._client = client
+    coordinator.data = plant
+    coordinator.async_update_listeners()
+
+    assert await coordinator.async_read_back([94])
+    assert coordinator.changed_devices == frozenset({0x11})
+    assert not coordinator.device_unchanged(0x11)
+    assert coordinator.device_unchanged(0x32)
+
+    coordinator.async_update_listeners()
+    assert coordinator.changed_devices == frozenset({0x32})
+
+
+async def test_read_back_declines_without_a_live_plant(hass):
+    """No client, a warm-start snapshot still being served, or a failed read all
+    leave the caller to fall back on a full refresh."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    assert not await coordinator.async_read_back([94])
+
+    client = AsyncMock()
+    client.connected = True
+    client.plant = SimpleNamespace(capabilities=None)
+    coordinator._client = client
+    coordinator.data = SimpleNamespace()
+    assert not await coordinator.async_read_back([94])
+    client.execute.assert_not_awaited()
+
+    coordinator.data = client.plant
+    client.execute = _reads(lambda request: True)
+    assert not await coordinator.async_read_back([94])
+    client.execute.assert_awaited_once()
+
+
+def _fast_lane_plant(caches: dict) -> SimpleNamespace:
+    from givenergy_modbus.model.inverter import SinglePhaseInverter
+    from givenergy_modbus.model.register_cache import RegisterCache
+
+    return SimpleNamespace(
+        register_caches=caches,
+        capabilities=_caps(inverter_address=0x11),
+        inverter=SinglePhaseInverter.from_register_cache(RegisterCache()),
+    )
+
+
+async def test_fast_poll_reads_only_the_power_flow_block(hass):
+    """A fast-lane poll reads the inverter's power-flow registers in one block and
+    notifies only the fast-lane listeners, not the full fan-out."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30, fast_lane_interval=2)
+    plant = _fast_lane_plant({0x11: {}})
+    client = AsyncMock()
+    client.connected = True
+    client.plant = plant
+    coordinator._client = client
+    coordinator.data = plant
+    regular, fast = [], []
+    unsub_regular = coordinator.async_add_listener(lambda: regular.append(1))
+    unsub_fast = coordinator.async_add_fast_lane_listener(lambda: fast.append(1))
+
+    assert await coordinator.async_fast_poll()
+    unsub_regular()
+    unsub_fast()
+
+    (requests,) = client.execute.call_args[0]
+    assert [(r.device_address, r.base_register, r.register_count) for r in requests] == [
+        (0x11, 18, 35)
+    ]
+    assert (regular, fast) == ([], [1])
+    assert coordinator.fast_lane_polls == 1
+    assert coordinator.timings.phases.percentile("fast_lane", 50) is not None
+
+
+async def test_fast_lane_timer_runs_only_while_subscribed(hass):
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30, fast_lane_interval=2)
+    unsub = coordinator.async_add_fast_lane_listener(lambda: None)
+    assert coordinator._fast_lane_unsub is not None
+    unsub()
+    assert coordinator._fast_lane_unsub is None
+
+    # Passive mode never solicits reads, so the fast lane stays off.
+    passive = GivEnergyUpdateCoordinator(
+        hass, "192.168.1.1", 8899, 30, passive=True, fast_lane_interval=2
+    )
+    assert passive.fast_lane_interval == 0
+
+
+async def test_fast_poll_failure_keeps_the_last_values(hass):
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30, fast_lane_interval=2)
+    plant = _fast_lane_plant({0x11: {}})
+    client = AsyncMock()
+    client.connected = True
+    client.plant = plant
+    client.execute = _reads(lambda request: True)
+    coordinator._client = client
+    coordinator.data = plant
+    fast = []
+    unsub = coordinator.async_add_fast_lane_listener(lambda: fast.append(1))
+
+    assert not await coordinator.async_fast_poll()
+    unsub()
+
+    assert fast == []
+    assert coordinator.fast_lane_failures == 1
+
+
+async def test_entity_sync_waits_for_a_clean_live_fan_out(hass):
+    """A scheduled entity sync runs once, on the first fan-out of live data from a
+    poll without failed reads, and a pending retiring sync stays retiring."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    sync = MagicMock()
+    remove = coordinator.async_add_entity_sync(sync)
+
+    coordinator.async_schedule_entity_sync(retire=True)
+    coordinator.async_schedule_entity_sync(retire=False)
+    coordinator.warm_start_from = datetime(2026, 1, 1)
+    coordinator.async_update_listeners()
+    coordinator.warm_start_from = None
+    coordinator._consecutive_partials = 1
+    coordinator.async_update_listeners()
+    sync.assert_not_called()
+
+    coordinator._consecutive_partials = 0
+    coordinator.async_update_listeners()
+    coordinator.async_update_listeners()
+    sync.assert_called_once_with(True)
+
+    remove()
+    coordinator.async_schedule_entity_sync(retire=False)
+    coordinator.async_update_listeners()
+    sync.assert_called_once()
+
+
+async def test_targeted_retire_reaches_only_the_registered_retires(hass):
+    """async_retire_entities hands the ids to each platform's retire at once — it
+    neither waits for a poll nor runs the (topology-wide) syncs."""
+    coordinator = GivEnergyUpdateCoordinator(hass, "192.168.1.1", 8899, 30)
+    sync, retire = MagicMock(), MagicMock()
+    remove = coordinator.async_add_entity_sync(sync, retire)
+
+    coordinator.async_retire_entities({"BT1_v_cell_03"})
+    retire.assert_called_once_with({"BT1_v_cell_03"})
+    sync.assert_not_called()
+
+    remove()
+    coordinator.async_retire_entities({"BT1_v_cell_04"})
+    retire.assert_called_once()
@@ -0,0 +1,36 @@
+"""Tests for the config entry diagnostics download."""
+
+from homeassistant.const import CONF_HOST
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.givenergy_local.const import DOMAIN
+from custom_components.givenergy_local.diagnostics import async_get_config_entry_diagnostics
+
+
+async def test_diagnostics_carry_poll_timings_and_redact_host(hass, setup_integration):
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    coordinator.crc_failures_by_device[0x32] = 2
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, setup_integration)
+
+    assert diagnostics["entry"]["data"][CONF_HOST] == "**REDACTED**"
+    # The first refresh ran during setup, so the tick and its phases are sampled.
+    phases = diagnostics["poll"]["timings"]["phases"]
+    assert phases["tick"]["samples"] >= 1
+    assert {"p50", "p95", "p99", "last"} <= phases["refresh"].keys()
+    assert diagnostics["comms"]["crc_failures"] == {"0x32": 2}
+    assert diagnostics["writes"]["batches"] == 0
+    # Experimental sections only appear when their option is on.
+    assert "pipeline" not in diagnostics
+    assert "bank_schedule" not in diagnostics
+
+
+async def test_diagnostics_without_a_loaded_coordinator(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: "192.168.1.100", "port": 8899})
+    entry.add_to_hass(hass)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics == {
+        "entry": {"data": {CONF_HOST: "**REDACTED**", "port": 8899}, "options": {}}
+    }
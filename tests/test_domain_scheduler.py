@@ -0,0 +1,84 @@
+"""Tests for the domain-wide poll/detect scheduler."""
+
+import asyncio
+
+from custom_components.givenergy_local.domain_scheduler import DomainScheduler
+
+
+async def _poll(scheduler, host, starts, hold=0.0, port=8899):
+    async with scheduler.poll_slot(host, port):
+        starts.append((host, asyncio.get_running_loop().time()))
+        await asyncio.sleep(hold)
+
+
+async def test_single_entry_never_waits():
+    scheduler = DomainScheduler(stagger=10.0)
+    scheduler.register("a")
+    starts: list = []
+    loop = asyncio.get_running_loop()
+    began = loop.time()
+    await _poll(scheduler, "10.0.0.1", starts)
+    await _poll(scheduler, "10.0.0.1", starts)
+    assert loop.time() - began < 1.0
+    assert scheduler.staggered_polls == 0
+
+
+async def test_simultaneous_polls_are_spread_by_the_stagger():
+    scheduler = DomainScheduler(stagger=0.05)
+    for entry_id in ("a", "b", "c"):
+        scheduler.register(entry_id)
+    starts: list = []
+    await asyncio.gather(*(_poll(scheduler, f"10.0.0.{n}", starts) for n in (1, 2, 3)))
+    times = sorted(t for _, t in starts)
+    assert all(later - earlier >= 0.045 for earlier, later in zip(times, times[1:]))
+    assert scheduler.staggered_polls == 2
+
+
+async def test_unregister_stops_the_stagger():
+    scheduler = DomainScheduler(stagger=10.0)
+    scheduler.register("a")
+    unregister = scheduler.register("b")
+    unregister()
+    assert scheduler.entries == 1
+    starts: list = []
+    await asyncio.wait_for(
+        asyncio.gather(_poll(scheduler, "10.0.0.1", starts), _poll(scheduler, "10.0.0.2", starts)),
+        timeout=1.0,
+    )
+
+
+async def test_one_poll_in_flight_per_endpoint():
+    scheduler = DomainScheduler(stagger=0.0)
+    scheduler.register("a")
+    scheduler.register("b")
+    in_flight = 0
+    peak = 0
+
+    async def _hold():
+        nonlocal in_flight, peak
+        async with scheduler.poll_slot("10.0.0.1", 8899):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(_hold(), _hold(), _hold())
+    assert peak == 1
+
+
+async def test_detect_sweeps_are_capped():
+    scheduler = DomainScheduler(max_concurrent_detects=1)
+    in_flight = 0
+    peak = 0
+
+    async def _detect():
+        nonlocal in_flight, peak
+        async with scheduler.detect_slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(_detect(), _detect(), _detect())
+    assert peak == 1
+    assert scheduler.detect_waits == 2
@@ -1,11 +1,15 @@
 """Tests for integration setup, unload, and config-entry migration."""
 
+import copy
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import voluptuous as vol
 from givenergy_modbus.exceptions import PlantTopologyMismatch
 from givenergy_modbus.model.inverter import Model
 from givenergy_modbus.model.plant import PlantCapabilities
+from givenergy_modbus.model.register import HR
+from givenergy_modbus.model.register_cache import RegisterCache
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.exceptions import HomeAssistantError
@@ -17,22 +21,28 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.givenergy_local import (
     _STRATEGY_URL,
     _STRATEGY_VERSION,
+    _reconcile_fast_lane_entities,
     _reconcile_per_cell_entities,
     async_remove_entry,
     async_setup,
 )
 from custom_components.givenergy_local.const import (
+    CONF_CELL_VECTOR_SENSORS,
     CONF_EXPOSE_PER_CELL,
     CONF_RETRIES,
     CONF_TIMEOUT_TOLERANCE,
     DOMAIN,
     EXPOSE_RECOMMENDED_ENTITY_KEYS,
+    SERVICE_APPLY_SCHEDULE,
     SERVICE_CALIBRATE_BATTERY_SOC,
     SERVICE_CAPTURE_FRAMES,
     SERVICE_EXPOSE_RECOMMENDED_ENTITIES,
+    SERVICE_GET_CELL_HISTORY,
+    SERVICE_PIN_CELLS,
     SERVICE_REBOOT_INVERTER,
     SERVICE_REDETECT_PLANT,
     SERVICE_SET_SYSTEM_DATETIME,
+    SERVICE_UNPIN_CELLS,
 )
 
 
@@ -223,6 +233,21 @@ async def test_async_remove_entry_clears_capabilities_cache(hass, mock_config_en
     fake_store.async_remove.assert_awaited_once()
 
 
+async def test_cell_drift_statistics_persist_across_a_reload(hass, mock_client, setup_integration):
+    """The drift tracker is saved on unload and restored at setup, so the ranking
+    doesn't restart from nothing (here, with recording stubbed out after the reload)."""
+    from custom_components.givenergy_local.cell_drift import CellDriftTracker
+
+    assert "BT1234A001" in hass.data[DOMAIN][setup_integration.entry_id].cell_drift
+    assert await hass.config_entries.async_unload(setup_integration.entry_id)
+
+    with patch.object(CellDriftTracker, "record"):
+        assert await hass.config_entries.async_setup(setup_integration.entry_id)
+        await hass.async_block_till_done()
+
+    assert "BT1234A001" in hass.data[DOMAIN][setup_integration.entry_id].cell_drift
+
+
 async def test_set_system_datetime_service_sends_command(hass, mock_client, setup_integration):
     """The set_system_datetime service writes the inverter clock for the device."""
     device_reg = dr.async_get(hass)
@@ -268,6 +293,49 @@ async def test_calibrate_battery_soc_service_sends_command(hass, mock_client, se
     mock_client.one_shot_command.assert_called_once()
 
 
+async def test_apply_schedule_writes_only_changed_registers(
+    hass, mock_client, mock_plant, setup_integration
+):
+    """apply_schedule diffs the schedule against the cached holding registers,
+    sends only the registers that change in one batch, and reports them."""
+    mock_plant.register_caches = {
+        0x32: RegisterCache({HR(96): 1, HR(20): 1, HR(116): 80, HR(59): 0})
+    }
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_SCHEDULE,
+        {
+            "device_id": _inverter_device_id(hass, setup_integration.entry_id),
+            "charge_target_soc": 80,
+            "enable_discharge": True,
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    mock_client.one_shot_command.assert_called_once()
+    (sent,) = mock_client.one_shot_command.call_args[0]
+    assert [(r.register, r.value) for r in sent] == [(59, 1)]
+    assert response["written"] == [{"register": 59, "previous": 0, "value": 1}]
+    assert response["unchanged"] == 3
+    assert response["bus_time"] >= 0
+
+
+async def test_apply_schedule_already_in_place_sends_nothing(
+    hass, mock_client, mock_plant, setup_integration
+):
+    mock_plant.register_caches = {0x32: RegisterCache({HR(59): 1})}
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_SCHEDULE,
+        {"serial": "SA1234G123", "enable_discharge": True},
+        blocking=True,
+        return_response=True,
+    )
+    mock_client.one_shot_command.assert_not_called()
+    assert response == {"written": [], "unchanged": 1, "bus_time": 0.0}
+
+
 @pytest.mark.parametrize(
     "service",
     [SERVICE_REBOOT_INVERTER, SERVICE_CALIBRATE_BATTERY_SOC, SERVICE_SET_SYSTEM_DATETIME],
@@ -369,7 +437,9 @@ async def test_topology_mismatch_persists_actual_and_raises_repairs_issue(
     hass, mock_client, mock_config_entry
 ):
     """End-to-end: detect(prior=) raising PlantTopologyMismatch persists the
-    new layout, raises an advisory Repairs issue, and queues a reload.
+    new layout and raises an advisory Repairs issue. It came during setup's
+    first poll, before any entities existed, so nothing is reloaded: the
+    platforms enumerate from the accepted topology.
     """
     actual = PlantCapabilities(
         device_type=Model.HYBRID,
@@ -406,8 +476,7 @@ async def test_topology_mismatch_persists_actual_and_raises_repairs_issue(
     # An advisory Repairs issue was raised for this entry.
     issues = ir.async_get(hass).issues
     assert (DOMAIN, f"plant_topology_changed_{mock_config_entry.entry_id}") in issues
-    # And a reload was queued.
-    reload_mock.assert_called_with(mock_config_entry.entry_id)
+    reload_mock.assert_not_called()
 
 
 async def test_persistent_loss_raises_error_repair_and_keeps_cache(
@@ -488,12 +557,22 @@ async def test_full_topology_detect_clears_stale_missing_repair(
     ) not in ir.async_get(hass).issues
 
 
-async def test_heal_reloads_when_recovered_device_missed_setup(
-    hass, mock_client, mock_config_entry
+def _second_battery(mock_battery):
+    battery = copy.copy(mock_battery)
+    battery.serial_number = "BT1234A002"
+    return battery
+
+
+def _battery_entity_id(hass, serial: str) -> str | None:
+    return er.async_get(hass).async_get_entity_id("sensor", DOMAIN, f"{serial}_soc")
+
+
+async def test_heal_adds_entities_for_recovered_device_without_reload(
+    hass, mock_client, mock_plant, mock_battery, mock_config_entry
 ):
-    """A device absent when entities were created gets them via an entry reload once
-    the topology heals (#148): the healed callback diffs the confirmed topology
-    against the setup-time snapshot and schedules a reload on any gap."""
+    """A device absent when entities were created gets them in place once the
+    topology heals (#148): the healed callback diffs the confirmed topology against
+    the setup-time snapshot and the next clean poll syncs the new entities in."""
     # Default fixture topology: one battery at 0x32.
     mock_config_entry.add_to_hass(hass)
     await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -510,6 +589,78 @@ async def test_heal_reloads_when_recovered_device_missed_setup(
     )
     with patch.object(hass.config_entries, "async_schedule_reload") as reload_mock:
         await coordinator._on_topology_healed(confirmed)
+        mock_plant.capabilities = confirmed
+        mock_plant.batteries = [mock_battery, _second_battery(mock_battery)]
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    reload_mock.assert_not_called()
+    assert _battery_entity_id(hass, "BT1234A001") is not None
+    entity_id = _battery_entity_id(hass, "BT1234A002")
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "85"
+
+
+async def test_accepted_topology_change_retires_lost_device_entities(
+    hass, mock_client, mock_plant, mock_battery, mock_config_entry
+):
+    """An accepted same-type topology change syncs the entities in place: the
+    devices it no longer lists are retired from the entity registry."""
+    mock_plant.capabilities = PlantCapabilities(
+        device_type=Model.HYBRID,
+        inverter_address=0x32,
+        meter_addresses=[],
+        lv_battery_addresses=[0x32, 0x33],
+        bcu_stacks=[],
+    )
+    mock_plant.batteries = [mock_battery, _second_battery(mock_battery)]
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert _battery_entity_id(hass, "BT1234A002") is not None
+
+    actual = PlantCapabilities(
+        device_type=Model.HYBRID,
+        inverter_address=0x32,
+        meter_addresses=[],
+        lv_battery_addresses=[0x32],
+        bcu_stacks=[],
+    )
+    with (
+        patch("custom_components.givenergy_local._save_capabilities", new=AsyncMock()),
+        patch.object(hass.config_entries, "async_schedule_reload") as reload_mock,
+    ):
+        await coordinator._on_topology_changed(actual)
+        mock_plant.capabilities = actual
+        mock_plant.batteries = [mock_battery]
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    reload_mock.assert_not_called()
+    assert _battery_entity_id(hass, "BT1234A001") is not None
+    assert _battery_entity_id(hass, "BT1234A002") is None
+
+
+async def test_device_type_change_still_reloads(hass, mock_client, mock_config_entry):
+    """A different device type changes more than the device list — reload."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    actual = PlantCapabilities(
+        device_type=Model.AC,
+        inverter_address=0x32,
+        meter_addresses=[],
+        lv_battery_addresses=[0x32],
+        bcu_stacks=[],
+    )
+    with (
+        patch("custom_components.givenergy_local._save_capabilities", new=AsyncMock()),
+        patch.object(hass.config_entries, "async_schedule_reload") as reload_mock,
+    ):
+        await coordinator._on_topology_changed(actual)
     reload_mock.assert_called_once_with(mock_config_entry.entry_id)
 
 
@@ -794,6 +945,80 @@ async def test_save_capabilities_writes_library_dict_directly(hass):
     fake_store.async_save.assert_awaited_once_with(caps.to_dict())
 
 
+# ---------------------------------------------------------------------------
+# Warm-start plant snapshot
+# ---------------------------------------------------------------------------
+
+
+async def test_warm_start_builds_entities_before_the_live_connect(
+    hass, mock_client, mock_config_entry
+):
+    """With a cached topology and a usable snapshot, setup completes (entities
+    created from the snapshot) while connect() is still pending; the live poll
+    then replaces the snapshot in the background."""
+    import asyncio
+    from datetime import UTC, datetime
+
+    from custom_components.givenergy_local.snapshot import PlantSnapshot
+
+    release = asyncio.Event()
+
+    async def _slow_connect() -> None:
+        await release.wait()
+
+    mock_client.connect = AsyncMock(side_effect=_slow_connect)
+    saved_at = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+    mock_config_entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.givenergy_local._load_capabilities",
+            new=AsyncMock(return_value=mock_client.plant.capabilities),
+        ),
+        patch(
+            "custom_components.givenergy_local._load_snapshot",
+            new=AsyncMock(return_value=PlantSnapshot(plant=mock_client.plant, saved_at=saved_at)),
+        ),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+        assert coordinator.warm_start_from == saved_at
+        assert coordinator.last_successful_refresh is None
+        registry = er.async_get(hass)
+        assert registry.async_get_entity_id("sensor", DOMAIN, "SA1234G123_battery_soc")
+        mock_client.refresh.assert_not_awaited()
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.warm_start_from is None
+    assert coordinator.last_successful_refresh is not None
+    mock_client.refresh.assert_awaited()
+
+
+async def test_cold_start_without_snapshot_blocks_on_first_refresh(
+    hass, mock_client, mock_config_entry
+):
+    """No cached topology: the snapshot isn't consulted and setup polls first."""
+    mock_config_entry.add_to_hass(hass)
+    with (
+        patch(
+            "custom_components.givenergy_local._load_capabilities",
+            new=AsyncMock(return_value=None),
+        ),
+        patch("custom_components.givenergy_local._load_snapshot", new=AsyncMock()) as load_mock,
+    ):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    load_mock.assert_not_awaited()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.warm_start_from is None
+    assert coordinator.last_successful_refresh is not None
+
+
 # ---------------------------------------------------------------------------
 # Voice-assistant exposure (issue #65)
 # ---------------------------------------------------------------------------
@@ -1078,6 +1303,24 @@ def test_resolve_bool_feature_defaults_client_value_true():
     ) == {"demo_kwarg": True}
 
 
+def test_resolve_coordinator_feature_stays_out_of_client_kwargs():
+    """An integration-side feature maps to a coordinator kwarg, never a client one."""
+    from custom_components.givenergy_local.const import (
+        CONF_EXPERIMENTAL,
+        ExperimentalFeature,
+        resolve_experimental_client_kwargs,
+        resolve_experimental_coordinator_kwargs,
+    )
+
+    feat = ExperimentalFeature(conf_key="demo", coordinator_kwarg="demo_kwarg")
+    options = {CONF_EXPERIMENTAL: {"demo": True}}
+    assert resolve_experimental_client_kwargs(options, features=(feat,)) == {}
+    assert resolve_experimental_coordinator_kwargs(options, features=(feat,)) == {
+        "demo_kwarg": True
+    }
+    assert resolve_experimental_coordinator_kwargs({}, features=(feat,)) == {}
+
+
 async def test_reconcile_per_cell_entities_removes_cells_when_disabled(hass):
     """With per-cell exposure off, the reconcile removes the individual cell rows a
     prior version / opt-in created, keeping the roll-ups and aggregates (#179)."""
@@ -1120,3 +1363,139 @@ async def test_reconcile_per_cell_entities_keeps_cells_when_enabled(hass):
     _reconcile_per_cell_entities(hass, entry)
 
     assert registry.async_get_entity_id("sensor", DOMAIN, "BT1234A001_v_cell_01") is not None
+
+
+async def test_reconcile_per_cell_entities_keeps_pinned_cells(hass):
+    entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_EXPOSE_PER_CELL: False}, unique_id="SA1234G123"
+    )
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    for unique_id in ("BT1234A001_v_cell_01", "BT1234A001_v_cell_02"):
+        registry.async_get_or_create("sensor", DOMAIN, unique_id, config_entry=entry)
+
+    _reconcile_per_cell_entities(hass, entry, {"BT1234A001_v_cell_02"})
+
+    assert registry.async_get_entity_id("sensor", DOMAIN, "BT1234A001_v_cell_01") is None
+    assert registry.async_get_entity_id("sensor", DOMAIN, "BT1234A001_v_cell_02") is not None
+
+
+async def test_reconcile_per_cell_entities_removes_cells_entity_when_enabled(hass):
+    """Turning per-cell exposure on retires the lean mode's Cells entity."""
+    entry = MockConfigEntry(domain=DOMAIN, options={}, unique_id="SA1234G123")
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    registry.async_get_or_create("sensor", DOMAIN, "BT1234A001_cell_array", config_entry=entry)
+
+    _reconcile_per_cell_entities(hass, entry)
+
+    assert registry.async_get_entity_id("sensor", DOMAIN, "BT1234A001_cell_array") is None
+
+
+async def test_reconcile_per_cell_entities_follows_the_cell_vector_option(hass):
+    registry = er.async_get(hass)
+    for enabled in (True, False):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_CELL_VECTOR_SENSORS: enabled},
+            unique_id=f"SA1234G12{int(enabled)}",
+        )
+        entry.add_to_hass(hass)
+        unique_id = f"BT1234A00{int(enabled)}_cell_vector"
+        registry.async_get_or_create("sensor", DOMAIN, unique_id, config_entry=entry)
+
+        _reconcile_per_cell_entities(hass, entry)
+
+        present = registry.async_get_entity_id("sensor", DOMAIN, unique_id) is not None
+        assert present is enabled
+
+
+async def test_reconcile_fast_lane_entities_follows_the_fast_lane(hass):
+    registry = er.async_get(hass)
+    for interval in (2, 0):
+        entry = MockConfigEntry(domain=DOMAIN, unique_id=f"SA1234G12{interval}")
+        entry.add_to_hass(hass)
+        unique_id = f"SA1234G12{interval}_p_battery_fast"
+        registry.async_get_or_create("sensor", DOMAIN, unique_id, config_entry=entry)
+
+        _reconcile_fast_lane_entities(hass, entry, MagicMock(fast_lane_interval=interval))
+
+        present = registry.async_get_entity_id("sensor", DOMAIN, unique_id) is not None
+        assert present is bool(interval)
+
+
+async def test_pin_cells_adds_and_unpin_retires_cell_entities_without_reload(hass, mock_client):
+    """In the lean mode, pinning a cell creates just its entity in place; unpinning
+    retires it again. Neither reloads the entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.1.100", "port": 8899, "scan_interval": 30, "passive": False},
+        options={CONF_EXPOSE_PER_CELL: False},
+        unique_id="SA1234G123",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    registry = er.async_get(hass)
+    pinned = ("BT1234A001_v_cell_03", "BT1234A001_t_cells_05_08")
+
+    def _present(uid: str) -> bool:
+        return registry.async_get_entity_id("sensor", DOMAIN, uid) is not None
+
+    assert not any(_present(uid) for uid in pinned)
+    assert _present("BT1234A001_cell_array")
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        for service in (SERVICE_PIN_CELLS, SERVICE_UNPIN_CELLS):
+            await hass.services.async_call(
+                DOMAIN,
+                service,
+                {"serial": "BT1234A001", "voltages": [3], "temperatures": [6]},
+                blocking=True,
+            )
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+            assert all(_present(uid) for uid in pinned) is (service == SERVICE_PIN_CELLS)
+            assert coordinator.pinned_cells == (
+                set(pinned) if service == SERVICE_PIN_CELLS else set()
+            )
+    reload.assert_not_called()
+
+
+async def test_pin_cells_rejects_a_cell_the_pack_lacks(hass, mock_client, setup_integration):
+    with pytest.raises(HomeAssistantError, match="no cell 17"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PIN_CELLS, {"serial": "BT1234A001", "voltages": [17]}, blocking=True
+        )
+
+
+async def test_pin_cells_rejects_an_empty_serial(hass, mock_client, setup_integration):
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PIN_CELLS, {"serial": " ", "voltages": [3]}, blocking=True
+        )
+
+
+async def test_get_cell_history_returns_recent_samples(hass, mock_client, setup_integration):
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_CELL_HISTORY,
+        {"serial": "BT1234A001", "cells": [1, 2]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["serial"] == "BT1234A001"
+    assert response["kind"] == "lv_battery"
+    assert len(response["times"]) >= 1
+    assert set(response["voltages"]) == {"1", "2"}
+    assert set(response["temperatures"]) == {"1-4"}
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_CELL_HISTORY,
+            {"serial": "BT0000X000"},
+            blocking=True,
+            return_response=True,
+        )
@@ -9,6 +9,7 @@ so no real network is involved).
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 from datetime import UTC, date, datetime, timedelta, timezone
@@ -215,6 +216,45 @@ async def test_call_ignores_messages_with_other_ids():
     assert await ws._call("recorder/list_statistic_ids") == 42
 
 
+class _OutOfOrderWS:
+    """Answers requests only once ``batch`` of them are in flight, newest first."""
+
+    def __init__(self, batch: int) -> None:
+        self._batch = batch
+        self._sent: list[dict] = []
+        self._responses: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def send(self, data: str) -> None:
+        self._sent.append(json.loads(data))
+        if len(self._sent) == self._batch:
+            for msg in reversed(self._sent):
+                self._responses.put_nowait(
+                    {"id": msg["id"], "success": True, "result": msg["type"]}
+                )
+
+    async def recv(self) -> str:
+        return json.dumps(await self._responses.get())
+
+    async def close(self) -> None:  # pragma: no cover - parity with the real client
+        pass
+
+
+async def test_concurrent_calls_are_matched_to_their_responses_by_id():
+    ws = _MOD.HAWebSocket("http://h:8123", "t")
+    ws._ws = _OutOfOrderWS(batch=3)
+    results = await asyncio.gather(ws._call("a"), ws._call("b"), ws._call("c"))
+    assert results == ["a", "b", "c"]
+    assert ws._pending == {}
+    await ws.close()
+
+
+async def test_lost_connection_fails_the_waiting_calls():
+    ws = _MOD.HAWebSocket("http://h:8123", "t")
+    ws._ws = _FakeWS([])  # recv raises: the socket is gone
+    with pytest.raises(ConnectionError):
+        await ws._call("get_config")
+
+
 async def test_call_raises_on_error_response():
     ws = _MOD.HAWebSocket("http://h:8123", "t")
     ws._ws = _FakeWS([{"id": 1, "success": False, "error": {"code": "bad"}}])
@@ -273,3 +313,174 @@ async def test_import_statistics_splits_into_chunks():
     assert all(c.kwargs["metadata"] == {"statistic_id": "x"} for c in calls)
     reassembled = [r for c in calls for r in c.kwargs["stats"]]
     assert reassembled == stats
+
+
+async def test_iter_statistics_pages_windows_from_the_first_month_with_data():
+    """A monthly probe skips the empty history before the first row; the rest is
+    fetched one window per call, oldest first, tiling [first month, end)."""
+    ws = _MOD.HAWebSocket("http://h:8123", "t")
+    first = datetime(2024, 1, 1, tzinfo=UTC)
+    end = first + _MOD._FETCH_WINDOW + timedelta(days=10)
+    probe = {"x": [{"start": first.isoformat()}, {"start": "2024-02-01T00:00:00+00:00"}]}
+    ws.get_statistics = AsyncMock(side_effect=[probe, {"x": [1]}, {"x": [2]}])
+
+    chunks = [c async for c in ws.iter_statistics(["x"], _MOD._EPOCH, end=end)]
+
+    assert chunks == [{"x": [1]}, {"x": [2]}]
+    calls = ws.get_statistics.await_args_list
+    assert calls[0].kwargs["period"] == "month"
+    windows = [(c.args[1], c.kwargs["end"]) for c in calls[1:]]
+    assert windows == [(first, first + _MOD._FETCH_WINDOW), (first + _MOD._FETCH_WINDOW, end)]
+
+
+async def test_iter_statistics_yields_nothing_for_an_empty_history():
+    ws = _MOD.HAWebSocket("http://h:8123", "t")
+    ws.get_statistics = AsyncMock(return_value={"x": []})
+    assert [c async for c in ws.iter_statistics(["x"], _MOD._EPOCH)] == []
+    ws.get_statistics.assert_awaited_once()  # the probe only
+
+
+async def test_fetch_rows_normalises_each_window_as_it_arrives():
+    ws = _MOD.HAWebSocket("http://h:8123", "t")
+    ws.get_statistics = AsyncMock(
+        side_effect=[
+            {"x": [{"start": 1704067200000}]},
+            {"x": [{"start": 1704067200000, "end": 1704070800000, "sum": 1.0}]},
+        ]
+    )
+    end = datetime(2024, 1, 2, tzinfo=UTC)
+    rows = [r async for r in _MOD.fetch_rows(ws, "x", _MOD._EPOCH, end=end)]
+    assert rows == [{"start": "2024-01-01T00:00:00+00:00", "sum": 1.0}]
+
+
+def test_batch_by_rows_packs_in_order_within_the_budget():
+    estimates = {"a": 900, "b": 900, "c": 300, "d": 2500, "e": 10}
+    assert _MOD.batch_by_rows(estimates, 2000) == [["a", "b"], ["c"], ["d"], ["e"]]
+    assert _MOD.batch_by_rows({}, 2000) == []
+
+
+def _series_ws(series: dict[str, list[dict]]) -> tuple[object, list[tuple[list[str], str]]]:
+    """A real HAWebSocket whose statistics_during_period serves `series`, filtered to
+    [start, end); records (ids, period) per call."""
+    ws = _MOD.HAWebSocket("http://h:8123", "t")
+    calls: list[tuple[list[str], str]] = []
+
+    async def get_statistics(ids, start, end=None, types=None, period="hour"):  # noqa: ANN001
+        calls.append((list(ids), period))
+        return {
+            i: [
+                r
+                for r in series.get(i, [])
+                if start <= _MOD._to_utc(r["start"])
+                and (end is None or _MOD._to_utc(r["start"]) < end)
+            ]
+            for i in ids
+        }
+
+    ws.get_statistics = get_statistics
+    return ws, calls
+
+
+async def test_batcher_fetches_each_batch_once_and_hands_each_id_its_own_rows(monkeypatch):
+    """Registered reads are probed together, packed by estimated rows per window and
+    fetched a batch per request; each id is served its own rows, ids without history
+    cost no request, and a repeat or unregistered read goes to the connection."""
+    monkeypatch.setattr(_MOD, "_FETCH_BATCH_ROWS", 1500)
+    cutover = datetime(2024, 2, 1, tzinfo=UTC)
+    series = {
+        sid: [{"start": f"2024-01-{day:02d}T00:00:00+00:00", "sum": float(day)} for day in days]
+        for sid, days in {"a": (1, 2), "b": (3,), "c": (5, 6, 7)}.items()
+    }
+    ws, calls = _series_ws(series)
+    ids = ["a", "b", "c", "d"]
+    source = _MOD.StatisticsBatcher(ws, [(i, _MOD._EPOCH, cutover) for i in ids])
+
+    async def read(sid: str, end: datetime = cutover) -> list[dict]:
+        return [r async for r in _MOD.fetch_rows(source, sid, _MOD._EPOCH, end=end)]
+
+    got = await asyncio.gather(*(read(i) for i in ids))
+
+    assert [[r["sum"] for r in rows] for rows in got] == [[1.0, 2.0], [3.0], [5.0, 6.0, 7.0], []]
+    # ~750 hourly rows a window each: a and b share a request, c has its own.
+    assert calls == [(ids, "month"), (["a", "b"], "hour"), (["c"], "hour")]
+
+    calls.clear()
+    assert [r["sum"] for r in await read("a")] == [1.0, 2.0]
+    assert [r["sum"] for r in await read("c", end=datetime(2024, 1, 6, tzinfo=UTC))] == [5.0]
+    assert calls == [(["a"], "month"), (["a"], "hour"), (["c"], "month"), (["c"], "hour")]
+
+
+async def test_batcher_hands_over_each_window_before_fetching_the_next():
+    """A batched read sees a window's rows as soon as that window's request returns,
+    while both ids still share one request per window."""
+    first = datetime(2024, 1, 1, tzinfo=UTC)
+    end = first + _MOD._FETCH_WINDOW + timedelta(days=1)
+    series = {
+        sid: [{"start": first.isoformat(), "sum": 1.0}, {"start": end - timedelta(hours=1)}]
+        for sid in ("a", "b")
+    }
+    ws, calls = _series_ws(series)
+    served = ws.get_statistics
+    release = asyncio.Event()
+
+    async def get_statistics(ids, start, end=None, types=None, period="hour"):  # noqa: ANN001
+        if period == "hour" and start > first:
+            await release.wait()
+        return await served(ids, start, end=end, types=types, period=period)
+
+    ws.get_statistics = get_statistics
+    source = _MOD.StatisticsBatcher(ws, [(i, _MOD._EPOCH, end) for i in ("a", "b")])
+    reads = {i: _MOD.fetch_rows(source, i, _MOD._EPOCH, end=end) for i in ("a", "b")}
+
+    # The second window's request is held, yet both reads have their first rows.
+    firsts = await asyncio.wait_for(asyncio.gather(*(anext(r) for r in reads.values())), 1)
+    assert [row["sum"] for row in firsts] == [1.0, 1.0]
+    assert calls == [(["a", "b"], "month"), (["a", "b"], "hour")]
+    release.set()
+    assert [len([r async for r in rows]) for rows in reads.values()] == [1, 1]
+    assert calls[2:] == [(["a", "b"], "hour")]
+
+
+async def test_batcher_buffers_at_most_a_window_ahead_and_only_for_started_reads():
+    """A read that isn't consuming holds up its fetch after one waiting window, and a
+    registered read that hasn't started isn't fetched (so nothing piles up for it)."""
+    first = datetime(2024, 1, 1, tzinfo=UTC)
+    end = first + 5 * _MOD._FETCH_WINDOW
+    series = {
+        sid: [{"start": first + n * _MOD._FETCH_WINDOW, "sum": float(n)} for n in range(5)]
+        for sid in ("a", "b")
+    }
+    ws, calls = _series_ws(series)
+    source = _MOD.StatisticsBatcher(ws, [(i, _MOD._EPOCH, end) for i in ("a", "b")])
+    rows = _MOD.fetch_rows(source, "a", _MOD._EPOCH, end=end)
+
+    assert (await anext(rows))["sum"] == 0.0
+    for _ in range(20):
+        await asyncio.sleep(0)
+    # Window 1 taken, window 2 waiting for the read, window 3 waiting to be handed over.
+    assert calls == [(["a", "b"], "month")] + [(["a"], "hour")] * 3
+    assert [r["sum"] async for r in rows] == [1.0, 2.0, 3.0, 4.0]
+
+    calls.clear()
+    b = [r["sum"] async for r in _MOD.fetch_rows(source, "b", _MOD._EPOCH, end=end)]
+    assert b == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert calls == [(["b"], "hour")] * 5
+
+
+async def test_detect_cutover_reads_both_series_in_the_same_requests():
+    givtcp = "sensor.givtcp_ab1234c567_pv_energy_today_kwh"
+    ge = "sensor.givenergy_inverter_ab1234c567_pv_energy_today"
+    ws, calls = _series_ws(
+        {
+            givtcp: [
+                {"start": "2024-01-01T00:00:00+00:00"},
+                {"start": "2024-03-09T23:00:00+00:00"},
+            ],
+            ge: [{"start": "2024-03-08T00:00:00+00:00"}, {"start": "2024-03-10T00:00:00+00:00"}],
+        }
+    )
+
+    dates = await _MOD.detect_cutover(ws, "ab1234c567", lambda eid: eid)
+
+    assert dates == (date(2024, 3, 9), date(2024, 3, 8))
+    assert calls and all(ids == [givtcp, ge] for ids, _ in calls)
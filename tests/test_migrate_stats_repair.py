@@ -3,6 +3,8 @@ from __future__ import annotations
 import argparse
 import asyncio
 import importlib.util
+import random
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from types import ModuleType
 from zoneinfo import ZoneInfo
@@ -186,6 +188,42 @@ def test_gap_crosses_reset_annual_endpoint_on_boundary_is_not_crossing():
     )
 
 
+def _local_reference(start_iso: str, tz: ZoneInfo) -> datetime:
+    return datetime.fromisoformat(start_iso).astimezone(tz)
+
+
+@pytest.mark.parametrize("tz", [_LONDON, ZoneInfo("America/New_York"), ZoneInfo("Asia/Kolkata")])
+def test_parsed_stamps_match_datetime_arithmetic_across_dst(tz):
+    """The cached integer stamps decide resets exactly as the local datetimes
+    would, through both DST changes (including the repeated autumn hour) and
+    the year end."""
+    rc = _MOD.ResetClass
+    starts = [
+        _MOD._as_iso(base + timedelta(minutes=30 * n))
+        for base in (
+            datetime(2025, 3, 29, 18, tzinfo=UTC),
+            datetime(2025, 10, 25, 18, tzinfo=UTC),
+            datetime(2025, 11, 1, 18, tzinfo=UTC),
+            datetime(2025, 12, 30, 18, tzinfo=UTC),
+        )
+        for n in range(120)
+    ]
+    for prev, start in zip(starts, starts[3:]):
+        a, b = _local_reference(prev, tz), _local_reference(start, tz)
+        midnight = (a + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        jan1 = a.replace(year=a.year + 1, month=1, day=1, hour=0, minute=0, second=0)
+        assert _MOD._gap_crosses_reset(prev, start, rc.DAILY, tz) == (b > a and midnight < b)
+        assert _MOD._gap_crosses_reset(prev, start, rc.ANNUAL, tz) == (b > a and jan1 < b)
+        minutes = b.hour * 60 + b.minute
+        near = min(minutes, 24 * 60 - minutes) <= 90
+        edge = (b.month, b.day) in {(1, 1), (12, 31)}
+        assert _MOD._is_reset_boundary(start, rc.DAILY, tz, 1.5) == near
+        assert _MOD._is_reset_boundary(start, rc.ANNUAL, tz, 1.5) == (near and edge)
+        elapsed = datetime.fromisoformat(start) - datetime.fromisoformat(prev)
+        assert _MOD._elapsed_hours(prev, start) == max(1.0, elapsed.total_seconds() / 3600.0)
+    assert _MOD._stamp(starts[0], tz) is _MOD._stamp(starts[0], tz)
+
+
 def test_segment_coherent_monotonic_within_bound():
     held = [
         ("2026-05-20T12:00:00+00:00", 1000.0),
@@ -1050,10 +1088,14 @@ class _RecordingWS:
         self.clear_calls: list[list[str]] = []
         self.import_calls: list[dict] = []
 
-    async def get_statistics(self, ids, start, end=None, types=None):  # noqa: ANN001
+    async def get_statistics(self, ids, start, end=None, types=None, period="hour"):  # noqa: ANN001
         self.get_calls.append(list(ids))
         return {i: self.read_back.get(i, []) for i in ids}
 
+    async def iter_statistics(self, ids, start, end=None, types=None, since=None):  # noqa: ANN001
+        # The whole series as a single window.
+        yield await self.get_statistics(ids, start, end=end, types=types)
+
     async def clear_statistics(self, ids):  # noqa: ANN001
         self.clear_calls.append(list(ids))
 
@@ -1426,10 +1468,14 @@ class _ApplyWS:
             raise RuntimeError("simulated import failure")
         self.import_calls.append({"metadata": metadata, "stats": stats})
 
-    async def get_statistics(self, ids, start, end=None, types=None):  # noqa: ANN001
+    async def get_statistics(self, ids, start, end=None, types=None, period="hour"):  # noqa: ANN001
         self.get_calls.append(list(ids))
         return {i: self.read_back.get(i, []) for i in ids}
 
+    async def iter_statistics(self, ids, start, end=None, types=None, since=None):  # noqa: ANN001
+        # The whole series as a single window.
+        yield await self.get_statistics(ids, start, end=end, types=types)
+
 
 def _apply_args() -> argparse.Namespace:
     return argparse.Namespace(
@@ -1440,6 +1486,7 @@ def _apply_args() -> argparse.Namespace:
         include_charge_from_grid=False,
         trust_source_sums=False,
         max_kw=50.0,
+        concurrency=4,
     )
 
 
@@ -1467,6 +1514,45 @@ def _patch_apply_path(
     monkeypatch.setattr(_MOD, "migrate_entity", fake_migrate)
 
 
+def test_phase_a_builds_entities_concurrently_within_the_limit(monkeypatch, capsys):
+    """Candidates are built up to --concurrency at a time, keep the plan's order,
+    and the writes that follow still go one entity at a time in that order."""
+    ids = [f"sensor.ge_{i}" for i in range(6)]
+    series = {
+        ge_id: [
+            {"start": "2026-05-19T08:00:00+00:00", "sum": 10.0 + i, "state": 10.0 + i},
+            {"start": "2026-05-19T09:00:00+00:00", "sum": 12.0 + 3 * i, "state": 12.0 + 3 * i},
+        ]
+        for i, ge_id in enumerate(ids)
+    }
+    cands = {
+        ge_id: _candidate(ge_id, [dict(r) for r in rows], source_movement=2.0 + 2 * i)
+        for i, (ge_id, rows) in enumerate(series.items())
+    }
+    ws = _ApplyWS(read_back={ge_id: [dict(r) for r in rows] for ge_id, rows in series.items()})
+    _patch_apply_path(monkeypatch, ws, cands, ids)
+    in_flight = peak = 0
+
+    async def slow_migrate(ws_arg, givtcp_id, ge_id, *a, **k):  # noqa: ANN001
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return cands[ge_id]
+
+    monkeypatch.setattr(_MOD, "migrate_entity", slow_migrate)
+    args = _apply_args()
+    args.concurrency = 2
+
+    code = asyncio.run(_MOD.run(args))
+
+    assert code == 0
+    assert peak == 2
+    assert ws.clear_calls == [[ge_id] for ge_id in ids]
+    assert all(c.status == "migrated" for c in cands.values())
+
+
 def test_phase_b_aborts_on_blocking_candidate(monkeypatch, capsys):
     # Two candidates; the second holds an unresolved event -> blocking. The gate
     # must refuse BEFORE Phase B: no clear/import calls at all, non-zero exit.
@@ -1889,3 +1975,95 @@ def test_positive_float_rejects_non_finite():
     for value in ("nan", "inf", "-inf"):
         with pytest.raises(argparse.ArgumentTypeError):
             _MOD._positive_float(value)
+
+
+# ---------------------------------------------------------------------------
+# Columnar (NumPy) fast paths match the reference implementations
+# ---------------------------------------------------------------------------
+
+
+def _noisy_series(seed: int, reset_class, hours: int = 24 * 45) -> list[dict]:  # noqa: ANN001
+    """An hourly counter with the defects the rebuild handles: missing hours (some
+    across midnight), None states, one-off spikes and fake zeros, off-boundary
+    drops, sustained shifts and the counter's own resets."""
+    rng = random.Random(seed)
+    start = datetime(2026, 3, 1, tzinfo=UTC)
+    value = 0.0 if reset_class is not _MOD.ResetClass.LIFETIME else 1000.0
+    rows = []
+    for h in range(hours):
+        at = start + timedelta(hours=h)
+        local = at.astimezone(_LONDON)
+        if reset_class is _MOD.ResetClass.DAILY and local.hour == 0:
+            value = 0.0
+        value = round(value + rng.choice([0.0, 0.0, 0.3, 1.25, 2.5]), 3)
+        roll = rng.random()
+        if roll < 0.02:
+            continue
+        state: float | None = value
+        if roll < 0.03:
+            state = None
+        elif roll < 0.04:
+            state = value * 40
+        elif roll < 0.05:
+            state = 0.0
+        elif roll < 0.053:
+            value += 400.0
+            state = value
+        elif roll < 0.056:
+            state = max(0.0, value - 5.0)
+        rows.append({"start": _MOD._as_iso(at), "state": state, "sum": state})
+    return rows
+
+
+@pytest.mark.parametrize("reset_class", list(_MOD.ResetClass))
+@pytest.mark.parametrize("seed", range(4))
+def test_columnar_paths_match_the_reference_row_for_row(monkeypatch, reset_class, seed):
+    pytest.importorskip("numpy")
+    rows = _noisy_series(seed, reset_class)
+    assert len(rows) >= _MOD._COLUMNAR_MIN_ROWS
+
+    def analyse() -> tuple:
+        events: dict = {}
+        deltas = _MOD._state_deltas(rows)
+        ceiling = _MOD.adaptive_ceiling(deltas)
+        rebuilt = _MOD.rebuild_sum_walk(rows, reset_class, ceiling, _LONDON, events=events)
+        return (
+            list(deltas),
+            ceiling,
+            rebuilt,
+            events,
+            _MOD.find_implausible_hours(rows, ceiling),
+            _MOD.find_flat_line_spans(rows, 2),
+            _MOD._reset_aware_movement(rows, reset_class, _LONDON),
+        )
+
+    columnar = analyse()
+    monkeypatch.setattr(_MOD, "np", None)
+    reference = analyse()
+
+    assert columnar == reference
+    # The series exercise the reference walk's decisions, not just clean runs.
+    assert columnar[3]
+
+
+def test_columnar_rebuild_takes_clean_runs_around_the_rows_it_steps_through():
+    pytest.importorskip("numpy")
+    start = datetime(2026, 5, 1, tzinfo=UTC)
+    rows = [
+        _row(_MOD._as_iso(start + timedelta(hours=h)), 100.0 + h)
+        for h in range(_MOD._COLUMNAR_MIN_ROWS)
+    ]
+    rows[200]["state"] = 9000.0
+    steps = _MOD._Columns(rows).clean_steps(_MOD.ResetClass.LIFETIME, 5.0, _LONDON, 2.0)
+
+    # Rows 1..199 run clean; the spike's steps in and out are not.
+    assert steps.run_end(1) == 200
+    assert steps.run_end(200) == 200
+    assert steps.run_end(202) == len(rows)
+    assert steps.running(100.0, 1, 4) == [101.0, 102.0, 103.0]
+
+    events: dict = {}
+    out = _MOD.rebuild_sum_walk(rows, _MOD.ResetClass.LIFETIME, 5.0, _LONDON, events=events)
+    assert out[200]["sum"] == 299.0  # the spike is flattened by the reference walk
+    assert out[-1]["sum"] == 100.0 + len(rows) - 1
+    assert events == {}
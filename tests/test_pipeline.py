@@ -0,0 +1,144 @@
+"""Tests for the pipelined (concurrent) register reader."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from givenergy_modbus.exceptions import ReadFailure, RefreshFailed, RefreshPartiallySucceeded
+from givenergy_modbus.pdu import ReadInputRegistersRequest
+
+from custom_components.givenergy_local.pipeline import (
+    LATENCY_BUCKETS_MS,
+    LatencyHistogram,
+    PipelinedReader,
+    merge_outcomes,
+)
+
+
+def _ir(addr, base=60, count=60):
+    return ReadInputRegistersRequest(base_register=base, register_count=count, device_address=addr)
+
+
+class _Client:
+    """Answers each request after ``delay`` seconds; addresses in ``fail`` time out."""
+
+    def __init__(self, delay=0.01, fail=()):
+        self.plant = MagicMock()
+        self.delay = delay
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.peak = 0
+        self.sent: list[int] = []
+
+    async def execute(self, requests, timeout, retries, retry_delay, return_exceptions):
+        assert return_exceptions
+        return await asyncio.gather(*(self._send(r) for r in requests), return_exceptions=True)
+
+    async def _send(self, request):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.sent.append(request.device_address)
+        try:
+            await asyncio.sleep(self.delay)
+            if request.device_address in self.fail:
+                raise TimeoutError
+            return MagicMock()
+        finally:
+            self.in_flight -= 1
+
+
+async def _execute(reader, client, requests):
+    return await reader.execute(client, requests, timeout=2.0, retries=1, retry_delay=0.5)
+
+
+async def test_all_requests_issued_concurrently():
+    """No window of its own: every bank is queued at once, as ``refresh()`` would."""
+    client = _Client()
+    requests = [_ir(addr) for addr in range(0x32, 0x3A)]
+    assert await _execute(PipelinedReader(), client, requests) is client.plant
+    assert sorted(client.sent) == list(range(0x32, 0x3A))
+    assert client.peak == len(requests)
+
+
+async def test_cancellation_propagates():
+    client = _Client(delay=10)
+    task = asyncio.ensure_future(_execute(PipelinedReader(), client, [_ir(0x33)]))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_latency_recorded_per_device():
+    client = _Client(delay=0.01)
+    reader = PipelinedReader()
+    await _execute(reader, client, [_ir(0x32, 0), _ir(0x32, 180), _ir(0x33)])
+    assert reader.latency[0x32].requests == 2
+    assert reader.latency[0x33].requests == 1
+    attrs = reader.latency[0x33].as_dict()
+    assert attrs[f"le_{LATENCY_BUCKETS_MS[0]}ms"] == 1
+    assert attrs["failures"] == 0
+    assert attrs["mean_ms"] is not None
+
+
+async def test_partial_failure_raises_with_plant_and_failures():
+    client = _Client(fail={0x34})
+    reader = PipelinedReader()
+    with pytest.raises(RefreshPartiallySucceeded) as exc_info:
+        await _execute(reader, client, [_ir(0x33), _ir(0x34)])
+    assert exc_info.value.plant is client.plant
+    assert exc_info.value.failures == [ReadFailure(0x34, "ReadInputRegistersRequest", 60, 60)]
+    assert reader.latency[0x34].failures == 1
+    assert reader.latency[0x34].requests == 0
+
+
+async def test_all_failed_raises_refresh_failed_with_timeout_causes():
+    client = _Client(fail={0x33, 0x34})
+    with pytest.raises(RefreshFailed) as exc_info:
+        await _execute(PipelinedReader(), client, [_ir(0x33), _ir(0x34)])
+    _, rest = exc_info.value.cause.split(TimeoutError)
+    assert rest is None
+
+
+async def test_empty_batch_sends_nothing():
+    client = _Client()
+    assert await _execute(PipelinedReader(), client, []) is client.plant
+    assert client.sent == []
+
+
+def test_histogram_overflow_bucket():
+    histogram = LatencyHistogram()
+    histogram.record(LATENCY_BUCKETS_MS[-1] / 1000 + 1)
+    assert histogram.as_dict()[f"gt_{LATENCY_BUCKETS_MS[-1]}ms"] == 1
+
+
+def _failed(cls, addr, plant=None):
+    failures = [ReadFailure(addr, "ReadHoldingRegistersRequest", 0, 60)]
+    group = ExceptionGroup("x", [TimeoutError()])
+    if cls is RefreshPartiallySucceeded:
+        return cls("x", plant=plant, failures=failures, cause=group)
+    return cls("x", failures=failures, cause=group)
+
+
+def test_merge_outcomes_pools_failures():
+    plant = MagicMock()
+    assert merge_outcomes(plant, [plant, plant]) is plant
+    assert merge_outcomes(plant, (plant, plant)) is plant
+
+    with pytest.raises(RefreshPartiallySucceeded) as partial:
+        merge_outcomes(plant, [_failed(RefreshFailed, 0x32), plant])
+    assert partial.value.plant is plant
+    assert [f.device_address for f in partial.value.failures] == [0x32]
+
+    with pytest.raises(RefreshFailed) as failed:
+        merge_outcomes(plant, [_failed(RefreshFailed, 0x32), _failed(RefreshFailed, 0x33)])
+    assert len(failed.value.failures) == 2
+    # Leaf causes are pooled, so a timeout-only outcome still reads as one.
+    _, rest = failed.value.cause.split(TimeoutError)
+    assert rest is None
+
+
+def test_merge_outcomes_reraises_other_errors():
+    boom = RuntimeError("producer died")
+    with pytest.raises(RuntimeError):
+        merge_outcomes(MagicMock(), [boom, _failed(RefreshFailed, 0x32)])
@@ -0,0 +1,84 @@
+"""Tests for the apply_schedule diff planner."""
+
+from datetime import time
+from types import SimpleNamespace
+
+import pytest
+from givenergy_modbus.model.inverter import Model, SinglePhaseInverter
+from givenergy_modbus.model.plant import PlantCapabilities
+from givenergy_modbus.model.register import HR
+from givenergy_modbus.model.register_cache import RegisterCache
+from givenergy_modbus.model.slot_map import SINGLE_PHASE_SLOTS
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.givenergy_local.schedule import plan_schedule
+
+
+def _plant(registers: dict[int, int]):
+    cache = RegisterCache({HR(r): v for r, v in registers.items()})
+    inverter = SinglePhaseInverter.from_register_cache(cache)
+    assert inverter.slot_map == SINGLE_PHASE_SLOTS
+    return SimpleNamespace(
+        inverter=inverter,
+        register_caches={0x11: cache},
+        capabilities=PlantCapabilities(
+            device_type=Model.HYBRID,
+            inverter_address=0x11,
+            meter_addresses=[],
+            lv_battery_addresses=[0x32],
+            bcu_stacks=[],
+        ),
+    )
+
+
+def test_only_registers_that_change_are_planned():
+    # Charge slot 1 is 02:30-05:00 (HR94/95); the target is already 80 %.
+    plant = _plant({94: 230, 95: 500, 96: 1, 20: 1, 116: 80})
+    plan = plan_schedule(
+        plant,
+        {
+            "charge_slot_1_start": time(2, 30),
+            "charge_slot_1_end": time(6, 0),
+            "charge_target_soc": 80,
+        },
+    )
+    assert [(r.register, r.value) for r in plan.requests] == [(95, 600)]
+    assert plan.unchanged == 4
+    assert plan.as_response(0.1234) == {
+        "written": [{"register": 95, "previous": 500, "value": 600}],
+        "unchanged": 4,
+        "bus_time": 0.123,
+    }
+
+
+def test_explicit_enable_flag_wins_over_the_target_implied_enable():
+    # A charge target implies enable_charge; an explicit flag in the same
+    # schedule is applied after it.
+    plan = plan_schedule(_plant({}), {"enable_charge": False, "charge_target_soc": 100})
+    writes = {r.register: r.value for r in plan.requests}
+    assert writes[96] == 0
+    assert [c.register for c in plan.changes].count(96) == 1
+
+
+def test_pending_optimistic_writes_count_as_already_written():
+    # HR95 still reads 05:00, but a 06:00 write to it awaits confirmation.
+    plant = _plant({94: 230, 95: 500})
+    plan = plan_schedule(plant, {"charge_slot_1_end": time(6, 0)}, {95: 600})
+    assert plan.requests == []
+    assert plan.unchanged == 1
+
+
+def test_fields_the_time_controls_would_refuse_are_rejected():
+    # No pause-mode register: the pause slot controls aren't created, so the
+    # service can't write them either. Charge slot 2 reads as unset, which
+    # its control's set_value ignores.
+    plant = _plant({94: 230, 95: 500})
+    with pytest.raises(ServiceValidationError, match="battery_pause_slot_start"):
+        plan_schedule(plant, {"battery_pause_slot_start": time(1, 0)})
+    with pytest.raises(ServiceValidationError, match="charge_slot_2_end"):
+        plan_schedule(plant, {"charge_slot_1_end": time(6, 0), "charge_slot_2_end": time(7, 0)})
+
+    # The pause slot is writable once its readability register is present.
+    plant = _plant({94: 230, 95: 500, 318: 0, 319: 100, 320: 200})
+    plan = plan_schedule(plant, {"battery_pause_slot_start": time(0, 30)})
+    assert [(r.register, r.value) for r in plan.requests] == [(319, 30)]
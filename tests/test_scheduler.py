@@ -0,0 +1,189 @@
+"""Tests for the per-bank adaptive poll scheduler."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from givenergy_modbus.model.inverter import Model
+from givenergy_modbus.model.plant import PlantCapabilities
+
+from custom_components.givenergy_local.scheduler import (
+    SLOW_BANK_MAX_SECONDS,
+    BankScheduler,
+    refresh_banks,
+    refresh_requests,
+)
+
+INV_IR0 = (0x32, 0, 60)
+INV_IR180 = (0x32, 180, 60)
+BAT_33 = (0x33, 60, 60)
+BAT_34 = (0x34, 60, 60)
+
+T0 = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+
+
+def _plant(batteries=(0x33, 0x34)) -> MagicMock:
+    """A plant with a hybrid inverter at 0x32 and LV packs at the given addresses."""
+    plant = MagicMock()
+    plant.capabilities = PlantCapabilities(
+        device_type=Model.HYBRID,
+        inverter_address=0x32,
+        meter_addresses=[],
+        lv_battery_addresses=list(batteries),
+        bcu_stacks=[],
+    )
+    plant.block_present.return_value = True
+    # Default: every bank's content changed just now (never backs off).
+    plant.content_unchanged_seconds.return_value = 0.0
+    return plant
+
+
+def _tick(scheduler, plant, n, *, unchanged=None, failed=frozenset(), scan=30):
+    """Run one scheduler tick at t = n * scan seconds; return the banks that were due.
+
+    ``unchanged`` maps a bank to the seconds its content has been steady; banks not
+    listed report a fresh change.
+    """
+    unchanged = unchanged or {}
+    plant.content_unchanged_seconds.side_effect = lambda addr, _t, base, count, now: unchanged.get(
+        (addr, base, count), 0.0
+    )
+    due = scheduler.due(plant)
+    scheduler.record(
+        plant,
+        due,
+        set(failed),
+        elapsed=0.5,
+        now=float(n * scan),
+        now_wall=T0 + timedelta(seconds=n * scan),
+    )
+    return due
+
+
+def test_first_tick_polls_every_bank():
+    scheduler = BankScheduler(30)
+    plant = _plant()
+    assert set(_tick(scheduler, plant, 0)) == {INV_IR0, INV_IR180, BAT_33, BAT_34}
+    assert scheduler.reads_skipped == 0
+
+
+def test_unchanged_battery_bank_backs_off_and_inverter_stays_fast():
+    """A battery bank whose content holds steady doubles its interval each poll up to
+    the slow ceiling; the inverter's power-flow banks stay at every tick regardless."""
+    scheduler = BankScheduler(30)
+    plant = _plant(batteries=(0x33,))
+    steady = {INV_IR0: 10_000.0, INV_IR180: 10_000.0, BAT_33: 10_000.0}
+
+    polled_battery_at = []
+    for n in range(12):
+        due = _tick(scheduler, plant, n, unchanged=steady)
+        assert INV_IR0 in due and INV_IR180 in due
+        if BAT_33 in due:
+            polled_battery_at.append(n)
+
+    # 0 (first sight, no baseline), 1 (steady → 2 ticks), 3 (→ 4 ticks = 120 s cap), 7, 11.
+    assert polled_battery_at == [0, 1, 3, 7, 11]
+    bank = next(b for b in scheduler.banks if b.key == BAT_33)
+    assert bank.interval_ticks == SLOW_BANK_MAX_SECONDS // 30
+    assert scheduler.reads_skipped == 12 - len(polled_battery_at)
+
+
+def test_changed_content_tightens_interval():
+    scheduler = BankScheduler(30)
+    plant = _plant(batteries=(0x33,))
+    steady = {BAT_33: 10_000.0}
+    for n in range(4):
+        _tick(scheduler, plant, n, unchanged=steady)
+    bank = next(b for b in scheduler.banks if b.key == BAT_33)
+    assert bank.interval_ticks == 4
+
+    # Next due at tick 7; the content has moved by then → interval halves.
+    for n in range(4, 8):
+        _tick(scheduler, plant, n)
+    assert bank.interval_ticks == 2
+    assert bank.next_due_tick == 9
+
+
+def test_failed_bank_retried_next_tick():
+    scheduler = BankScheduler(30)
+    plant = _plant(batteries=(0x33,))
+    steady = {BAT_33: 10_000.0}
+    _tick(scheduler, plant, 0, unchanged=steady)
+    _tick(scheduler, plant, 1, unchanged=steady, failed={BAT_33})
+    bank = next(b for b in scheduler.banks if b.key == BAT_33)
+    assert bank.next_due_tick == 2
+    assert BAT_33 in _tick(scheduler, plant, 2, unchanged=steady)
+
+
+def test_absent_bank_is_never_due_or_counted():
+    scheduler = BankScheduler(30)
+    plant = _plant(batteries=(0x33,))
+    plant.block_present.side_effect = lambda addr, *_: False if addr == 0x33 else True
+    for n in range(3):
+        assert BAT_33 not in _tick(scheduler, plant, n)
+    assert scheduler.reads_skipped == 0
+
+
+def test_reset_makes_every_bank_due():
+    scheduler = BankScheduler(30)
+    plant = _plant(batteries=(0x33,))
+    steady = {BAT_33: 10_000.0}
+    for n in range(2):
+        _tick(scheduler, plant, n, unchanged=steady)
+    assert BAT_33 not in scheduler.due(plant)
+
+    scheduler.reset()
+    assert BAT_33 in scheduler.due(plant)
+
+
+def test_bus_time_saved_prices_skips_at_measured_read_cost():
+    scheduler = BankScheduler(30)
+    plant = _plant(batteries=(0x33,))
+    steady = {BAT_33: 10_000.0}
+    for n in range(3):  # battery skipped on tick 2 only
+        _tick(scheduler, plant, n, unchanged=steady)
+    assert scheduler.reads_skipped == 1
+    # elapsed 0.5 s over 3 reads on the first ticks → ~0.167 s per read.
+    assert scheduler.read_seconds is not None
+    assert abs(scheduler.bus_seconds_saved - scheduler.read_seconds) < 0.05
+
+
+def test_topology_change_keeps_known_bank_state():
+    scheduler = BankScheduler(30)
+    plant = _plant(batteries=(0x33,))
+    steady = {BAT_33: 10_000.0}
+    for n in range(2):
+        _tick(scheduler, plant, n, unchanged=steady)
+    before = next(b for b in scheduler.banks if b.key == BAT_33)
+
+    grown = _plant(batteries=(0x33, 0x34))
+    due = scheduler.due(grown)
+    assert BAT_34 in due  # the new pack is read straight away
+    assert next(b for b in scheduler.banks if b.key == BAT_33) is before
+
+
+def test_slow_ceiling_floors_at_one_tick_for_long_scan_intervals():
+    scheduler = BankScheduler(300)
+    plant = _plant(batteries=(0x33,))
+    steady = {BAT_33: 10_000.0}
+    for n in range(4):
+        assert BAT_33 in _tick(scheduler, plant, n, unchanged=steady, scan=300)
+
+
+def test_refresh_requests_cover_every_present_bank_in_refresh_order():
+    plant = _plant(batteries=(0x33, 0x34))
+    plant.capabilities = PlantCapabilities(
+        device_type=Model.HYBRID,
+        inverter_address=0x32,
+        meter_addresses=[0x01],
+        lv_battery_addresses=[0x33, 0x34],
+        bcu_stacks=[],
+    )
+    assert refresh_banks(plant.capabilities) == [INV_IR0, INV_IR180, BAT_33, BAT_34, (1, 60, 30)]
+    plant.block_present.side_effect = lambda addr, *_: False if addr == 0x34 else None
+    requests = refresh_requests(plant)
+    assert [(r.device_address, r.base_register, r.register_count) for r in requests] == [
+        INV_IR0,
+        INV_IR180,
+        BAT_33,
+        (1, 60, 30),
+    ]
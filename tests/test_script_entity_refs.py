@@ -47,7 +47,7 @@ def _load_migrate_module() -> ModuleType:
 
 
 class _FakeWS:
-    """Stand-in for HAWebSocket.get_statistics in migrate_entity guard tests."""
+    """Stand-in for HAWebSocket's statistics reads in migrate_entity guard tests."""
 
     def __init__(self, series: dict[str, list[dict]]) -> None:
         self._series = series
@@ -57,6 +57,10 @@ class _FakeWS:
         self.calls.append({"ids": list(ids), "types": types})
         return {i: self._series.get(i, []) for i in ids}
 
+    async def iter_statistics(self, ids, start, end=None, types=None):  # noqa: ANN001
+        # The whole series as a single window.
+        yield await self.get_statistics(ids, start, end=end, types=types)
+
 
 def _stat_row(dt: datetime, value: float) -> dict:
     """A recorder statistics row (millisecond `start`, as HA returns)."""
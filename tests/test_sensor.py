@@ -1,8 +1,10 @@
 """Tests for the GivEnergy Local sensor platform."""
 
+import time
 from datetime import UTC
+from operator import attrgetter
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from homeassistant.components.sensor import SensorStateClass
@@ -12,7 +14,12 @@ from homeassistant.helpers.entity import EntityCategory
 
 from custom_components.givenergy_local.const import (
     CONF_BATTERY_DATA_ONLY,
+    CONF_CELL_VECTOR_SENSORS,
     CONF_EXPOSE_PER_CELL,
+    CONF_FAST_LANE_INTERVAL,
+    CONF_THROTTLE_DEADBAND,
+    CONF_THROTTLE_MAX_INTERVAL,
+    CONF_THROTTLE_POWER_SENSORS,
     DOMAIN,
 )
 from custom_components.givenergy_local.sensor import (
@@ -232,10 +239,11 @@ async def test_expected_sensor_count(hass, setup_integration):
     # 1 battery → inverter sensors + battery aggregates + per-cell entities
     # (created by default — the test entry has no expose_per_cell key, so it
     # resolves on) + coordinator diagnostics, minus e_load_total which only
-    # exists on three-phase models (#154).
+    # exists on three-phase models (#154), plus the pack's Worst Cell Drift.
     expected = (
         len(INVERTER_SENSORS)
         + len(BATTERY_SENSORS)
+        + 1
         + len(BATTERY_CELL_SENSORS)
         + len(COORDINATOR_SENSORS)
         - 1
@@ -276,6 +284,52 @@ def test_comms_counter_descriptions_compute_total_and_breakdown():
     assert by_key["cold_start_holds"].value_fn(coord) == 3
 
 
+def test_poll_duration_descriptions_read_rolling_percentiles():
+    """The Poll Duration sensors read the tick percentile and break it down by
+    phase and device in their attributes (None before the first tick)."""
+    from custom_components.givenergy_local.timing import PollTimings
+
+    by_key = {d.key: d for d in COORDINATOR_SENSORS}
+    coord = SimpleNamespace(timings=PollTimings())
+    assert by_key["poll_duration_p50"].value_fn(coord) is None
+    assert by_key["poll_duration_p50"].attributes_fn(coord) is None
+
+    for seconds in range(1, 21):
+        coord.timings.phases.record("tick", float(seconds))
+        coord.timings.phases.record("refresh", seconds / 2)
+    coord.timings.devices.record("0x32", 0.75)
+
+    assert by_key["poll_duration_p50"].value_fn(coord) == 10.0
+    assert by_key["poll_duration_p95"].value_fn(coord) == 19.0
+    assert by_key["poll_duration_p99"].value_fn(coord) == 20.0
+    assert by_key["poll_duration_p95"].attributes_fn(coord) == {
+        "phases": {"tick": 19.0, "refresh": 9.5},
+        "devices": {"0x32": 0.75},
+        "samples": 20,
+    }
+
+
+def test_write_confirmation_descriptions_read_the_optimistic_overlay():
+    from custom_components.givenergy_local.writes import OptimisticOverlay
+
+    by_key = {d.key: d for d in COORDINATOR_SENSORS}
+    overlay = OptimisticOverlay()
+    coord = SimpleNamespace(writes=SimpleNamespace(overlay=overlay))
+    assert by_key["write_confirm_latency"].value_fn(coord) is None
+    assert by_key["write_mismatches"].value_fn(coord) == 0
+
+    overlay.latency.record("confirm", 1.5)
+    overlay.confirmed, overlay.mismatches = 1, 2
+    assert by_key["write_confirm_latency"].value_fn(coord) == 1.5
+    assert by_key["write_confirm_latency"].attributes_fn(coord) == {
+        "p95": 1.5,
+        "samples": 1,
+        "pending_registers": [],
+    }
+    assert by_key["write_mismatches"].value_fn(coord) == 2
+    assert by_key["write_mismatches"].attributes_fn(coord)["confirmed"] == 1
+
+
 async def test_comms_counter_sensors_default_to_zero(hass, setup_integration):
     """The five noise-floor counters are created and read 0 on a clean plant."""
     for key in (
@@ -1610,6 +1664,44 @@ def test_sensor_unavailable_when_backing_ir_block_stale(mock_plant):
     assert entity.available is False
 
 
+def test_stale_gate_reads_coordinator_block_age_table(mock_plant):
+    """With the coordinator's per-fan-out age table the gate resolves its registers
+    to covering windows once and never scans Plant.register_age()."""
+    from datetime import timedelta
+
+    from givenergy_modbus.model.register import IR
+
+    from custom_components.givenergy_local import sensor as sensor_mod
+    from custom_components.givenergy_local.sensor import GivEnergyInverterSensor
+
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.update_interval = timedelta(seconds=30)
+    coordinator.data = mock_plant
+    coordinator.block_layout_version = 1
+    coordinator.block_ages = {0x32: {("IR", 0, 60): 35.0, ("IR", 180, 60): 900.0}}
+    entity = GivEnergyInverterSensor(coordinator, _inverter_desc("e_grid_out_day"))
+    entity._source_ir_registers = (IR(25), IR(26))
+    mock_plant.register_age = MagicMock()
+
+    with patch.object(sensor_mod, "_covering_blocks", wraps=sensor_mod._covering_blocks) as resolve:
+        assert entity.available is True
+        # Bank stopped committing past the ceiling (300 s at a 30 s interval).
+        coordinator.block_ages = {0x32: {("IR", 0, 60): 600.0, ("IR", 180, 60): 900.0}}
+        assert entity.available is False
+        assert resolve.call_count == 1
+        # A fresher window covering the same register wins.
+        coordinator.block_layout_version = 2
+        coordinator.block_ages = {0x32: {("IR", 0, 60): 600.0, ("IR", 0, 120): 10.0}}
+        assert entity.available is True
+        assert resolve.call_count == 2
+        # No window covers the register: never committed, stays available.
+        coordinator.block_layout_version = 3
+        coordinator.block_ages = {0x32: {("IR", 180, 60): 900.0}}
+        assert entity.available is True
+    mock_plant.register_age.assert_not_called()
+
+
 def test_sensor_without_ir_source_keeps_default_availability(mock_plant):
     """Computed / HR-backed / mock-model sensors never consult bank ages."""
     from datetime import timedelta
@@ -1689,13 +1781,11 @@ def test_battery_sensor_without_ir_source_keeps_default_availability(mock_plant)
     mock_plant.register_age.assert_not_called()
 
 
-def test_battery_sensor_available_when_index_out_of_range(mock_plant):
-    """A pack index beyond the known battery addresses keeps default availability
-    (bounds guard) rather than indexing past the capabilities list."""
+def test_battery_sensor_unavailable_when_its_pack_is_absent(mock_plant):
+    """A pack whose serial no longer appears in the poll drops to unavailable
+    rather than reading a neighbour's data."""
     from datetime import timedelta
 
-    from givenergy_modbus.model.register import IR
-
     from custom_components.givenergy_local.sensor import GivEnergyBatterySensor
 
     coordinator = MagicMock()
@@ -1703,12 +1793,78 @@ def test_battery_sensor_available_when_index_out_of_range(mock_plant):
     coordinator.update_interval = timedelta(seconds=30)
     coordinator.data = mock_plant
     entity = GivEnergyBatterySensor(coordinator, _battery_desc("soc"), 0)
-    entity._battery_index = 5  # beyond capabilities.lv_battery_addresses ([0x32])
-    entity._source_ir_registers = (IR(64),)
-    mock_plant.register_age = MagicMock()
-
     assert entity.available is True
-    mock_plant.register_age.assert_not_called()
+
+    mock_plant.batteries = []
+    assert entity.available is False
+    assert entity._backing_device_address() is None
+    assert entity.native_value is None
+
+
+def _lv_pack(serial: str, soc: int) -> MagicMock:
+    battery = MagicMock()
+    battery.serial_number = serial
+    battery.soc = soc
+    battery.bms_firmware_version = 3005
+    return battery
+
+
+def test_battery_sensors_follow_their_pack_when_packs_reorder():
+    """Plant.batteries skips packs without a register cache, so positions shift
+    when a pack answers late or is removed; each entity keeps reading the pack
+    its unique_id names, at that pack's device address, vector-bound or not."""
+    from datetime import timedelta
+
+    from givenergy_modbus.model.inverter import Model
+    from givenergy_modbus.model.plant import PlantCapabilities
+
+    from custom_components.givenergy_local.sensor import GivEnergyBatterySensor, _ValueVector
+
+    first, second = _lv_pack("BT0001", 40), _lv_pack("BT0002", 90)
+    plant = SimpleNamespace(
+        batteries=[first, second],
+        register_caches={0x32: {}, 0x33: {}},
+        capabilities=PlantCapabilities(
+            device_type=Model.HYBRID,
+            inverter_address=0x11,
+            meter_addresses=[],
+            lv_battery_addresses=[0x32, 0x33],
+            bcu_stacks=[],
+        ),
+        inverter_serial_number="SA1234G123",
+    )
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.update_interval = timedelta(seconds=30)
+    coordinator.update_generation = 1
+    coordinator.data = plant
+    unbound = GivEnergyBatterySensor(coordinator, _battery_desc("soc"), 1)
+    bound = GivEnergyBatterySensor(coordinator, _battery_desc("soc"), 1)
+    bound.bind_value_vector(_ValueVector(coordinator))
+    assert unbound.unique_id == bound.unique_id == "BT0002_soc"
+
+    for entity in (unbound, bound):
+        assert entity.native_value == 90
+        assert entity._backing_device_address() == 0x33
+
+    # The first pack's cache goes away (removed, or not yet answering after a
+    # reconnect): the second pack is now batteries[0].
+    del plant.register_caches[0x32]
+    plant.batteries = [second]
+    coordinator.update_generation = 2
+    for entity in (unbound, bound):
+        assert entity.native_value == 90
+        assert entity._backing_device_address() == 0x33
+        assert entity.available is True
+
+    # Both back, in swapped list order (a late answer re-sorted by the library).
+    plant.register_caches = {0x32: {}, 0x33: {}}
+    plant.capabilities.lv_battery_addresses = [0x33, 0x32]
+    plant.batteries = [second, first]
+    coordinator.update_generation = 3
+    for entity in (unbound, bound):
+        assert entity.native_value == 90
+        assert entity._backing_device_address() == 0x33
 
 
 def _aio_desc(key: str):
@@ -2222,7 +2378,11 @@ async def test_hv_modules_create_device_per_module_nested_under_stack(hass, mock
     rollups = _sensor_uids(hass, entry, "HV2301A")
     assert "HV2301A001_cell_voltage_min" in rollups
     assert "HV2301A001_cell_voltage_delta" in rollups
-    assert len(rollups) == 2 * len(HV_MODULE_SENSORS)
+    # Plus each module's Worst Cell Drift and, per-cell exposure being off, its
+    # single Cells entity.
+    assert "HV2301A001_cell_array" in rollups
+    assert "HV2301A001_cell_drift" in rollups
+    assert len(rollups) == 2 * (len(HV_MODULE_SENSORS) + 2)
 
 
 async def test_hv_module_rollup_values(hass, mock_client):
@@ -2245,7 +2405,7 @@ async def test_hv_module_per_cell_present_when_enabled(hass, mock_client):
     ids = _sensor_uids(hass, entry, "HV2301A")
     assert "HV2301A001_v_cell_01" in ids
     assert "HV2301A001_t_cell_24" in ids
-    assert len(ids) == len(HV_MODULE_SENSORS) + len(HV_MODULE_CELL_SENSORS)
+    assert len(ids) == len(HV_MODULE_SENSORS) + 1 + len(HV_MODULE_CELL_SENSORS)
 
 
 async def test_hv_module_per_cell_absent_when_disabled(hass, mock_client):
@@ -2257,6 +2417,30 @@ async def test_hv_module_per_cell_absent_when_disabled(hass, mock_client):
     assert "HV2301A001_cell_voltage_min" in ids  # roll-ups stay
 
 
+async def test_lean_mode_cells_entity_carries_every_cell(hass, mock_client):
+    """With per-cell exposure off, one Cells entity per module stands in for its
+    individual cells: the mean as state, the arrays as unrecorded attributes."""
+    from custom_components.givenergy_local.sensor import GivEnergyCellArraySensor
+
+    await _setup_hv_with_modules(hass, mock_client, expose_per_cell=False, serials=("HV2301A001",))
+    state = hass.states.get(_entity_id(hass, "sensor", "HV2301A001_cell_array"))
+    assert state is not None
+    assert "state_class" not in state.attributes
+    voltages = state.attributes["cell_voltages"]
+    assert len(voltages) == 24
+    assert float(state.state) == pytest.approx(sum(voltages) / 24, abs=1e-4)
+    assert len(state.attributes["cell_temperatures"]) == 24
+    assert state.attributes["pinned_cells"] == []
+    assert {"cell_voltages", "cell_temperatures"} <= GivEnergyCellArraySensor._unrecorded_attributes
+
+
+async def test_cells_entity_absent_when_per_cell_exposed(hass, mock_client):
+    entry = await _setup_hv_with_modules(
+        hass, mock_client, expose_per_cell=True, serials=("HV2301A001",)
+    )
+    assert "HV2301A001_cell_array" not in _sensor_uids(hass, entry)
+
+
 def test_hv_module_cell_descriptions_cover_expected_cells():
     keys = [d.key for d in HV_MODULE_CELL_SENSORS]
     assert len(keys) == len(set(keys))
@@ -2281,6 +2465,60 @@ async def _setup_lv_with_option(hass, expose_per_cell: bool | None):
     return entry
 
 
+async def test_cell_vector_packs_every_cell_into_one_recorded_state(hass, mock_client):
+    """With the option on, each pack gets a Cell Vector sensor: the spread (mV) as
+    state and every cell packed into recorded attributes, with no state_class so
+    none of it reaches long-term statistics."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.givenergy_local.sensor import GivEnergyCellVectorSensor
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.1.100", "port": 8899, "scan_interval": 30, "passive": False},
+        options={CONF_EXPOSE_PER_CELL: False, CONF_CELL_VECTOR_SENSORS: True},
+        unique_id="SA1234G123",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = _entity_id(hass, "sensor", "BT1234A001_cell_vector")
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert "state_class" not in state.attributes
+    cell_mv = state.attributes["cell_mv"]
+    assert cell_mv == [3275 + n for n in range(1, 17)]
+    assert int(state.state) == max(cell_mv) - min(cell_mv)
+    assert state.attributes["cell_temps"] == [22.1, 22.4, 22.6, 22.3]
+    assert state.attributes["cells_per_temp"] == 4
+    assert not GivEnergyCellVectorSensor._unrecorded_attributes
+    # Same device as the pack's other sensors.
+    registry = er.async_get(hass)
+    soc = registry.async_get(_entity_id(hass, "sensor", "BT1234A001_soc"))
+    assert registry.async_get(entity_id).device_id == soc.device_id
+
+
+async def test_worst_cell_drift_ranks_the_packs_cells(hass, setup_integration):
+    """Each pack gets a Worst Cell Drift sensor fed by the coordinator's drift
+    tracker: the worst cell's averaged deviation from the pack mean as state."""
+    state = hass.states.get(_entity_id(hass, "sensor", "BT1234A001_cell_drift"))
+    assert state is not None
+    assert state.attributes["state_class"] == SensorStateClass.MEASUREMENT
+    worst = state.attributes["worst_cells"]
+    # The fixture's cells climb 1 mV per cell, so the ends deviate most.
+    assert len(worst) == 5
+    assert {worst[0]["cell"], worst[1]["cell"]} == {1, 16}
+    assert float(state.state) == pytest.approx(7.5, abs=0.1)
+    assert worst[0]["slope_mv_per_day"] is None
+    assert state.attributes["days_tracked"] == 1
+
+
+async def test_cell_vector_absent_by_default(hass, mock_client):
+    entry = await _setup_lv_with_option(hass, expose_per_cell=False)
+    assert not any(u.endswith("_cell_vector") for u in _sensor_uids(hass, entry))
+
+
 async def test_lv_per_cell_absent_when_disabled(hass, mock_client):
     """The global option suppresses the LV pack's individual cells but keeps the
     aggregates (the per-cell split is not a regression for the rest)."""
@@ -2295,3 +2533,348 @@ async def test_lv_per_cell_present_when_option_absent(hass, mock_client):
     entry = await _setup_lv_with_option(hass, expose_per_cell=None)
     uids = _sensor_uids(hass, entry)
     assert any("_v_cell_" in u for u in uids)
+
+
+def test_bank_schedule_attributes_describe_each_bank():
+    """The adaptive-poll diagnostic names each bank with its target interval, the
+    cadence achieved and its read/skip counts; absent without a scheduler."""
+    from custom_components.givenergy_local.scheduler import BankSchedule
+    from custom_components.givenergy_local.sensor import _bank_schedule_attributes
+
+    coordinator = MagicMock()
+    coordinator.bank_scheduler = None
+    assert _bank_schedule_attributes(coordinator) is None
+
+    bank = BankSchedule(key=(0x33, 60, 60), max_interval_ticks=4, interval_ticks=2)
+    bank.cadence_seconds = 59.94
+    bank.polls = 5
+    bank.skipped = 3
+    coordinator.bank_scheduler = SimpleNamespace(
+        banks=[bank], scan_interval=30, read_seconds=0.41234
+    )
+    assert _bank_schedule_attributes(coordinator) == {
+        "read_seconds": 0.412,
+        "banks": {
+            "0x33 IR(60,60)": {
+                "interval_seconds": 60,
+                "achieved_cadence_seconds": 59.9,
+                "polls": 5,
+                "skipped": 3,
+            }
+        },
+    }
+
+
+async def test_bank_scheduler_sensors_absent_by_default(hass, mock_client):
+    """Without the option there's no scheduler, so no poll-schedule diagnostics."""
+    entry = await _setup_lv_with_option(hass, expose_per_cell=False)
+    uids = _sensor_uids(hass, entry)
+    assert not any(u.endswith(("_poll_reads_skipped", "_poll_bus_time_saved")) for u in uids)
+
+
+async def test_bank_scheduler_sensors_created_with_adaptive_polling(hass, mock_client):
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.givenergy_local.const import CONF_ADAPTIVE_POLLING
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.1.100", "port": 8899, "scan_interval": 30, "passive": False},
+        options={CONF_ADAPTIVE_POLLING: True},
+        unique_id="SA1234G123",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    uids = _sensor_uids(hass, entry)
+    assert {"SA1234G123_poll_reads_skipped", "SA1234G123_poll_bus_time_saved"} <= uids
+
+
+async def test_unchanged_sensor_state_write_is_suppressed(hass, setup_integration, mock_inverter):
+    """A tick that leaves a sensor's value, availability and attributes untouched
+    skips its state write (counted on the coordinator); a changed value writes."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    entity_id = _entity_id(hass, "sensor", "SA1234G123_p_pv1")
+
+    coordinator.async_set_updated_data(coordinator.data)
+    await hass.async_block_till_done()
+    written = hass.states.get(entity_id).last_reported
+    before = coordinator.suppressed_writes
+
+    coordinator.async_set_updated_data(coordinator.data)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).last_reported == written
+    assert coordinator.last_tick_suppressed_writes > 0
+    assert coordinator.suppressed_writes == before + coordinator.last_tick_suppressed_writes
+
+    mock_inverter.p_pv1 = 1750
+    coordinator.async_set_updated_data(coordinator.data)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "1750"
+
+
+async def test_power_sensor_publish_policy_holds_jitter_until_heartbeat(
+    hass, mock_client, mock_inverter
+):
+    """With throttling on, a power sensor skips sub-deadband jitter, publishes a
+    significant change straight away, and refreshes on the heartbeat."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.1.100", "port": 8899, "scan_interval": 30, "passive": False},
+        options={CONF_THROTTLE_POWER_SENSORS: True},
+        unique_id="SA1234G123",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    entity_id = _entity_id(hass, "sensor", "SA1234G123_p_battery")
+    assert hass.states.get(entity_id).state == "500"
+
+    async def tick(p_battery: int) -> str:
+        mock_inverter.p_battery = p_battery
+        coordinator.async_set_updated_data(coordinator.data)
+        await hass.async_block_till_done()
+        return hass.states.get(entity_id).state
+
+    throttled = coordinator.throttled_writes
+    assert await tick(508) == "500"
+    assert coordinator.throttled_writes == throttled + 1
+    assert await tick(540) == "540"
+    # Significant relative to the last published value, not the last reading.
+    assert await tick(552) == "540"
+    assert await tick(561) == "561"
+    # To or from zero always publishes, however small the step.
+    assert await tick(12) == "12"
+    assert await tick(0) == "0"
+    assert await tick(5) == "5"
+    assert await tick(3) == "5"
+    with patch("custom_components.givenergy_local.sensor.time") as clock:
+        clock.monotonic.return_value = time.monotonic() + 301
+        assert await tick(3) == "3"
+    # Unthrottled sensors still publish every change.
+    pv1 = _entity_id(hass, "sensor", "SA1234G123_p_pv1")
+    mock_inverter.p_pv1 = 1501
+    coordinator.async_set_updated_data(coordinator.data)
+    await hass.async_block_till_done()
+    assert hass.states.get(pv1).state == "1501"
+
+
+async def test_power_sensor_publish_policy_follows_the_entry_tuning(
+    hass, mock_client, mock_inverter
+):
+    """The options' deadband and heartbeat replace the 20 W / five-minute defaults."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.1.100", "port": 8899, "scan_interval": 30, "passive": False},
+        options={
+            CONF_THROTTLE_POWER_SENSORS: True,
+            CONF_THROTTLE_DEADBAND: 100,
+            CONF_THROTTLE_MAX_INTERVAL: 60,
+        },
+        unique_id="SA1234G123",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    entity_id = _entity_id(hass, "sensor", "SA1234G123_p_battery")
+
+    async def tick(p_battery: int) -> str:
+        mock_inverter.p_battery = p_battery
+        coordinator.async_set_updated_data(coordinator.data)
+        await hass.async_block_till_done()
+        return hass.states.get(entity_id).state
+
+    assert await tick(550) == "500"
+    assert await tick(600) == "600"
+    with patch("custom_components.givenergy_local.sensor.time") as clock:
+        clock.monotonic.return_value = time.monotonic() + 61
+        assert await tick(610) == "610"
+
+
+async def test_fast_lane_sensors_update_between_full_ticks(hass, mock_client, mock_inverter):
+    """With the fast lane on, each power-flow sensor gets a Fast twin that a
+    fast-lane poll updates while the regular sensor waits for the full tick."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "192.168.1.100", "port": 8899, "scan_interval": 30, "passive": False},
+        options={CONF_FAST_LANE_INTERVAL: 2},
+        unique_id="SA1234G123",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert _sensor_uids(hass, entry, "SA1234G123_") >= {
+        f"SA1234G123_{key}_fast" for key in ("p_pv", "p_battery", "grid_power", "p_load_demand")
+    }
+    fast = _entity_id(hass, "sensor", "SA1234G123_p_battery_fast")
+    regular = _entity_id(hass, "sensor", "SA1234G123_p_battery")
+    assert hass.states.get(fast).state == "500"
+    assert "state_class" not in hass.states.get(fast).attributes
+
+    mock_inverter.p_battery = 1200
+    with patch.object(coordinator, "fast_lane_ranges", return_value=[(18, 35)]):
+        assert await coordinator.async_fast_poll()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(fast).state == "1200"
+    assert hass.states.get(regular).state == "500"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_fast_lane_sensors_absent_by_default(hass, setup_integration):
+    uids = _sensor_uids(hass, setup_integration, "SA1234G123_")
+    assert not [uid for uid in uids if uid.endswith("_fast")]
+
+
+async def test_suppressed_writes_sensor_created(hass, setup_integration):
+    state = hass.states.get(_entity_id(hass, "sensor", "SA1234G123_suppressed_state_writes"))
+    assert state is not None
+    assert "last_tick" in state.attributes
+
+
+def test_value_vector_evaluates_each_field_once_per_update():
+    """Sensors bound to the same (source, key) share a slot, which is evaluated on
+    its first read after a fan-out and then served from the vector."""
+    from custom_components.givenergy_local.sensor import _ValueVector
+
+    battery = SimpleNamespace(soc=80)
+    coordinator = SimpleNamespace(update_generation=1, data=SimpleNamespace(batteries=[battery]))
+    value_fn = MagicMock(side_effect=lambda bat: bat.soc)
+    resolve = MagicMock(side_effect=lambda plant: plant.batteries[0])
+    vector = _ValueVector(coordinator)
+
+    slot = vector.bind(("battery", 0), resolve, "soc", value_fn)
+    assert vector.bind(("battery", 0), resolve, "soc", value_fn) == slot
+    assert len(vector) == 1
+
+    assert vector.value(slot) == 80
+    assert vector.value(slot) == 80
+    assert value_fn.call_count == 1
+
+    battery.soc = 79
+    coordinator.update_generation = 2
+    assert vector.value(slot) == 79
+    assert value_fn.call_count == 2
+    assert resolve.call_count == 2
+
+
+def test_value_vector_rollups_served_from_cell_stats():
+    """Roll-ups are answered from the coordinator's cell statistics snapshot; the
+    device's cell attributes aren't walked again per sensor."""
+    from custom_components.givenergy_local.cell_stats import compute_cell_stats
+    from custom_components.givenergy_local.sensor import _cell_rollup, _ValueVector
+
+    battery = SimpleNamespace(serial_number="BT1", v_cell_01=3.30, v_cell_02=3.35, v_cell_03=0)
+    plant = SimpleNamespace(batteries=[battery], aio_battery_modules=[], hv_stacks=[])
+    coordinator = SimpleNamespace(
+        update_generation=1, data=plant, cell_stats=compute_cell_stats(plant)
+    )
+    vector = _ValueVector(coordinator)
+    resolve = lambda p: p.batteries[0]  # noqa: E731
+    lo = _cell_rollup("v_cell", 3, "min")
+    lo_slot = vector.bind(("battery", 0), resolve, "v_min", lo)
+    hi_slot = vector.bind(("battery", 0), resolve, "v_max", _cell_rollup("v_cell", 3, "max"))
+    spread = vector.bind(("battery", 0), resolve, "spread", _cell_rollup("v_cell", 3, "spread"))
+
+    # Mutate the device after the snapshot: the vector still serves the snapshot.
+    battery.v_cell_01 = 3.10
+    assert vector.value(lo_slot) == 3.30
+    assert vector.value(hi_slot) == 3.35
+    assert vector.value(spread) == pytest.approx(0.05)
+    # Without a snapshot entry the roll-up computes directly off the device.
+    assert lo(battery) == 3.10
+
+
+def test_compute_cell_stats_lv_aio_and_hv():
+    from custom_components.givenergy_local.cell_stats import (
+        KIND_AIO_MODULE,
+        KIND_HV_MODULE,
+        KIND_LV_BATTERY,
+        compute_cell_stats,
+    )
+
+    lv = SimpleNamespace(serial_number="", v_cell_01=3.30, v_cell_02=3.34, t_cells_01_04=21.0)
+    aio = SimpleNamespace(serial_number="AIO1", is_valid=lambda: True, v_cell_01=3.31)
+    aio_bad = SimpleNamespace(serial_number="AIO2", is_valid=lambda: False)
+    bmu = SimpleNamespace(
+        serial_number="BMU1", is_valid=lambda: True, v_cell_01=3.2, v_cell_02=3.25, t_cell_02=18.0
+    )
+    plant = SimpleNamespace(
+        batteries=[lv],
+        aio_battery_modules=[aio, aio_bad],
+        hv_stacks=[SimpleNamespace(bmus=[bmu])],
+    )
+
+    stats = compute_cell_stats(plant)
+    assert set(stats) == {"battery_0", "AIO1", "BMU1"}
+    pack = stats["battery_0"]
+    assert pack.kind == KIND_LV_BATTERY
+    assert len(pack.voltages) == 16 and pack.voltages[2] is None
+    assert (pack.v_min, pack.v_max) == (3.30, 3.34)
+    assert pack.v_mean == pytest.approx(3.32)
+    assert pack.outliers == (1, 2)  # each 20 mV off the mean
+    assert (pack.t_min, pack.t_max, pack.cells_per_temperature) == (21.0, 21.0, 4)
+    assert stats["AIO1"].kind == KIND_AIO_MODULE
+    assert len(stats["AIO1"].temperatures) == 12
+    hv = stats["BMU1"]
+    assert hv.kind == KIND_HV_MODULE
+    assert hv.rollup("v_cell", "spread") == pytest.approx(0.05)
+    assert hv.rollup("t_cell", "max") == 18.0
+    assert hv.rollup("t_cell", "spread") == 0.0
+
+
+def test_cell_history_keeps_recent_snapshots_per_cell():
+    from datetime import UTC, datetime, timedelta
+
+    from custom_components.givenergy_local.cell_stats import (
+        CellHistory,
+        cell_entity_key,
+        compute_cell_stats,
+    )
+
+    history = CellHistory(maxlen=2)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    battery = SimpleNamespace(serial_number="BT1", v_cell_01=3.30, t_cells_05_08=20.0)
+    plant = SimpleNamespace(batteries=[battery], aio_battery_modules=[], hv_stacks=[])
+    for n in range(3):
+        battery.v_cell_01 = 3.30 + n / 100
+        history.record(start + timedelta(seconds=30 * n), compute_cell_stats(plant))
+    # A tick serving last-known data (same refresh time) adds nothing.
+    history.record(start + timedelta(seconds=60), compute_cell_stats(plant))
+
+    result = history.query("BT1", {1, 6})
+    assert result["kind"] == "lv_battery"
+    assert len(result["times"]) == 2
+    assert result["voltages"]["1"] == pytest.approx([3.31, 3.32])
+    assert result["temperatures"]["5-8"] == [20.0, 20.0]
+    assert history.query("BT2") is None
+    assert cell_entity_key("lv_battery", "temperature", 6) == "t_cells_05_08"
+    assert cell_entity_key("aio_module", "temperature", 13) is None
+    assert cell_entity_key("hv_module", "voltage", 24) == "v_cell_24"
+
+
+async def test_lv_packs_have_no_cell_voltage_delta_entity(hass, setup_integration):
+    """The heatmap reads the Cells / Cell Vector entities, so an LV pack gets no
+    extra default-on delta entity."""
+    registry = er.async_get(hass)
+    assert registry.async_get_entity_id("sensor", DOMAIN, "BT1234A001_cell_voltage_delta") is None
+
+
+def test_value_vector_source_absent_reads_none():
+    from custom_components.givenergy_local.sensor import _ValueVector
+
+    coordinator = SimpleNamespace(update_generation=1, data=SimpleNamespace(ems=None))
+    vector = _ValueVector(coordinator)
+    slot = vector.bind(("ems",), attrgetter("ems"), "status", MagicMock())
+    assert vector.value(slot) is None
@@ -0,0 +1,81 @@
+"""Tests for the warm-start Plant snapshot encoding."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from givenergy_modbus.model.inverter import Model
+from givenergy_modbus.model.plant import Plant, PlantCapabilities
+from givenergy_modbus.model.register import HR, IR
+from givenergy_modbus.model.register_cache import RegisterCache
+
+from custom_components.givenergy_local.snapshot import (
+    SNAPSHOT_MAX_AGE,
+    decode_snapshot,
+    encode_snapshot,
+)
+
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+
+
+def _caps(*batteries: int) -> PlantCapabilities:
+    return PlantCapabilities(
+        device_type=Model.HYBRID,
+        inverter_address=0x11,
+        meter_addresses=[],
+        lv_battery_addresses=list(batteries),
+        bcu_stacks=[],
+    )
+
+
+def _plant() -> Plant:
+    plant = Plant(
+        register_caches={
+            0x11: RegisterCache({HR(0): 0x2001, IR(0): 5, IR(1): 6}),
+            0x32: RegisterCache({IR(60): 3300}),
+        },
+        inverter_serial_number="SA1234G123",
+        data_adapter_serial_number="WF1234G456",
+    )
+    plant.capabilities = _caps(0x32)
+    plant.register_block_updated_at[(0x11, "IR", 0, 60)] = NOW - timedelta(seconds=12)
+    return plant
+
+
+def _round_trip(plant: Plant) -> dict:
+    """Encode, then pass through JSON as the Store would."""
+    return json.loads(json.dumps(encode_snapshot(plant, NOW)))
+
+
+def test_snapshot_round_trips_caches_identity_and_block_ages():
+    payload = _round_trip(_plant())
+    snapshot = decode_snapshot(payload, _caps(0x32), NOW + timedelta(seconds=30))
+
+    assert snapshot is not None
+    assert snapshot.saved_at == NOW
+    plant = snapshot.plant
+    assert dict(plant.register_caches[0x11]) == {HR(0): 0x2001, IR(0): 5, IR(1): 6}
+    assert dict(plant.register_caches[0x32]) == {IR(60): 3300}
+    assert plant.capabilities == _caps(0x32)
+    assert plant.inverter_serial_number == "SA1234G123"
+    assert plant.data_adapter_serial_number == "WF1234G456"
+    # Block stamps keep their real age, so the stale-IR gate ages them on.
+    assert plant.register_block_updated_at == {(0x11, "IR", 0, 60): NOW - timedelta(seconds=12)}
+
+
+def test_snapshot_ignored_when_too_old_or_topology_differs():
+    payload = _round_trip(_plant())
+    assert decode_snapshot(payload, _caps(0x32), NOW + SNAPSHOT_MAX_AGE * 2) is None
+    assert decode_snapshot(payload, _caps(0x32, 0x33), NOW) is None
+
+
+def test_corrupt_snapshot_is_rejected():
+    payload = _round_trip(_plant())
+    assert decode_snapshot({**payload, "saved_at": "yesterday"}, _caps(0x32), NOW) is None
+    assert decode_snapshot({**payload, "registers": ""}, _caps(0x32), NOW) is None
+    del payload["blocks"]
+    assert decode_snapshot(payload, _caps(0x32), NOW) is None
+
+
+def test_test_double_is_not_encoded():
+    assert encode_snapshot(MagicMock(), NOW) is None
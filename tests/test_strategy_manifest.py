@@ -56,6 +56,8 @@ for _kind in ("charge", "discharge", "export"):
 # Some entities (e.g. the battery-out-of-spec binary sensor) build a hardcoded
 # unique_id suffix rather than carrying an EntityDescription; pick those up too.
 _HARDCODED_UID = re.compile(r'unique_id\s*=\s*f"\{serial\}_([a-z0-9_]+)"')
+# The whole-pack cell entities set theirs via a class-level suffix.
+_UID_SUFFIX = re.compile(r'_unique_id_suffix\s*=\s*"([a-z0-9_]+)"')
 
 
 def _real_keys() -> set[str]:
@@ -67,6 +69,7 @@ def _real_keys() -> set[str]:
                 keys.update(d.key for d in value)
         source = Path(module.__file__).read_text()
         keys.update(_HARDCODED_UID.findall(source))
+        keys.update(_UID_SUFFIX.findall(source))
     return keys
 
 
@@ -0,0 +1,55 @@
+"""Tests for the rolling poll-timing windows."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.givenergy_local.timing import PollTimings, RollingTimings, percentile
+
+
+def test_nearest_rank_percentile():
+    ordered = [float(n) for n in range(1, 101)]
+    assert percentile(ordered, 50) == 50.0
+    assert percentile(ordered, 95) == 95.0
+    assert percentile(ordered, 99) == 99.0
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_window_keeps_only_the_latest_samples():
+    timings = RollingTimings(window=3)
+    for seconds in (10.0, 1.0, 2.0, 3.0):
+        timings.record("tick", seconds)
+    # The 10 s outlier has rolled out of the window.
+    assert timings.percentile("tick", 99) == 3.0
+    assert timings.summary()["tick"] == {
+        "p50": 2.0,
+        "p95": 3.0,
+        "p99": 3.0,
+        "last": 3.0,
+        "samples": 3,
+    }
+    assert timings.percentile("connect", 50) is None
+
+
+def test_measure_records_even_when_the_body_raises():
+    timings = RollingTimings()
+    with pytest.raises(TimeoutError), timings.measure("detect"):
+        raise TimeoutError
+    assert timings.summary()["detect"]["samples"] == 1
+
+
+def test_device_commits_measured_from_tick_start():
+    started = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+    stamps = {
+        (0x32, "IR", 0, 60): started + timedelta(seconds=0.4),
+        (0x32, "IR", 180, 60): started + timedelta(seconds=1.5),
+        (0x33, "IR", 60, 60): started + timedelta(seconds=2.25),
+        # Committed on an earlier tick (deferred or absent this time): not counted.
+        (0x34, "IR", 60, 60): started - timedelta(seconds=30),
+    }
+    timings = PollTimings()
+    timings.record_device_commits(stamps, started)
+    devices = timings.as_dict()["devices"]
+    assert set(devices) == {"0x32", "0x33"}
+    assert devices["0x32"]["last"] == 1.5
+    assert devices["0x33"]["last"] == 2.25
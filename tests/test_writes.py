@@ -0,0 +1,306 @@
+"""Tests for the coalescing entity write queue."""
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from givenergy_modbus.exceptions import InvalidPduState
+from givenergy_modbus.model.inverter import Model, SinglePhaseInverter
+from givenergy_modbus.model.plant import PlantCapabilities
+from givenergy_modbus.model.register import HR
+from givenergy_modbus.model.register_cache import RegisterCache
+from givenergy_modbus.pdu import WriteHoldingRegisterRequest
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from custom_components.givenergy_local.writes import (
+    OptimisticOverlay,
+    WriteQueue,
+    block_ranges,
+    coalesce,
+    readback_ranges,
+)
+
+
+def _coordinator() -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.hass.async_create_background_task = MagicMock(
+        side_effect=lambda target, name: asyncio.get_running_loop().create_task(target, name=name)
+    )
+    coordinator._client.connected = True
+    coordinator._client.one_shot_command = AsyncMock()
+    coordinator.async_read_back = AsyncMock(return_value=True)
+    coordinator.async_request_refresh = AsyncMock()
+    return coordinator
+
+
+def _read_back(coordinator) -> list[int]:
+    coordinator.async_read_back.assert_awaited_once()
+    (registers,) = coordinator.async_read_back.call_args[0]
+    return sorted(registers)
+
+
+def test_coalesce_keeps_the_last_write_per_register():
+    first, other, last = (
+        WriteHoldingRegisterRequest(94, 100),
+        WriteHoldingRegisterRequest(95, 500),
+        WriteHoldingRegisterRequest(94, 130),
+    )
+    assert coalesce([first, other, last]) == [other, last]
+
+
+def test_readback_ranges_merge_neighbours_within_a_block():
+    assert readback_ranges([96, 94, 95, 20, 23, 40]) == [(20, 4), (40, 1), (94, 3)]
+    # A run never grows past one 60-register read.
+    assert readback_ranges(range(0, 70, 4)) == [(0, 57), (60, 9)]
+    # A wider gap reads through sparse registers as one block.
+    assert readback_ranges([52, 18, 30, 42, 20], max_gap=60) == [(18, 35)]
+
+
+def test_block_ranges_read_through_the_known_blocks():
+    blocks = [(0, 60), (60, 60), (94, 2), (120, 60)]
+    # Registers a block covers read the widest such block; the ad-hoc (94, 2)
+    # window never wins over the (60, 60) block it sits in.
+    assert block_ranges([95, 94, 116], blocks) == [(60, 60)]
+    assert block_ranges([59, 60], blocks) == [(0, 60), (60, 60)]
+    # Registers outside every block fall back to merged runs.
+    assert block_ranges([95, 200, 201], blocks) == [(60, 60), (200, 2)]
+    assert block_ranges([52, 18], [], max_gap=60) == readback_ranges([52, 18], max_gap=60)
+
+
+async def test_writes_in_one_window_share_a_batch_and_a_read_back():
+    coordinator = _coordinator()
+    queue = WriteQueue(coordinator, window=0.01)
+
+    await asyncio.gather(
+        queue.submit([WriteHoldingRegisterRequest(94, 100), WriteHoldingRegisterRequest(95, 500)]),
+        queue.submit([WriteHoldingRegisterRequest(116, 80)]),
+        queue.submit([WriteHoldingRegisterRequest(94, 130)]),
+    )
+
+    coordinator._client.one_shot_command.assert_awaited_once()
+    (sent,) = coordinator._client.one_shot_command.call_args[0]
+    assert [(r.register, r.value) for r in sent] == [(95, 500), (116, 80), (94, 130)]
+    assert _read_back(coordinator) == [94, 95, 116]
+    coordinator.async_request_refresh.assert_not_awaited()
+    assert (queue.batches, queue.submitted, queue.sent) == (1, 4, 3)
+
+
+async def test_an_invalid_write_only_fails_its_own_caller():
+    coordinator = _coordinator()
+    bad = [WriteHoldingRegisterRequest(0, 1)]
+
+    async def one_shot_command(requests):
+        if any(r.register == 0 for r in requests):
+            raise InvalidPduState("HR(0) is not permitted", requests[0])
+
+    coordinator._client.one_shot_command = AsyncMock(side_effect=one_shot_command)
+    queue = WriteQueue(coordinator, window=0.01)
+
+    good, failed = await asyncio.gather(
+        queue.submit([WriteHoldingRegisterRequest(116, 80)]),
+        queue.submit(bad),
+        return_exceptions=True,
+    )
+
+    assert isinstance(good, float)
+    assert isinstance(failed, InvalidPduState)
+    assert _read_back(coordinator) == [116]
+
+
+async def test_failed_read_back_falls_back_to_a_refresh():
+    coordinator = _coordinator()
+    coordinator.async_read_back.return_value = False
+    queue = WriteQueue(coordinator, window=0.01)
+
+    await queue.submit([WriteHoldingRegisterRequest(116, 80)])
+
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert queue.readback_failures == 1
+
+
+async def test_flush_runs_as_a_tracked_background_task():
+    coordinator = _coordinator()
+    queue = WriteQueue(coordinator, window=0.01)
+
+    submitted = asyncio.ensure_future(queue.submit([WriteHoldingRegisterRequest(116, 80)]))
+    await asyncio.sleep(0)
+    coordinator.hass.async_create_background_task.assert_called_once()
+    assert len(queue._flushes) == 1
+
+    await submitted
+    await asyncio.sleep(0)
+    assert not queue._flushes
+
+
+async def test_read_back_error_after_a_sent_write_refreshes_instead_of_reverting():
+    coordinator = _coordinator()
+    coordinator.data = _plant(hr116=100)
+    coordinator.async_read_back.side_effect = RuntimeError("decoder blew up")
+    queue = WriteQueue(coordinator, window=0.01)
+
+    assert isinstance(await queue.submit([WriteHoldingRegisterRequest(116, 80)]), float)
+
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert queue.readback_failures == 1
+    # The write reached the inverter, so the shown value stays until a read confirms it.
+    assert _shown(queue.overlay, coordinator.data) == 80
+    assert queue.overlay.writes
+
+
+async def test_disconnected_client_rejects_the_batch():
+    coordinator = _coordinator()
+    coordinator._client.connected = False
+    queue = WriteQueue(coordinator, window=0.01)
+
+    with pytest.raises(HomeAssistantError):
+        await queue.submit([WriteHoldingRegisterRequest(116, 80)])
+    coordinator._client.one_shot_command.assert_not_awaited()
+
+
+class _Plant(SimpleNamespace):
+    @property
+    def inverter(self):
+        return SinglePhaseInverter.from_register_cache(self.register_caches[0x11])
+
+
+def _plant(**registers):
+    """A Plant-shaped double with a real inverter cache at 0x11."""
+    cache = RegisterCache({HR(int(name[2:])): value for name, value in registers.items()})
+    return _Plant(
+        register_caches={0x11: cache},
+        register_block_updated_at={(0x11, "HR", 60, 60): datetime(2026, 1, 1, tzinfo=UTC)},
+        capabilities=PlantCapabilities(
+            device_type=Model.HYBRID,
+            inverter_address=0x11,
+            meter_addresses=[],
+            lv_battery_addresses=[0x32],
+            bcu_stacks=[],
+        ),
+    )
+
+
+def _shown(overlay, plant) -> int:
+    """The charge target (HR(116)) a control reading through ``overlay`` shows."""
+    return overlay.inverter(plant).charge_target_soc
+
+
+def _read(plant, register, value, issued_at):
+    """Commit a read of ``register``, issued at ``issued_at``, holding ``value``."""
+    plant.register_caches[0x11][HR(register)] = value
+    plant.register_block_updated_at[(0x11, "HR", register, 1)] = dt_util.utcnow()
+    return issued_at
+
+
+def test_overlay_shows_the_write_until_a_later_read_confirms_it():
+    plant = _plant(hr116=100)
+    overlay = OptimisticOverlay()
+    write = [WriteHoldingRegisterRequest(116, 80)]
+
+    assert overlay.apply(plant, write) == 0x11
+    assert _shown(overlay, plant) == 80
+    # The layer sits over the cache; the cache keeps what the inverter returned.
+    assert plant.register_caches[0x11][HR(116)] == 100
+
+    # A poll that read the register before the write landed settles nothing.
+    issued = dt_util.utcnow()
+    assert overlay.reconcile(plant, _read(plant, 116, 100, issued)) is None
+    assert _shown(overlay, plant) == 80
+    overlay.acknowledge(write)
+    assert overlay.reconcile(plant, None) is None
+    assert overlay.writes
+
+    issued = dt_util.utcnow()
+    assert overlay.reconcile(plant, _read(plant, 116, 80, issued)) == 0x11
+    assert not overlay.writes
+    assert (overlay.confirmed, overlay.mismatches) == (1, 0)
+    assert overlay.latency.percentile("confirm", 50) is not None
+
+
+def test_overlay_ignores_a_read_in_flight_when_the_write_landed():
+    """A read issued before the acknowledgement but committed after it may have
+    sampled the register before the write: it neither confirms nor mismatches."""
+    plant = _plant(hr116=100)
+    overlay = OptimisticOverlay()
+    write = [WriteHoldingRegisterRequest(116, 80)]
+    overlay.apply(plant, write)
+
+    issued = dt_util.utcnow()
+    overlay.acknowledge(write)
+    assert overlay.reconcile(plant, _read(plant, 116, 100, issued)) is None
+
+    assert overlay.writes
+    assert overlay.mismatches == 0
+    assert _shown(overlay, plant) == 80
+
+
+def test_overlay_counts_a_read_that_disagrees_as_a_mismatch():
+    plant = _plant(hr116=100)
+    overlay = OptimisticOverlay()
+    write = [WriteHoldingRegisterRequest(116, 80)]
+    overlay.apply(plant, write)
+    overlay.acknowledge(write)
+
+    issued = dt_util.utcnow()
+    assert overlay.reconcile(plant, _read(plant, 116, 75, issued)) == 0x11
+
+    assert _shown(overlay, plant) == 75
+    assert overlay.mismatches == 1
+    assert overlay.last_mismatch == {"register": 116, "written": 80, "read": 75}
+
+
+async def test_failed_write_restores_the_displayed_value():
+
+    coordinator = _coordinator()
+    coordinator.data = _plant(hr116=100)
+    coordinator._client.one_shot_command.side_effect = TimeoutError()
+    queue = WriteQueue(coordinator, window=0.01)
+
+    with pytest.raises(TimeoutError):
+        await queue.submit([WriteHoldingRegisterRequest(116, 80)])
+
+    assert _shown(queue.overlay, coordinator.data) == 100
+    assert not queue.overlay.writes
+    # Shown optimistically on submit, then taken back on failure.
+    assert coordinator._async_update_listeners_for.call_count == 2
+
+
+async def test_closing_fails_writes_still_waiting_in_the_window():
+    coordinator = _coordinator()
+    coordinator.data = _plant(hr116=100)
+    queue = WriteQueue(coordinator, window=10)
+
+    submitted = asyncio.ensure_future(queue.submit([WriteHoldingRegisterRequest(116, 80)]))
+    await asyncio.sleep(0)
+    await queue.async_close()
+
+    with pytest.raises(HomeAssistantError):
+        await submitted
+    coordinator._client.one_shot_command.assert_not_awaited()
+    assert _shown(queue.overlay, coordinator.data) == 100
+    assert not queue._pending
+    assert not queue._flushes
+
+
+async def test_closing_fails_a_write_cancelled_on_the_wire():
+    coordinator = _coordinator()
+    coordinator.data = _plant(hr116=100)
+    on_the_wire = asyncio.Event()
+
+    async def one_shot_command(requests):
+        on_the_wire.set()
+        await asyncio.Event().wait()
+
+    coordinator._client.one_shot_command = AsyncMock(side_effect=one_shot_command)
+    queue = WriteQueue(coordinator, window=0.01)
+
+    submitted = asyncio.ensure_future(queue.submit([WriteHoldingRegisterRequest(116, 80)]))
+    await on_the_wire.wait()
+    await queue.async_close()
+
+    with pytest.raises(HomeAssistantError):
+        await submitted
+    assert _shown(queue.overlay, coordinator.data) == 100
+    assert not queue.overlay.writes